@@ -0,0 +1,87 @@
+"""
+Detalles:
+    - Benchmark del tiempo de import de cada modulo del paquete riggingCodes.
+    - Cada modulo se importa en un proceso nuevo, para medir el import en frio y no el de la cache.
+    - Se debe ejecutar con el interprete que tenga maya.cmds disponible (mayapy):
+        mayapy benchmarks/bench_startup.py
+        mayapy benchmarks/bench_startup.py --repeat 10 --json startup.json
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ['riggingCodes',
+           'riggingCodes.Reset_Controls',
+           'riggingCodes.snapIKFK',
+           'riggingCodes.Grupos_y_Spaces',
+           'riggingCodes.Conectar_Y_Desconectar',
+           'riggingCodes.shelf',
+           'riggingCodes.cli']
+
+# maya.cmds se importa antes de medir: dentro de Maya ya esta cargado, y no es coste de nuestros modulos
+_SNIPPET = """
+import time
+try:
+    import maya.cmds
+except ImportError:
+    pass
+_start = time.perf_counter()
+import {module}
+print(time.perf_counter() - _start)
+"""
+
+
+def measure(module, repeat=5):
+    """
+    - Devuelve los tiempos de import (segundos) de "module" en "repeat" procesos nuevos.
+    """
+    _env = dict(os.environ)
+    _env['PYTHONPATH'] = os.pathsep.join([_ROOT] + [_env['PYTHONPATH']] if _env.get('PYTHONPATH') else [_ROOT])
+    _env['PYTHONDONTWRITEBYTECODE'] = '1'
+
+    times = []
+    for _ in range(repeat):
+        _output = subprocess.check_output([sys.executable, '-c', _SNIPPET.format(module=module)],
+                                          env=_env, stderr=subprocess.DEVNULL)
+        times.append(float(_output.decode().strip().splitlines()[-1]))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of every riggingCodes module.")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', default=None, help="Save the results in this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in MODULES:
+        try:
+            _times = measure(module, args.repeat)
+        except subprocess.CalledProcessError:
+            print("{:<40} FAILED (is maya.cmds available?)".format(module))
+            continue
+        results[module] = {'min': min(_times), 'median': sorted(_times)[len(_times) // 2]}
+        print("{:<40} min {:8.2f} ms   median {:8.2f} ms".format(
+            module, results[module]['min'] * 1000.0, results[module]['median'] * 1000.0))
+
+    if args.json:
+        with open(args.json, "w") as file_to_write:
+            json.dump(results, file_to_write, indent=4)
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
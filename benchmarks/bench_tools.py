@@ -0,0 +1,736 @@
+"""
+Detalles:
+    - Benchmark de las herramientas del paquete riggingCodes sobre rigs sinteticos de distintos tamanos.
+    - Los rigs se construyen con riggingCodes.syntheticRig, y por defecto se ejecuta sobre el stand-in
+        en memoria de maya.cmds (riggingCodes.mayaStandIn), asi que funciona en Linux sin Maya (CI).
+    - Para cada caso y tamano se mide:
+        - time:   tiempo de la ejecucion (minimo de "repeat" ejecuciones), en segundos.
+        - calls:  numero de llamadas a maya.cmds de una ejecucion (con --maya, solo las de las herramientas,
+                  medidas con riggingCodes.cmdsProfiler).
+        - memory: pico de memoria de Python de una ejecucion (tracemalloc), en bytes.
+    - La escena se construye antes de medir, y solo se mide la llamada a la herramienta.
+    - Los resultados se pueden guardar como baseline JSON (--save), y comparar con una baseline (--compare):
+        si algun valor empeora mas que el threshold, el script termina con codigo 1.
+    - Ejemplos de uso:
+        python benchmarks/bench_tools.py
+        python benchmarks/bench_tools.py --sizes 10 100 --characters 1 10 --save benchmarks/baseline.json
+        python benchmarks/bench_tools.py --compare benchmarks/baseline.json --threshold 0.25
+        python benchmarks/bench_tools.py --cases connect disconnect --repeat 5
+        python benchmarks/bench_tools.py --cases load_dict --sizes 1000 --profile
+        python benchmarks/bench_tools.py --cases load_dict connect --index
+        mayapy benchmarks/bench_tools.py --maya --backend openmaya --bulk
+        mayapy benchmarks/bench_tools.py --maya --check-backends
+        python benchmarks/bench_tools.py --check-snaps
+        mayapy benchmarks/bench_tools.py --maya
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -check_snaps / --check-snaps: regression check of the snapIKFK accuracy (riggingCodes.snapCheck)
+        -publish_pose case (riggingCodes.posePublisher)
+        -'--check-backends' is skipped, with a message, when only one backend is available (stand-in)
+        -connect_matrix / disconnect_matrix cases (batch connect of the matrix methods)
+Entorno:
+    -Python 2023.2.4
+    -Linux / Windows (sin Maya), Autodesk Maya 2023 con --maya
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from riggingCodes import cmdsProfiler, mayaStandIn
+
+SIZES = [10, 100, 1000, 10000]
+CHARACTERS = [1, 10, 100]
+
+# Metricas que se comparan con la baseline
+METRICS = ['time', 'calls', 'memory']
+
+cmds = None
+
+
+# ------------------------------------------------------------------------------
+# Escenas
+# ------------------------------------------------------------------------------
+def _new_scene():
+    """
+    - Vacia la escena (nueva escena del stand-in o file new en Maya).
+    """
+    if mayaStandIn.is_installed():
+        mayaStandIn.new_scene()
+    else:
+        cmds.file(new=True, force=True)
+
+
+def _write_template(folder, rigs, method='typeA'):
+    """
+    - Escribe un template de RigConnector que conecta cada control con "method" (typeA por defecto)
+        a su grupo '_ctl_grp', con applyPrefix para poder aplicarlo a varios namespaces.
+    - Devuelve (RigConnector, namespaces).
+    """
+    from riggingCodes import Conectar_Y_Desconectar
+
+    _database = {}
+    for control in rigs[0]['controls']:
+        _key = control.split(':')[-1]
+        _database[_key] = {'source': _key + "_grp",
+                           'connectMethod': method,
+                           'disconnectMethod': method,
+                           'applyPrefix': True,
+                           'path': _key}
+
+    _data = {'version': Conectar_Y_Desconectar.TEMPLATE_VERSION,
+             'prefix': rigs[0]['namespace'],
+             'database': _database}
+    with open(os.path.join(folder, "bench.rigConnections"), "w") as file_to_write:
+        json.dump(_data, file_to_write, indent=4)
+
+    connector = Conectar_Y_Desconectar.RigConnector(folder, "bench.rigConnections")
+    return connector, [rig['namespace'] for rig in rigs]
+
+
+# ------------------------------------------------------------------------------
+# Casos
+# ------------------------------------------------------------------------------
+# Cada caso tiene:
+#   - 'scale':    'controls' (un rig de N controles) o 'characters' (N rigs base en namespaces)
+#   - 'setup':    funcion(rigs, folder) que prepara la escena y devuelve el estado de la ejecucion
+#   - 'run':      funcion(state) que se mide. Si es None, el estado es la funcion a medir
+#   - 'teardown': funcion(state) opcional que se ejecuta sin medir despues de cada ejecucion
+CASES = {}
+
+
+def _case(name, scale='controls'):
+    """
+    - Registra un caso cuyo setup devuelve directamente la funcion a medir.
+    """
+    def _register(function):
+        CASES[name] = {'scale': scale, 'setup': function, 'run': None, 'teardown': None}
+        return function
+    return _register
+
+
+@_case('get_nodesInfo_asDict')
+def _setup_get_nodes_info(rigs, folder):
+    from riggingCodes import Reset_Controls
+    _controls = rigs[0]['controls']
+    return lambda: Reset_Controls.get_nodesInfo_asDict(*_controls)
+
+
+@_case('get_nodesInfo_asTable')
+def _setup_get_nodes_table(rigs, folder):
+    from riggingCodes import Reset_Controls
+    _controls = rigs[0]['controls']
+    return lambda: Reset_Controls.get_nodesInfo_asTable(*_controls)
+
+
+def _setup_hold_poses(read):
+    # Memoria de tener en memoria una pose por personaje, como diccionarios anidados o como PoseTable
+    def _setup(rigs, folder):
+        from riggingCodes import Reset_Controls
+        _read = getattr(Reset_Controls, read)
+        return lambda: [_read(*rig['controls']) for rig in rigs]
+    return _setup
+
+
+_case('hold_poses_dict', scale='characters')(_setup_hold_poses('get_nodesInfo_asDict'))
+_case('hold_poses_table', scale='characters')(_setup_hold_poses('get_nodesInfo_asTable'))
+
+
+@_case('export_dict')
+def _setup_export_dict(rigs, folder):
+    from riggingCodes import Reset_Controls
+    _controls = rigs[0]['controls']
+
+    def _run():
+        # Export completo desde la seleccion, como el boton de la shelf
+        cmds.select(_controls, replace=True)
+        return Reset_Controls.export_dict(fileName="bench", filePath=folder)
+    return _run
+
+
+@_case('export_dict_rig')
+def _setup_export_dict_rig(rigs, folder):
+    from riggingCodes import Reset_Controls
+    _root = rigs[0]['root']
+    cmds.select(clear=True)
+    # Controles del rig sin seleccion (controlDiscovery): la jerarquia se recorre en la primera ejecucion
+    return lambda: Reset_Controls.export_dict(fileName="bench", filePath=folder, rig=_root)
+
+
+@_case('export_dict_tracked')
+def _setup_export_dict_tracked(rigs, folder):
+    from riggingCodes import Reset_Controls
+    _controls = rigs[0]['controls']
+    cmds.select(_controls, replace=True)
+    Reset_Controls.export_dict(fileName="bench", filePath=folder, track=True)
+
+    # El 1% de los controles cambia entre exports (checkpoints frecuentes)
+    _changed = [control for control in _controls[::100]
+                if not cmds.getAttr(control + ".translateX", lock=True)]
+    _state = {'run': 0}
+
+    def _run():
+        # Export incremental (poseTracker): solo se releen los plugs que cambiaron y se escribe el delta
+        _state['run'] += 1
+        for control in _changed:
+            cmds.setAttr(control + ".translateX", _state['run'])
+        return Reset_Controls.export_dict(fileName="bench", filePath=folder)
+    return _run
+
+
+@_case('load_dict')
+def _setup_load_dict(rigs, folder):
+    from riggingCodes import Reset_Controls
+    Reset_Controls.export_dict(dictToExport=Reset_Controls.get_nodesInfo_asDict(*rigs[0]['controls']),
+                               fileName="bench", filePath=folder)
+    return lambda: Reset_Controls.load_dict(fileName="bench", filePath=folder)
+
+
+@_case('load_dict_chunked')
+def _setup_load_dict_chunked(rigs, folder):
+    from riggingCodes import Reset_Controls, jobScheduler
+    Reset_Controls.export_dict(dictToExport=Reset_Controls.get_nodesInfo_asDict(*rigs[0]['controls']),
+                               fileName="bench", filePath=folder)
+
+    def _run():
+        # El mismo load_dict por chunks (jobScheduler), sin esperar al idle: mide el coste de los chunks
+        scheduler = jobScheduler.Scheduler(mode='manual')
+        jobScheduler._SHARED[0], _previous = scheduler, jobScheduler._SHARED[0]
+        try:
+            Reset_Controls.load_dict(fileName="bench", filePath=folder, deferred=True)
+            scheduler.run_all()
+        finally:
+            jobScheduler._SHARED[0] = _previous
+    return _run
+
+
+@_case('restore_snapshot')
+def _setup_restore_snapshot(rigs, folder):
+    from riggingCodes import poseSnapshots
+    _controls = rigs[0]['controls']
+    snapshots = poseSnapshots.SnapshotStack()
+    snapshot = snapshots.capture(*_controls)
+    _changed = [control for control in _controls[::100]
+                if not cmds.getAttr(control + ".translateX", lock=True)]
+    _state = {'run': 0}
+
+    def _run():
+        # El mismo reset que load_dict, desde la pila en memoria: el 1% de los controles cambio
+        _state['run'] += 1
+        for control in _changed:
+            cmds.setAttr(control + ".translateX", _state['run'])
+        return snapshots.restore(snapshot)
+    return _run
+
+
+@_case('reset_to_default', scale='characters')
+def _setup_reset_to_default(rigs, folder):
+    from riggingCodes import Reset_Controls
+    _namespaces = [rig['namespace'] for rig in rigs]
+    _changed = [control for rig in rigs for control in rig['controls'][::100]
+                if not cmds.getAttr(control + ".translateX", lock=True)]
+    _state = {'run': 0}
+
+    def _run():
+        # Reset de todos los personajes a los defaults (sin archivo): el 1% de los controles cambio
+        _state['run'] += 1
+        for control in _changed:
+            cmds.setAttr(control + ".translateX", _state['run'])
+        return Reset_Controls.reset_to_default(namespace=_namespaces)
+    return _run
+
+
+@_case('pose_library_save', scale='characters')
+def _setup_pose_library_save(rigs, folder):
+    from riggingCodes import Reset_Controls, poseLibrary
+    library = poseLibrary.PoseLibrary(os.path.join(folder, "library"))
+    _poses = [Reset_Controls.get_nodesInfo_asTable(*rig['controls']) for rig in rigs]
+    # Los personajes tienen la misma pose: los chunks se guardan una vez (deduplicados)
+    return lambda: [library.save(pose, name=rig['namespace']) for pose, rig in zip(_poses, rigs)]
+
+
+@_case('pose_library_find', scale='characters')
+def _setup_pose_library_find(rigs, folder):
+    from riggingCodes import Reset_Controls, poseLibrary
+    library = poseLibrary.PoseLibrary(os.path.join(folder, "library"))
+    for index, rig in enumerate(rigs):
+        library.save(Reset_Controls.get_nodesInfo_asTable(*rig['controls']), name=rig['namespace'], timestamp=index)
+    _node = rigs[0]['controls'][0].split(':')[-1]
+    _namespace = rigs[-1]['namespace']
+    # Consultas con el indice, sin leer los archivos de las poses
+    return lambda: (library.find(node=_node), library.latest(namespace=_namespace))
+
+
+@_case('auto_snap')
+def _setup_auto_snap(rigs, folder):
+    from riggingCodes import snapIKFK
+
+    def _run():
+        for part in ['arm', 'leg']:
+            for side in ['L', 'R']:
+                snapIKFK.auto_snap(part=part, side=side)
+    return _run
+
+
+def _snap_pose(part, side, source):
+    """
+    - Devuelve la funcion pose(frame) de snapCheck.check_snap, con una pose distinta en cada frame
+        para el sistema origen del snap.
+    - En el stand-in no hay solver de IK: para IK a FK se rotan directamente los joints IK
+        (como los dejaria el solver) y el control IK del extremo se pone en la posicion y orientacion del joint.
+        El snap de FK a IK solo se puede comprobar en Maya.
+    - El codo y la rodilla solo rotan en su eje de bisagra (Y en brazos, Z en piernas), como en snapIKFK.
+    """
+    _first, _middle, _hinge = {'arm': ("shoulder", "elbow", "rotateY"), 'leg': ("hip", "knee", "rotateZ")}[part]
+    if source == 1:
+        _pose = [("{}_{}FK_ctl".format(side, _first), "rotateZ", 1.5),
+                 ("{}_{}FK_ctl".format(side, _first), "rotateX", -1.0),
+                 ("{}_{}FK_ctl".format(side, _middle), _hinge, -2.0)]
+    elif mayaStandIn.is_installed():
+        _pose = [("{}_{}IK_jnt".format(side, _first), "rotateZ", 1.5),
+                 ("{}_{}IK_jnt".format(side, _first), "rotateX", -1.0),
+                 ("{}_{}IK_jnt".format(side, _middle), _hinge, -2.0)]
+    else:
+        _pose = [("{}_{}IK_ctl".format(side, {'arm': "hand", 'leg': "foot"}[part]), "translateY", -0.5),
+                 ("{}_{}PoleVector_ctl".format(side, part), "translateX", 0.5)]
+
+    _end = None
+    if source == 0 and mayaStandIn.is_installed():
+        _end = ("{}_{}IK_jnt".format(side, {'arm': "wrist", 'leg': "ankle"}[part]),
+                "{}_{}IK_ctl".format(side, {'arm': "hand", 'leg': "foot"}[part]))
+
+    def _apply(frame):
+        for node, attr, step in _pose:
+            cmds.setAttr("{}.{}".format(node, attr), step * frame)
+        if _end:
+            # El toe de la pierna sigue al control IK del pie, que en Maya es el que mueve el tobillo
+            cmds.xform(_end[1], worldSpace=True,
+                       translation=cmds.xform(_end[0], query=True, worldSpace=True, translation=True),
+                       rotation=cmds.xform(_end[0], query=True, worldSpace=True, rotation=True))
+    return _apply
+
+
+def check_snaps(frames=24):
+    """
+    - Test de regresion de snapIKFK: construye un biped sintetico y mide el error de cada snap
+        (snapCheck.check_snap) en "frames" frames con una pose distinta en cada uno.
+    - Devuelve la lista de reportes con errores fuera de la tolerancia (vacia si todos los snaps son precisos).
+    """
+    from riggingCodes import snapCheck, syntheticRig
+
+    _new_scene()
+    syntheticRig.build_biped()
+    # Sin solver de IK (stand-in) el snap de FK a IK no mueve los joints del esqueleto
+    _sources = [0] if mayaStandIn.is_installed() else [0, 1]
+    failed = []
+    with _quiet():
+        for part in ['arm', 'leg']:
+            for side in ['L', 'R']:
+                for source in _sources:
+                    report = snapCheck.check_snap(part=part, side=side, start=1, end=frames, source=source,
+                                                  pose=_snap_pose(part, side, source))
+                    if report is None or report.failed:
+                        failed.append(report)
+    return failed
+
+
+@_case('check_snap')
+def _setup_check_snap(rigs, folder):
+    from riggingCodes import snapCheck
+
+    def _run():
+        for part in ['arm', 'leg']:
+            for side in ['L', 'R']:
+                snapCheck.check_snap(part=part, side=side, start=1, end=10, source=0,
+                                     pose=_snap_pose(part, side, 0))
+    return _run
+
+
+@_case('publish_pose')
+def _setup_publish_pose(rigs, folder):
+    from riggingCodes import posePublisher
+    publisher = posePublisher.start(*rigs[0]['controls'])
+    reader = posePublisher.PoseReader(publisher.name)
+
+    def _run():
+        # Una pose publicada en memoria compartida y leida sin copia, en vez de export_dict + json
+        publisher.publish()
+        return reader.read(copy=False)[0]
+    return _run
+
+
+@_case('change_switchSpace')
+def _setup_change_switch_space(rigs, folder):
+    from riggingCodes import Grupos_y_Spaces
+    _controls = [(control, int(cmds.addAttr(control + ".Spaces", query=True, max=True)) + 1)
+                 for control in rigs[0]['spaceControls']]
+    _state = {'run': 0}
+
+    def _run():
+        # Cada ejecucion cambia todos los controles al siguiente space
+        _state['run'] += 1
+        for control, count in _controls:
+            Grupos_y_Spaces.change_switchSpace(controlName=control, space=_state['run'] % count)
+    return _run
+
+
+def _disconnect_all(state):
+    state['connector'].disconnect_namespaces(state['namespaces'])
+
+
+def _connect_all(state):
+    state['connector'].connect_namespaces(state['namespaces'])
+
+
+def _setup_connector(rigs, folder, connected, method='typeA'):
+    connector, namespaces = _write_template(folder, rigs, method)
+    state = {'connector': connector, 'namespaces': namespaces}
+    if connected:
+        _connect_all(state)
+    return state
+
+
+for _scale, _suffix in [('controls', ''), ('characters', '_namespaces')]:
+    CASES['connect' + _suffix] = {'scale': _scale,
+                                  'setup': lambda rigs, folder: _setup_connector(rigs, folder, False),
+                                  'run': _connect_all, 'teardown': _disconnect_all}
+    CASES['disconnect' + _suffix] = {'scale': _scale,
+                                     'setup': lambda rigs, folder: _setup_connector(rigs, folder, True),
+                                     'run': _disconnect_all, 'teardown': _connect_all}
+
+# Metodos matrix: conexion por lotes (se leen todas las matrices antes de crear las redes)
+CASES['connect_matrix'] = {'scale': 'controls',
+                           'setup': lambda rigs, folder: _setup_connector(rigs, folder, False, 'matrixA'),
+                           'run': _connect_all, 'teardown': _disconnect_all}
+CASES['disconnect_matrix'] = {'scale': 'controls',
+                              'setup': lambda rigs, folder: _setup_connector(rigs, folder, True, 'matrixA'),
+                              'run': _disconnect_all, 'teardown': _connect_all}
+
+
+# ------------------------------------------------------------------------------
+# Medicion
+# ------------------------------------------------------------------------------
+@contextlib.contextmanager
+def _quiet():
+    """
+    - Silencia los prints y warnings de las herramientas durante la medicion.
+    """
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            yield
+
+
+def _build(scale, size):
+    from riggingCodes import syntheticRig
+    _new_scene()
+    if scale == 'controls':
+        return [syntheticRig.build_biped(controls=size)]
+    return syntheticRig.build_crowd(characters=size)
+
+
+def measure(name, size, repeat=3, profile=False):
+    """
+    - Ejecuta el caso "name" con un rig de tamano "size" y devuelve un diccionario:
+        {'time': <float>, 'calls': <int o None>, 'memory': <int>, 'build': <float>}
+    - Con profile=True (o sin el stand-in) se hace otra ejecucion con cmdsProfiler,
+        y su CallStats se agrega en 'profile'.
+    """
+    case = CASES[name]
+    folder = tempfile.mkdtemp(prefix="riggingCodes_bench_")
+    try:
+        with _quiet():
+            _start = time.perf_counter()
+            rigs = _build(case['scale'], size)
+            _build_time = time.perf_counter() - _start
+
+            state = case['setup'](rigs, folder)
+            run = state if case['run'] is None else lambda: case['run'](state)
+            # Con --index, el indice de la escena se construye antes de medir (como en una sesion de Maya)
+            from riggingCodes import sceneIndex
+            sceneIndex.active()
+            teardown = (lambda: case['teardown'](state)) if case['teardown'] else None
+
+            # Tiempo: minimo de varias ejecuciones
+            times = []
+            calls = None
+            for index in range(repeat):
+                if mayaStandIn.is_installed():
+                    mayaStandIn.current_scene().reset_stats()
+                _start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - _start)
+                if index == 0 and mayaStandIn.is_installed():
+                    calls = sum(mayaStandIn.current_scene().stats().values())
+                if teardown:
+                    teardown()
+
+            # Memoria: una ejecucion aparte, tracemalloc distorsiona los tiempos
+            tracemalloc.start()
+            try:
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            if teardown:
+                teardown()
+
+            # Llamadas por comando y por funcion: otra ejecucion aparte, con la instrumentacion activa
+            stats = None
+            if profile or not mayaStandIn.is_installed():
+                with cmdsProfiler.profile(name) as stats:
+                    run()
+                if teardown:
+                    teardown()
+                if calls is None:
+                    calls = stats.calls
+    finally:
+        # Los trackers de export_dict_tracked, el cache de controles y los publishers no deben seguir activos
+        # en los siguientes casos
+        from riggingCodes import controlDiscovery, posePublisher, poseTracker
+        poseTracker.stop()
+        controlDiscovery.clear()
+        posePublisher.stop()
+        shutil.rmtree(folder, ignore_errors=True)
+
+    result = {'time': min(times), 'calls': calls, 'memory': peak, 'build': _build_time}
+    if stats is not None:
+        result['profile'] = stats
+    return result
+
+
+def compare(results, baseline, threshold=0.25, minTime=0.005):
+    """
+    - Compara los resultados con una baseline y devuelve la lista de regresiones <str>.
+    - Una metrica es una regresion si es mayor que baseline * (1 + threshold).
+        Las llamadas a maya.cmds son deterministas, asi que cualquier aumento es una regresion.
+    - Los tiempos que empeoran menos de "minTime" segundos se ignoran (ruido de las medidas muy cortas).
+    - Los casos o tamanos que no estan en los dos lados se ignoran.
+    """
+    regressions = []
+    for name, sizes in results.items():
+        for size, values in sizes.items():
+            _base = baseline.get(name, {}).get(size)
+            if not _base:
+                continue
+            for metric in METRICS:
+                current, previous = values.get(metric), _base.get(metric)
+                if current is None or not previous:
+                    continue
+                _limit = previous if metric == 'calls' else previous * (1.0 + threshold)
+                if metric == 'time' and current - previous < minTime:
+                    continue
+                if current > _limit:
+                    regressions.append("{} [{}] {}: {:.4g} -> {:.4g} ({:+.1%})".format(
+                        name, size, metric, previous, current, current / float(previous) - 1.0))
+    return regressions
+
+
+# ------------------------------------------------------------------------------
+# Backends
+# ------------------------------------------------------------------------------
+def _digest(rigs, result):
+    """
+    - Estado de la escena despues de un caso: el valor que devolvio la herramienta,
+        y los atributos del channelBox y la matriz de mundo de todos los controles (siempre leidos con maya.cmds).
+    """
+    from riggingCodes import mayaBackend
+    _reader = mayaBackend.CmdsBackend()
+    _controls = {}
+    for rig in rigs:
+        for control in rig['controls']:
+            _values = dict((attr, _reader.get_plug(control, attr)) for attr in _reader.list_attributes(control))
+            _values['worldMatrix'] = _reader.get_world_matrix(control)
+            _controls[control] = _values
+    return {'result': result, 'controls': _controls}
+
+
+def _differences(current, expected, path="", tolerance=1e-6):
+    """
+    - Compara dos valores (diccionarios, listas, numeros) y devuelve la lista de diferencias <str>.
+    """
+    if isinstance(expected, dict) and isinstance(current, dict):
+        lines = []
+        for key in sorted(set(expected) | set(current), key=str):
+            if key not in current or key not in expected:
+                lines.append("{}/{}: missing in {}".format(path, key, "result" if key not in current else "reference"))
+            else:
+                lines.extend(_differences(current[key], expected[key], "{}/{}".format(path, key), tolerance))
+        return lines
+    if isinstance(expected, (list, tuple)) and isinstance(current, (list, tuple)) and len(expected) == len(current):
+        lines = []
+        for index, (value, reference) in enumerate(zip(current, expected)):
+            lines.extend(_differences(value, reference, "{}[{}]".format(path, index), tolerance))
+        return lines
+    if isinstance(expected, float) or isinstance(current, float):
+        try:
+            if abs(float(current) - float(expected)) <= tolerance:
+                return []
+        except (TypeError, ValueError):
+            pass
+    elif current == expected:
+        return []
+    return ["{}: {!r} != {!r}".format(path or "/", current, expected)]
+
+
+def check_backends(name, size, backends, undoable=True):
+    """
+    - Ejecuta el caso "name" una vez con cada backend, sobre una escena nueva cada vez,
+        y compara el resultado y el estado de la escena con los del primer backend.
+    - Devuelve la lista de diferencias <str> (vacia si todos los backends dan lo mismo).
+    """
+    from riggingCodes import mayaBackend
+    case = CASES[name]
+    _previous = mayaBackend.current()
+    digests = []
+    folder = tempfile.mkdtemp(prefix="riggingCodes_bench_")
+    try:
+        with _quiet():
+            for backend in backends:
+                rigs = _build(case['scale'], size)
+                mayaBackend.use(backend, undoable=undoable)
+                state = case['setup'](rigs, folder)
+                result = state() if case['run'] is None else case['run'](state)
+                digests.append(_digest(rigs, result))
+    finally:
+        mayaBackend._CURRENT[0] = _previous
+        shutil.rmtree(folder, ignore_errors=True)
+
+    lines = []
+    for backend, digest in zip(backends[1:], digests[1:]):
+        lines.extend("{} [{}] {} vs {}: {}".format(name, size, backend, backends[0], line)
+                     for line in _differences(digest, digests[0]))
+    return lines
+
+
+def _format_memory(value):
+    return "{:.2f} MB".format(value / (1024.0 * 1024.0))
+
+
+def main(argv=None):
+    global cmds
+
+    parser = argparse.ArgumentParser(description="Benchmark the riggingCodes tools on synthetic rigs.")
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES,
+                        help="Number of controls of the rig for the per-control cases.")
+    parser.add_argument('--characters', nargs='+', type=int, default=CHARACTERS,
+                        help="Number of characters for the per-namespace cases.")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', default=None, help="Save the results as a JSON baseline.")
+    parser.add_argument('--compare', default=None, help="Compare the results with a JSON baseline.")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed regression over the baseline (0.25 = 25%%).")
+    parser.add_argument('--min-time', type=float, default=0.005,
+                        help="Ignore time regressions smaller than this (seconds).")
+    parser.add_argument('--profile', action='store_true',
+                        help="Print the maya.cmds calls of every case by command and function.")
+    parser.add_argument('--maya', action='store_true', help="Use the real maya.cmds instead of the stand-in.")
+    parser.add_argument('--index', action='store_true', help="Enable the shared scene index (riggingCodes.sceneIndex).")
+    parser.add_argument('--backend', default='cmds', choices=['cmds', 'openmaya'],
+                        help="Execution backend of the tools (riggingCodes.mayaBackend).")
+    parser.add_argument('--bulk', action='store_true',
+                        help="Let the backend write without undo (OpenMaya MDGModifier bulk writes).")
+    parser.add_argument('--check-backends', action='store_true',
+                        help="Check that every available backend gives the same results (smallest size of each case). "
+                             "Needs --maya: the stand-in only has the 'cmds' backend, so the check is skipped.")
+    parser.add_argument('--check-snaps', action='store_true',
+                        help="Check that the snapIKFK snaps don't move the skeleton joints (riggingCodes.snapCheck).")
+    args = parser.parse_args(argv)
+
+    if args.maya:
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+    else:
+        mayaStandIn.install()
+    import maya.cmds
+    cmds = maya.cmds
+    if args.index:
+        from riggingCodes import sceneIndex
+        sceneIndex.enable()
+    from riggingCodes import mayaBackend
+    mayaBackend.use(args.backend, undoable=not args.bulk)
+
+    if args.check_snaps:
+        failed = check_snaps()
+        if failed:
+            print("# {} snaps out of tolerance:".format(len(failed)))
+            for report in failed:
+                print(report.format() if report is not None else "    invalid rig")
+            return 1
+        print("# Every snap is within tolerance.")
+        return 0
+
+    if args.check_backends:
+        _backends = mayaBackend.available()
+        if len(_backends) < 2:
+            print("# Only the {!r} backend is available: nothing to compare, skipping the check "
+                  "(run it with mayapy and --maya).".format(_backends))
+            return 0
+        differences = []
+        for name in args.cases:
+            _sizes = args.sizes if CASES[name]['scale'] == 'controls' else args.characters
+            differences.extend(check_backends(name, min(_sizes), _backends, undoable=not args.bulk))
+        if differences:
+            print("# {} differences between backends {!r}:".format(len(differences), _backends))
+            for line in differences:
+                print("    " + line)
+            return 1
+        print("# Backends {!r} give the same results.".format(_backends))
+        return 0
+
+    results = {}
+    print("{:<24} {:>7} {:>11} {:>9} {:>11} {:>9}".format("case", "size", "time", "calls", "memory", "build"))
+    for name in args.cases:
+        _sizes = args.sizes if CASES[name]['scale'] == 'controls' else args.characters
+        results[name] = {}
+        for size in _sizes:
+            values = measure(name, size, repeat=args.repeat, profile=args.profile)
+            stats = values.pop('profile', None)
+            # Las claves de JSON son str
+            results[name][str(size)] = values
+            print("{:<24} {:>7} {:>9.2f}ms {:>9} {:>11} {:>8.2f}s".format(
+                name, size, values['time'] * 1000.0, values['calls'] if values['calls'] is not None else "-",
+                _format_memory(values['memory']), values['build']))
+            if args.profile and stats is not None:
+                print(stats.report(by=['caller', 'command'], limit=10))
+
+    if args.save:
+        _data = {'meta': {'python': platform.python_version(),
+                          'platform': platform.platform(),
+                          'backend': 'maya' if args.maya else 'standIn',
+                          'toolBackend': args.backend,
+                          'repeat': args.repeat},
+                 'results': results}
+        with open(args.save, "w") as file_to_write:
+            json.dump(_data, file_to_write, indent=4, sort_keys=True)
+        print("# Saved baseline: {!r}".format(args.save))
+
+    if args.compare:
+        with open(args.compare, "r") as file_to_read:
+            _baseline = json.load(file_to_read)
+        regressions = compare(results, _baseline.get('results', {}), args.threshold, args.min_time)
+        if regressions:
+            print("# {} regressions over {!r} (threshold {:.0%}):".format(
+                len(regressions), args.compare, args.threshold))
+            for line in regressions:
+                print("    " + line)
+            return 1
+        print("# No regressions over {!r} (threshold {:.0%}).".format(args.compare, args.threshold))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2219 @@
+"""
+Detalles:
+    - Herramienta para conectar o desconectar los nodos especificados, en base a un archivo externo especificado
+    - El script espera que no existan nodos con los mismos nombres en la escena, a menos que tengan un prefix.
+    - El rig DEBE encontrarse en su posicion inicial a la hora de conectar y desconectar, para evitar desfases.
+    - Importar este modulo no ejecuta nada en la escena.
+    - Ejemplos de uso:
+        from riggingCodes.Conectar_Y_Desconectar import RigConnector
+
+        # Crear un template en base a la seleccion
+        rigCon = RigConnector('C:/Users/user7Desktop'. 'templates.rigConnections')
+        rigCon.export_template()
+
+        # Crear un template con los sources ya encontrados automaticamente
+        rigCon.export_template(destinationRoot='rig01:root', sourceRoot='skel:root')
+
+        # Conectar un rig
+        rigCon = RigConnector('C:/Users/user7Desktop'. 'templates.rigConnections')
+        rigCon.connect()
+
+        # Desconectar un rig
+        rigCon = RigConnector('C:/Users/user7Desktop'. 'templates.rigConnections')
+        rigCon.disconnect()
+
+        # Conectar el mismo template a todos los rigs referenciados en la escena
+        rigCon = RigConnector('C:/Users/user7Desktop'. 'templates.rigConnections')
+        rigCon.connect_namespaces()
+
+Autor:
+    - Sofia Ares Fernandez
+Fecha de actualizacion:
+    13/02/2024 by Sofia:
+        -Create script
+        -Testing and changing spelling mistake
+    19/10/2026:
+        -Bulk existence resolution with a single 'ls' query and consolidated skip report
+        -Transactional connect/disconnect (single undo chunk, rollback or continue on error)
+        -Matrix based connection methods (matrixA, matrixB, matrixC) without constraint nodes
+        -Connection snapshot: idempotent connect and precise disconnect
+        -Dependency ordered connections (parent first) with cycle detection
+        -Multi-namespace fan-out (connect_namespaces / disconnect_namespaces)
+        -Connection method registry with batched handlers (fixes typeC and disconnectMethod dispatch)
+        -Versioned template schema (v2) with upfront validation and compiled SQLite index
+        -Auto match of sources in export_template (name tokens, sides and KD-tree position fallback)
+        -Moved into the riggingCodes package, removed the example code executed on import
+        -resolve_nodes uses the shared scene index when it is enabled
+        -Deferred connect/disconnect in chunks on idle, with progress and cancellation (riggingCodes.jobScheduler)
+        -One structured report per connect/disconnect (riggingCodes.toolReport) instead of a print per entry
+        -export_template can export the controls of a rig (rig argument, riggingCodes.controlDiscovery)
+        -batch_transaction undoes the chunk on any exception, and handler errors of any type fail their entry
+        -matrixA disconnect restores the original offsetParentMatrix; singular matrices fail their entry (RuntimeError)
+        -Disconnect of a template with cycles also runs child first (cycle entries first, in reverse file order)
+        -TemplateIndex.query matches 'root' exactly (case and '_'), like the in-memory filter
+        -Template v3: applySourcePrefix, export_template keeps the namespace of sources in another namespace,
+            and entries whose source is their own destination are rejected (validation and cycles)
+        -export_template only clears applySourcePrefix for matched sources in another namespace
+            (empty sources are filled in by hand with the prefix), and the candidates keep their namespace
+        -upgrade_template leaves non-integer versions to validate_template instead of raising TypeError
+        -Batch connect of the matrix methods: the matrices of a whole group are read before any network is built
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import os
+import heapq
+import math
+import time
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import maya.cmds as cmds
+
+from riggingCodes import controlDiscovery, jobScheduler, mayaBackend, sceneIndex, toolReport
+
+# Politicas posibles ante un error durante connect/disconnect
+_ON_ERROR_POLICIES = ['rollback', 'continue']
+
+
+# Matriz identidad en el formato plano (16 valores, por filas) que usan xform y getAttr
+_IDENTITY_MATRIX = [1.0, 0.0, 0.0, 0.0,
+                    0.0, 1.0, 0.0, 0.0,
+                    0.0, 0.0, 1.0, 0.0,
+                    0.0, 0.0, 0.0, 1.0]
+
+
+# Atributo del multMatrix de matrixA con el offsetParentMatrix del destination antes de conectar
+_ORIGINAL_MATRIX_ATTR = 'originalOffsetParentMatrix'
+
+
+def _matrix_mult(a, b):
+    """
+    - Multiplica dos matrices 4x4 en formato plano (a * b, convencion de Maya: vectores fila).
+    """
+    result = []
+    for row in range(4):
+        for col in range(4):
+            result.append(sum(a[row * 4 + k] * b[k * 4 + col] for k in range(4)))
+    return result
+
+
+def _matrix_inverse(m, node=None):
+    """
+    - Devuelve la inversa de una matriz 4x4 en formato plano (Gauss-Jordan).
+    - Si la matriz no se puede invertir (por ejemplo un nodo con scale 0) lanza RuntimeError,
+        con el nombre de "node" si se especifica, para que la entrada del template falle y se haga el rollback.
+    """
+    _rows = [list(m[row * 4:row * 4 + 4]) + [1.0 if row == col else 0.0 for col in range(4)]
+             for row in range(4)]
+
+    for col in range(4):
+        # Pivot parcial
+        _pivot = max(range(col, 4), key=lambda row: abs(_rows[row][col]))
+        if abs(_rows[_pivot][col]) < 1e-12:
+            if node:
+                raise RuntimeError("The matrix of {!r} is singular (zero scale?) and can't be inverted.".format(node))
+            raise RuntimeError("The matrix is singular and can't be inverted.")
+        _rows[col], _rows[_pivot] = _rows[_pivot], _rows[col]
+
+        _factor = _rows[col][col]
+        _rows[col] = [value / _factor for value in _rows[col]]
+
+        for row in range(4):
+            if row != col and _rows[row][col]:
+                _factor = _rows[row][col]
+                _rows[row] = [value - _factor * pivotValue for value, pivotValue in zip(_rows[row], _rows[col])]
+
+    return [value for row in _rows for value in row[4:]]
+
+
+def _euler_to_matrix(rotation):
+    """
+    - Convierte una rotacion euler en grados (orden xyz, como jointOrient) a una matriz 4x4 en formato plano.
+    """
+    _rx, _ry, _rz = [math.radians(value) for value in rotation]
+    _cx, _sx = math.cos(_rx), math.sin(_rx)
+    _cy, _sy = math.cos(_ry), math.sin(_ry)
+    _cz, _sz = math.cos(_rz), math.sin(_rz)
+
+    _matX = [1.0, 0.0, 0.0, 0.0, 0.0, _cx, _sx, 0.0, 0.0, -_sx, _cx, 0.0, 0.0, 0.0, 0.0, 1.0]
+    _matY = [_cy, 0.0, -_sy, 0.0, 0.0, 1.0, 0.0, 0.0, _sy, 0.0, _cy, 0.0, 0.0, 0.0, 0.0, 1.0]
+    _matZ = [_cz, _sz, 0.0, 0.0, -_sz, _cz, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+    return _matrix_mult(_matrix_mult(_matX, _matY), _matZ)
+
+
+def _is_identity(m, tolerance=1e-9):
+    """
+    - Devuelve True si la matriz en formato plano es (practicamente) la identidad.
+    """
+    return all(abs(value - identity) < tolerance for value, identity in zip(m, _IDENTITY_MATRIX))
+
+
+def _ensure_matrix_nodes():
+    """
+    - Carga el plugin matrixNodes (decomposeMatrix) si no esta cargado.
+    """
+    if not cmds.pluginInfo('matrixNodes', query=True, loaded=True):
+        cmds.loadPlugin('matrixNodes', quiet=True)
+
+
+# Tipos de nodo que forman parte de las redes creadas por los metodos de conexion
+_NETWORK_NODE_TYPES = ['parentConstraint', 'orientConstraint', 'scaleConstraint',
+                       'pointConstraint', 'aimConstraint', 'multMatrix', 'decomposeMatrix']
+
+# Firma de cada metodo de conexion: que plug del destination controla, con que tipo de nodo,
+# y si ademas conecta el scale directamente desde el source.
+_METHOD_SIGNATURES = {'typeA': {'driverPlugs': ['translateX'], 'driverType': 'parentConstraint', 'scale': True},
+                      'typeB': {'driverPlugs': ['rotateX'], 'driverType': 'orientConstraint', 'scale': True},
+                      'typeC': {'driverPlugs': ['scaleX'], 'driverType': 'scaleConstraint', 'scale': False},
+                      'matrixA': {'driverPlugs': ['offsetParentMatrix'], 'driverType': 'multMatrix',
+                                  'scale': False, 'resetMatrix': 'offsetParentMatrix'},
+                      'matrixB': {'driverPlugs': ['rotate', 'rotateX'], 'driverType': 'decomposeMatrix',
+                                  'scale': True},
+                      'matrixC': {'driverPlugs': ['scale', 'scaleX'], 'driverType': 'decomposeMatrix',
+                                  'scale': False}}
+
+
+class ConnectionSnapshot(object):
+    """
+    - Foto de las conexiones de entrada de todos los destinations de un template.
+    - Se toma con una unica consulta 'listConnections' para todos los destinations, mas una consulta por
+        nivel de red (constraint -> source, decomposeMatrix -> multMatrix -> source), por lo que el numero
+        de llamadas no depende del tamaño del template.
+    - En base a la firma de cada metodo (_METHOD_SIGNATURES) permite saber exactamente que conexiones
+        hizo esta herramienta, para que connect no repita conexiones y disconnect solo borre las suyas.
+    - Ejemplo:
+        snapshot = ConnectionSnapshot(['rig01:root', 'rig01:spine'])
+        snapshot.state('skel:root', 'rig01:root', 'typeA')  # 'connected', 'partial', 'free' o 'conflict'
+    """
+    def __init__(self, nodes):
+        # {<str node>: {<str attr>: <str sourcePlug>}}
+        self.incoming = {}
+        # {<str node>: <str nodeType>}
+        self.types = {}
+
+        _frontier = list(nodes)
+        while _frontier:
+            _pairs = cmds.listConnections(_frontier, source=True, destination=False,
+                                          connections=True, plugs=True) or []
+            _upstream = set()
+            for _dstPlug, _srcPlug in zip(_pairs[::2], _pairs[1::2]):
+                _node, _attr = _dstPlug.split('.', 1)
+                self.incoming.setdefault(_node, {})[_attr] = _srcPlug
+                _upstream.add(_srcPlug.split('.', 1)[0])
+
+            for _node in _frontier:
+                self.incoming.setdefault(_node, {})
+
+            # Tipos de los nodos nuevos, en una sola consulta
+            _new = [_node for _node in _upstream if _node not in self.types]
+            if _new:
+                _typed = cmds.ls(_new, showType=True) or []
+                self.types.update(zip(_typed[::2], _typed[1::2]))
+
+            # Solo seguimos subiendo por los nodos de red que aun no conocemos
+            _frontier = [_node for _node in _new
+                         if self.types.get(_node) in _NETWORK_NODE_TYPES and _node not in self.incoming]
+
+    @staticmethod
+    def _node(plug):
+        return plug.split('.', 1)[0]
+
+    def _network(self, node):
+        """
+        - Devuelve el nodo de red especificado mas todos los nodos de red que lo alimentan.
+        """
+        _result = []
+        _pending = [node]
+        while _pending:
+            _node = _pending.pop()
+            if _node in _result:
+                continue
+            _result.append(_node)
+            for _srcPlug in self.incoming.get(_node, {}).values():
+                _srcNode = self._node(_srcPlug)
+                if self.types.get(_srcNode) in _NETWORK_NODE_TYPES:
+                    _pending.append(_srcNode)
+        return _result
+
+    def _classify(self, sourceNode, destinationNode, method):
+        """
+        - Clasifica las conexiones del destinationNode segun la firma del metodo.
+        - Devolvera un diccionario con el formato:
+            {'nodes': <list nodos de red hechos desde el sourceNode>,
+             'plugs': <list (sourcePlug, destinationPlug) conexiones directas hechas desde el sourceNode>,
+             'foreign': <list destinationPlugs controlados por otra cosa>,
+             'missing': <int conexiones esperadas que no existen>}
+        """
+        signature = _METHOD_SIGNATURES[method]
+        _incoming = self.incoming.get(destinationNode, {})
+        result = {'nodes': [], 'plugs': [], 'foreign': [], 'missing': 0}
+
+        # Nodo de red que controla el destination (constraint o matrices)
+        _driver = ''
+        for _attr in signature['driverPlugs']:
+            if _attr in _incoming:
+                _driver = _attr
+                break
+
+        if not _driver:
+            result['missing'] += 1
+        else:
+            _driverNode = self._node(_incoming[_driver])
+            _network = self._network(_driverNode)
+            _inputs = set(self._node(_srcPlug) for _node in _network
+                          for _srcPlug in self.incoming.get(_node, {}).values())
+
+            if self.types.get(_driverNode) == signature['driverType'] and sourceNode in _inputs:
+                result['nodes'].extend(_network)
+            else:
+                result['foreign'].append("{}.{}".format(destinationNode, _driver))
+
+        # Conexiones directas de scale
+        if signature['scale']:
+            for axis in "XYZ":
+                _attr = "scale{}".format(axis)
+                _srcPlug = _incoming.get(_attr)
+                if not _srcPlug:
+                    result['missing'] += 1
+                elif _srcPlug == "{}.{}".format(sourceNode, _attr):
+                    result['plugs'].append((_srcPlug, "{}.{}".format(destinationNode, _attr)))
+                else:
+                    result['foreign'].append("{}.{}".format(destinationNode, _attr))
+
+        return result
+
+    def state(self, sourceNode, destinationNode, method):
+        """
+        - Devuelve el estado de la conexion de una entrada:
+            'connected': todas las conexiones del metodo existen y vienen del sourceNode.
+            'partial': solo existen algunas de las conexiones del metodo.
+            'free': no existe ninguna conexion del metodo.
+            'conflict': algun plug del metodo esta controlado por otro nodo.
+            None: el metodo no tiene firma conocida.
+        """
+        if method not in _METHOD_SIGNATURES:
+            return None
+
+        _classified = self._classify(sourceNode, destinationNode, method)
+        if _classified['foreign']:
+            return 'conflict'
+        if not _classified['missing']:
+            return 'connected'
+        if _classified['nodes'] or _classified['plugs']:
+            return 'partial'
+        return 'free'
+
+    def owned(self, sourceNode, destinationNode, method):
+        """
+        - Devuelve las conexiones que esta herramienta hizo para una entrada: (nodes, plugs).
+            nodes: nodos de red a borrar.
+            plugs: lista de (sourcePlug, destinationPlug) a desconectar.
+        """
+        if method not in _METHOD_SIGNATURES:
+            return [], []
+
+        _classified = self._classify(sourceNode, destinationNode, method)
+        return _classified['nodes'], _classified['plugs']
+
+    def conflicts(self, sourceNode, destinationNode, method):
+        """
+        - Devuelve los plugs del destinationNode que el metodo necesita y controla otro nodo.
+        """
+        if method not in _METHOD_SIGNATURES:
+            return []
+        return self._classify(sourceNode, destinationNode, method)['foreign']
+
+
+# Version actual del formato de los archivos .rigConnections
+# v1: sin campo 'version'.
+# v2: campo 'version' y 'path' (path completo sin prefix) opcional en cada entrada.
+# v3: campo 'applySourcePrefix' opcional en cada entrada (por defecto el valor de 'applyPrefix'),
+#     para sources de otro namespace que el destination.
+TEMPLATE_VERSION = 3
+
+# Formato de las tablas del indice compilado (TemplateIndex). Los indices de otro formato se recompilan.
+_INDEX_FORMAT = 2
+
+# Numero maximo de errores que se detallan en el reporte de validacion
+_MAX_REPORTED_ERRORS = 20
+
+
+def validate_template(data):
+    """
+    - Valida la estructura de la data de un template en una unica pasada, antes de conectar nada.
+    - Comprueba: la version, el prefix, que cada entrada tenga source (y que no sea el mismo destination),
+        que los metodos esten registrados (ver register_connection_method) y el tipo de applyPrefix
+        y applySourcePrefix.
+    - Devolvera una lista de errores <str>. Si la lista esta vacia, el template es valido.
+    """
+    if not isinstance(data, dict):
+        return ["The template data is not a dictionary."]
+
+    errors = []
+    version = data.get('version', 1)
+    if not isinstance(version, int) or version < 1:
+        errors.append("Invalid template version: {!r}".format(version))
+    elif version > TEMPLATE_VERSION:
+        errors.append("The template version {} is newer than the supported version {}.".format(
+            version, TEMPLATE_VERSION))
+
+    if not isinstance(data.get('prefix', ''), str):
+        errors.append("Invalid prefix: {!r}".format(data.get('prefix')))
+
+    database = data.get('database')
+    if not isinstance(database, dict):
+        errors.append("The template has no valid 'database' dictionary.")
+        return errors
+
+    _methods = set(get_connection_methods())
+    for key, values in database.items():
+        if not isinstance(values, dict):
+            errors.append("{!r}: the entry is not a dictionary.".format(key))
+            continue
+
+        if not values.get('source'):
+            errors.append("{!r}: empty source.".format(key))
+
+        _connectMethod = values.get('connectMethod', '')
+        if _connectMethod not in _methods:
+            errors.append("{!r}: unknown connectMethod {!r}.".format(key, _connectMethod))
+
+        _disconnectMethod = values.get('disconnectMethod', '')
+        if _disconnectMethod and _disconnectMethod not in _methods:
+            errors.append("{!r}: unknown disconnectMethod {!r}.".format(key, _disconnectMethod))
+
+        if not isinstance(values.get('applyPrefix', False), bool):
+            errors.append("{!r}: applyPrefix must be a bool.".format(key))
+
+        if not isinstance(values.get('applySourcePrefix', False), bool):
+            errors.append("{!r}: applySourcePrefix must be a bool.".format(key))
+        elif (values.get('source') == key and
+              values.get('applySourcePrefix', values.get('applyPrefix', False)) == values.get('applyPrefix', False)):
+            errors.append("{!r}: the source is the destination itself.".format(key))
+
+    return errors
+
+
+def upgrade_template(data):
+    """
+    - Actualiza la data de un template de una version anterior a TEMPLATE_VERSION (en el mismo diccionario).
+    - Las versiones que no son un numero entero no se tocan: validate_template las reporta como error.
+    - Devolvera la data actualizada.
+    """
+    if not isinstance(data, dict):
+        return data
+    version = data.get('version', 1)
+    if isinstance(version, int) and version < TEMPLATE_VERSION:
+        # v1 -> v2 -> v3: solo se actualiza la version, 'path' y 'applySourcePrefix' son opcionales
+        data['version'] = TEMPLATE_VERSION
+    return data
+
+
+class TemplateIndex(object):
+    """
+    - Indice compilado (SQLite) de un template, para templates muy grandes (10k+ entradas).
+    - Permite consultas parciales sin cargar ni recorrer el archivo .rigConnections completo:
+        - Todas las entradas bajo un nodo de la jerarquia (necesita el campo 'path' de la version 2).
+        - Todas las entradas de un metodo.
+    - El indice guarda el tamaño y la fecha del archivo original, para saber si ha quedado desactualizado.
+    - Ejemplo:
+        index = TemplateIndex.compile(data, 'C:/templates/body.rigConnections.db', 'C:/templates/body.rigConnections')
+        index.query(root='spine_01', method='typeA')
+    """
+    def __init__(self, indexPath):
+        import sqlite3
+
+        if not os.path.isfile(indexPath):
+            raise OSError("The index {!r} was not found.".format(indexPath))
+
+        self.indexPath = indexPath
+        self._connection = sqlite3.connect(indexPath)
+
+    @classmethod
+    def compile(cls, data, indexPath, sourcePath=None):
+        """
+        - Compila la data de un template en un indice SQLite en "indexPath", sobreescribiendolo si existe.
+        - Si se especifica "sourcePath", se guarda su tamaño y fecha para detectar cambios.
+        - Devolvera el TemplateIndex.
+        """
+        import sqlite3
+
+        if os.path.isfile(indexPath):
+            os.remove(indexPath)
+
+        connection = sqlite3.connect(indexPath)
+        with connection:
+            connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, source TEXT, connectMethod TEXT, "
+                               "disconnectMethod TEXT, applyPrefix INTEGER, applySourcePrefix INTEGER, path TEXT)")
+            connection.execute("CREATE INDEX entries_method ON entries (connectMethod)")
+            connection.execute("CREATE INDEX entries_path ON entries (path)")
+
+            _meta = {'version': data.get('version', 1),
+                     'indexFormat': _INDEX_FORMAT,
+                     'prefix': data.get('prefix', '')}
+            if sourcePath:
+                _stat = os.stat(sourcePath)
+                _meta['sourceSize'] = _stat.st_size
+                _meta['sourceMtime'] = _stat.st_mtime
+            connection.executemany("INSERT INTO meta VALUES (?, ?)",
+                                   [(key, json.dumps(value)) for key, value in _meta.items()])
+
+            connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                   [(key,
+                                     values.get('source', ''),
+                                     values.get('connectMethod', ''),
+                                     values.get('disconnectMethod', ''),
+                                     int(bool(values.get('applyPrefix', False))),
+                                     int(bool(values.get('applySourcePrefix', values.get('applyPrefix', False)))),
+                                     values.get('path', ''))
+                                    for key, values in data.get('database', {}).items()])
+        connection.close()
+
+        return cls(indexPath)
+
+    def meta(self, key, default=None):
+        """
+        - Devuelve un valor de la tabla meta del indice.
+        """
+        _row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(_row[0]) if _row else default
+
+    def is_stale(self, sourcePath):
+        """
+        - Devuelve True si el archivo original cambio desde que se compilo el indice,
+            o si el indice tiene otro formato de tablas.
+        """
+        if not os.path.isfile(sourcePath) or self.meta('indexFormat', 1) != _INDEX_FORMAT:
+            return True
+        _stat = os.stat(sourcePath)
+        return (self.meta('sourceSize') != _stat.st_size or
+                self.meta('sourceMtime') != _stat.st_mtime)
+
+    def query(self, root=None, method=None):
+        """
+        - Devuelve las entradas del template que cumplen los filtros, en el mismo formato que
+            RigConnector._compile_template.
+        - Argumentos opcionales:
+            -root       <str> Nombre (sin prefix) de un nodo de la jerarquia: devuelve el nodo y todos los que
+                                tengan ese nodo en su 'path'.
+            -method     <str> Devuelve solo las entradas con ese connectMethod.
+        """
+        _sql = "SELECT key, source, connectMethod, disconnectMethod, applyPrefix, applySourcePrefix, path FROM entries"
+        _where = []
+        _args = []
+        if root:
+            # instr y no LIKE: LIKE no distingue mayusculas y toma '_' como comodin (mismo filtro que _filter_template)
+            _where.append("(key = ? OR instr(path || '|', ?) > 0)")
+            _args.extend([root, "|{}|".format(root)])
+        if method:
+            _where.append("connectMethod = ?")
+            _args.append(method)
+        if _where:
+            _sql += " WHERE " + " AND ".join(_where)
+
+        return [{'key': key,
+                 'source': source,
+                 'connectMethod': connectMethod,
+                 'disconnectMethod': disconnectMethod,
+                 'applyPrefix': bool(applyPrefix),
+                 'applySourcePrefix': bool(applySourcePrefix),
+                 'path': path}
+                for key, source, connectMethod, disconnectMethod, applyPrefix, applySourcePrefix, path
+                in self._connection.execute(_sql, _args)]
+
+    def close(self):
+        self._connection.close()
+
+
+# Tokens de tipo de nodo que se ignoran al comparar nombres (auto match)
+_NAME_TYPE_TOKENS = ['jnt', 'joint', 'jj', 'bind', 'bnd', 'skin', 'skn', 'ctl', 'ctrl', 'con', 'drv', 'driver',
+                     'grp', 'group', 'offset', 'zero', 'loc', 'null', 'srt', 'xform']
+
+# Tokens de lado: {<str token>: <str lado normalizado>}
+_SIDE_TOKENS = {'l': 'L', 'lf': 'L', 'lft': 'L', 'left': 'L',
+                'r': 'R', 'rt': 'R', 'rgt': 'R', 'right': 'R',
+                'c': 'C', 'ct': 'C', 'ctr': 'C', 'mid': 'C', 'center': 'C', 'centre': 'C'}
+
+
+def _split_name_tokens(name):
+    """
+    - Divide un nombre en tokens en minusculas, por '_' y por cambios camelCase:
+        'rig01:L_shoulderFK_ctl' -> ['l', 'shoulder', 'fk', 'ctl']
+    """
+    # Quitamos el path y el prefix
+    name = name.split('|')[-1].split(':')[-1]
+
+    tokens = []
+    for _part in name.split('_'):
+        _current = ''
+        for i, _char in enumerate(_part):
+            _prev = _part[i - 1] if i else ''
+            _next = _part[i + 1] if i + 1 < len(_part) else ''
+            # Nuevo token en: aB, a1, 1a, y ABc (el ultimo de una serie de mayusculas)
+            if _current and (
+                    (_char.isupper() and (_prev.islower() or _prev.isdigit() or _next.islower())) or
+                    (_char.isdigit() != _prev.isdigit())):
+                tokens.append(_current.lower())
+                _current = ''
+            _current += _char
+        if _current:
+            tokens.append(_current.lower())
+    return tokens
+
+
+def name_match_key(name):
+    """
+    - Devuelve la clave normalizada de un nombre para el auto match: (<str lado>, <tuple tokens>).
+        El lado se busca en el primer y ultimo token, y los tokens de tipo de nodo se ignoran:
+        'rig01:L_shoulder_jnt', 'Left_shoulder_ctl' y 'shoulder_l' -> ('L', ('shoulder',))
+    """
+    tokens = _split_name_tokens(name)
+
+    side = 'C'
+    if len(tokens) > 1 and tokens[0] in _SIDE_TOKENS:
+        side = _SIDE_TOKENS[tokens.pop(0)]
+    elif len(tokens) > 1 and tokens[-1] in _SIDE_TOKENS:
+        side = _SIDE_TOKENS[tokens.pop()]
+
+    return side, tuple(token for token in tokens if token not in _NAME_TYPE_TOKENS)
+
+
+class _KDTree(object):
+    """
+    - KD-tree en 3D para buscar los nodos mas cercanos a una posicion sin comparar con todos (O(log n)).
+    - Cada nodo del arbol es una tupla: (point, name, axis, left, right).
+    """
+    def __init__(self, points):
+        # points: [(<list [x, y, z]>, <str name>), ...]
+        self._root = self._build(list(points), 0)
+
+    def _build(self, points, depth):
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda item: item[0][axis])
+        median = len(points) // 2
+        return (points[median][0], points[median][1], axis,
+                self._build(points[:median], depth + 1),
+                self._build(points[median + 1:], depth + 1))
+
+    def nearest(self, point, count=2):
+        """
+        - Devuelve los "count" nodos mas cercanos a "point": [(<float distancia>, <str name>), ...]
+        """
+        best = []
+
+        def _search(node):
+            if node is None:
+                return
+            _point, _name, axis, left, right = node
+
+            _distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(point, _point)))
+            best.append((_distance, _name))
+            best.sort()
+            del best[count:]
+
+            _diff = point[axis] - _point[axis]
+            _near, _far = (left, right) if _diff < 0 else (right, left)
+            _search(_near)
+            # Solo bajamos por la otra rama si puede tener algo mas cercano
+            if len(best) < count or abs(_diff) < best[-1][0]:
+                _search(_far)
+
+        _search(self._root)
+        return best
+
+
+def auto_match(destinations, sources, **kwargs):
+    """
+    - Busca el source de cada destination:
+        01) Por nombre: ambas jerarquias se indexan por su clave normalizada (ver name_match_key).
+        02) Por posicion: si no hay coincidencia por nombre, o hay varias, se busca el source mas
+            cercano en world space con un KD-tree.
+    - Argumentos opcionales:
+        -tolerance      <float> Distancia maxima para el match por posicion, y diferencia minima entre
+                                los dos candidatos mas cercanos para no considerarlo ambiguo.
+                                Valor default: 0.01.
+    - Devolvera un diccionario con el formato:
+        {<str destination>: {'source': <str o ''>,
+                             'match': <str 'name', 'position' o ''>,
+                             'ambiguous': <bool>,
+                             'candidates': <list str>}}
+    """
+    tolerance = kwargs.get('tolerance', 0.01)
+
+    # Indice de los sources por nombre normalizado
+    _byKey = {}
+    for source in sources:
+        _byKey.setdefault(name_match_key(source), []).append(source)
+
+    result = {}
+    _pending = []
+    for destination in destinations:
+        _candidates = _byKey.get(name_match_key(destination), [])
+        result[destination] = {'source': '',
+                               'match': '',
+                               'ambiguous': False,
+                               'candidates': list(_candidates)}
+        if len(_candidates) == 1:
+            result[destination]['source'] = _candidates[0]
+            result[destination]['match'] = 'name'
+        else:
+            _pending.append(destination)
+
+    if not _pending:
+        return result
+
+    # Fallback por posicion: solo consultamos las posiciones si hacen falta
+    def _position(node):
+        return cmds.xform(node, query=True, worldSpace=True, translation=True)
+
+    _tree = _KDTree([(_position(source), source) for source in sources])
+    for destination in _pending:
+        _entry = result[destination]
+        _nearest = _tree.nearest(_position(destination), count=2)
+        if not _nearest or _nearest[0][0] > tolerance:
+            # Sin match: si habia varios candidatos por nombre, es ambiguo
+            _entry['ambiguous'] = bool(_entry['candidates'])
+            continue
+
+        _entry['source'] = _nearest[0][1]
+        _entry['match'] = 'position'
+        # Ambiguo si habia varios candidatos por nombre o si los dos mas cercanos estan igual de cerca
+        if _entry['candidates'] and _entry['source'] not in _entry['candidates']:
+            _entry['ambiguous'] = True
+        elif len(_nearest) > 1 and _nearest[1][0] - _nearest[0][0] < tolerance:
+            _entry['ambiguous'] = True
+            _entry['candidates'] = [name for _, name in _nearest]
+
+    return result
+
+
+class _Transaction(object):
+    """
+    - Estado de una transaccion abierta con batch_transaction.
+    """
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.rolledBack = False
+        self._rollbackRequested = False
+
+    def rollback(self):
+        """
+        - Pide deshacer el undo chunk completo de la transaccion.
+        - El undo se ejecuta al cerrar la transaccion, una vez cerrado el chunk.
+        """
+        if self.enabled:
+            self._rollbackRequested = True
+
+
+@contextmanager
+def batch_transaction(chunkName, enabled=True):
+    """
+    - Context manager para ejecutar muchas operaciones como una unica transaccion:
+        01) Abre un unico undo chunk (un solo paso en el undo queue, y permite el rollback completo).
+        02) Suspende el refresh del viewport.
+        03) Difiere la evaluacion: el evaluation manager pasa a modo DG mientras dura la transaccion,
+            para que el grafo paralelo no se reconstruya tras cada nodo o conexion nueva.
+    - Si el undo esta desactivado, se activa (sin vaciar el queue) mientras dura la transaccion.
+    - Si una excepcion sale del bloque, el chunk se deshace completo (como con rollback) y la excepcion sigue.
+    - Si "enabled" es False no hace nada, y las operaciones se ejecutan una a una como siempre.
+    """
+    _transaction = _Transaction(enabled)
+    if not enabled:
+        yield _transaction
+        return
+
+    _undoState = cmds.undoInfo(query=True, state=True)
+    if not _undoState:
+        cmds.undoInfo(stateWithoutFlush=True)
+
+    _emMode = (cmds.evaluationManager(query=True, mode=True) or ['off'])[0]
+
+    cmds.undoInfo(openChunk=True, chunkName=chunkName)
+    cmds.refresh(suspend=True)
+    if _emMode != 'off':
+        cmds.evaluationManager(mode='off')
+
+    try:
+        yield _transaction
+    except BaseException:
+        # Cualquier error que no controlo la operacion deshace todo lo que ya se aplico en el chunk
+        _transaction.rollback()
+        raise
+    finally:
+        if _emMode != 'off':
+            cmds.evaluationManager(mode=_emMode)
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+
+        # Deshacemos el chunk completo (antes de restaurar el estado del undo)
+        if _transaction._rollbackRequested:
+            cmds.undo()
+            _transaction.rolledBack = True
+
+        if not _undoState:
+            cmds.undoInfo(stateWithoutFlush=False)
+
+
+class RigConnector:
+    def __init__(self, file_path, file_name):
+        # Verificamos el path
+        self.filePath = file_path
+        if not os.path.exists(self.filePath):
+            raise OSError("The path {!r} was not found.".format(self.filePath))
+
+        # Verificamos que el archivo existe
+        self.fileName = file_name
+        # Verificamos el path completo del archivo incluyendo el directorio
+        self.full_filePath = os.path.join(self.filePath, self.fileName)
+        self.valid_fullFilePath = False
+        self.msg_invalid_file = ("This file {!r} doesn't exist. Only export method can ".format(self.full_filePath) +
+                                 "be used until an existing file is set.")
+
+        # Variable que guardara la informacion de los archivos externos
+        self.data = {}
+        # Errores de validacion de la data (ver validate_template)
+        self.errors = []
+
+        # Analizar si el full_filePath existe
+        if not os.path.exists(self.full_filePath):
+            # Si no existe
+            print(self.msg_invalid_file)
+            self.valid_fullFilePath = False
+
+        # Si existe
+        else:
+            self.valid_fullFilePath = True
+            self.get_data()
+
+    @staticmethod
+    def _list_hierarchy(root):
+        """
+        - Devuelve el nodo "root" y todos los transforms (incluyendo joints) de su jerarquia.
+        """
+        if not cmds.objExists(root):
+            raise ValueError("The node {!r} doesn't exist.".format(root))
+
+        _descendants = cmds.listRelatives(root, allDescendents=True) or []
+        return [root] + list(reversed(cmds.ls(_descendants, type='transform') or []))
+
+# Exportar el archivo template
+
+    def export_template(self, **kwargs):
+        """
+        - En base a la seleccion, exporta una base de datos template en el directorio especificado.
+        - Este metodo espera que no hayan otros nodos con el mismo nombre en la escena,
+            y su uso en esas condiciones puede ser inestable.
+        - Este metodo unicamente se basa en crear un template simple, por lo que el prefix adquirido sera unicamente
+        el del primer objeto de la seleccion y no es detallado para el resto de los objetos.
+        - Si el archivo ya existe, lo creara con otro nombre.
+        - Si el argumetno 'update' es True, los valores de la clase se actualizaran en base a los input
+            del path y de este metodo
+        - Argumentos opcionales:
+            -destinationRoot    <str> En vez de la seleccion, exporta este nodo y toda su jerarquia.
+                                    Valor default: None.
+            -rig                <str/list> En vez de la seleccion, exporta los controles de este rig
+                                    (ver controlDiscovery).
+                                    Valor default: None.
+            -sourceRoot         <str> Si se especifica, se activa el auto match: se busca el source de cada
+                                    destination en esta jerarquia por nombre y, si no, por posicion
+                                    (ver auto_match). Las entradas encontradas reciben el "defaultMethod",
+                                    y las dudosas se marcan con 'ambiguous': True y sus 'candidates'.
+                                    Valor default: None.
+            -defaultMethod      <str> Metodo de conexion para las entradas encontradas con el auto match.
+                                    Valor default: 'typeA'.
+            -tolerance          <float> Tolerancia del auto match por posicion.
+                                    Valor default: 0.01.
+        - El formato necesario para el diccionario de data sera:
+            {'version': <int TEMPLATE_VERSION>,
+             'prefix' : <str>,
+                'database':
+                    {<str targetNodeName>:
+                        {'source': <str>,
+                        'connectMethod': <str>,
+                        'disconnectMethod': <str>,
+                        'applyPrefix': <bool>,
+                        'applySourcePrefix': <bool> False si el source esta en otro namespace
+                                            (y entonces 'source' incluye su namespace),
+                        'path': <str path completo en la jerarquia, sin prefix>
+                    }
+        }
+        """
+        file_name = kwargs.get('fileName', self.fileName)
+        file_path = kwargs.get('filePath', self.filePath)
+        update = kwargs.get('update', True)
+        destination_root = kwargs.get('destinationRoot')
+        rig = kwargs.get('rig')
+        source_root = kwargs.get('sourceRoot')
+        default_method = kwargs.get('defaultMethod', 'typeA')
+
+        # Analizamos la seleccion, o la jerarquia especificada
+        if destination_root:
+            _selection = self._list_hierarchy(destination_root)
+        elif rig:
+            _selection = list(controlDiscovery.controls(rig))
+        else:
+            _selection = cmds.ls(sl=True)
+
+        # Si no hay seleccion
+        if not _selection:
+            raise ValueError("Please select at least one object for the template creation.")
+
+        # Creamos el template donde guardamos el prefijo de la data
+        _data = {'version': TEMPLATE_VERSION}
+
+        # Conseguimos el prefijo de la seleccion
+        _sel = _selection[0]  # Por ejemplo: rig01:root
+        _symb = ':'
+        _hasPrefix = False # Por defecto es False
+
+        if _symb in _sel:  # Si existe ":" en el nombre
+            _split = _sel.split(_symb)  # Divide el nombre en: ["rig01", "root"]
+            _data['prefix'] = _split[0]  # El primer elemento sera el prefijo: "rig01"
+
+            # Si se encuentra ':'
+            _hasPrefix = True
+
+        # Paths completos de la seleccion, en una sola consulta (mismo orden que la seleccion)
+        _longNames = cmds.ls(_selection, long=True) or []
+
+        # Auto match de los sources
+        _matches = {}
+        if source_root:
+            _matches = auto_match(_selection, self._list_hierarchy(source_root),
+                                  tolerance=kwargs.get('tolerance', 0.01))
+
+        # Guardamos la data
+        _data['database'] = {}
+        for eachNode, eachLong in zip(_selection, _longNames):
+            _match = _matches.get(eachNode, {})
+
+            # Filtramos el prefijo, si existe
+            if _symb in eachNode:
+                eachNode = eachNode.split(_symb)[-1]
+
+            # Path sin el prefijo en cada nivel: |rig01:root|rig01:spine -> |root|spine
+            _path = "|".join(_token.split(_symb)[-1] for _token in eachLong.split("|"))
+
+            # El source guarda su namespace si no es el del destination (por ejemplo skel:root -> rig01:root).
+            # Los sources vacios (sin match, se completan a mano) usan el prefijo, como applyPrefix.
+            _source = _match.get('source', '')
+            _sourceNamespace = _source.rpartition(_symb)[0]
+            _sameNamespace = _sourceNamespace == _data.get('prefix', '')
+            if _sameNamespace:
+                _source = _source.split(_symb)[-1]
+
+            _data['database'][eachNode] = {'source': _source,
+                                           'connectMethod': default_method if _source else '',
+                                           'disconnectMethod': '',
+                                           'applyPrefix': _hasPrefix,
+                                           'applySourcePrefix': _hasPrefix and (not _source or _sameNamespace),
+                                           'path': _path}
+
+            # Marcamos los matches dudosos para revisarlos a mano (los candidatos con su namespace)
+            if _match.get('ambiguous'):
+                _data['database'][eachNode]['ambiguous'] = True
+                _data['database'][eachNode]['candidates'] = list(_match['candidates'])
+
+        if _matches:
+            _found = [each for each in _matches.values() if each['source']]
+            _ambiguous = [name for name, each in _matches.items() if each['ambiguous']]
+            print("# Auto match: {} of {} entries matched ({} by position), {} ambiguous: {!r}".format(
+                len(_found), len(_matches), len([each for each in _found if each['match'] == 'position']),
+                len(_ambiguous), _ambiguous))
+
+        # Verificamos el path
+        if not os.path.exists(file_path):
+            raise OSError("The path {!r} was not found.".format(file_path))
+
+        # Verificamos el fichero
+        _fullFilePath = os.path.join(file_path, file_name)
+
+        # Si el fichero existe, creamos un nuevo fichero con un nuevo nombre que incluye el timepo
+        if os.path.exists(_fullFilePath):
+
+            # Añadimos un sufijo con el timepo actual
+            # si el nombre tiene multiples "." el resultado puede ser inesperado
+            # recomendacion de que el nombre tenga un unico "."
+            _now = datetime.now() # Convertimos el valor en string
+            _suffix = _now.strftime("%Y%m%d_%H%M%S")  #20230213
+            _raw_file_name = file_name.split('.')[0]  # Por ejemplo: myFile
+            _raw_extension = file_name.split('.')[1]  # Por ejemplo: json
+            _new_raw_file_name = "{}_{}".format(_raw_file_name, _suffix)  # Por ejemplo: myFile_20230213_193720
+            _new_file_name = "{}.{}".format(_new_raw_file_name, _raw_extension)
+            _fullFilePath = os.path.join(file_path, _new_file_name)
+
+        # Escribimos la data en el archivo
+        with open(_fullFilePath, "w") as file_to_write:
+            json.dump(_data, file_to_write, indent=4)
+
+        print("Exported successfully to: {!r}".format(_fullFilePath))
+
+        # Update del path, si se especifica
+        if update:
+            self.set_file_path(filePath=file_path, fileName=file_name, silent=True)  # Para que no imprima la ultima
+                                                                                    # linea de get_data()
+
+
+    def set_file_path(self, **kwargs):
+        """
+        - Metodo para setear el path y/o file de la clase.
+        """
+        # Variable para silenciar los prints y que no aparezcan cada vex que se ejecute esta parte del script
+        silent = kwargs.get('silent', False)
+
+        # Verificamos el path
+        self.filePath = kwargs.get('filePath', self.filePath)
+
+        # Si el path no existe
+        if not os.path.exists(self.filePath):
+            raise OSError("The path {!r} was not found.".format(self.filePath))
+
+        # Verificamos el fichero
+        _fileName = kwargs.get('fileName', self.fileName)
+        self.full_filePath = os.path.join(self.filePath, _fileName)
+
+        # Verificamos si existe o no
+        # Si no existe
+        if not os.path.exists(self.full_filePath):
+            print(self.msg_invalid_file)
+            self.valid_fullFilePath = False
+
+        # Si existe
+        else:
+            self.valid_fullFilePath = True
+            self.get_data(silent=silent)
+
+    def get_data(self, **kwargs):
+        """
+        - Intentara leer la data del archivo especificado.
+        - La data se actualiza a la version actual del formato y se valida una unica vez al leerla.
+            Los errores se guardan en self.errors y se imprimen en un unico reporte.
+        """
+        # Variable para silenciar los prints y que no aparezcan cada vex que se ejecute esta parte del script
+        silent = kwargs.get('silent', False)
+
+        # Verificamos si valid.fullFilePath es True
+        if not self.valid_fullFilePath:
+            print(self.msg_invalid_file)
+            return
+
+        # Usar Python's context manager para leer el archivo
+        with open(self.full_filePath, "r") as file_to_read:
+            self.data = upgrade_template(json.load(file_to_read))
+
+        # Validacion de toda la data de una vez
+        self.errors = validate_template(self.data)
+        if self.errors:
+            _shown = self.errors[:_MAX_REPORTED_ERRORS]
+            cmds.warning("{} errors found in {!r}:\n    {}{}".format(
+                len(self.errors), self.full_filePath, "\n    ".join(_shown),
+                "\n    (...)" if len(self.errors) > len(_shown) else ""))
+
+        if not silent:
+            print("File read properly: {!r}".format(self.full_filePath))
+
+    @staticmethod
+    def con_typeA(sourceNode, destinationNode):
+        """
+        - Metodo de conexion.
+        - La conexion se realizara de la siguiente manera:
+            01) Parent Constraint del objeto source al objeto destinado.
+            02) Conexion directa de los atributos scale.
+        """
+        # Aplicamos parentConstraint
+        cmds.parentConstraint(sourceNode, destinationNode, mo=True, weight=True)
+        # Aplicamos parentConstraint
+        for axis in "xyz":
+            cmds.connectAttr("{}.s{}".format(sourceNode, axis),  # scaleX == sx
+                             "{}.s{}".format(destinationNode, axis))
+
+    @staticmethod
+    def con_typeB(sourceNode, destinationNode):
+        """
+        - Metodo de conexion.
+        - La conexion se realizara de la siguiente manera:
+            01) Orient Constraint del objeto source al objeto destinado.
+            02) Conexion directa de los atributos scale.
+        """
+        # Aplicamos parentConstraint
+        cmds.orientConstraint(sourceNode, destinationNode, mo=True, weight=True)
+        # Aplicamos parentConstraint
+        for axis in "xyz":
+            cmds.connectAttr("{}.s{}".format(sourceNode, axis),  # scaleX == sx
+                             "{}.s{}".format(destinationNode, axis))
+
+    @staticmethod
+    def con_typeC(sourceNode, destinationNode):
+        """
+        - Metodo de conexion.
+        - La conexion se realizara de la siguiente manera:
+            01) Scale Constraint del objeto source al objeto destinado.
+        - El scaleConstraint ya controla los atributos scale, por lo que no se conectan directamente.
+        """
+        # Aplicamos scaleConstraint
+        cmds.scaleConstraint(sourceNode, destinationNode, mo=True, weight=True)
+
+    @staticmethod
+    def _disconnect_owned(pairs, method, snapshot=None):
+        """
+        - Desconexion precisa comun a todos los metodos: solo borra los nodos de red y desconecta
+            los plugs que se hicieron desde el sourceNode con ese metodo (ver ConnectionSnapshot).
+        - Recibe todas las parejas [(sourceNode, destinationNode), ...] de un mismo metodo a la vez,
+            y borra los nodos de red de todas ellas con una unica llamada a 'delete'.
+        - Si no se pasa un snapshot, se toma uno para todos los destinationNodes.
+        - Devolvera la lista de destinationNodes que tenian algo que desconectar.
+        """
+        if snapshot is None:
+            snapshot = ConnectionSnapshot([destinationNode for _, destinationNode in pairs])
+
+        # Algunos metodos dejan un atributo de matriz que hay que restaurar (offsetParentMatrix)
+        _resetMatrix = _METHOD_SIGNATURES.get(method, {}).get('resetMatrix')
+
+        _nodes = []
+        _plugs = []
+        _changed = []
+        _restore = []
+        for sourceNode, destinationNode in pairs:
+            nodes, plugs = snapshot.owned(sourceNode, destinationNode, method)
+            if nodes or plugs:
+                _changed.append(destinationNode)
+                if _resetMatrix:
+                    # Valor antes de conectar, guardado en el nodo de red (antes de borrarlo)
+                    _restore.append((destinationNode, RigConnector._original_matrix(nodes)))
+            _nodes.extend(_node for _node in nodes if _node not in _nodes)
+            _plugs.extend(plugs)
+
+        if _nodes:
+            cmds.delete(_nodes)
+        for _srcPlug, _dstPlug in _plugs:
+            cmds.disconnectAttr(_srcPlug, _dstPlug)
+
+        for destinationNode, matrix in _restore:
+            cmds.setAttr("{}.{}".format(destinationNode, _resetMatrix), matrix, type='matrix')
+
+        return _changed
+
+    @staticmethod
+    def _original_matrix(nodes):
+        """
+        - Devuelve la matriz guardada al conectar en alguno de los nodos de red (ver con_matrixA),
+            o la identidad si ninguno la tiene.
+        """
+        for node in nodes:
+            if cmds.attributeQuery(_ORIGINAL_MATRIX_ATTR, node=node, exists=True):
+                return cmds.getAttr("{}.{}".format(node, _ORIGINAL_MATRIX_ATTR))
+        return _IDENTITY_MATRIX
+
+    @staticmethod
+    def discon_typeA(sourceNode, destinationNode, snapshot=None):
+        """
+        - Metodo de desconexion.
+        - El rig DEBE estar reseteado en su posicion inicial.
+        - La desconexion se realizara de la siguiente manera:
+            01) Se obtiene el nodo parentContraint desde el destinationNode y se elimina,
+                solo si tiene como target al sourceNode.
+            02) Se desconecta los atributos de scale que vienen del sourceNode.
+        """
+        RigConnector._disconnect_owned([(sourceNode, destinationNode)], 'typeA', snapshot)
+
+    @staticmethod
+    def discon_typeB(sourceNode, destinationNode, snapshot=None):
+        """
+        - Metodo de desconexion.
+        - El rig DEBE estar reseteado en su posicion inicial.
+        - La desconexion se realizara de la siguiente manera:
+            01) Se obtiene el nodo orientContraint desde el destinationNode y se elimina,
+                solo si tiene como target al sourceNode.
+            02) Se desconecta los atributos de scale que vienen del sourceNode.
+        """
+        RigConnector._disconnect_owned([(sourceNode, destinationNode)], 'typeB', snapshot)
+
+    @staticmethod
+    def discon_typeC(sourceNode, destinationNode, snapshot=None):
+        """
+        - Metodo de desconexion.
+        - El rig DEBE estar reseteado en su posicion inicial.
+        - La desconexion se realizara eliminando el nodo scaleContraint del destinationNode,
+            solo si tiene como target al sourceNode.
+        """
+        RigConnector._disconnect_owned([(sourceNode, destinationNode)], 'typeC', snapshot)
+
+    @staticmethod
+    def _matrix_node_name(destinationNode, suffix):
+        """
+        - Nombre para los nodos de matrices creados por los metodos matrix, en base al destinationNode.
+        """
+        # Quitamos el path y el prefix (los ':' no son validos en un nombre nuevo)
+        return "{}_{}".format(destinationNode.split('|')[-1].replace(':', '_'), suffix)
+
+    @staticmethod
+    def _create_offset_network(sourceNode, destinationNode, offset, tail=None, suffix="conMtx"):
+        """
+        - Crea el nodo multMatrix comun a los metodos matrix:
+            matrixIn[0]: offset calculado al conectar (maintain offset).
+            matrixIn[1]: sourceNode.worldMatrix[0]
+            matrixIn[2]: destinationNode.parentInverseMatrix[0]
+            matrixIn[3]: "tail" constante, solo si se especifica y no es la identidad.
+        - El plugin matrixNodes ya tiene que estar cargado (ver _ensure_matrix_nodes).
+        - Devolvera el nombre del nodo multMatrix.
+        """
+        mult = cmds.createNode('multMatrix', name=RigConnector._matrix_node_name(destinationNode, suffix + "_mmx"))
+        cmds.setAttr("{}.matrixIn[0]".format(mult), offset, type='matrix')
+        cmds.connectAttr("{}.worldMatrix[0]".format(sourceNode), "{}.matrixIn[1]".format(mult))
+        cmds.connectAttr("{}.parentInverseMatrix[0]".format(destinationNode), "{}.matrixIn[2]".format(mult))
+
+        if tail and not _is_identity(tail):
+            cmds.setAttr("{}.matrixIn[3]".format(mult), tail, type='matrix')
+
+        return mult
+
+    @staticmethod
+    def _get_local_tail(destinationNode, jointOrient=False):
+        """
+        - Matriz constante que lleva el espacio del padre al espacio local de rotacion del destinationNode:
+            inverse(offsetParentMatrix) y, si se pide, inverse(jointOrient) para los joints.
+        """
+        tail = _matrix_inverse(cmds.getAttr("{}.offsetParentMatrix".format(destinationNode)), destinationNode)
+
+        if jointOrient and cmds.attributeQuery('jointOrient', node=destinationNode, exists=True):
+            _jointOrient = cmds.getAttr("{}.jointOrient".format(destinationNode))[0]
+            tail = _matrix_mult(tail, _matrix_inverse(_euler_to_matrix(_jointOrient), destinationNode))
+
+        return tail
+
+    @staticmethod
+    def con_matrixA(sourceNode, destinationNode):
+        """
+        - Metodo de conexion ligero, equivalente a typeA (parentConstraint + scale) sin constraints.
+        - La conexion se realizara de la siguiente manera:
+            01) Se calcula el offset entre ambos nodos en el momento de conectar (maintain offset).
+            02) multMatrix(offset, source.worldMatrix, destination.parentInverseMatrix)
+                conectado al offsetParentMatrix del destinationNode.
+        - Los valores locales del destinationNode no se modifican, y el offsetParentMatrix original se guarda
+            en el multMatrix, por lo que al desconectar vuelve exactamente a su posicion.
+        """
+        RigConnector._connect_matrix_pair(sourceNode, destinationNode, 'matrixA')
+
+    @staticmethod
+    def con_matrixB(sourceNode, destinationNode):
+        """
+        - Metodo de conexion ligero, equivalente a typeB (orientConstraint + scale) sin constraints.
+        - La conexion se realizara de la siguiente manera:
+            01) Se calcula el offset entre ambos nodos en el momento de conectar (maintain offset).
+            02) multMatrix -> decomposeMatrix, con outputRotate conectado al rotate del destinationNode.
+                El jointOrient de los joints se compensa dentro de la misma red.
+            03) Conexion directa de los atributos scale.
+        """
+        RigConnector._connect_matrix_pair(sourceNode, destinationNode, 'matrixB')
+
+    @staticmethod
+    def con_matrixC(sourceNode, destinationNode):
+        """
+        - Metodo de conexion ligero, equivalente a typeC (scaleConstraint) sin constraints.
+        - La conexion se realizara de la siguiente manera:
+            01) Se calcula el offset entre ambos nodos en el momento de conectar (maintain offset).
+            02) multMatrix -> decomposeMatrix, con outputScale conectado al scale del destinationNode.
+        """
+        RigConnector._connect_matrix_pair(sourceNode, destinationNode, 'matrixC')
+
+    @staticmethod
+    def _matrix_offset(sourceNode, destinationNode, method, backend):
+        """
+        - Lecturas de los metodos matrix (sin modificar la escena): devuelve (offset, tail) de la red
+            del destinationNode (ver _create_offset_network).
+        """
+        _srcWorld = backend.get_world_matrix(sourceNode)
+        _dstWorld = backend.get_world_matrix(destinationNode)
+
+        if method == 'matrixA':
+            # world = local * offsetParentMatrix * parentWorld
+            # => offset = inverse(local) * world * inverse(sourceWorld)
+            _dstLocal = cmds.getAttr("{}.matrix".format(destinationNode))
+            offset = _matrix_mult(_matrix_mult(_matrix_inverse(_dstLocal, destinationNode), _dstWorld),
+                                  _matrix_inverse(_srcWorld, sourceNode))
+            return offset, None
+
+        # offset = world * inverse(sourceWorld), el resto de la cadena lo deja en espacio local
+        offset = _matrix_mult(_dstWorld, _matrix_inverse(_srcWorld, sourceNode))
+        return offset, RigConnector._get_local_tail(destinationNode, jointOrient=method == 'matrixB')
+
+    @staticmethod
+    def _build_matrix_network(sourceNode, destinationNode, method, offset, tail):
+        """
+        - Crea y conecta la red de un metodo matrix con el offset ya calculado (ver _matrix_offset).
+        """
+        mult = RigConnector._create_offset_network(sourceNode, destinationNode, offset, tail=tail, suffix=method)
+
+        if method == 'matrixA':
+            # El offsetParentMatrix original se guarda en el multMatrix, para restaurarlo al desconectar
+            _original = cmds.getAttr("{}.offsetParentMatrix".format(destinationNode))
+            cmds.addAttr(mult, longName=_ORIGINAL_MATRIX_ATTR, dataType='matrix')
+            cmds.setAttr("{}.{}".format(mult, _ORIGINAL_MATRIX_ATTR), _original, type='matrix')
+            cmds.connectAttr("{}.matrixSum".format(mult), "{}.offsetParentMatrix".format(destinationNode))
+            return
+
+        decompose = cmds.createNode('decomposeMatrix',
+                                    name=RigConnector._matrix_node_name(destinationNode, method + "_dcm"))
+        cmds.connectAttr("{}.matrixSum".format(mult), "{}.inputMatrix".format(decompose))
+        if method == 'matrixC':
+            cmds.connectAttr("{}.outputScale".format(decompose), "{}.scale".format(destinationNode))
+            return
+
+        cmds.connectAttr("{}.rotateOrder".format(destinationNode), "{}.inputRotateOrder".format(decompose))
+        cmds.connectAttr("{}.outputRotate".format(decompose), "{}.rotate".format(destinationNode))
+        for axis in "xyz":
+            cmds.connectAttr("{}.s{}".format(sourceNode, axis),  # scaleX == sx
+                             "{}.s{}".format(destinationNode, axis))
+
+    @staticmethod
+    def _connect_matrix_pair(sourceNode, destinationNode, method):
+        """
+        - Conexion de una sola pareja con un metodo matrix (con_matrixA/B/C): los errores se lanzan.
+        """
+        _ensure_matrix_nodes()
+        offset, tail = RigConnector._matrix_offset(sourceNode, destinationNode, method, mayaBackend.current())
+        RigConnector._build_matrix_network(sourceNode, destinationNode, method, offset, tail)
+
+    @staticmethod
+    def _connect_matrix(pairs, method, snapshot=None):
+        """
+        - Conexion por lotes de los metodos matrix: recibe todas las parejas [(sourceNode, destinationNode), ...]
+            de un lote a la vez.
+        - Primero se leen las matrices y se calculan los offsets de todas las parejas, y despues se crean
+            todas las redes: la escena no se vuelve a evaluar entre conexion y conexion.
+            Las parejas de un mismo lote no dependen entre si (ver schedule_entries), y las redes mantienen
+            el offset, asi que crear una red no cambia las matrices de las demas.
+        - Una pareja que falla (por ejemplo una matriz singular) no detiene las demas.
+        - Devolvera un diccionario {indice de la pareja: error} con las parejas que fallaron.
+        """
+        _ensure_matrix_nodes()
+        _backend = mayaBackend.current()
+
+        failed = {}
+        _networks = []
+        for index, (sourceNode, destinationNode) in enumerate(pairs):
+            try:
+                _networks.append((index, sourceNode, destinationNode)
+                                 + RigConnector._matrix_offset(sourceNode, destinationNode, method, _backend))
+            except Exception as e:
+                failed[index] = e
+
+        for index, sourceNode, destinationNode, offset, tail in _networks:
+            try:
+                RigConnector._build_matrix_network(sourceNode, destinationNode, method, offset, tail)
+            except Exception as e:
+                failed[index] = e
+        return failed
+
+    @staticmethod
+    def discon_matrixA(sourceNode, destinationNode, snapshot=None):
+        """
+        - Metodo de desconexion de con_matrixA.
+        - La desconexion se realizara de la siguiente manera:
+            01) Se obtiene el multMatrix conectado al offsetParentMatrix del destinationNode y se elimina,
+                solo si su source es el sourceNode.
+            02) Se restaura el offsetParentMatrix que tenia antes de conectar (la identidad en conexiones antiguas).
+        """
+        RigConnector._disconnect_owned([(sourceNode, destinationNode)], 'matrixA', snapshot)
+
+    @staticmethod
+    def discon_matrixB(sourceNode, destinationNode, snapshot=None):
+        """
+        - Metodo de desconexion de con_matrixB.
+        - El rig DEBE estar reseteado en su posicion inicial.
+        - La desconexion se realizara de la siguiente manera:
+            01) Se obtienen los nodos decomposeMatrix y multMatrix desde el destinationNode y se eliminan,
+                solo si su source es el sourceNode.
+            02) Se desconecta los atributos de scale que vienen del sourceNode.
+        """
+        RigConnector._disconnect_owned([(sourceNode, destinationNode)], 'matrixB', snapshot)
+
+    @staticmethod
+    def discon_matrixC(sourceNode, destinationNode, snapshot=None):
+        """
+        - Metodo de desconexion de con_matrixC.
+        - El rig DEBE estar reseteado en su posicion inicial.
+        - La desconexion se realizara eliminando los nodos decomposeMatrix y multMatrix conectados al scale,
+            solo si su source es el sourceNode.
+        """
+        RigConnector._disconnect_owned([(sourceNode, destinationNode)], 'matrixC', snapshot)
+
+    def _reload_data(self):
+        """
+        - Refresca la data desde el archivo antes de conectar o desconectar.
+        - Devolvera True si la data se pudo leer, False en caso contrario.
+        """
+        # Si el archivo no es valido
+        if not self.valid_fullFilePath:
+            print(self.msg_invalid_file)
+            return False
+
+        # verificamos que el full_filePath exista (por si el objeto a sido modificado o eliminado)
+        if not os.path.exists(self.full_filePath):
+            print(self.msg_invalid_file)
+
+            # verificamos no existe
+            self.valid_fullFilePath = False
+            return False
+
+        # Si existe
+        self.valid_fullFilePath = True
+        self.get_data(silent=True)
+        return True
+
+    def _compile_template(self):
+        """
+        - Compila la database del template una unica vez en una lista de entradas sin prefix.
+        - Devolvera una lista de diccionarios con el formato:
+            {'key': <str nombreEnElTemplate>,
+             'source': <str>,
+             'connectMethod': <str>,
+             'disconnectMethod': <str>,
+             'applyPrefix': <bool>,
+             'applySourcePrefix': <bool>,
+             'path': <str>}
+        """
+        database = self.data.get('database', {})
+
+        _template = []
+        for key, values in database.items():
+            _template.append({'key': key,
+                              'source': values.get('source', ''),
+                              'connectMethod': values.get('connectMethod', ''),
+                              'disconnectMethod': values.get('disconnectMethod', ''),
+                              'applyPrefix': values.get('applyPrefix', False),
+                              'applySourcePrefix': values.get('applySourcePrefix', values.get('applyPrefix', False)),
+                              'path': values.get('path', '')})
+        return _template
+
+    def _compile_entries(self, prefixes=None, template=None):
+        """
+        - Compila la database del template en una lista de entradas con los nombres completos
+            (con el prefix aplicado si la entrada lo pide), una vez por cada prefix especificado.
+        - Si no se especifican prefixes, se usa el prefix del archivo.
+        - Las entradas sin applyPrefix son iguales para todos los prefixes, y solo se incluyen una vez.
+        - Devolvera una lista de diccionarios con el formato:
+            {'key': <str nombreEnElTemplate>,
+             'namespace': <str prefix aplicado>,
+             'destination': <str>,
+             'source': <str>,
+             'connectMethod': <str>,
+             'disconnectMethod': <str>}
+        """
+        if prefixes is None:
+            prefixes = [self.data.get('prefix', '')]
+        if template is None:
+            template = self._compile_template()
+
+        _entries = []
+        _seen = set()
+        for prefix in prefixes:
+            for values in template:
+                destination = values['key']
+                source = values['source']
+
+                # Analizamos el prefix (el source puede estar en otro namespace, con applySourcePrefix False)
+                if values['applyPrefix'] and prefix:
+                    destination = "{}:{}".format(prefix, destination)
+                if values.get('applySourcePrefix', values['applyPrefix']) and prefix and source:
+                    source = "{}:{}".format(prefix, source)
+
+                if destination in _seen:
+                    continue
+                _seen.add(destination)
+
+                _entries.append({'key': values['key'],
+                                 'namespace': prefix if values['applyPrefix'] else '',
+                                 'destination': destination,
+                                 'source': source,
+                                 'connectMethod': values['connectMethod'],
+                                 'disconnectMethod': values['disconnectMethod']})
+        return _entries
+
+    @staticmethod
+    def resolve_nodes(names):
+        """
+        - Resuelve la existencia de todos los nodos especificados con una unica consulta 'ls',
+            en vez de un 'objExists' por nodo. Si el indice de la escena esta activo no hace falta ninguna consulta.
+        - Devolvera una tupla de sets: (found, missing).
+        """
+        _names = set(names)
+        if not _names:
+            return set(), set()
+
+        _index = sceneIndex.active()
+        if _index is not None:
+            _found = set(name for name in _names if _index.exists(name))
+            return _found, _names - _found
+
+        # 'ls' ignora los nodos que no existen, asi que una sola llamada resuelve todo el template
+        _existing = cmds.ls(list(_names)) or []
+
+        _found = set()
+        for eachNode in _existing:
+            _found.add(eachNode)
+            # Si el nombre no es unico 'ls' puede devolver el path completo (|grp|node)
+            _found.add(eachNode.split('|')[-1])
+        _found &= _names
+
+        return _found, _names - _found
+
+    def _resolve_entries(self, entries):
+        """
+        - Separa las entradas compiladas en validas y descartadas, resolviendo la existencia
+            de todos los nodos del template de una vez (ver resolve_nodes).
+        - Devolvera una tupla: (validEntries, report), donde report tiene el formato:
+            {'found': <set>,
+             'missing': <set>,
+             'noSource': <list destinations>,
+             'skipped': <list destinations>}
+        """
+        _names = set()
+        for entry in entries:
+            _names.add(entry['destination'])
+            if entry['source']:
+                _names.add(entry['source'])
+
+        found, missing = self.resolve_nodes(_names)
+
+        _valid = []
+        report = {'found': found,
+                  'missing': missing,
+                  'noSource': [],
+                  'skipped': []}
+
+        for entry in entries:
+            # Si no hay source
+            if not entry['source']:
+                report['noSource'].append(entry['destination'])
+                continue
+
+            # Si alguno de los nodos no existe
+            if entry['destination'] in missing or entry['source'] in missing:
+                report['skipped'].append(entry['destination'])
+                continue
+
+            _valid.append(entry)
+
+        return _valid, report
+
+    @staticmethod
+    def schedule_entries(entries):
+        """
+        - Ordena las entradas para conectarlas de padre a hijo, en base a un grafo de dependencias:
+            - Si el source de una entrada es el destination de otra (rigs encadenados),
+                esa otra entrada va primero.
+            - Si un ancestro en la jerarquia de la escena del destination o del source de una entrada
+                es el destination de otra entrada, esa otra entrada va primero.
+        - La jerarquia se obtiene con una unica consulta 'ls' de paths completos.
+        - Las entradas se ordenan por nivel de dependencias (guardado en entry['level']),
+            y dentro de un mismo nivel se mantiene el orden del archivo.
+        - Una entrada cuyo source es su propio destination (o un nodo de su jerarquia) depende de si misma,
+            y se devuelve como un ciclo de una entrada.
+        - Devolvera una tupla: (orderedEntries, cycles).
+            Si hay ciclos, orderedEntries no incluye las entradas implicadas y cycles es una lista
+            de ciclos, cada uno como lista de destinations: [[<str>, <str>, ...], ...].
+        """
+        _index = {}
+        for i, entry in enumerate(entries):
+            _index[entry['destination']] = i
+
+        # Paths completos de todos los nodos, en una sola consulta
+        _names = set(_index)
+        for entry in entries:
+            _names.add(entry['source'])
+
+        _longNames = {}
+        for _long in cmds.ls(list(_names), long=True) or []:
+            _longNames[_long.split('|')[-1]] = _long
+
+        # Dependencias: {<int index>: set(<int index que debe ir antes>)}
+        _dependencies = dict((i, set()) for i in range(len(entries)))
+        for i, entry in enumerate(entries):
+            _parent = _index.get(entry['source'])
+            if _parent is not None:
+                _dependencies[i].add(_parent)
+
+            for _node in [entry['destination'], entry['source']]:
+                # Ancestro mas cercano que sea destination de otra entrada (el resto es transitivo)
+                for _ancestor in reversed(_longNames.get(_node, '').split('|')[1:-1]):
+                    _parent = _index.get(_ancestor)
+                    if _parent is not None:
+                        _dependencies[i].add(_parent)
+                        break
+
+        # Orden topologico (Kahn), usando el orden del archivo para desempatar
+        _children = dict((i, []) for i in _dependencies)
+        for i, _parents in _dependencies.items():
+            for _parent in _parents:
+                _children[_parent].append(i)
+
+        _pending = dict((i, len(_parents)) for i, _parents in _dependencies.items())
+        _ready = [i for i, count in _pending.items() if not count]
+        heapq.heapify(_ready)
+
+        _ordered = []
+        while _ready:
+            i = heapq.heappop(_ready)
+            _ordered.append(i)
+            for _child in _children[i]:
+                _pending[_child] -= 1
+                if not _pending[_child]:
+                    heapq.heappush(_ready, _child)
+
+        # Nivel de cada entrada: las entradas de un mismo nivel no dependen entre si
+        _levels = {}
+        for i in _ordered:
+            _levels[i] = max([_levels[_parent] + 1 for _parent in _dependencies[i]] or [0])
+            entries[i]['level'] = _levels[i]
+        _ordered.sort(key=lambda i: (_levels[i], i))
+
+        # Las entradas que no se pudieron ordenar forman parte de algun ciclo (o dependen de uno)
+        cycles = []
+        _blocked = set(i for i, count in _pending.items() if count)
+        _visited = set()
+        for _start in sorted(_blocked):
+            if _start in _visited:
+                continue
+            # Seguimos dependencias bloqueadas hasta repetir un nodo: eso es un ciclo
+            _path = []
+            _node = _start
+            while _node not in _path and _node not in _visited:
+                _path.append(_node)
+                _node = min(_parent for _parent in _dependencies[_node] if _parent in _blocked)
+            if _node in _path:
+                cycles.append([entries[each]['destination'] for each in _path[_path.index(_node):]])
+            _visited.update(_path)
+
+        return [entries[i] for i in _ordered], cycles
+
+    @staticmethod
+    def _group_entries(entries):
+        """
+        - Agrupa las entradas ordenadas en lotes consecutivos del mismo nivel de dependencias y del mismo metodo,
+            para que cada handler reciba todas sus entradas de una vez sin romper el orden padre-hijo.
+        - Devolvera una lista de tuplas: [(<str metodo>, [entries]), ...]
+        """
+        groups = []
+        _current = {}
+        _currentLevel = None
+        for entry in entries:
+            _level = entry.get('level', 0)
+            if _level != _currentLevel:
+                _currentLevel = _level
+                _current = {}
+
+            if entry['method'] not in _current:
+                _current[entry['method']] = []
+                groups.append((entry['method'], _current[entry['method']]))
+            _current[entry['method']].append(entry)
+        return groups
+
+    def _run_entries(self, entries, mode, **kwargs):
+        """
+        - Ejecuta todas las entradas resueltas en modo 'connect' o 'disconnect'.
+        - Cada metodo se busca en el registro de metodos (ver register_connection_method), y sus entradas
+            se le pasan agrupadas por nivel de dependencias (ver _group_entries).
+        - En disconnect se usa 'disconnectMethod', y si esta vacio, 'connectMethod'.
+        - Argumentos opcionales:
+            -transaction    <bool> Si es True, todo el template se ejecuta dentro de un unico undo chunk,
+                                    con el refresh suspendido y la evaluacion diferida (ver batch_transaction).
+                                    Valor default: True.
+            -onError        <str> Politica ante el primer error: 'rollback' deshace todo el template,
+                                    'continue' registra el error y sigue con la siguiente entrada.
+                                    Sin transaccion no hay rollback posible: 'rollback' solo detiene el proceso.
+                                    Valor default: 'rollback'.
+            -snapshot       <ConnectionSnapshot> Snapshot de las conexiones de los destinations.
+                                    Valor default: se toma uno nuevo para todas las entradas.
+        - Con el snapshot, connect es idempotente: las entradas ya conectadas no se repiten ('unchanged'),
+            las conectadas a medias se limpian antes de conectar, y las que tienen sus plugs controlados
+            por otro nodo no se tocan ('conflict').
+        - Devolvera un diccionario con el formato:
+            {'entries': [{'destination': <str>, 'source': <str>, 'method': <str>,
+                          'status': <str>, 'error': <str>}],
+             'noMethod': <list destinations>,
+             'rolledBack': <bool>,
+             'time': <float segundos>}
+            Los status posibles son: 'done', 'unchanged', 'conflict', 'failed', 'skipped' y 'rolledBack'.
+        """
+        transaction = kwargs.get('transaction', True)
+        on_error = kwargs.get('onError', 'rollback')
+
+        if on_error not in _ON_ERROR_POLICIES:
+            raise ValueError("Invalid onError policy {!r}. Use one of the following: {!r}".format(
+                on_error, _ON_ERROR_POLICIES))
+
+        _start = time.time()
+        result = {'entries': [],
+                  'noMethod': [],
+                  'rolledBack': False,
+                  'time': 0.0}
+
+        # Metodo de cada entrada
+        for entry in entries:
+            if mode == 'connect':
+                entry['method'] = entry['connectMethod']
+            else:
+                entry['method'] = entry['disconnectMethod'] or entry['connectMethod']
+
+        # Una unica foto de las conexiones de todo el template
+        snapshot = kwargs.get('snapshot')
+        if snapshot is None:
+            snapshot = ConnectionSnapshot([entry['destination'] for entry in entries])
+
+        with batch_transaction("RigConnector_{}".format(mode), enabled=transaction) as _transaction:
+            for methodName, group in self._group_entries(entries):
+                handler = _CONNECTION_METHODS.get(methodName)
+
+                _todo = []
+                _partial = []
+                for entry in group:
+                    _status = {'destination': entry['destination'],
+                               'source': entry['source'],
+                               'method': methodName,
+                               'status': 'done',
+                               'error': ''}
+                    result['entries'].append(_status)
+
+                    if handler is None:
+                        _status['status'] = 'skipped'
+                        result['noMethod'].append(entry['destination'])
+                        continue
+
+                    # Connect idempotente en base al snapshot
+                    if mode == 'connect':
+                        _state = snapshot.state(entry['source'], entry['destination'], methodName)
+                        if _state == 'connected':
+                            _status['status'] = 'unchanged'
+                            continue
+                        if _state == 'conflict':
+                            _status['status'] = 'conflict'
+                            _status['error'] = "Already driven by another node: {!r}".format(
+                                snapshot.conflicts(entry['source'], entry['destination'], methodName))
+                            continue
+                        if _state == 'partial':
+                            _partial.append((entry['source'], entry['destination']))
+
+                    _todo.append((entry, _status))
+
+                if not _todo:
+                    continue
+
+                _failed = False
+                try:
+                    # Si alguna entrada esta conectada a medias, limpiamos primero lo que hizo esta herramienta
+                    if _partial:
+                        self._disconnect_owned(_partial, methodName, snapshot)
+
+                    _failed = self._call_handler(handler, mode, _todo, snapshot)
+                except Exception as e:
+                    # Un error en un handler por lotes afecta a todo el lote
+                    for _, _status in _todo:
+                        _status['status'] = 'failed'
+                        _status['error'] = str(e).strip()
+                    _failed = True
+
+                # Si la politica es rollback, paramos en el primer error
+                if _failed and on_error == 'rollback':
+                    _transaction.rollback()
+                    break
+
+        if _transaction.rolledBack:
+            result['rolledBack'] = True
+            for _status in result['entries']:
+                if _status['status'] == 'done':
+                    _status['status'] = 'rolledBack'
+
+        result['time'] = time.time() - _start
+        return result
+
+    @staticmethod
+    def _call_handler(handler, mode, todo, snapshot):
+        """
+        - Llama al handler de un metodo con las entradas de un lote [(entry, status), ...].
+            - Handlers por lotes: una unica llamada con todas las parejas y el snapshot. Pueden devolver
+                {indice de la pareja: error} con las entradas que fallaron.
+            - Handlers simples: una llamada por entrada, con (sourceNode, destinationNode).
+        - Devolvera True si alguna entrada fallo.
+        """
+        _function = handler.connect if mode == 'connect' else handler.disconnect
+        _batch = handler.batchConnect if mode == 'connect' else handler.batchDisconnect
+
+        if _batch:
+            _failed = _function([(entry['source'], entry['destination']) for entry, _ in todo], snapshot) or {}
+            for index, e in _failed.items():
+                _status = todo[index][1]
+                _status['status'] = 'failed'
+                _status['error'] = str(e).strip()
+            return bool(_failed)
+
+        _failed = False
+        for entry, _status in todo:
+            try:
+                _function(entry['source'], entry['destination'])
+            except Exception as e:
+                _status['status'] = 'failed'
+                _status['error'] = str(e).strip()
+                _failed = True
+        return _failed
+
+    @staticmethod
+    def _build_report(mode, result, report, cycles=None):
+        """
+        - Junta el resultado de la ejecucion de un template (ver _run_entries) y las entradas descartadas
+            al resolverlo en un unico reporte (ver toolReport), que se emite una vez al final,
+            en vez de un print o un warning por cada entrada.
+        """
+        summary = toolReport.Report("RigConnector {}".format(mode))
+
+        for _status in result['entries']:
+            if _status['status'] in ['failed', 'conflict']:
+                summary.fail('failed', "{!r} -> {!r}: {}".format(_status['source'], _status['destination'],
+                                                                 _status['error']))
+            elif _status['status'] == 'skipped':
+                continue
+            else:
+                summary.add(_status['status'], _status['destination'])
+
+        if report['missing']:
+            summary.count('skipped', len(report['skipped']))
+            for _missing in sorted(report['missing']):
+                summary.fail('missing', _missing)
+        for destination in report['noSource']:
+            summary.fail('noSource', destination)
+        for destination in result['noMethod']:
+            summary.fail('noMethod', destination)
+
+        for _cycle in cycles or []:
+            summary.warn("Cycle found in the template: {}".format(" -> ".join(_cycle + _cycle[:1])))
+        if result['rolledBack']:
+            summary.warn("The {} process was rolled back after the first error. No changes were kept.".format(mode))
+
+        summary.count('entries', len(result['entries']))
+        summary.timings[mode] = result['time']
+        summary.elapsed = result['time']
+        summary.groups = result.get('namespaces', {})
+        return summary
+
+    @staticmethod
+    def find_reference_namespaces():
+        """
+        - Devuelve los namespaces de todas las referencias cargadas en la escena.
+        """
+        namespaces = []
+        for reference in cmds.file(query=True, reference=True) or []:
+            if not cmds.referenceQuery(reference, isLoaded=True):
+                continue
+            # referenceQuery devuelve el namespace con ':' al inicio
+            _namespace = cmds.referenceQuery(reference, namespace=True).lstrip(':')
+            if _namespace and _namespace not in namespaces:
+                namespaces.append(_namespace)
+        return namespaces
+
+    @staticmethod
+    def _namespace_summary(entries, result, report):
+        """
+        - Agrupa el resultado de la ejecucion por namespace.
+        - Devolvera un diccionario con el formato:
+            {<str namespace>: {'done': <int>, 'unchanged': <int>, 'failed': <int>, 'skipped': <int>}}
+        """
+        _namespaces = {}
+        for entry in entries:
+            _namespaces[entry['destination']] = entry['namespace']
+
+        summary = {}
+        for _status in result['entries']:
+            _counts = summary.setdefault(_namespaces.get(_status['destination'], ''),
+                                         {'done': 0, 'unchanged': 0, 'failed': 0, 'skipped': 0})
+            if _status['status'] in ['failed', 'conflict']:
+                _counts['failed'] += 1
+            elif _status['status'] in _counts:
+                _counts[_status['status']] += 1
+
+        for destination in report['skipped'] + report['noSource']:
+            _counts = summary.setdefault(_namespaces.get(destination, ''),
+                                         {'done': 0, 'unchanged': 0, 'failed': 0, 'skipped': 0})
+            _counts['skipped'] += 1
+
+        return summary
+
+    @property
+    def index_path(self):
+        """
+        - Path del indice compilado del template (ver compile_index).
+        """
+        return "{}.db".format(self.full_filePath)
+
+    def compile_index(self):
+        """
+        - Compila el template actual en un indice SQLite junto al archivo (<archivo>.db),
+            para poder hacer connect/disconnect parciales (argumentos 'root' y 'method')
+            sin cargar ni recorrer el archivo completo.
+        - El indice se ignora automaticamente si el archivo cambia despues de compilarlo.
+        - Devolvera el path del indice.
+        """
+        if not self._reload_data():
+            return
+
+        if self.errors:
+            cmds.warning("The index was compiled from a template with {} errors.".format(len(self.errors)))
+
+        TemplateIndex.compile(self.data, self.index_path, self.full_filePath).close()
+        print("# Compiled template index: {!r}".format(self.index_path))
+        return self.index_path
+
+    def _get_index(self):
+        """
+        - Devuelve el TemplateIndex del template si existe y esta actualizado, o None.
+        """
+        if not os.path.isfile(self.index_path):
+            return None
+
+        index = TemplateIndex(self.index_path)
+        if index.is_stale(self.full_filePath):
+            index.close()
+            return None
+        return index
+
+    @staticmethod
+    def _filter_template(template, root=None, method=None):
+        """
+        - Filtra las entradas compiladas de un template igual que TemplateIndex.query, pero en memoria.
+        """
+        result = []
+        for values in template:
+            if method and values['connectMethod'] != method:
+                continue
+            if root and values['key'] != root and "|{}|".format(root) not in values['path'] + "|":
+                continue
+            result.append(values)
+        return result
+
+    def _process(self, mode, namespaces=None, **kwargs):
+        """
+        - Proceso comun de connect y disconnect: refresca la data, resuelve los nodos, los ordena
+            por dependencias (ver schedule_entries) y ejecuta las entradas.
+        - Si se especifican namespaces, el template se compila una vez y se aplica a todos los namespaces,
+            resolviendo todos los nodos en una unica consulta y dentro de una unica transaccion.
+        - Si se especifica 'root' y/o 'method', solo se procesan esas entradas. Si existe un indice
+            actualizado (ver compile_index), se consultan directamente sin leer el archivo.
+        - Si 'strict' es True y el template tiene errores de validacion, no se procesa nada.
+        - Connect se aplica de padre a hijo, y si hay ciclos no se conecta nada.
+        - Disconnect se aplica de hijo a padre, y los ciclos no lo bloquean: las entradas de los ciclos
+            se desconectan primero, en el orden inverso del archivo.
+        """
+        root = kwargs.get('root')
+        method = kwargs.get('method')
+        strict = kwargs.get('strict', False)
+
+        template = None
+        prefix = ''
+
+        # Consulta parcial desde el indice compilado, sin leer el archivo completo
+        if (root or method) and not strict:
+            index = self._get_index()
+            if index is not None:
+                template = index.query(root=root, method=method)
+                prefix = index.meta('prefix', '')
+                index.close()
+
+        if template is None:
+            if not self._reload_data():
+                return
+
+            # Si no hay data
+            if not self.data:
+                print("No data found to analyze")
+                return
+
+            # Si no existe database
+            if not self.data.get('database', ''):
+                print("No database found to analyze.")
+                return
+
+            if strict and self.errors:
+                cmds.warning("{} process skipped as the template has {} errors.".format(
+                    mode.capitalize(), len(self.errors)))
+                return
+
+            template = self._compile_template()
+            if root or method:
+                template = self._filter_template(template, root=root, method=method)
+            prefix = self.data.get('prefix', '')
+
+        if not template:
+            print("No entries found to analyze.")
+            return
+
+        if namespaces is None:
+            namespaces = [prefix]
+
+        _compiled = self._compile_entries(prefixes=namespaces, template=template)
+        entries, report = self._resolve_entries(_compiled)
+
+        # Orden por dependencias
+        ordered, cycles = self.schedule_entries(entries)
+        if cycles:
+            if mode == 'connect':
+                result = {'entries': [], 'noMethod': [], 'rolledBack': False, 'time': 0.0,
+                          'report': report, 'cycles': cycles, 'namespaces': {}}
+                result['summary'] = self._build_report(mode, result, report, cycles)
+                result['summary'].warn("Connect process skipped: no connection was made as the template has cycles.")
+                result['summary'].emit()
+                return result
+            # Las entradas de los ciclos (y las que dependen de ellos) van despues de las ordenadas,
+            # cada una en su propio lote para que _group_entries no cambie su orden
+            _ordered = set(id(entry) for entry in ordered)
+            _blocked = [entry for entry in entries if id(entry) not in _ordered]
+            _level = max([entry['level'] for entry in ordered] or [0])
+            for entry in _blocked:
+                _level += 1
+                entry['level'] = _level
+            ordered = ordered + _blocked
+        entries = ordered
+        if mode == 'disconnect':
+            entries = list(reversed(entries))
+
+        # Por partes en el idle de Maya: devolvemos el Job, y el resultado queda en job.result al terminar
+        if kwargs.get('deferred', False):
+            return jobScheduler.shared().submit(self._entries_job(entries, mode, _compiled, report, cycles, **kwargs))
+
+        result = self._run_entries(entries, mode, **kwargs)
+        result['report'] = report
+        result['cycles'] = cycles
+        result['namespaces'] = self._namespace_summary(_compiled, result, report)
+        result['summary'] = self._build_report(mode, result, report, cycles).emit()
+        return result
+
+    def _entries_job(self, entries, mode, compiled, report, cycles, **kwargs):
+        """
+        - Devuelve un Job (ver jobScheduler) que ejecuta las entradas ordenadas por partes:
+            cada chunk es un _run_entries con su propia transaccion y su propio snapshot.
+        - Al cancelar, o si un chunk falla con onError 'rollback', se aplica el modo contrario
+            a las entradas que ya se hicieron ('done'), de la ultima a la primera.
+        - Al terminar emite el reporte y deja el resultado combinado (ver _run_entries) en job.result.
+        """
+        _kwargs = dict(kwargs)
+        _kwargs.pop('snapshot', None)
+        _byDestination = dict((entry['destination'], entry) for entry in entries)
+        _results = []
+
+        def _process(chunk):
+            result = self._run_entries(chunk, mode, **_kwargs)
+            _results.append(result)
+            if result['rolledBack']:
+                raise RuntimeError("The {} process was rolled back after an error.".format(mode))
+            return result
+
+        def _rollback(chunks):
+            _statuses = [_status for result in _results for _status in result['entries']
+                         if _status['status'] == 'done']
+            if not _statuses:
+                return
+            _undoMode = 'disconnect' if mode == 'connect' else 'connect'
+            self._run_entries([_byDestination[_status['destination']] for _status in reversed(_statuses)],
+                              _undoMode, onError='continue')
+            for _status in _statuses:
+                _status['status'] = 'rolledBack'
+
+        def _finish(job):
+            result = {'entries': [_status for each in _results for _status in each['entries']],
+                      'noMethod': [name for each in _results for name in each['noMethod']],
+                      'rolledBack': job.rolledBack,
+                      'time': job.elapsed,
+                      'report': report,
+                      'cycles': cycles,
+                      'state': job.state}
+            result['namespaces'] = self._namespace_summary(compiled, result, report)
+            job.result = result
+
+            # El aviso de rollback del reporte es el de un error; la cancelacion tiene el suyo
+            summary = self._build_report(mode, dict(result, rolledBack=job.rolledBack and job.state == 'failed'),
+                                         report, cycles)
+            if job.state == 'cancelled':
+                summary.warn("The {} process was cancelled after {} of {} entries.".format(mode, job.done, job.total))
+            result['summary'] = summary.emit()
+
+        return jobScheduler.Job("RigConnector_{}".format(mode), entries, _process,
+                                rollback=_rollback, finish=_finish, undoChunk=False)
+
+    def connect(self, **kwargs):
+        """
+        - En base al path y file, intentara conectar la data encontrada en ese archivo.
+        - La existencia de todos los nodos se resuelve con una unica consulta antes de conectar,
+            y las entradas descartadas se cuentan en un unico reporte al final (ver toolReport).
+        - Por defecto todo el template se conecta como una unica transaccion: un solo paso de undo,
+            y si una entrada falla se deshace todo el template.
+        - Argumentos opcionales:
+            -transaction    <bool> Ejecuta el template dentro de un unico undo chunk.
+                                    Valor default: True.
+            -onError        <str> 'rollback' o 'continue'.
+                                    Valor default: 'rollback'.
+            -root           <str> Solo conecta las entradas bajo ese nodo de la jerarquia (sin prefix).
+                                    Valor default: None.
+            -method         <str> Solo conecta las entradas con ese connectMethod.
+                                    Valor default: None.
+            -strict         <bool> Si es True, no conecta nada si el template tiene errores de validacion.
+                                    Valor default: False.
+            -deferred       <bool> Conecta por partes cuando Maya esta idle, con progreso y cancelacion
+                                    (ver jobScheduler). Devuelve el Job, con el resultado en job.result al terminar.
+                                    Valor default: False.
+        - Devolvera el resultado con el status de cada entrada (ver _run_entries),
+            y el reporte emitido (ver toolReport) en result['summary'].
+         """
+        return self._process('connect', **kwargs)
+
+    def disconnect(self, **kwargs):
+        """
+         - En base al path y file, intentara desconectar la data encontrada en ese archivo.
+         - La existencia de todos los nodos se resuelve con una unica consulta antes de desconectar,
+            y las entradas descartadas se cuentan en un unico reporte al final (ver toolReport).
+         - Acepta los mismos argumentos opcionales que connect.
+         - Devolvera el resultado con el status de cada entrada (ver _run_entries).
+          """
+        return self._process('disconnect', **kwargs)
+
+
+    def connect_namespaces(self, namespaces=None, **kwargs):
+        """
+        - Conecta el template a varios rigs (por ejemplo personajes referenciados) en una sola pasada:
+            01) El archivo se lee y el template se compila una unica vez.
+            02) Todos los nodos de todos los namespaces se resuelven en una unica consulta.
+            03) Todas las conexiones se aplican dentro de una unica transaccion.
+        - Si no se especifican namespaces, se usan los de todas las referencias cargadas en la escena.
+        - Acepta los mismos argumentos opcionales que connect.
+        - Devolvera el resultado de connect, con un resumen por namespace en result['namespaces'].
+        - Ejemplo:
+            rigCon.connect_namespaces(['crowd01', 'crowd02', 'crowd03'])
+        """
+        if namespaces is None:
+            namespaces = self.find_reference_namespaces()
+        if not namespaces:
+            cmds.warning("No namespaces found to connect.")
+            return
+
+        return self._process('connect', namespaces=list(namespaces), **kwargs)
+
+    def disconnect_namespaces(self, namespaces=None, **kwargs):
+        """
+        - Desconecta el template de varios rigs en una sola pasada (ver connect_namespaces).
+        """
+        if namespaces is None:
+            namespaces = self.find_reference_namespaces()
+        if not namespaces:
+            cmds.warning("No namespaces found to disconnect.")
+            return
+
+        return self._process('disconnect', namespaces=list(namespaces), **kwargs)
+
+
+# Registro de metodos de conexion: {<str nombre>: <ConnectionMethod>}
+_CONNECTION_METHODS = {}
+
+
+class ConnectionMethod(object):
+    """
+    - Pareja de handlers de conexion y desconexion registrada con un nombre (ver register_connection_method).
+    """
+    def __init__(self, name, connect, disconnect, batchConnect=False, batchDisconnect=False):
+        self.name = name
+        self.connect = connect
+        self.disconnect = disconnect
+        self.batchConnect = batchConnect
+        self.batchDisconnect = batchDisconnect
+
+
+def register_connection_method(name, connect, disconnect, **kwargs):
+    """
+    - Registra un metodo de conexion para que se pueda usar en el 'connectMethod'/'disconnectMethod'
+        de los templates, sin tener que modificar RigConnector.
+    - Se necesitan los siguientes argumentos:
+        -name           <str> El nombre del metodo en el template.
+        -connect        <callable> Handler de conexion.
+        -disconnect     <callable> Handler de desconexion.
+    - Argumentos opcionales:
+        -batchConnect       <bool> Si es True, el handler de conexion recibe todas las entradas del lote a la vez:
+                                    connect([(sourceNode, destinationNode), ...], snapshot)
+                                y puede devolver {indice de la pareja: error} con las que fallaron.
+                                Si es False, recibe una entrada por llamada: connect(sourceNode, destinationNode)
+                                Valor default: False.
+        -batchDisconnect    <bool> Lo mismo para el handler de desconexion.
+                                Valor default: False.
+        -signature          <dict> Firma de las conexiones que hace el metodo, para el ConnectionSnapshot:
+                                {'driverPlugs': <list attrs>, 'driverType': <str nodeType>, 'scale': <bool>,
+                                 'resetMatrix': <str attr de matriz a resetear al desconectar, opcional>}
+                                Sin firma, connect no puede saber si la entrada ya esta conectada.
+                                Valor default: None.
+        -override           <bool> Si es False y ya existe un metodo con ese nombre, da error.
+                                Valor default: False.
+    - Ejemplo:
+        def con_point(sourceNode, destinationNode):
+            cmds.pointConstraint(sourceNode, destinationNode, mo=True)
+        register_connection_method('point', con_point, discon_point)
+    """
+    override = kwargs.get('override', False)
+    signature = kwargs.get('signature')
+
+    if name in _CONNECTION_METHODS and not override:
+        raise ValueError("The connection method {!r} is already registered.".format(name))
+
+    _CONNECTION_METHODS[name] = ConnectionMethod(name, connect, disconnect,
+                                                 batchConnect=kwargs.get('batchConnect', False),
+                                                 batchDisconnect=kwargs.get('batchDisconnect', False))
+    if signature:
+        _METHOD_SIGNATURES[name] = signature
+    else:
+        _METHOD_SIGNATURES.pop(name, None)
+
+
+def unregister_connection_method(name):
+    """
+    - Elimina un metodo de conexion del registro.
+    """
+    _CONNECTION_METHODS.pop(name, None)
+    _METHOD_SIGNATURES.pop(name, None)
+
+
+def get_connection_methods():
+    """
+    - Devuelve los nombres de todos los metodos de conexion registrados.
+    """
+    return sorted(_CONNECTION_METHODS)
+
+
+def _register_builtin_methods():
+    """
+    - Registra los metodos de RigConnector. Las desconexiones se registran por lotes,
+        para borrar los nodos de todas las entradas de un metodo con una unica llamada.
+    - Las conexiones matrix tambien van por lotes (ver _connect_matrix). Las de constraints (typeA/B/C)
+        son una por entrada: cada constraint es un comando con su source y su destination.
+    """
+    def _batch_disconnect(method):
+        def _disconnect(pairs, snapshot):
+            RigConnector._disconnect_owned(pairs, method, snapshot)
+        return _disconnect
+
+    def _batch_connect(method):
+        def _connect(pairs, snapshot):
+            return RigConnector._connect_matrix(pairs, method, snapshot)
+        return _connect
+
+    for _name in ['typeA', 'typeB', 'typeC', 'matrixA', 'matrixB', 'matrixC']:
+        _matrix = _name.startswith('matrix')
+        register_connection_method(_name,
+                                   _batch_connect(_name) if _matrix else getattr(RigConnector, "con_{}".format(_name)),
+                                   _batch_disconnect(_name),
+                                   batchConnect=_matrix,
+                                   batchDisconnect=True,
+                                   signature=_METHOD_SIGNATURES[_name],
+                                   override=True)
+
+
+_register_builtin_methods()
@@ -0,0 +1,107 @@
+"""
+Detalles:
+    -  Script con utilidades para crear grupos
+    -  Funciones:
+        change_switchSpace()
+    - Importar este modulo no ejecuta nada en la escena.
+    - Ejemplos de uso:
+        from riggingCodes.Grupos_y_Spaces import change_switchSpace
+        change_switchSpace(controlName="L_handIK_ctl", space=0)
+        change_switchSpace(space=1, rig="rig01:rig_grp")     # Todos los controles del rig con el atributo
+
+Autor:
+    - Sofia Ares Fernandez
+Fecha de actualizacion:
+    03/02/2024 by Sofia:
+        -Create script
+        -Testing and changing spelling mistakes
+    06/02/2023
+        -Recommended corrections by tutor
+    19/10/2026:
+        -Moved into the riggingCodes package, removed the example switch executed on import
+        -Missing or repeated control names are skipped when the shared scene index is enabled
+        -Plugs and world matrices go through the selected backend (riggingCodes.mayaBackend)
+        -Skipped controls are reported once per call (riggingCodes.toolReport) instead of one warning each
+        -rig argument: switch every control of a rig that has the attribute (riggingCodes.controlDiscovery)
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import maya.cmds as cmds
+
+from riggingCodes import controlDiscovery, mayaBackend, sceneIndex, toolReport
+
+# controlName y el space se cambiara por el controlador y el space deseado (este es solamente de ejemplo)
+
+def change_switchSpace(controlName="", attr="Spaces", space=0, rig=None):
+    """
+        -Funcion que sirve para poder cambiar el sistema de spaces de los controladores IK.
+            El sistema hace que cuando se mueva un controlador relacionado con el space del controlador IK,
+            el animador pueda cambiar el sistema de spaces sin que el controlador se mueva de posicion
+        -Si se especifica "rig" (root del rig, o una lista), se cambian todos los controles del rig
+            que tienen el atributo (ver controlDiscovery), en vez de controlName o la seleccion.
+        -Devolvera el reporte de la operacion (ver toolReport), con los controles cambiados y los saltados.
+        """
+    #Creamos una lista vacia para la seleccion
+    selection= list()
+
+    #Comporbar si hay rig o controlName
+    if rig:
+        selection = list(controlDiscovery.controls(rig))
+
+    elif controlName:
+        selection= [controlName]
+
+    else:
+        # Obtenemos la seleccionn actual
+        selection = cmds.ls(sl=True)
+
+    # Verificamos si hay seleccion
+    if selection:
+        # Con el indice de la escena activo comprobamos que cada nombre exista y sea unico sin consultar maya
+        _index = sceneIndex.active()
+        _backend = mayaBackend.current()
+        # Los controles saltados se reportan todos juntos al final, en vez de un warning por cada uno
+        report = toolReport.Report("change_switchSpace")
+
+        # Cuando hay seleccion
+        # Iteramos sobre cada objeto
+        for item in selection:
+
+            if _index is not None and _index.count(item) != 1:
+                report.fail('missingOrRepeated', item)
+                continue
+
+            #Comporbar si la seleccion tiene el attribute de .Spaces
+            if not _backend.attribute_exists(item, attr):
+                # En un rig completo, los controles sin spaces no son un error
+                if not rig:
+                    report.fail('noAttribute', "{}.{}".format(item, attr))
+                continue
+
+            # Guardamos los valores de matriz (translation y rotation)
+            ctlMatrix = _backend.get_world_matrix(item)
+
+            # Saber el valor maximo de el atributo enum del controlador seleccionado
+            enum_max = int(cmds.addAttr(item + "." + attr, query=True, max=True))
+
+            #Comprobar si space es mayor que enum_max
+            if space > enum_max:
+                report.fail('outOfRange', "{}.{} (max {})".format(item, attr, enum_max))
+                # Continue para que pase al siguiente item
+                continue
+
+            # Seteamos el space nuevo
+            _backend.set_plug(item, attr, space)
+
+            # Pegamos valores de matriz en el control
+            _backend.set_world_matrix(item, ctlMatrix)
+            report.add('switched', item)
+
+        return report.emit()
+
+    else:
+        # Cuando no hay seleccion
+        cmds.warning("Select at least one object.")
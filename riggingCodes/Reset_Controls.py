@@ -0,0 +1,612 @@
+"""
+Detalles:
+    -  Scriptpara resetear los valores de nodos.
+    -  Este script tiene dos grandes funcionalidades:
+        01) Guardar los valores del channelBox de los nodos especificados en un archivo externo.
+        02) Ejecutar esos valores guardados.
+    - CUIDADO: Este script supone que no existen nodos con el mismo nombre en la escena.
+                Si se llegara ejecutar en ese caso, los resultados son inesperados (debido al full path en el nombre).
+                Con el indice de la escena activo (sceneIndex.enable()) load_dict avisa y salta esos nodos.
+    - Importar este modulo no ejecuta nada en la escena.
+    - Ejemplos de usos:
+        from riggingCodes.Reset_Controls import get_nodesInfo_asDict, export_dict, load_dict
+
+        # Export
+        _nodes_info = get_nodesInfo_asDict()
+        export_dict(dictToExport=nodes_info,
+                filePath= 'C:/Example/Directory/Path',
+                fileName= 'ctrlsData')
+        # Export incremental: el primero es completo, los siguientes solo escriben lo que cambio
+        export_dict(filePath='C:/Example/Directory/Path', fileName='ctrlsData', track=True)
+        export_dict(filePath='C:/Example/Directory/Path', fileName='ctrlsData')
+        compact_export(filePath='C:/Example/Directory/Path', fileName='ctrlsData')
+        # Reset a los valores default, sin archivo
+        reset_to_default()                                  # Seleccion actual
+        reset_to_default('rig01:root_ctl', hierarchy=True)
+        reset_to_default(namespace=['rig01', 'rig02'])
+        # Todos los controles de un rig, sin seleccion (ver controlDiscovery)
+        export_dict(filePath='C:/Example/Directory/Path', fileName='ctrlsData', rig='rig01:rig_grp')
+        reset_to_default(rig='rig01:rig_grp')
+        # Load
+        load_dict(fileName= 'ctrlsData',
+                  filePath= 'C:/Example/Directory/Path') # Se puede usar prefix en caso necesario usando el argumento prefix
+Autor:
+    - Sofia Ares Fernandez
+Fecha de actualizacion:
+    09/02/2024 by Sofia:
+        -Create script
+        -Testing and changing spelling mistake
+    19/10/2026:
+        -Moved into the riggingCodes package, removed the example export/load executed on import
+        -export_dict exports the dictToExport argument, load_dict uses the prefix as namespace (prefix:node)
+        -Node names are resolved with the shared scene index when it is enabled
+        -Plugs are read and written through the selected backend (riggingCodes.mayaBackend), load_dict writes in bulk
+        -load_dict can run deferred in chunks on idle, with progress and cancellation (riggingCodes.jobScheduler)
+        -load_dict reports once per operation (riggingCodes.toolReport) instead of printing every attribute set
+        -Incremental export with track=True (riggingCodes.poseTracker): only changed plugs are read, delta file
+         and compact_export
+        -get_nodesInfo_asTable returns the pose as a compact PoseTable (riggingCodes.poseTable),
+         export_dict reads the selection with it
+        -reset_to_default resets the channelBox to the declared defaults, cached per node type
+        -get_defaults only caches the static attributes: dynamic attributes are queried on each node
+        -rig argument: export and reset all the controls of a rig (riggingCodes.controlDiscovery)
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import maya.cmds as cmds
+import functools
+import os
+import json
+import time
+
+from riggingCodes import controlDiscovery, jobScheduler, mayaBackend, poseTable, poseTracker, sceneIndex, toolReport
+
+
+def get_channelBox_attrs(node):
+    """
+            -Funcion para obtener los atributos actuales del channelBox de un "node".
+            -Esta funcion necesita un objeto para ser ejecutada.
+    """
+
+    # El backend (maya.cmds u OpenMaya) devuelve los atributos de listAttr que son animables
+    return mayaBackend.current().list_attributes(node)
+
+
+def get_nodesInfo_asDict(*args, **kwargs):
+    """
+            -Devolvera un diccionario con los nombres de los nodos y los atributos en su channel box.
+            -Si no se pasa ningun objeto en sus argumentos, intentara utilizar la seleccion actual.
+            -Argumentos opcionales:
+                -rig    <str/list> Root (o roots) de un rig: usa todos sus controles (ver controlDiscovery)
+                                    en vez de los objetos o la seleccion.
+                                    Valor default: None.
+            -El formato del diccionario es:
+                {'nombreDelNodoA':
+                    {'nombreDelAttrAA':
+                        {'value': 'valorAA':
+                         'type' : 'typeNameAA'}
+                     {'nombreDelAttrAB':
+                        {'value': 'valorAB':
+                         'type' : 'typeNameAB'}
+                }
+    """
+
+    # Definir nuestra data que vamos a delvolver
+    _data = {}
+    for target, plugs in _read_nodes(_targets(args, kwargs)):
+
+        # Guardamos los valores de los atributos y su tipo
+        _data[target] = dict((attr, {'value': val, 'type': typ}) for attr, val, typ in plugs)
+    return _data
+
+
+def get_nodesInfo_asTable(*args, **kwargs):
+    """
+            -Como get_nodesInfo_asDict, pero devolvera la pose como un PoseTable (ver poseTable):
+                nombres guardados una unica vez y los valores en un buffer contiguo.
+            -El PoseTable se puede usar como el diccionario: table['nombreDelNodoA']['nombreDelAttrAA']['value'].
+    """
+    _table = poseTable.PoseTable()
+    for target, plugs in _read_nodes(_targets(args, kwargs)):
+        _table.add_node(target, plugs)
+    return _table
+
+
+def _targets(args, kwargs):
+    """
+            -Devuelve los nodos de "args", o un generador con los controles del argumento rig (ver controlDiscovery).
+    """
+    rig = kwargs.get('rig')
+    if rig:
+        return controlDiscovery.controls(rig)
+    return args
+
+
+def _read_nodes(targets):
+    """
+            -Lee los atributos del channelBox de "targets" (o de la seleccion actual).
+            -Devuelve (generador) (nodo, [(attr, valor, tipo)]) por cada nodo que existe y tiene atributos,
+                para no tener toda la pose leida dos veces en memoria.
+    """
+    _backend = mayaBackend.current()
+    if not targets:
+        targets = cmds.ls(sl=True)
+
+    # Verificar el imput por las dudad
+    if targets:
+        for target in targets:
+
+            # Verificar que nuestro target realmente exista
+            if sceneIndex.exists(target):
+                _attrs = get_channelBox_attrs(target)
+
+                # Verificar que obtuvimos atributos
+                if _attrs:
+                    yield target, [(attr, _backend.get_plug(target, attr), _backend.get_plug_type(target, attr))
+                                   for attr in _attrs]
+
+
+def export_dict(**kwargs):
+    """
+        -Guardar el diccionario como una archivo .json en el directorio especificado.
+        -Se necesitan los siguientes argumentos:
+            -dictToExport    <dict> La data, en forma de diccionario (o PoseTable) a exportar o sobreescribir.
+                                    Valor default: {}, la seleccion actual leida con get_nodesInfo_asTable.
+            -fileName        <str> El nombre del archivo (sin extension) a exportar o sobreescribir.
+                                    Valor default: "".
+            -filePath        <str> El path hacia el archivo a exportar o sobreescribir.
+                                    Valor default: "".
+        -Argumentos opcionales:
+
+            -file_extension        <str> La extension del archivo a exportar o sobreescribir.
+                                        Valor default: "json".
+            -overwrite             <bool> Si es True, sobreescribira el archivo que ya existe con el mismo nombre.
+                                        Valor default: True
+            -rig                   <str/list> Si no hay dictToExport, exporta los controles de este rig
+                                        (ver controlDiscovery) en vez de la seleccion.
+                                        Valor default: None
+            -track                 <bool> Si es True, despues del export se siguen los cambios de los nodos exportados
+                                        (ver poseTracker). Los siguientes export_dict del mismo archivo sin
+                                        dictToExport solo releen los plugs que cambiaron y escriben un delta
+                                        ("<fileName>.delta.<fileExtension>"), hasta un export completo o compact_export.
+                                        Valor default: False
+    """
+
+    dict_to_export = kwargs.get('dictToExport', {})
+
+    # Definir el nombre del archivo que va ha ser exportardo
+    file_name = kwargs.get('fileName', "")  # Sin la extension
+
+    # Definir la extension del archivo a exportar
+    file_extension = kwargs.get('fileExtension', "json")
+
+    # Definir el directorio donde queremos que se guarde el archivo exportado
+    file_path = kwargs.get('filePath', "")
+
+    # Overwrite de archivos exportados (por default el archivo hara un overwrite)
+    overwrite = kwargs.get('overwrite', True)
+
+    # Seguimiento de los cambios para los siguientes exports (ver poseTracker)
+    track = kwargs.get('track', False)
+
+    # Root del rig cuyos controles se exportan, en vez de la seleccion (ver controlDiscovery)
+    rig = kwargs.get('rig')
+
+    # --------------------------------------------------------------------------
+    # Input Verification
+    # --------------------------------------------------------------------------
+    # File information
+    if not file_name or not file_path or not file_extension:
+        _args = ["fileName", "filePath", "fileExtension"]
+        cmds.warning("Please provide a valid input for the following arguments : {!r}".format(_args))
+        return
+
+    # Verificar que el path exista
+    if not os.path.isdir(file_path):
+        cmds.warning("The following path doesn't exist: {!r}".format(file_path))
+        return
+
+    file_fullName = "{}.{}".format(file_name, file_extension)
+    filePath_full = os.path.join(file_path, file_fullName)
+
+    # Si el archivo tiene seguimiento activo solo se releen los plugs que cambiaron, y se escribe el delta
+    _tracker = poseTracker.tracker(filePath_full)
+    if _tracker is not None and not dict_to_export and not track:
+        _pose = _tracker.export()
+        print("# Exported {} changed values ({} read) to file: {!r}".format(
+            _tracker.changed, _tracker.reads, _tracker.deltaPath))
+        return _pose
+
+    # Dictionary to export
+    if not dict_to_export:
+        dict_to_export = get_nodesInfo_asTable(rig=rig)
+    if not dict_to_export:
+        cmds.warning("No values found for the dictionary to export. Process skipped")
+        return
+
+    # --------------------------------------------------------------------------
+    # Main Process
+    # --------------------------------------------------------------------------
+
+    # Confirmar si existre file overwrite
+
+    if os.path.isfile(filePath_full):
+        if overwrite is False:
+            cmds.warning("The following is already exists and overwrite is set up to False: {!r}".format(filePath_full))
+            return
+
+    # Usar Python's context manager para abrir el archivo
+    if isinstance(dict_to_export, poseTable.PoseTable):
+        _text = dict_to_export.to_json(indent=4)
+    else:
+        _text = json.dumps(dict_to_export, indent=4)
+    with open(filePath_full, "w") as file_to_write:
+        file_to_write.write(_text)
+
+    print("# Exported data to file: {!r}".format(filePath_full))
+
+    # Un export completo es la nueva base del seguimiento: con track=True empieza (o reinicia) el seguimiento,
+    # y sin track se deja de seguir el archivo
+    if track:
+        poseTracker.track(filePath_full, dict_to_export, _text)
+    elif _tracker is not None:
+        poseTracker.stop(filePath_full)
+    return dict_to_export
+
+
+def compact_export(**kwargs):
+    """
+        -Junta el delta de un export con seguimiento (ver export_dict, track) con su export completo,
+            en un unico archivo completo, y borra el delta.
+        -Se necesitan los argumentos fileName y filePath (y opcionalmente fileExtension) de export_dict.
+        -Devolvera la pose compactada.
+    """
+    file_name = kwargs.get('fileName', "")
+    file_extension = kwargs.get('fileExtension', "json")
+    file_path = kwargs.get('filePath', "")
+
+    if not file_name or not file_path or not file_extension:
+        _args = ["fileName", "filePath", "fileExtension"]
+        cmds.warning("Please provide a valid input for the following arguments : {!r}".format(_args))
+        return
+
+    filePath_full = os.path.join(file_path, "{}.{}".format(file_name, file_extension))
+    if not os.path.isfile(filePath_full):
+        cmds.warning("The following file doesn't seem to exist: {!r}".format(filePath_full))
+        return
+
+    _pose = poseTracker.compact(filePath_full)
+    print("# Compacted data to file: {!r}".format(filePath_full))
+    return _pose
+
+
+def load_dict(**kwargs):
+    """
+        -Ejecuta los valores guardados en el diccionario del archivo especificado.
+        -Se espera que el diccionario tenga el siguiente formato:
+                {'nombreDelNodoA':
+                    {'nombreDelAttrAA':
+                        {'value': 'valorAA':
+                         'type' : 'typeNameAA'}
+                     {'nombreDelAttrAB':
+                        {'value': 'valorAB':
+                         'type' : 'typeNameAB'}
+                }
+        -Se necesitan los siguientes argumentos:
+            -fileName        <str> El nombre del archivo (sin extension) a importar.
+                                    Valor default: "".
+            -filePath        <str> El path hacia el archivo a importar.
+                                    Valor default: "".
+        -Argumentos opcionales:
+
+            -file_extension        <str> La extension del archivo a importar.
+                                        Valor default: "json".
+            -prefix             <str> El prefijo (namespace) de los nodos, sin ':'. Se busca "prefix:nodo".
+                                        Valor default: "".
+            -deferred           <bool> Si es True, los valores se setean por partes cuando Maya esta idle,
+                                        con progreso y cancelacion (ver jobScheduler), y se devuelve el Job.
+                                        En modo batch se setean directamente.
+                                        Valor default: False.
+        -Devolvera el reporte de la operacion (ver toolReport), o el Job si es deferred (con el reporte en job.report).
+    """
+    # Copiamos los argumentos que vamos a usar de export_dict
+    file_name = kwargs.get('fileName', "")  # Sin la extension
+
+    file_extension = kwargs.get('fileExtension', "json")
+
+    file_path = kwargs.get('filePath', "")
+
+    # Agregamos nuevo argumento prefijo
+    prefix = kwargs.get('prefix', "")
+
+    deferred = kwargs.get('deferred', False)
+
+    # --------------------------------------------------------------------------
+    # Input Verification
+    # --------------------------------------------------------------------------
+    # File information
+    if not file_name or not file_path or not file_extension:
+        _args = ["fileName", "filePath", "fileExtension"]
+        cmds.warning("Please provide a valid input for the following arguments : {!r}".format(_args))
+        return
+
+    # Verificar que el path exista
+    if not os.path.isdir(file_path):
+        cmds.warning("The following path doesn't exist: {!r}".format(file_path))
+        return
+
+    # File validation
+    file_fullName = "{}.{}".format(file_name, file_extension)
+    filePath_full = os.path.join(file_path, file_fullName)
+    if not os.path.isfile(filePath_full):
+        cmds.warning("The following file doesn't seem to exist: {!r}".format(filePath_full))
+        return
+
+    # --------------------------------------------------------------------------
+    # Main Process
+    # --------------------------------------------------------------------------
+    # Un unico reporte para toda la operacion (ver toolReport), en vez de un print por atributo
+    report = toolReport.Report("load_dict")
+
+    # Usar Python's context manager para leer el archivo
+    # (con el delta de un export con seguimiento, si existe)
+    with report.timer('read'):
+        _dict_to_read = poseTracker.read_pose(filePath_full)
+
+    # Ver si hay algun tipo de contenido en el archivo
+    if _dict_to_read:
+
+        # Comprobar si el contenido que hay sea tipo diccionario
+        if type(_dict_to_read) == dict:
+            _backend = mayaBackend.current()
+            # Valores a setear: [(nodo, atributo, valor)]
+            _values = []
+            # Verificamos el nombre de los nodos
+            with report.timer('resolve'):
+                for _key in _dict_to_read:
+
+                    # Primero buscar el nodo en la escena (con prefijo, si es especificado)
+                    eachNode = _key
+                    if prefix:
+                        eachNode = "{}:{}".format(prefix, _key)
+                    # Comprobamso que el nodo exista en la escena (y que sea unico, si el indice de la escena esta activo)
+                    try:
+                        _resolved = sceneIndex.resolve(eachNode)
+                    except ValueError:
+                        report.fail('ambiguous', eachNode)
+                        continue
+                    if _resolved is None:
+                        report.fail('missing', eachNode)
+                        # En vez de usar return y acabar el proceso, usaremos continue para que pase al siguiente nodo
+                        continue
+
+                    # Iteramos en los atributos verificando que existan
+                    for eachAttr in _dict_to_read[_key].keys():
+                        # Guardamos su valor en variables
+                        _attr_exists = _backend.attribute_exists(eachNode, eachAttr)
+                        # Si el attributo no existe lo contamos y pasamos al siguiente
+                        if not _attr_exists:
+                            report.add('noAttribute', "{}.{}".format(eachNode, eachAttr))
+                            continue
+
+                        val = _dict_to_read[_key][eachAttr]['value']
+                        typ = _dict_to_read[_key][eachAttr]['type']
+
+                        # Miramos que tipo de attributos son los correctos
+                        # Al haber alguno de estos valores se convertiran en float
+                        _floatTypes = ["double", "doubleLinear", "doubleAngle"]
+
+                        # En el caso de que sea bool se converitra en bool
+                        if typ == "bool":
+                            val = bool(val)
+                        elif typ in _floatTypes:
+                            val = float(val)
+
+                        _values.append((eachNode, eachAttr, val))
+
+            # Seteamos los valores: todos de una vez (el backend puede hacerlo en bloque),
+            # o por partes en el idle de Maya si es deferred. El reporte se emite al terminar el Job.
+            job = jobScheduler.Job("load_dict", _values, functools.partial(_set_values, report=report),
+                                   save=_get_values, rollback=_restore_values,
+                                   finish=functools.partial(_emit_report, report=report))
+            job.report = report
+            if deferred:
+                return jobScheduler.shared().submit(job)
+            job.run()
+            return report
+
+        # Si no el contenido no es de tipo diccionario
+        else:
+            cmds.warning("No valid dictionary data was found in the file: {!r}".format(filePath_full))
+            return
+
+    # Si no hay contenido
+    else:
+        cmds.warning("No data has been found in the file: {!r}".format(filePath_full))
+        return
+
+
+def _set_values(values, report):
+    """
+        -Setea una lista de valores [(nodo, atributo, valor)] con el backend actual,
+            y cuenta los seteados y los que fallaron en el reporte de la operacion.
+    """
+    with report.timer('set'):
+        _failed = mayaBackend.current().set_plugs(values)
+
+    _failedPlugs = set()
+    for eachNode, eachAttr, e in _failed:
+        _failedPlugs.add((eachNode, eachAttr))
+        report.fail('failed', "{}.{}: {}".format(eachNode, eachAttr, str(e).strip()))
+    if _failedPlugs:
+        values = [each for each in values if (each[0], each[1]) not in _failedPlugs]
+    report.extend('set', values)
+
+
+def _emit_report(job, report):
+    """
+        -Emite el reporte de un load_dict al terminar su Job (sincrono o deferred).
+    """
+    if job.state == 'cancelled':
+        report.warn("Cancelled after {} of {} values{}.".format(
+            job.done, job.total, ", the values already set were restored" if job.rolledBack else ""))
+    elif job.state == 'failed':
+        report.warn("Failed after {} of {} values: {}{}".format(
+            job.done, job.total, job.error, ", the values already set were restored" if job.rolledBack else ""))
+    report.emit()
+
+
+def _get_values(values):
+    """
+        -Devuelve los valores actuales de los plugs de una lista [(nodo, atributo, valor)],
+            para poder restaurarlos si se cancela un load_dict deferred.
+    """
+    _backend = mayaBackend.current()
+    return [(eachNode, eachAttr, _backend.get_plug(eachNode, eachAttr)) for eachNode, eachAttr, _ in values]
+
+
+def _restore_values(chunks):
+    """
+        -Rollback de un load_dict deferred: restaura los valores guardados por _get_values, del ultimo chunk al primero.
+    """
+    _backend = mayaBackend.current()
+    for _, saved, _ in reversed(chunks):
+        if saved:
+            _backend.set_plugs(saved)
+
+
+# Cache de valores default de los atributos estaticos: {nodeType: {atributo: default}}
+# Se comparte entre personajes: los atributos estaticos tienen el mismo default en todos los nodos del tipo.
+# Los atributos dinamicos no entran en el cache: cada nodo puede declarar un default distinto (addAttr).
+_DEFAULTS = {}
+
+
+def clear_defaults_cache():
+    """
+        -Vacia el cache de valores default (por ejemplo despues de recargar el plug-in que define un tipo de nodo).
+    """
+    _DEFAULTS.clear()
+
+
+def get_defaults(node, attrs=None):
+    """
+        -Devolvera un diccionario {atributo: default} con el valor default declarado de los atributos "attrs"
+            (por defecto los del channelBox) de un nodo. None si el atributo no tiene default.
+        -Los defaults de los atributos estaticos se consultan una unica vez por tipo de nodo (cache).
+            Los de los atributos dinamicos se consultan en cada nodo.
+    """
+    _defaults = _DEFAULTS.setdefault(cmds.nodeType(node), {})
+    _dynamic = set(cmds.listAttr(node, userDefined=True) or [])
+    if attrs is None:
+        attrs = get_channelBox_attrs(node) or []
+
+    _backend = mayaBackend.current()
+    result = {}
+    for attr in attrs:
+        if attr in _dynamic:
+            result[attr] = _backend.get_plug_default(node, attr)
+            continue
+        if attr not in _defaults:
+            _defaults[attr] = _backend.get_plug_default(node, attr)
+        result[attr] = _defaults[attr]
+    return result
+
+
+def reset_to_default(*args, **kwargs):
+    """
+        -Resetea los atributos del channelBox de los nodos a su valor default, sin necesidad de un archivo de export_dict.
+        -Si no se pasa ningun objeto en sus argumentos, intentara utilizar la seleccion actual.
+        -Argumentos opcionales:
+
+            -hierarchy          <bool> Si es True, tambien se resetean los controles debajo de los nodos.
+                                        Valor default: False.
+            -rig                <str/list> Resetea todos los controles de un rig (o varios), en vez de los nodos.
+                                        Valor default: None.
+            -namespace          <str/list> Resetea todos los controles de uno o varios namespaces (sin ':'),
+                                        en vez de los nodos.
+                                        Valor default: None.
+            -controlPattern     <str> Patron del nombre (sin namespace) de los controles de hierarchy y namespace.
+                                        Valor default: "*_ctl".
+        -Solo se setean los atributos cuyo valor es distinto del default, todos de una vez y en un unico paso de undo.
+        -Devolvera el reporte de la operacion (ver toolReport).
+    """
+    hierarchy = kwargs.get('hierarchy', False)
+    namespace = kwargs.get('namespace')
+    rig = kwargs.get('rig')
+    control_pattern = kwargs.get('controlPattern', controlDiscovery.CONTROL_PATTERN)
+
+    report = toolReport.Report("reset_to_default")
+    _backend = mayaBackend.current()
+
+    with report.timer('resolve'):
+        _nodes = _reset_targets(args, hierarchy, namespace, rig, control_pattern)
+    if not _nodes:
+        cmds.warning("No nodes found to reset. Process skipped")
+        return None
+
+    # Valores a setear: solo los que no estan en su default [(nodo, atributo, valor)]
+    _values = []
+    with report.timer('read'):
+        for eachNode in _nodes:
+            try:
+                _attrs = get_channelBox_attrs(eachNode) or []
+                _defaults = get_defaults(eachNode, _attrs)
+            except (RuntimeError, ValueError):
+                report.fail('missing', eachNode)
+                continue
+
+            for eachAttr in _attrs:
+                _default = _defaults[eachAttr]
+                if _default is None:
+                    report.count('noDefault')
+                    continue
+                _current = _backend.get_plug(eachNode, eachAttr)
+
+                # El default tiene que tener el mismo tipo que el valor de getAttr (bool, int o float)
+                if isinstance(_current, bool):
+                    _default = bool(_default)
+                elif isinstance(_current, int):
+                    _default = int(_default)
+                elif isinstance(_current, float):
+                    _default = float(_default)
+
+                if _current == _default:
+                    report.count('unchanged')
+                else:
+                    _values.append((eachNode, eachAttr, _default))
+    report.count('nodes', len(_nodes))
+
+    if _values:
+        cmds.undoInfo(openChunk=True, chunkName="reset_to_default")
+        try:
+            _set_values(_values, report)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+    return report.emit()
+
+
+def _reset_targets(nodes, hierarchy, namespace, rig, controlPattern):
+    """
+        -Devuelve la lista de nodos de reset_to_default, sin repetidos y en orden:
+            los controles de los rigs o de los namespaces (ver controlDiscovery),
+            o los nodos (o la seleccion) y, con hierarchy, los controles debajo.
+    """
+    if rig:
+        return list(controlDiscovery.controls(rig, pattern=controlPattern))
+    if namespace:
+        return list(controlDiscovery.controls(namespace=namespace, pattern=controlPattern))
+
+    _nodes = list(nodes) or cmds.ls(sl=True) or []
+    if hierarchy and _nodes:
+        _nodes.extend(controlDiscovery.controls(*_nodes, pattern=controlPattern))
+
+    _unique = []
+    _seen = set()
+    for eachNode in _nodes:
+        if eachNode not in _seen:
+            _seen.add(eachNode)
+            _unique.append(eachNode)
+    return _unique
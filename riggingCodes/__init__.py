@@ -0,0 +1,44 @@
+"""
+Detalles:
+    - Paquete con las herramientas de rigging:
+        - Reset_Controls: guardar y cargar los valores del channelBox de los controles.
+        - snapIKFK: cambiar de FK a IK, y viceversa, sin mover los joints.
+        - Grupos_y_Spaces: cambiar el space de los controles sin moverlos.
+        - Conectar_Y_Desconectar: conectar y desconectar rigs en base a un template (RigConnector).
+    - Importar el paquete o cualquiera de sus modulos no ejecuta nada en la escena.
+    - Los modulos se cargan bajo demanda: "import riggingCodes" no importa ninguno hasta que se usa.
+    - Puntos de entrada:
+        - Botones del shelf: riggingCodes.shelf
+        - Linea de comandos (mayapy): mayapy -m riggingCodes --help
+    - Ejemplos de uso:
+        import riggingCodes
+        riggingCodes.snapIKFK.auto_snap(part="arm", side="L")
+
+        from riggingCodes import Reset_Controls
+        Reset_Controls.load_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path')
+Fecha de actualizacion:
+    19/10/2026:
+        -Create package
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import importlib
+
+# Modulos del paquete que se cargan bajo demanda
+__all__ = ['Reset_Controls', 'snapIKFK', 'Grupos_y_Spaces', 'Conectar_Y_Desconectar', 'shelf', 'cli']
+
+
+def __getattr__(name):
+    """
+    - Importa el modulo del paquete la primera vez que se accede a el (riggingCodes.snapIKFK).
+    """
+    if name in __all__:
+        return importlib.import_module("{}.{}".format(__name__, name))
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,3 @@
+from riggingCodes.cli import main
+
+main()
@@ -0,0 +1,57 @@
+"""
+Detalles:
+    - Utilidades para cargar bajo demanda las dependencias pesadas (NumPy, OpenMaya, ...),
+        para que importar los modulos del paquete sea rapido y no falle si no estan instaladas.
+    - Ejemplo de uso:
+        from riggingCodes._lazy import lazy_import
+        np = lazy_import('numpy')      # No importa nada todavia
+        np.array([1, 2, 3])            # Se importa aqui, la primera vez que se usa
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import importlib
+import importlib.util
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """
+    - Modulo que se importa la primera vez que se accede a uno de sus atributos.
+    """
+    def __init__(self, name):
+        super(_LazyModule, self).__init__(name)
+        self.__dict__['_lazyModule'] = None
+
+    def _load(self):
+        if self.__dict__['_lazyModule'] is None:
+            self.__dict__['_lazyModule'] = importlib.import_module(self.__name__)
+        return self.__dict__['_lazyModule']
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    """
+    - Devuelve un modulo que solo se importa la primera vez que se usa.
+    """
+    return _LazyModule(name)
+
+
+def is_available(name):
+    """
+    - Devuelve True si el modulo "name" se puede importar, sin importarlo.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
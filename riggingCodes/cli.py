@@ -0,0 +1,139 @@
+"""
+Detalles:
+    - Linea de comandos para ejecutar las herramientas sin interfaz (batch), con mayapy.
+    - Si se ejecuta fuera de una sesion de Maya, inicializa maya.standalone al empezar.
+    - Ejemplos de uso:
+        mayapy -m riggingCodes connect --template C:/templates/body.rigConnections --scene shot.ma --save
+        mayapy -m riggingCodes connect --template C:/templates/body.rigConnections --scene crowd.ma --namespaces crowd01 crowd02
+        mayapy -m riggingCodes load-pose --pose C:/poses/ctrlsData.json --scene shot.ma --prefix rig01 --save
+        mayapy -m riggingCodes snap --part arm --side L --scene shot.ma --save
+        mayapy -m riggingCodes connect --template C:/templates/body.rigConnections --scene shot.ma --report-json report.json
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Added --verbosity and --report-json (riggingCodes.toolReport)
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import argparse
+import os
+
+
+def _initialize_maya():
+    """
+    - Inicializa maya.standalone si no estamos dentro de una sesion de Maya.
+    """
+    try:
+        import maya.cmds as cmds
+        # Dentro de Maya (o ya inicializado) cmds.about funciona
+        cmds.about(version=True)
+    except (ImportError, AttributeError):
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+
+
+def _open_scene(args):
+    import maya.cmds as cmds
+    if args.scene:
+        cmds.file(args.scene, open=True, force=True)
+
+
+def _save_scene(args):
+    import maya.cmds as cmds
+    if args.save:
+        cmds.file(save=True, force=True)
+
+
+def _cmd_connect(args):
+    from riggingCodes.Conectar_Y_Desconectar import RigConnector
+
+    rigCon = RigConnector(os.path.dirname(args.template), os.path.basename(args.template))
+    _kwargs = {'onError': args.on_error}
+    if args.root:
+        _kwargs['root'] = args.root
+
+    if args.command == 'connect':
+        if args.namespaces is not None:
+            return rigCon.connect_namespaces(args.namespaces or None, **_kwargs)
+        return rigCon.connect(**_kwargs)
+
+    if args.namespaces is not None:
+        return rigCon.disconnect_namespaces(args.namespaces or None, **_kwargs)
+    return rigCon.disconnect(**_kwargs)
+
+
+def _cmd_load_pose(args):
+    from riggingCodes import Reset_Controls
+
+    _fileName, _extension = os.path.splitext(os.path.basename(args.pose))
+    return Reset_Controls.load_dict(filePath=os.path.dirname(args.pose),
+                                    fileName=_fileName,
+                                    fileExtension=_extension.lstrip('.') or 'json',
+                                    prefix=args.prefix)
+
+
+def _cmd_snap(args):
+    from riggingCodes import snapIKFK
+    return snapIKFK.auto_snap(part=args.part, side=args.side)
+
+
+def build_parser():
+    """
+    - Devuelve el ArgumentParser de la linea de comandos.
+    """
+    parser = argparse.ArgumentParser(prog='riggingCodes', description="Rigging tools in batch mode.")
+    _subparsers = parser.add_subparsers(dest='command')
+    _subparsers.required = True
+
+    for _name in ['connect', 'disconnect']:
+        _parser = _subparsers.add_parser(_name, help="{} a rig from a .rigConnections template.".format(
+            _name.capitalize()))
+        _parser.add_argument('--template', required=True, help="Full path of the .rigConnections template.")
+        _parser.add_argument('--namespaces', nargs='*', default=None,
+                             help="Apply the template to these namespaces. Without values: all references.")
+        _parser.add_argument('--root', default=None, help="Only process the entries under this node.")
+        _parser.add_argument('--on-error', default='rollback', choices=['rollback', 'continue'])
+        _parser.set_defaults(function=_cmd_connect)
+
+    _parser = _subparsers.add_parser('load-pose', help="Load a pose exported with Reset_Controls.export_dict.")
+    _parser.add_argument('--pose', required=True, help="Full path of the pose file.")
+    _parser.add_argument('--prefix', default="", help="Prefix (namespace) of the nodes.")
+    _parser.set_defaults(function=_cmd_load_pose)
+
+    _parser = _subparsers.add_parser('snap', help="Switch FK/IK without moving the joints.")
+    _parser.add_argument('--part', default='arm', choices=['arm', 'leg'])
+    _parser.add_argument('--side', default='L', choices=['L', 'R'])
+    _parser.set_defaults(function=_cmd_snap)
+
+    for _parser in _subparsers.choices.values():
+        _parser.add_argument('--scene', default=None, help="Scene to open before running the command.")
+        _parser.add_argument('--save', action='store_true', help="Save the scene after running the command.")
+        _parser.add_argument('--verbosity', default='summary', choices=['quiet', 'summary', 'details'],
+                             help="Verbosity of the report printed by the command.")
+        _parser.add_argument('--report-json', default=None,
+                             help="Write the report of the command as JSON to this path (for pipeline checks).")
+
+    return parser
+
+
+def main(argv=None):
+    """
+    - Punto de entrada de la linea de comandos.
+    """
+    args = build_parser().parse_args(argv)
+
+    _initialize_maya()
+    from riggingCodes import toolReport
+    toolReport.set_verbosity(args.verbosity)
+
+    _open_scene(args)
+    result = args.function(args)
+    _save_scene(args)
+
+    # Reporte de la operacion en JSON (los comandos sin reporte, como snap, no escriben nada)
+    if args.report_json and toolReport.last() is not None:
+        toolReport.last().to_json(args.report_json)
+    return result
@@ -0,0 +1,323 @@
+"""
+Detalles:
+    - Instrumentacion opcional de las llamadas a maya.cmds de las herramientas del paquete
+        (Reset_Controls, snapIKFK, Grupos_y_Spaces, Conectar_Y_Desconectar y el backend mayaBackend).
+    - enable() reemplaza la variable 'cmds' de esos modulos por un proxy que cuenta las llamadas y
+        acumula su latencia por comando, por funcion que hace la llamada y por operacion.
+        disable() deja los modulos como estaban. Sin enable() no hay ningun coste.
+    - Para poder dejarlo activo en produccion, el tiempo se puede medir solo en 1 de cada N llamadas
+        (sampleEvery). Las llamadas se cuentan siempre, y el tiempo total se estima con la media medida.
+    - Ejemplos de uso:
+        from riggingCodes import cmdsProfiler, Reset_Controls
+
+        with cmdsProfiler.profile("export") as stats:
+            Reset_Controls.get_nodesInfo_asDict()
+        print(stats.report())
+
+        # Activo toda la sesion, midiendo 1 de cada 20 llamadas
+        cmdsProfiler.enable(sampleEvery=20)
+        with cmdsProfiler.operation("load pose"):
+            Reset_Controls.load_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path')
+        print(cmdsProfiler.session().report(by='operation'))
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import contextlib
+import importlib
+import sys
+import time
+import types
+
+# Modulos cuyas llamadas a maya.cmds se instrumentan
+TOOL_MODULES = ['riggingCodes.Reset_Controls',
+                'riggingCodes.snapIKFK',
+                'riggingCodes.Grupos_y_Spaces',
+                'riggingCodes.Conectar_Y_Desconectar',
+                'riggingCodes.mayaBackend']
+
+# Columnas por las que se puede agrupar el reporte
+_GROUPS = ['command', 'caller', 'operation']
+
+_perf_counter = time.perf_counter
+_getframe = sys._getframe
+
+
+class CallStats(object):
+    """
+    - Acumula las llamadas a maya.cmds: {(command, code, operation): [calls, timedCalls, time, maxTime]}
+        ("code" es el code object de la funcion que hizo la llamada; el nombre se resuelve en rows()).
+        - calls:      numero de llamadas.
+        - timedCalls: llamadas en las que se midio el tiempo (todas si sampleEvery es 1).
+        - time:       suma del tiempo medido, en segundos.
+        - maxTime:    llamada mas lenta medida.
+    """
+    def __init__(self, name=""):
+        self.name = name
+        self.entries = {}
+        self.start = _perf_counter()
+        self.wallTime = None
+
+    def add(self, key, elapsed):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.entries[key] = entry = [0, 0, 0.0, 0.0]
+        entry[0] += 1
+        if elapsed is not None:
+            entry[1] += 1
+            entry[2] += elapsed
+            if elapsed > entry[3]:
+                entry[3] = elapsed
+
+    def stop(self):
+        self.wallTime = _perf_counter() - self.start
+
+    @property
+    def calls(self):
+        return sum(entry[0] for entry in self.entries.values())
+
+    def rows(self, by='command'):
+        """
+        - Agrupa las llamadas y devuelve una lista de diccionarios ordenada por tiempo estimado:
+            {'command'/'caller'/'operation': <str>, 'calls': <int>, 'time': <float estimado>,
+             'mean': <float>, 'max': <float>}
+        - "by" puede ser un nombre o una lista de nombres de _GROUPS.
+        """
+        _by = [by] if isinstance(by, str) else list(by)
+        for name in _by:
+            if name not in _GROUPS:
+                raise ValueError("Invalid group {!r}. Use one of: {!r}".format(name, _GROUPS))
+        _indices = [_GROUPS.index(name) for name in _by]
+
+        _grouped = {}
+        for (command, code, operationName), (calls, timedCalls, elapsed, maxTime) in self.entries.items():
+            key = (command, _caller_name(code), operationName)
+            _key = tuple(key[index] for index in _indices)
+            _row = _grouped.setdefault(_key, [0, 0, 0.0, 0.0])
+            _row[0] += calls
+            _row[1] += timedCalls
+            _row[2] += elapsed
+            _row[3] = max(_row[3], maxTime)
+
+        rows = []
+        for _key, (calls, timedCalls, elapsed, maxTime) in _grouped.items():
+            _mean = elapsed / timedCalls if timedCalls else 0.0
+            row = dict(zip(_by, _key))
+            row.update({'calls': calls, 'time': _mean * calls, 'mean': _mean, 'max': maxTime})
+            rows.append(row)
+        rows.sort(key=lambda row: (-row['time'], -row['calls']))
+        return rows
+
+    def as_dict(self, by=('operation', 'caller', 'command')):
+        """
+        - Devuelve el resultado en un diccionario serializable (JSON).
+        """
+        return {'name': self.name,
+                'calls': self.calls,
+                'wallTime': self.wallTime if self.wallTime is not None else _perf_counter() - self.start,
+                'rows': self.rows(by)}
+
+    def report(self, by='command', limit=20):
+        """
+        - Devuelve una tabla <str> con las llamadas agrupadas por "by", las "limit" mas costosas.
+        """
+        _by = [by] if isinstance(by, str) else list(by)
+        rows = self.rows(_by)
+        _wallTime = self.wallTime if self.wallTime is not None else _perf_counter() - self.start
+        _total = sum(row['time'] for row in rows)
+
+        _widths = [max([len(name)] + [len(str(row[name])) for row in rows[:limit]]) for name in _by]
+        _header = "  ".join(name.ljust(width) for name, width in zip(_by, _widths))
+        lines = ["# maya.cmds calls{}: {} calls, {:.2f} ms in cmds of {:.2f} ms".format(
+                     " ({})".format(self.name) if self.name else "", self.calls, _total * 1000.0, _wallTime * 1000.0),
+                 "{}  {:>8} {:>11} {:>10} {:>10} {:>6}".format(_header, "calls", "time", "mean", "max", "%")]
+        for row in rows[:limit]:
+            _names = "  ".join(str(row[name]).ljust(width) for name, width in zip(_by, _widths))
+            lines.append("{}  {:>8} {:>9.2f}ms {:>8.3f}ms {:>8.3f}ms {:>5.1f}%".format(
+                _names, row['calls'], row['time'] * 1000.0, row['mean'] * 1000.0, row['max'] * 1000.0,
+                100.0 * row['time'] / _total if _total else 0.0))
+        if len(rows) > limit:
+            lines.append("(... {} more)".format(len(rows) - limit))
+        return "\n".join(lines)
+
+
+class _InstrumentedCmds(types.ModuleType):
+    """
+    - Proxy del modulo maya.cmds. Cada comando se envuelve la primera vez que se pide,
+        y se guarda en el __dict__ para que los siguientes accesos no pasen por __getattr__.
+    """
+    def __init__(self, cmds):
+        super(_InstrumentedCmds, self).__init__(cmds.__name__)
+        self.__dict__['_cmds'] = cmds
+
+    def __getattr__(self, name):
+        _function = getattr(self.__dict__['_cmds'], name)
+        if not callable(_function) or name.startswith('__'):
+            return _function
+        _wrapper = _wrap(name, _function)
+        self.__dict__[name] = _wrapper
+        return _wrapper
+
+
+# Estado de la instrumentacion
+_STATE = {'cmds': None, 'proxy': None, 'modules': {}, 'sampleEvery': 1, 'counter': 0}
+# Colectores activos: la sesion de enable() y los de profile()
+_COLLECTORS = []
+_SESSION = [None]
+# Operacion actual (ver operation())
+_OPERATION = [""]
+# {code object: "Modulo.funcion"}
+_CALLERS = {}
+
+
+def _caller_name(code):
+    name = _CALLERS.get(code)
+    if name is None:
+        _module = _module_name(code.co_filename)
+        name = _CALLERS[code] = "{}.{}".format(_module, getattr(code, 'co_qualname', code.co_name))
+    return name
+
+
+def _module_name(fileName):
+    return fileName.replace('\\', '/').rsplit('/', 1)[-1].rsplit('.', 1)[0]
+
+
+def _wrap(command, function):
+    def _instrumented(*args, **kwargs):
+        if not _COLLECTORS:
+            return function(*args, **kwargs)
+
+        _STATE['counter'] += 1
+        _timed = _STATE['counter'] % _STATE['sampleEvery'] == 0
+        if _timed:
+            _start = _perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _elapsed = _perf_counter() - _start
+                _key = (command, _getframe(1).f_code, _OPERATION[0])
+                for collector in _COLLECTORS:
+                    collector.add(_key, _elapsed)
+
+        _key = (command, _getframe(1).f_code, _OPERATION[0])
+        for collector in _COLLECTORS:
+            collector.add(_key, None)
+        return function(*args, **kwargs)
+
+    _instrumented.__name__ = command
+    _instrumented.__doc__ = getattr(function, '__doc__', None)
+    return _instrumented
+
+
+def is_enabled():
+    return _STATE['proxy'] is not None
+
+
+def enable(sampleEvery=1, modules=None):
+    """
+    - Instala el proxy de maya.cmds en los modulos de las herramientas (los importa si hace falta)
+        y empieza una sesion de estadisticas (ver session()).
+    - Keyword Args:
+        sampleEvery <int> Mide el tiempo de 1 de cada N llamadas. Default: 1 (todas).
+        modules     <list> Modulos a instrumentar. Default: TOOL_MODULES.
+    - Devuelve el CallStats de la sesion.
+    """
+    _STATE['sampleEvery'] = max(1, int(sampleEvery))
+    if not is_enabled():
+        import maya.cmds
+        _STATE['cmds'] = maya.cmds
+        _STATE['proxy'] = _InstrumentedCmds(maya.cmds)
+
+    for moduleName in modules or TOOL_MODULES:
+        module = importlib.import_module(moduleName)
+        if module.cmds is not _STATE['proxy']:
+            _STATE['modules'][moduleName] = module.cmds
+            module.cmds = _STATE['proxy']
+
+    if _SESSION[0] is None:
+        _SESSION[0] = CallStats("session")
+        _COLLECTORS.append(_SESSION[0])
+    return _SESSION[0]
+
+
+def disable():
+    """
+    - Restaura el maya.cmds original en los modulos y termina la sesion. Devuelve el CallStats de la sesion.
+    """
+    for moduleName, cmds in _STATE['modules'].items():
+        module = sys.modules.get(moduleName)
+        if module is not None and module.cmds is _STATE['proxy']:
+            module.cmds = cmds
+    _STATE['modules'].clear()
+    _STATE['cmds'] = _STATE['proxy'] = None
+
+    _session = _SESSION[0]
+    if _session is not None:
+        _session.stop()
+        _COLLECTORS.remove(_session)
+        _SESSION[0] = None
+    return _session
+
+
+def session():
+    """
+    - Devuelve el CallStats de la sesion de enable(), o None si no esta activa.
+    """
+    return _SESSION[0]
+
+
+def reset():
+    """
+    - Vacia las estadisticas de la sesion.
+    """
+    if _SESSION[0] is not None:
+        _index = _COLLECTORS.index(_SESSION[0])
+        _SESSION[0] = _COLLECTORS[_index] = CallStats("session")
+
+
+@contextlib.contextmanager
+def operation(name):
+    """
+    - Atribuye las llamadas del bloque a la operacion "name" (columna 'operation' del reporte).
+    """
+    _previous = _OPERATION[0]
+    _OPERATION[0] = name
+    try:
+        yield
+    finally:
+        _OPERATION[0] = _previous
+
+
+@contextlib.contextmanager
+def profile(name="", sampleEvery=None):
+    """
+    - Mide las llamadas a maya.cmds del bloque y devuelve su CallStats.
+    - Si la instrumentacion no estaba activa, se activa solo durante el bloque.
+    - Las llamadas del bloque se atribuyen a la operacion "name" (si se especifica).
+    """
+    _wasEnabled = is_enabled()
+    _previousSample = _STATE['sampleEvery']
+    if not _wasEnabled:
+        enable(sampleEvery=sampleEvery or 1)
+    elif sampleEvery:
+        _STATE['sampleEvery'] = max(1, int(sampleEvery))
+
+    stats = CallStats(name)
+    _COLLECTORS.append(stats)
+    try:
+        if name:
+            with operation(name):
+                yield stats
+        else:
+            yield stats
+    finally:
+        stats.stop()
+        _COLLECTORS.remove(stats)
+        _STATE['sampleEvery'] = _previousSample
+        if not _wasEnabled:
+            disable()
@@ -0,0 +1,211 @@
+"""
+Detalles:
+    - Busqueda de los controles de un rig, para que export, reset y switch de spaces trabajen sobre un personaje
+        completo sin depender de la seleccion ni de selection sets mantenidos a mano.
+    - Un nodo es control si cumple alguna de estas reglas:
+        - Tiene controller tag (nodo 'controller' conectado a su .message).
+        - Su nombre (sin namespace) cumple el patron (por defecto "*_ctl").
+        - Para los rigs registrados (register), la lista registrada reemplaza a las reglas.
+    - La jerarquia de cada root (o los nodos de cada namespace) se recorre una unica vez, y la lista de controles
+        se guarda en cache por rig. El cache se vacia con los callbacks de nodo creado, borrado, renombrado
+        o reparentado (los mismos que sceneIndex). Sin callbacks disponibles no se guarda cache.
+    - controls() es un generador: los controles se devuelven mientras se recorre la jerarquia.
+    - Los controles se devuelven con el nombre corto unico de maya.cmds, en el orden de la jerarquia (padres primero).
+    - Ejemplos de uso:
+        from riggingCodes import controlDiscovery, Reset_Controls
+
+        for control in controlDiscovery.controls('rig01:rig_grp'):
+            print(control)
+        list(controlDiscovery.controls(namespace='rig01'))
+        controlDiscovery.shared().register('rig02:rig_grp', ['rig02:root_ctl', 'rig02:cog_ctl'])
+
+        Reset_Controls.export_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path', rig='rig01:rig_grp')
+        Reset_Controls.reset_to_default(rig='rig01:rig_grp')
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import fnmatch
+
+import maya.cmds as cmds
+
+from riggingCodes import sceneIndex
+
+# Patron por defecto del nombre de los controles (sin namespace)
+CONTROL_PATTERN = "*_ctl"
+
+
+def _bare_name(name):
+    return name.split('|')[-1].split(':')[-1]
+
+
+class ControlDiscovery(object):
+    """
+    - Busqueda de controles con cache por rig:
+        cache:      {(<'root' o 'namespace'>, <str nombre>, <str patron>): [controles]}
+        registry:   {<str root>: [controles]} Controles registrados a mano, en vez de las reglas.
+        walks:      Numero de veces que se recorrio una jerarquia o un namespace.
+    """
+    def __init__(self, pattern=CONTROL_PATTERN, tags=True):
+        self.pattern = pattern
+        self.tags = tags
+        self.cache = {}
+        self.registry = {}
+        self.walks = 0
+        self._callbacks = None
+
+    def __repr__(self):
+        return "<ControlDiscovery {} rigs cached>".format(len(self.cache))
+
+    # --------------------------------------------------------------------------
+    # Cache y callbacks
+    # --------------------------------------------------------------------------
+    def attach(self):
+        """
+        - Registra los callbacks que vacian el cache. Devuelve False si no hay callbacks disponibles.
+        """
+        if self._callbacks is None:
+            # Los mismos callbacks de nodo que el indice de la escena
+            self._callbacks = sceneIndex._callback_backend(self._on_event)
+        return self._callbacks is not None
+
+    def detach(self):
+        if self._callbacks is not None:
+            self._callbacks.remove()
+            self._callbacks = None
+        self.cache.clear()
+
+    def _on_event(self, *args):
+        # Cualquier cambio de nodos (o una escena nueva) puede cambiar los controles de un rig
+        self.cache.clear()
+
+    def register(self, root, controls):
+        """
+        - Registra la lista de controles de un rig: controls(root) la devuelve en vez de buscar con las reglas.
+        """
+        self.registry[root] = list(controls)
+
+    def unregister(self, root):
+        self.registry.pop(root, None)
+
+    # --------------------------------------------------------------------------
+    # Busqueda
+    # --------------------------------------------------------------------------
+    def controls(self, *roots, **kwargs):
+        """
+        - Generador con los controles de los rigs "roots" (o de los nodos seleccionados), sin repetidos.
+        - Argumentos opcionales:
+            -namespace  <str/list> Busca los controles de uno o varios namespaces (sin ':') en vez de los roots.
+                                    Valor default: None.
+            -pattern    <str> Patron del nombre (sin namespace) de los controles. Valor default: el del objeto.
+        """
+        namespace = kwargs.get('namespace')
+        pattern = kwargs.get('pattern') or self.pattern
+
+        _keys = []
+        if namespace:
+            for eachNamespace in [namespace] if isinstance(namespace, str) else namespace:
+                _keys.append(('namespace', eachNamespace.strip(':'), pattern))
+        else:
+            if not roots:
+                roots = cmds.ls(sl=True) or []
+            for root in [roots] if isinstance(roots, str) else roots:
+                if isinstance(root, (list, tuple)):
+                    _keys.extend(('root', each, pattern) for each in root)
+                else:
+                    _keys.append(('root', root, pattern))
+
+        _seen = set()
+        for key in _keys:
+            for control in self._cached(key):
+                if control not in _seen:
+                    _seen.add(control)
+                    yield control
+
+    def _cached(self, key):
+        if key[0] == 'root' and key[1] in self.registry:
+            for control in self.registry[key[1]]:
+                yield control
+            return
+
+        _controls = self.cache.get(key)
+        if _controls is not None:
+            for control in _controls:
+                yield control
+            return
+
+        _controls = []
+        for control in self._walk(key):
+            _controls.append(control)
+            yield control
+        # Solo se guarda la lista completa (si el generador no se dejo a medias), y si hay callbacks para vaciarla
+        if self.attach():
+            self.cache[key] = _controls
+
+    def _walk(self, key):
+        """
+        - Recorre la jerarquia de un root (o los nodos de un namespace) una vez y devuelve sus controles.
+        """
+        kind, name, pattern = key
+        self.walks += 1
+        if kind == 'namespace':
+            _nodes = cmds.ls("{}:*".format(name), type='transform', long=True) or []
+        else:
+            if not cmds.objExists(name):
+                cmds.warning("The rig root {!r} doesn't exist.".format(name))
+                return
+            _descendants = cmds.listRelatives(name, allDescendents=True, type='transform', fullPath=True) or []
+            # listRelatives devuelve los descendientes mas profundos primero
+            _nodes = (cmds.ls(name, long=True) or []) + list(reversed(_descendants))
+
+        _tagged = self._tagged() if self.tags else set()
+        _found = [node for node in _nodes if node in _tagged or fnmatch.fnmatchcase(_bare_name(node), pattern)]
+        if not _found:
+            return
+        # Nombres cortos unicos, como los de la seleccion
+        for control in cmds.ls(_found) or []:
+            yield control
+
+    def _tagged(self):
+        """
+        - Devuelve los paths completos de los nodos con controller tag.
+        """
+        _tags = cmds.ls(type='controller') or []
+        if not _tags:
+            return set()
+        _objects = cmds.listConnections(["{}.controllerObject".format(tag) for tag in _tags],
+                                        source=True, destination=False) or []
+        return set(cmds.ls(_objects, long=True) or [])
+
+
+_SHARED = [None]
+
+
+def shared():
+    """
+    - Devuelve la busqueda de controles compartida por las herramientas (con su cache).
+    """
+    if _SHARED[0] is None:
+        _SHARED[0] = ControlDiscovery()
+    return _SHARED[0]
+
+
+def controls(*roots, **kwargs):
+    """
+    - Generador con los controles de los rigs, con la busqueda compartida (ver ControlDiscovery.controls).
+    """
+    return shared().controls(*roots, **kwargs)
+
+
+def clear():
+    """
+    - Quita los callbacks y el cache de la busqueda compartida.
+    """
+    if _SHARED[0] is not None:
+        _SHARED[0].detach()
+        _SHARED[0] = None
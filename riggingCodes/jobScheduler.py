@@ -0,0 +1,326 @@
+"""
+Detalles:
+    - Planificador cooperativo de trabajos largos (load_dict, connect/disconnect de RigConnector,
+        snap IK/FK en un rango de frames) para que no congelen la interfaz de Maya.
+    - Un Job divide sus elementos (nodos, entradas del template, frames) en chunks, y el Scheduler
+        ejecuta un chunk cada vez que Maya esta idle (scriptJob idleEvent). Entre chunks la interfaz responde.
+    - El tamano del chunk se ajusta solo para que cada chunk dure mas o menos el presupuesto de un frame
+        (frameBudget, por defecto 1/30 s).
+    - Progreso y ETA en la barra de progreso principal de Maya y en los callbacks del Job (onProgress).
+        Se puede cancelar con job.cancel() o con Esc en la barra de progreso.
+    - Cancelar (o un error) deshace lo que ya se hizo: con la funcion rollback del Job si tiene una,
+        o deshaciendo los undo chunks del Job (cada chunk es un paso de undo con el nombre del Job),
+        solo mientras sean los ultimos del undo queue.
+    - En modo batch (mayapy, sin interfaz) los trabajos se ejecutan directamente, sin chunks.
+    - Ejemplos de uso:
+        from riggingCodes import jobScheduler, Reset_Controls
+
+        job = Reset_Controls.load_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path', deferred=True)
+        job.onProgress.append(lambda job: print(job.progress, job.eta))
+        job.cancel()                    # Deshace los chunks ya ejecutados
+
+        # Sin interfaz: ejecutar los chunks a mano
+        scheduler = jobScheduler.Scheduler(mode='manual')
+        scheduler.submit(job)
+        scheduler.run_all()
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import time
+
+import maya.cmds as cmds
+
+# Modos del Scheduler
+_MODES = ['auto', 'idle', 'sync', 'manual']
+
+_JOB_IDS = [0]
+
+
+class Job(object):
+    """
+    - Trabajo dividido en chunks. Se necesitan:
+        name        <str> Nombre (para el progreso y el undo).
+        items       <list> Elementos a procesar, en orden.
+        process     <callable> process(chunk) procesa una lista de elementos y devuelve un resultado (opcional).
+    - Opcionales:
+        save        <callable> save(chunk) se llama antes de process (solo al ejecutar por chunks) y devuelve
+                        lo necesario para deshacer ese chunk.
+        rollback    <callable> rollback([(chunk, saved, result), ...]) deshace los chunks ya ejecutados,
+                        en orden de ejecucion. Si no hay, se deshacen los undo chunks del Job.
+        finish      <callable> finish(job) se llama al terminar (en cualquier estado).
+        chunkSize   <int> Tamano del primer chunk. Despues se ajusta al presupuesto del Scheduler.
+        undoChunk   <bool> Ejecuta cada chunk en un undo chunk con el nombre del Job. False si process
+                        ya abre sus propios undo chunks (un undo dentro de un chunk abierto no es seguro).
+    - Estados: 'pending', 'running', 'done', 'cancelled', 'failed'.
+    """
+    def __init__(self, name, items, process, save=None, rollback=None, finish=None, chunkSize=10, undoChunk=True):
+        _JOB_IDS[0] += 1
+        self.name = name
+        self.items = list(items)
+        self.process = process
+        self.save = save
+        self.rollback = rollback
+        self.finish = finish
+        self.chunkSize = max(1, int(chunkSize))
+        self.undoChunk = undoChunk
+
+        self.state = 'pending'
+        self.error = None
+        self.done = 0
+        self.chunks = []
+        self.results = []
+        self.elapsed = 0.0
+        self.rolledBack = False
+        self.onProgress = []
+        self.undoName = "{}_job{}".format(name, _JOB_IDS[0])
+        self._cancel = None
+
+    def __repr__(self):
+        return "<Job {!r} {} {}/{}>".format(self.name, self.state, self.done, self.total)
+
+    @property
+    def total(self):
+        return len(self.items)
+
+    @property
+    def progress(self):
+        return float(self.done) / self.total if self.total else 1.0
+
+    @property
+    def eta(self):
+        """
+        - Segundos estimados para terminar, con la velocidad media hasta ahora (None si aun no se sabe).
+        """
+        if not self.done or not self.elapsed:
+            return None
+        return (self.total - self.done) * self.elapsed / self.done
+
+    @property
+    def finished(self):
+        return self.state in ['done', 'cancelled', 'failed']
+
+    def cancel(self, rollback=True):
+        """
+        - Pide cancelar el Job. Se cancela antes del siguiente chunk, deshaciendo lo hecho si "rollback" es True.
+        """
+        if not self.finished:
+            self._cancel = 'rollback' if rollback else 'keep'
+
+    def run(self):
+        """
+        - Ejecuta el Job completo de una vez, sin chunks (modo batch). Devuelve el Job.
+        """
+        self.state = 'running'
+        _start = time.perf_counter()
+        try:
+            self.results.append(self.process(self.items))
+            self.done = self.total
+            self.state = 'done'
+        except Exception as e:
+            self.state = 'failed'
+            self.error = e
+            raise
+        finally:
+            self.elapsed += time.perf_counter() - _start
+            self._finish()
+        return self
+
+    def step(self, size=None):
+        """
+        - Ejecuta el siguiente chunk (de "size" elementos, o chunkSize) en un unico undo chunk.
+        - Atiende antes la cancelacion pedida. Devuelve True si el Job sigue pendiente.
+        """
+        if self.finished:
+            return False
+        if self._cancel:
+            self._stop('cancelled', rollback=self._cancel == 'rollback')
+            return False
+
+        self.state = 'running'
+        chunk = self.items[self.done:self.done + (size or self.chunkSize)]
+        _start = time.perf_counter()
+        saved = result = None
+        if self.undoChunk:
+            cmds.undoInfo(openChunk=True, chunkName=self.undoName)
+        try:
+            saved = self.save(chunk) if self.save else None
+            result = self.process(chunk)
+        except Exception as e:
+            self.error = e
+        finally:
+            if self.undoChunk:
+                cmds.undoInfo(closeChunk=True)
+            self.elapsed += time.perf_counter() - _start
+
+        if self.error is not None:
+            # El chunk que fallo tambien se deshace
+            self.chunks.append((chunk, saved, result))
+            self._stop('failed', rollback=True)
+            return False
+
+        self.chunks.append((chunk, saved, result))
+        self.results.append(result)
+        self.done += len(chunk)
+        for function in self.onProgress:
+            function(self)
+
+        if self.done >= self.total:
+            self.state = 'done'
+            self._finish()
+            return False
+        return True
+
+    def _stop(self, state, rollback=True):
+        self.state = state
+        if rollback and self.chunks:
+            self._rollback()
+        self._finish()
+
+    def _rollback(self):
+        if self.rollback is not None:
+            self.rollback(list(self.chunks))
+            self.rolledBack = True
+            return
+
+        # Sin rollback propio: deshacemos los undo chunks del Job mientras sean los ultimos del undo queue
+        # (un chunk que no cambio nada no deja paso de undo)
+        _undone = 0
+        while _undone < len(self.chunks) and cmds.undoInfo(query=True, undoName=True) == self.undoName:
+            cmds.undo()
+            _undone += 1
+        if _undone < len(self.results):
+            cmds.warning("{}: the scene changed after the job started, "
+                         "the rollback stopped before the end.".format(self.name))
+            return
+        self.rolledBack = True
+
+    def _finish(self):
+        if self.finish is not None:
+            self.finish(self)
+
+
+class Scheduler(object):
+    """
+    - Ejecuta los Jobs en orden, un chunk cada vez:
+        'idle':   en el idle de Maya (scriptJob idleEvent), con la barra de progreso principal.
+        'sync':   cada Job completo al hacer submit, sin chunks (modo batch).
+        'manual': chunks con step()/run_all(), sin idle (benchmarks, scripts).
+        'auto':   'sync' en modo batch, 'idle' con interfaz.
+    - El tamano de cada chunk se ajusta para que dure "frameBudget" segundos, entre minChunk y maxChunk.
+    """
+    def __init__(self, mode='auto', frameBudget=1.0 / 30.0, minChunk=1, maxChunk=10000):
+        if mode not in _MODES:
+            raise ValueError("Invalid mode {!r}. Use one of: {!r}".format(mode, _MODES))
+        if mode == 'auto':
+            mode = 'sync' if cmds.about(batch=True) else 'idle'
+        self.mode = mode
+        self.frameBudget = frameBudget
+        self.minChunk = minChunk
+        self.maxChunk = maxChunk
+        self.jobs = []
+        self._scriptJob = None
+        self._progressBar = None
+
+    def submit(self, job):
+        """
+        - Agrega un Job a la cola (en modo 'sync' lo ejecuta directamente). Devuelve el Job.
+        """
+        if self.mode == 'sync':
+            return job.run()
+        self.jobs.append(job)
+        if self.mode == 'idle' and self._scriptJob is None:
+            self._scriptJob = cmds.scriptJob(idleEvent=self._on_idle)
+        return job
+
+    def step(self):
+        """
+        - Ejecuta un chunk del primer Job pendiente y ajusta el tamano del siguiente.
+            Devuelve False si no quedan Jobs.
+        """
+        while self.jobs and self.jobs[0].finished:
+            self.jobs.pop(0)
+        if not self.jobs:
+            return False
+
+        job = self.jobs[0]
+        _size = job.chunkSize
+        _elapsed = job.elapsed
+        _pending = job.step(_size)
+
+        # Ajuste del chunk: el tamano que habria durado frameBudget, suavizado con el anterior
+        _chunkTime = job.elapsed - _elapsed
+        if _pending and _chunkTime > 0:
+            _ideal = _size * self.frameBudget / _chunkTime
+            job.chunkSize = int(min(self.maxChunk, max(self.minChunk, (_size + _ideal) / 2.0)))
+        if not _pending:
+            self.jobs.pop(0)
+        return bool(self.jobs)
+
+    def run_all(self):
+        """
+        - Ejecuta todos los chunks de todos los Jobs de la cola (modo 'manual').
+        """
+        while self.step():
+            pass
+
+    def cancel_all(self, rollback=True):
+        for job in self.jobs:
+            job.cancel(rollback=rollback)
+
+    # --------------------------------------------------------------------------
+    # Idle de Maya
+    # --------------------------------------------------------------------------
+    def _on_idle(self):
+        job = self.jobs[0] if self.jobs else None
+        if job is not None and self._cancelled_by_user():
+            job.cancel()
+
+        _pending = self.step()
+        self._show_progress()
+        if not _pending:
+            self._hide_progress()
+            if self._scriptJob is not None:
+                # Un scriptJob no se puede borrar desde su propio callback
+                _id, self._scriptJob = self._scriptJob, None
+                cmds.evalDeferred(lambda: cmds.scriptJob(kill=_id, force=True))
+
+    def _main_progress_bar(self):
+        if self._progressBar is None:
+            import maya.mel as mel
+            self._progressBar = mel.eval('$tmp = $gMainProgressBar')
+            cmds.progressBar(self._progressBar, edit=True, beginProgress=True, isInterruptable=True)
+        return self._progressBar
+
+    def _show_progress(self):
+        if not self.jobs:
+            return
+        job = self.jobs[0]
+        _eta = " (ETA {:.1f}s)".format(job.eta) if job.eta is not None else ""
+        cmds.progressBar(self._main_progress_bar(), edit=True, maxValue=max(1, job.total), progress=job.done,
+                         status="{}: {}/{}{}".format(job.name, job.done, job.total, _eta))
+
+    def _hide_progress(self):
+        if self._progressBar is not None:
+            cmds.progressBar(self._progressBar, edit=True, endProgress=True)
+            self._progressBar = None
+
+    def _cancelled_by_user(self):
+        return self._progressBar is not None and cmds.progressBar(self._progressBar, query=True, isCancelled=True)
+
+
+_SHARED = [None]
+
+
+def shared():
+    """
+    - Devuelve el Scheduler compartido por las herramientas (modo 'auto').
+    """
+    if _SHARED[0] is None:
+        _SHARED[0] = Scheduler()
+    return _SHARED[0]
@@ -0,0 +1,491 @@
+"""
+Detalles:
+    - Backend de ejecucion de las herramientas: las operaciones de los bucles costosos
+        (leer/escribir plugs, leer/escribir la matriz de mundo, listar atributos y conexiones)
+        pasan por un objeto backend en vez de llamar directamente a maya.cmds.
+    - Backends:
+        - 'cmds':     maya.cmds, con nombres de plug en texto. Es el default, y el unico fuera de Maya
+                      (en el stand-in).
+        - 'openmaya': OpenMaya 2.0. Guarda los MObject (MObjectHandle), MDagPath y MPlug de cada nombre,
+                      asi que las lecturas repetidas no vuelven a buscar el nodo ni el atributo.
+                      Lo que no sabe leer o escribir (tipos raros, plugs con indices) lo hace con maya.cmds.
+    - Las escrituras de OpenMaya no entran en la cola de undo de Maya. Por eso, con el backend 'openmaya'
+        las escrituras se hacen con maya.cmds salvo que se pida undoable=False: entonces set_plug y
+        set_world_matrix usan un MDGModifier, y set_plugs escribe todos los valores con un solo
+        MDGModifier (se puede deshacer con undo_last()).
+    - El backend se elige en tiempo de ejecucion con use(), y el benchmark comprueba que todos los
+        backends disponibles dejan la escena igual (bench_tools.py --check-backends).
+    - Ejemplos de uso:
+        from riggingCodes import mayaBackend
+
+        mayaBackend.use('openmaya')                     # Lecturas con OpenMaya, escrituras con undo
+        mayaBackend.use('openmaya', undoable=False)     # Escrituras en bloque con MDGModifier
+        backend = mayaBackend.current()
+        backend.get_plug('L_handIK_ctl', 'translateX')
+        backend.set_plugs([('L_handIK_ctl', 'translateX', 1.0), ('L_handIK_ctl', 'rotateY', 45.0)])
+        backend.undo_last()
+
+        mayaBackend.use('cmds')
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Check the optional dependencies with riggingCodes._lazy
+        -Plug cache per node: a cache miss no longer scans every cached plug
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import maya.cmds as cmds
+
+from riggingCodes import _lazy
+
+
+class CmdsBackend(object):
+    """
+    - Backend con maya.cmds. Los valores tienen el mismo formato que getAttr
+        (los atributos compuestos como [(x, y, z)]) y las matrices son listas de 16 valores, como en xform.
+    """
+    name = 'cmds'
+
+    def __init__(self, undoable=True):
+        self.undoable = undoable
+
+    # --------------------------------------------------------------------------
+    # Plugs
+    # --------------------------------------------------------------------------
+    def attribute_exists(self, node, attr):
+        return cmds.attributeQuery(attr, exists=True, node=node)
+
+    def get_plug(self, node, attr):
+        return cmds.getAttr("{}.{}".format(node, attr))
+
+    def get_plug_type(self, node, attr):
+        return cmds.getAttr("{}.{}".format(node, attr), type=True)
+
+    def get_plug_default(self, node, attr):
+        """
+        - Valor default declarado del atributo (attributeQuery listDefault), con el formato de getAttr.
+            Devuelve None si el atributo no tiene default (strings, mensajes).
+        """
+        _default = cmds.attributeQuery(attr, node=node, listDefault=True)
+        if not _default or _default[0] is None:
+            return None
+        if len(_default) == 1:
+            return _default[0]
+        return [tuple(_default)]
+
+    def set_plug(self, node, attr, value):
+        _plug = "{}.{}".format(node, attr)
+        if isinstance(value, str):
+            cmds.setAttr(_plug, value, type='string')
+        elif isinstance(value, (list, tuple)):
+            # Formato de getAttr para los compuestos: [(x, y, z)]
+            if len(value) == 1 and isinstance(value[0], (list, tuple)):
+                value = value[0]
+            cmds.setAttr(_plug, *value)
+        else:
+            cmds.setAttr(_plug, value)
+
+    def set_plugs(self, values):
+        """
+        - Escribe una lista de valores [(node, attr, value)].
+        - No se detiene en los que fallan: devuelve una lista [(node, attr, error)].
+        """
+        failed = []
+        for node, attr, value in values:
+            try:
+                self.set_plug(node, attr, value)
+            except RuntimeError as e:
+                failed.append((node, attr, e))
+        return failed
+
+    def undo_last(self):
+        """
+        - Deshace el ultimo set_plugs. Con maya.cmds las escrituras ya estan en la cola de undo de Maya.
+        """
+        cmds.undo()
+
+    # --------------------------------------------------------------------------
+    # Transforms
+    # --------------------------------------------------------------------------
+    def get_world_matrix(self, node):
+        return cmds.xform(node, query=True, worldSpace=True, matrix=True)
+
+    def set_world_matrix(self, node, matrix):
+        cmds.xform(node, worldSpace=True, matrix=matrix)
+
+    # --------------------------------------------------------------------------
+    # Listas
+    # --------------------------------------------------------------------------
+    def list_attributes(self, node):
+        """
+        - Atributos del channelBox del nodo (los de listAttr que son animables), en el orden de listAttr.
+        """
+        _attrs = []
+        _allAttrs = cmds.listAttr(node)
+        _chbxAttrs = cmds.listAnimatable(node)
+
+        if _allAttrs and _chbxAttrs:
+            for _attr in _allAttrs:
+                for _cbAttr in _chbxAttrs:
+                    if _cbAttr.endswith(_attr):
+                        _attrs.append(_attr)
+        return _attrs
+
+    def list_connections(self, node, source=True, destination=True):
+        """
+        - Devuelve las conexiones del nodo como una lista de tuplas (sourcePlug, destinationPlug).
+        """
+        pairs = []
+        if source:
+            _plugs = cmds.listConnections(node, source=True, destination=False,
+                                          connections=True, plugs=True) or []
+            pairs.extend(zip(_plugs[1::2], _plugs[0::2]))
+        if destination:
+            _plugs = cmds.listConnections(node, source=False, destination=True,
+                                          connections=True, plugs=True) or []
+            pairs.extend(zip(_plugs[0::2], _plugs[1::2]))
+        return pairs
+
+    def clear_cache(self):
+        pass
+
+
+class OpenMayaBackend(CmdsBackend):
+    """
+    - Backend con OpenMaya 2.0. Cache:
+        nodes: {name: MObjectHandle}
+        paths: {name: MDagPath}
+        plugs: {name: {attr: (MPlug, typeName)}}   (por nodo: olvidar un nodo no recorre los plugs de los demas)
+    - Cada acceso comprueba que el MObjectHandle siga siendo valido y que el nodo se siga llamando igual;
+        si no (nodo borrado, renombrado, escena nueva), se vuelve a buscar el nombre y se vacia su cache.
+    """
+    name = 'openmaya'
+
+    def __init__(self, undoable=True):
+        super(OpenMayaBackend, self).__init__(undoable)
+        import maya.api.OpenMaya as om
+        self._om = om
+        self._nodes = {}
+        self._paths = {}
+        self._plugs = {}
+        self._lastModifier = None
+
+        MFn = om.MFn
+        _numeric = om.MFnNumericData
+        self._numericTypes = {_numeric.kBoolean: 'bool', _numeric.kByte: 'byte', _numeric.kChar: 'char',
+                              _numeric.kShort: 'short', _numeric.kInt: 'long', _numeric.kFloat: 'float',
+                              _numeric.kDouble: 'double', _numeric.k3Double: 'double3', _numeric.k3Float: 'float3'}
+        self._apiTypes = {MFn.kDoubleLinearAttribute: 'doubleLinear', MFn.kFloatLinearAttribute: 'floatLinear',
+                          MFn.kDoubleAngleAttribute: 'doubleAngle', MFn.kFloatAngleAttribute: 'floatAngle',
+                          MFn.kEnumAttribute: 'enum', MFn.kAttribute3Double: 'double3',
+                          MFn.kAttribute3Float: 'float3'}
+        self._unitTypes = {om.MFnUnitAttribute.kDistance: 'doubleLinear', om.MFnUnitAttribute.kAngle: 'doubleAngle'}
+
+    def clear_cache(self):
+        self._nodes.clear()
+        self._paths.clear()
+        self._plugs.clear()
+
+    # --------------------------------------------------------------------------
+    # Cache
+    # --------------------------------------------------------------------------
+    def _node(self, name):
+        om = self._om
+        handle = self._nodes.get(name)
+        if handle is not None and handle.isValid():
+            _object = handle.object()
+            if om.MFnDependencyNode(_object).name() == name.rsplit('|', 1)[-1]:
+                return _object
+
+        # Nodo nuevo, borrado o renombrado: se busca otra vez (solo hay cache que vaciar si ya estaba)
+        if handle is not None:
+            self._forget(name)
+        _selection = om.MSelectionList()
+        try:
+            _selection.add(name)
+        except RuntimeError:
+            raise ValueError("No object matches name: {}".format(name))
+        _object = _selection.getDependNode(0)
+        self._nodes[name] = om.MObjectHandle(_object)
+        return _object
+
+    def _forget(self, name):
+        self._nodes.pop(name, None)
+        self._paths.pop(name, None)
+        self._plugs.pop(name, None)
+
+    def _dag_path(self, name):
+        _object = self._node(name)
+        path = self._paths.get(name)
+        if path is None or not path.isValid():
+            path = self._paths[name] = self._om.MDagPath.getAPathTo(_object)
+        return path
+
+    def _plug(self, node, attr):
+        """
+        - Devuelve (MPlug, typeName), o None si el atributo no se puede resolver con OpenMaya
+            (plugs con indices o de otro nodo): entonces se usa maya.cmds.
+        """
+        if '[' in attr or '.' in attr:
+            return None
+        _object = self._node(node)
+        _nodePlugs = self._plugs.setdefault(node, {})
+        entry = _nodePlugs.get(attr)
+        if entry is None:
+            try:
+                _plug = self._om.MFnDependencyNode(_object).findPlug(attr, False)
+            except RuntimeError:
+                raise ValueError("No object matches name: {}.{}".format(node, attr))
+            entry = _nodePlugs[attr] = (_plug, self._plug_type(_plug))
+        return entry
+
+    def _plug_type(self, plug):
+        """
+        - Tipo del plug con los nombres de getAttr(type=True), o None si no se sabe leer con OpenMaya.
+        """
+        om = self._om
+        attribute = plug.attribute()
+        apiType = attribute.apiType()
+        if apiType == om.MFn.kNumericAttribute:
+            return self._numericTypes.get(om.MFnNumericAttribute(attribute).numericType())
+        if apiType == om.MFn.kUnitAttribute:
+            return self._unitTypes.get(om.MFnUnitAttribute(attribute).unitType())
+        if apiType == om.MFn.kTypedAttribute:
+            return 'string' if om.MFnTypedAttribute(attribute).attrType() == om.MFnData.kString else None
+        return self._apiTypes.get(apiType)
+
+    # --------------------------------------------------------------------------
+    # Lectura y escritura de valores
+    # --------------------------------------------------------------------------
+    def _read(self, plug, typeName):
+        om = self._om
+        if typeName == 'bool':
+            return plug.asBool()
+        if typeName in ('byte', 'char', 'short', 'long', 'enum'):
+            return plug.asInt()
+        if typeName in ('float', 'double'):
+            return plug.asDouble()
+        if typeName in ('doubleLinear', 'floatLinear'):
+            return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+        if typeName in ('doubleAngle', 'floatAngle'):
+            return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+        if typeName == 'string':
+            return plug.asString()
+        # double3/float3
+        _children = [plug.child(index) for index in range(plug.numChildren())]
+        return [tuple(self._read(child, self._plug_type(child)) for child in _children)]
+
+    def _write(self, modifier, plug, typeName, value):
+        om = self._om
+        if plug.isLocked or plug.isDestination:
+            raise RuntimeError("setAttr: The attribute '{}' is locked or connected "
+                               "and cannot be modified.".format(plug.name()))
+        if typeName == 'bool':
+            modifier.newPlugValueBool(plug, bool(value))
+        elif typeName in ('byte', 'char', 'short', 'long', 'enum'):
+            modifier.newPlugValueInt(plug, int(value))
+        elif typeName in ('float', 'double'):
+            modifier.newPlugValueDouble(plug, float(value))
+        elif typeName in ('doubleLinear', 'floatLinear'):
+            modifier.newPlugValueMDistance(plug, om.MDistance(float(value), om.MDistance.uiUnit()))
+        elif typeName in ('doubleAngle', 'floatAngle'):
+            modifier.newPlugValueMAngle(plug, om.MAngle(float(value), om.MAngle.uiUnit()))
+        elif typeName == 'string':
+            modifier.newPlugValueString(plug, value)
+        else:
+            # double3/float3: [(x, y, z)] o (x, y, z)
+            if len(value) == 1 and isinstance(value[0], (list, tuple)):
+                value = value[0]
+            for index, childValue in enumerate(value):
+                _child = plug.child(index)
+                self._write(modifier, _child, self._plug_type(_child), childValue)
+
+    def get_plug(self, node, attr):
+        entry = self._plug(node, attr)
+        if entry is None or entry[1] is None:
+            return super(OpenMayaBackend, self).get_plug(node, attr)
+        return self._read(*entry)
+
+    def get_plug_type(self, node, attr):
+        entry = self._plug(node, attr)
+        if entry is None or entry[1] is None:
+            return super(OpenMayaBackend, self).get_plug_type(node, attr)
+        return entry[1]
+
+    def attribute_exists(self, node, attr):
+        return self._om.MFnDependencyNode(self._node(node)).hasAttribute(attr)
+
+    def set_plug(self, node, attr, value):
+        if self.undoable:
+            return super(OpenMayaBackend, self).set_plug(node, attr, value)
+        failed = self.set_plugs([(node, attr, value)])
+        if failed:
+            raise failed[0][2]
+
+    def set_plugs(self, values):
+        """
+        - Con undoable=False escribe todos los valores con un solo MDGModifier.
+            Los que no se pueden escribir con OpenMaya se escriben con maya.cmds despues.
+        """
+        if self.undoable:
+            return super(OpenMayaBackend, self).set_plugs(values)
+
+        failed = []
+        _fallback = []
+        modifier = self._om.MDGModifier()
+        for node, attr, value in values:
+            try:
+                entry = self._plug(node, attr)
+                if entry is None or entry[1] is None:
+                    _fallback.append((node, attr, value))
+                    continue
+                self._write(modifier, entry[0], entry[1], value)
+            except (RuntimeError, ValueError) as e:
+                failed.append((node, attr, e))
+        modifier.doIt()
+        self._lastModifier = modifier
+
+        failed.extend(super(OpenMayaBackend, self).set_plugs(_fallback))
+        return failed
+
+    def undo_last(self):
+        if self.undoable:
+            return super(OpenMayaBackend, self).undo_last()
+        if self._lastModifier is not None:
+            self._lastModifier.undoIt()
+            self._lastModifier = None
+
+    # --------------------------------------------------------------------------
+    # Transforms
+    # --------------------------------------------------------------------------
+    def _ui_distance(self):
+        om = self._om
+        return om.MDistance(1.0, om.MDistance.internalUnit()).asUnits(om.MDistance.uiUnit())
+
+    def get_world_matrix(self, node):
+        _matrix = self._dag_path(node).inclusiveMatrix()
+        values = [_matrix.getElement(row, column) for row in range(4) for column in range(4)]
+        _scale = self._ui_distance()
+        if _scale != 1.0:
+            for index in (12, 13, 14):
+                values[index] *= _scale
+        return values
+
+    def set_world_matrix(self, node, matrix):
+        """
+        - Con undoable=False descompone la matriz en translate/rotate/scale y los escribe con un MDGModifier.
+            Si el nodo tiene pivots, rotateAxis o shear se usa xform (la descomposicion no los tiene en cuenta).
+        """
+        if self.undoable or not self._simple_transform(node):
+            return super(OpenMayaBackend, self).set_world_matrix(node, matrix)
+
+        om = self._om
+        _values = list(matrix)
+        _scale = self._ui_distance()
+        if _scale != 1.0:
+            for index in (12, 13, 14):
+                _values[index] /= _scale
+        _local = om.MMatrix(_values) * self._dag_path(node).exclusiveMatrixInverse()
+        _transform = om.MTransformationMatrix(_local)
+
+        _rotation = _transform.asRotateMatrix()
+        _object = self._node(node)
+        if _object.hasFn(om.MFn.kJoint):
+            # En los joints la rotacion local es rotate * jointOrient
+            _orient = om.MEulerRotation(*[om.MAngle(value, om.MAngle.uiUnit()).asRadians()
+                                          for value in self.get_plug(node, 'jointOrient')[0]])
+            _rotation = _rotation * _orient.asMatrix().inverse()
+        _order = self.get_plug(node, 'rotateOrder')
+        _euler = om.MTransformationMatrix(_rotation).rotation().reorder(_order)
+
+        _translate = _transform.translation(om.MSpace.kTransform)
+        values = [(node, 'translate', [_translate.x * _scale, _translate.y * _scale, _translate.z * _scale]),
+                  (node, 'rotate', [om.MAngle(value).asUnits(om.MAngle.uiUnit())
+                                    for value in (_euler.x, _euler.y, _euler.z)]),
+                  (node, 'scale', _transform.scale(om.MSpace.kTransform))]
+        failed = self.set_plugs(values)
+        if failed:
+            raise failed[0][2]
+
+    def _simple_transform(self, node):
+        for attr in ['rotatePivot', 'scalePivot', 'rotateAxis', 'shear']:
+            if not self.attribute_exists(node, attr):
+                return False
+            if any(abs(value) > 1e-9 for value in self.get_plug(node, attr)[0]):
+                return False
+        return True
+
+    # --------------------------------------------------------------------------
+    # Listas
+    # --------------------------------------------------------------------------
+    def list_attributes(self, node):
+        """
+        - Atributos keyable del nodo (los del channelBox), en el orden de los atributos del nodo.
+        """
+        om = self._om
+        _object = self._node(node)
+        _node = om.MFnDependencyNode(_object)
+        _attrs = []
+        for index in range(_node.attributeCount()):
+            _attribute = om.MFnAttribute(_node.attribute(index))
+            if not _attribute.keyable or _attribute.hidden:
+                continue
+            _plug = om.MPlug(_object, _node.attribute(index))
+            if _plug.isKeyable:
+                _attrs.append(_attribute.name)
+        return _attrs
+
+    def list_connections(self, node, source=True, destination=True):
+        _node = self._om.MFnDependencyNode(self._node(node))
+        pairs = []
+        for plug in _node.getConnections():
+            if source:
+                pairs.extend((other.name(), plug.name()) for other in plug.connectedTo(True, False))
+            if destination:
+                pairs.extend((plug.name(), other.name()) for other in plug.connectedTo(False, True))
+        return pairs
+
+
+# ------------------------------------------------------------------------------
+# Seleccion del backend
+# ------------------------------------------------------------------------------
+BACKENDS = {'cmds': CmdsBackend,
+            'openmaya': OpenMayaBackend}
+
+_CURRENT = [None]
+
+
+def available():
+    """
+    - Devuelve los nombres de los backends que se pueden usar en esta sesion.
+        Con el stand-in de maya.cmds solo 'cmds'.
+    """
+    names = ['cmds']
+    if not getattr(cmds, '__standIn__', False):
+        if _lazy.is_available('maya.api.OpenMaya'):
+            names.append('openmaya')
+    return names
+
+
+def use(name='cmds', undoable=True):
+    """
+    - Cambia el backend de las herramientas. Devuelve el backend.
+    """
+    if name not in BACKENDS:
+        raise ValueError("Invalid backend {!r}. Use one of: {!r}".format(name, sorted(BACKENDS)))
+    if name not in available():
+        raise RuntimeError("The {!r} backend is not available in this session.".format(name))
+    _CURRENT[0] = BACKENDS[name](undoable=undoable)
+    return _CURRENT[0]
+
+
+def current():
+    """
+    - Devuelve el backend actual (maya.cmds si no se eligio ninguno).
+    """
+    if _CURRENT[0] is None:
+        _CURRENT[0] = CmdsBackend()
+    return _CURRENT[0]
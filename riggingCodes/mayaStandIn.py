@@ -0,0 +1,2351 @@
+"""
+Detalles:
+    - Escena en memoria que imita el subconjunto de maya.cmds que usan las herramientas del paquete
+        (Reset_Controls, snapIKFK, Grupos_y_Spaces y Conectar_Y_Desconectar), para poder ejecutarlas,
+        medirlas y hacer pruebas de regresion fuera de Maya (Linux sin Maya, CI).
+    - install() registra los modulos 'maya' y 'maya.cmds' en sys.modules. Se debe llamar antes de importar
+        las herramientas; si ya estaban importadas, tambien se actualiza su variable 'cmds'.
+    - Lo que implementa:
+        - Grafo de nodos con nombres cortos, paths (|a|b), namespaces (ns:node), nombres repetidos en DAG y UUIDs.
+        - Atributos con tipo, valor default, lock, keyable, channelBox, min/max, enum, compuestos (translate)
+            y multi (worldMatrix[0], matrixIn[2]). Atributos dinamicos con addAttr.
+        - Conexiones con evaluacion bajo demanda y propagacion real de matrices:
+            matrix, worldMatrix, parentMatrix, parentInverseMatrix, offsetParentMatrix, jointOrient y rotateOrder.
+            Los valores evaluados se guardan en cache, y un cambio solo invalida los plugs que dependen de el.
+        - Nodos: transform, joint, locator, parent/point/orient/scaleConstraint (con offset y varios targets con peso),
+            multMatrix, decomposeMatrix, reverse, condition y controller (controller tags).
+        - Undo con chunks (undoInfo/undo), seleccion y referencias simuladas (file/referenceQuery).
+        - Callbacks de nodo creado/borrado/renombrado/reparentado (add_node_callback), como los de
+            MDGMessage/MNodeMessage/MDagMessage de OpenMaya, y de atributo cambiado (add_attribute_callback).
+        - Contador de llamadas por comando (Scene.stats).
+        - Tiempo actual (currentTime) y keys (setKeyframe), que se guardan pero no se evaluan.
+    - Lo que no implementa: curvas de animacion, geometria, pivots, shear, segmentScaleCompensate e IK.
+        Los flags no soportados dan TypeError, para que no pasen desapercibidos.
+    - Ejemplo de uso:
+        from riggingCodes import mayaStandIn
+        scene = mayaStandIn.install()
+
+        from riggingCodes import syntheticRig, Reset_Controls
+        syntheticRig.build_biped(controls=100)
+        Reset_Controls.get_nodesInfo_asDict('L_handIK_ctl')
+        print(scene.stats())
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Linux / Windows (sin Maya)
+"""
+
+import collections
+import functools
+import math
+import re
+import sys
+import types
+import uuid
+
+
+# ------------------------------------------------------------------------------
+# Matrices (formato plano de 16 valores por filas, convencion de Maya: vectores fila)
+# ------------------------------------------------------------------------------
+
+_IDENTITY = (1.0, 0.0, 0.0, 0.0,
+             0.0, 1.0, 0.0, 0.0,
+             0.0, 0.0, 1.0, 0.0,
+             0.0, 0.0, 0.0, 1.0)
+
+# Valores del enum rotateOrder de Maya. La primera letra es el primer eje que se aplica.
+ROTATE_ORDERS = ['xyz', 'yzx', 'zxy', 'xzy', 'yxz', 'zyx']
+
+
+def _mult(a, b):
+    """
+    - Multiplica dos matrices 4x4 en formato plano (a * b).
+    """
+    result = []
+    for row in range(0, 16, 4):
+        _a0, _a1, _a2, _a3 = a[row:row + 4]
+        for col in range(4):
+            result.append(_a0 * b[col] + _a1 * b[4 + col] + _a2 * b[8 + col] + _a3 * b[12 + col])
+    return result
+
+
+def _inverse(m):
+    """
+    - Devuelve la inversa de una matriz 4x4 en formato plano (Gauss-Jordan).
+    """
+    _rows = [list(m[row * 4:row * 4 + 4]) + [1.0 if row == col else 0.0 for col in range(4)]
+             for row in range(4)]
+
+    for col in range(4):
+        _pivot = max(range(col, 4), key=lambda row: abs(_rows[row][col]))
+        if abs(_rows[_pivot][col]) < 1e-12:
+            raise RuntimeError("The matrix is singular and can't be inverted.")
+        _rows[col], _rows[_pivot] = _rows[_pivot], _rows[col]
+
+        _factor = _rows[col][col]
+        _rows[col] = [value / _factor for value in _rows[col]]
+
+        for row in range(4):
+            if row != col and _rows[row][col]:
+                _factor = _rows[row][col]
+                _rows[row] = [value - _factor * pivotValue for value, pivotValue in zip(_rows[row], _rows[col])]
+
+    return [value for row in _rows for value in row[4:]]
+
+
+def _axis_matrix(axis, degrees):
+    """
+    - Matriz de rotacion (vectores fila) sobre el eje 0, 1 o 2.
+    """
+    _angle = math.radians(degrees)
+    _c, _s = math.cos(_angle), math.sin(_angle)
+    if axis == 0:
+        return [1.0, 0.0, 0.0, 0.0, 0.0, _c, _s, 0.0, 0.0, -_s, _c, 0.0, 0.0, 0.0, 0.0, 1.0]
+    if axis == 1:
+        return [_c, 0.0, -_s, 0.0, 0.0, 1.0, 0.0, 0.0, _s, 0.0, _c, 0.0, 0.0, 0.0, 0.0, 1.0]
+    return [_c, _s, 0.0, 0.0, -_s, _c, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+
+def euler_to_matrix(rotation, rotateOrder=0):
+    """
+    - Convierte una rotacion euler en grados al formato plano, con el rotateOrder de Maya (0 = xyz).
+    """
+    result = list(_IDENTITY)
+    for letter in ROTATE_ORDERS[rotateOrder]:
+        _axis = 'xyz'.index(letter)
+        if rotation[_axis]:
+            result = _mult(result, _axis_matrix(_axis, rotation[_axis]))
+    return result
+
+
+def matrix_to_euler(m, rotateOrder=0):
+    """
+    - Devuelve la rotacion euler en grados de una matriz de rotacion pura (sin escala), con el rotateOrder de Maya.
+    """
+    _i, _j, _k = ['xyz'.index(letter) for letter in ROTATE_ORDERS[rotateOrder]]
+    # Transpuesta: la matriz en convencion de vectores columna, C = Rk * Rj * Ri
+    _col = [[m[col * 4 + row] for col in range(3)] for row in range(3)]
+    _sign = 1.0 if (_i, _j, _k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)] else -1.0
+
+    _sinB = max(-1.0, min(1.0, -_sign * _col[_k][_i]))
+    _beta = math.asin(_sinB)
+    if abs(math.cos(_beta)) > 1e-7:
+        _alpha = math.atan2(_sign * _col[_k][_j], _col[_k][_k])
+        _gamma = math.atan2(_sign * _col[_j][_i], _col[_i][_i])
+    else:
+        # Gimbal lock: gamma = 0 y alpha sale de Rj(beta)^T * C
+        _gamma = 0.0
+        _rj = _axis_matrix(_j, math.degrees(_beta))
+        _rjCol = [[_rj[col * 4 + row] for col in range(3)] for row in range(3)]
+        _rest = [[sum(_rjCol[k][row] * _col[k][col] for k in range(3)) for col in range(3)] for row in range(3)]
+        _alpha = math.atan2(_sign * _rest[_k][_j], _rest[_j][_j])
+
+    result = [0.0, 0.0, 0.0]
+    result[_i] = math.degrees(_alpha)
+    result[_j] = math.degrees(_beta)
+    result[_k] = math.degrees(_gamma)
+    return result
+
+
+def _row_length(m, row):
+    return math.sqrt(m[row * 4] ** 2 + m[row * 4 + 1] ** 2 + m[row * 4 + 2] ** 2)
+
+
+def _rotation_part(m):
+    """
+    - Devuelve la rotacion de la matriz: filas normalizadas y sin translacion.
+    """
+    result = list(_IDENTITY)
+    _det = _determinant3(m)
+    for row in range(3):
+        _length = _row_length(m, row) or 1.0
+        if row == 0 and _det < 0:
+            _length = -_length
+        result[row * 4:row * 4 + 3] = [value / _length for value in m[row * 4:row * 4 + 3]]
+    return result
+
+
+def _determinant3(m):
+    return (m[0] * (m[5] * m[10] - m[6] * m[9]) -
+            m[1] * (m[4] * m[10] - m[6] * m[8]) +
+            m[2] * (m[4] * m[9] - m[5] * m[8]))
+
+
+def _orthonormalize(m):
+    """
+    - Gram-Schmidt sobre las filas de rotacion (para mezclar rotaciones con pesos).
+    """
+    _x = m[0:3]
+    _lx = math.sqrt(sum(v * v for v in _x)) or 1.0
+    _x = [v / _lx for v in _x]
+    _y = m[4:7]
+    _dot = sum(a * b for a, b in zip(_x, _y))
+    _y = [b - _dot * a for a, b in zip(_x, _y)]
+    _ly = math.sqrt(sum(v * v for v in _y)) or 1.0
+    _y = [v / _ly for v in _y]
+    _z = [_x[1] * _y[2] - _x[2] * _y[1], _x[2] * _y[0] - _x[0] * _y[2], _x[0] * _y[1] - _x[1] * _y[0]]
+    return _x + [0.0] + _y + [0.0] + _z + [0.0] + list(m[12:16])
+
+
+def compose_matrix(translate=(0.0, 0.0, 0.0), rotate=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0),
+                   rotateOrder=0, jointOrient=None):
+    """
+    - Matriz local de un transform: S * R * [jointOrient] * T.
+    """
+    _rot = euler_to_matrix(rotate, rotateOrder)
+    if jointOrient and any(jointOrient):
+        _rot = _mult(_rot, euler_to_matrix(jointOrient))
+    result = list(_rot)
+    for row in range(3):
+        for col in range(3):
+            result[row * 4 + col] *= scale[row]
+    result[12:15] = [float(value) for value in translate]
+    return result
+
+
+def decompose_matrix(m, rotateOrder=0, jointOrient=None):
+    """
+    - Separa una matriz local en (translate, rotate, scale), teniendo en cuenta el jointOrient.
+    """
+    _scale = [_row_length(m, row) for row in range(3)]
+    if _determinant3(m) < 0:
+        _scale[0] = -_scale[0]
+
+    _rot = _rotation_part(m)
+    if jointOrient and any(jointOrient):
+        _rot = _mult(_rot, _inverse(euler_to_matrix(jointOrient)))
+
+    return list(m[12:15]), matrix_to_euler(_rot, rotateOrder), _scale
+
+
+def _transform_point(point, m):
+    _x, _y, _z = point
+    return [_x * m[0] + _y * m[4] + _z * m[8] + m[12],
+            _x * m[1] + _y * m[5] + _z * m[9] + m[13],
+            _x * m[2] + _y * m[6] + _z * m[10] + m[14]]
+
+
+# ------------------------------------------------------------------------------
+# Definicion de atributos y tipos de nodo
+# ------------------------------------------------------------------------------
+
+class _AttrDef(object):
+    """
+    - Definicion de un atributo (de un tipo de nodo o dinamico).
+    """
+    __slots__ = ['name', 'short', 'type', 'default', 'keyable', 'channelBox', 'hidden', 'compute',
+                 'children', 'parent', 'index', 'multi', 'min', 'max', 'enum', 'dynamic', 'niceName']
+
+    def __init__(self, name, short, attrType, default=None, **kwargs):
+        self.name = name
+        self.short = short or name
+        self.type = attrType
+        self.default = default
+        self.keyable = kwargs.get('keyable', False)
+        self.channelBox = kwargs.get('channelBox', False)
+        self.hidden = kwargs.get('hidden', False)
+        # Funcion compute(scene, node, key) para los atributos de salida
+        self.compute = kwargs.get('compute')
+        self.children = []
+        self.parent = None
+        self.index = 0
+        self.multi = kwargs.get('multi', False)
+        self.min = kwargs.get('min')
+        self.max = kwargs.get('max')
+        self.enum = kwargs.get('enum')
+        self.dynamic = kwargs.get('dynamic', False)
+        self.niceName = kwargs.get('niceName')
+
+    @property
+    def output(self):
+        return self.compute is not None or (self.parent is not None and self.parent.compute is not None)
+
+
+def _attr(name, short, attrType, default=None, **kwargs):
+    return [_AttrDef(name, short, attrType, default, **kwargs)]
+
+
+def _compound(name, short, childType, default=(0.0, 0.0, 0.0), suffixes='XYZ', shortSuffixes=None, **kwargs):
+    """
+    - Atributo compuesto de tres hijos (translate -> translateX, translateY, translateZ).
+    """
+    _parentKwargs = dict(kwargs)
+    _parentKwargs['keyable'] = False
+    parent = _AttrDef(name, short, 'float3' if childType == 'float' else 'double3', None, **_parentKwargs)
+    _childKwargs = dict(kwargs)
+    _childKwargs.pop('compute', None)
+    result = [parent]
+    for index, suffix in enumerate(suffixes):
+        _shortSuffix = (shortSuffixes or suffixes.lower())[index]
+        child = _AttrDef(name + suffix, short + _shortSuffix, childType, default[index], **_childKwargs)
+        child.parent = parent
+        child.index = index
+        parent.children.append(child)
+        result.append(child)
+    return result
+
+
+class _NodeType(object):
+    """
+    - Tipo de nodo: cadena de herencia y definiciones de atributos (por nombre largo y corto).
+    """
+    def __init__(self, name, base, attrs, dag):
+        self.name = name
+        self.base = base
+        self.dag = dag if dag is not None else (base.dag if base else False)
+        self.inherited = [name] + (base.inherited if base else [])
+        self.order = (base.order if base else []) + attrs
+        self.defs = {}
+        for attrDef in self.order:
+            self.defs[attrDef.name] = attrDef
+            self.defs.setdefault(attrDef.short, attrDef)
+
+
+_NODE_TYPES = {}
+
+
+def _register_type(name, base, attrs, dag=None):
+    _NODE_TYPES[name] = _NodeType(name, _NODE_TYPES.get(base), attrs, dag)
+
+
+# ------------------------------------------------------------------------------
+# Funciones compute de los atributos de salida
+# ------------------------------------------------------------------------------
+
+def _local_matrix(scene, node):
+    # Las shapes (locator) no tienen transform propio
+    if 'translate' not in node.nodeType.defs:
+        return list(_IDENTITY)
+    _jointOrient = None
+    if 'jointOrient' in node.nodeType.defs:
+        _jointOrient = scene.evaluate(node, 'jointOrient')
+    return compose_matrix(scene.evaluate(node, 'translate'),
+                          scene.evaluate(node, 'rotate'),
+                          scene.evaluate(node, 'scale'),
+                          scene.evaluate(node, 'rotateOrder'),
+                          _jointOrient)
+
+
+def _parent_matrix(scene, node):
+    if node.parent is None or not scene.evaluate(node, 'inheritsTransform'):
+        return list(_IDENTITY)
+    return scene.evaluate(node.parent, 'worldMatrix[0]')
+
+
+def _world_matrix(scene, node):
+    _world = _local_matrix(scene, node)
+    _offset = scene.evaluate(node, 'offsetParentMatrix')
+    if tuple(_offset) != _IDENTITY:
+        _world = _mult(_world, _offset)
+    if node.parent is not None and scene.evaluate(node, 'inheritsTransform'):
+        _world = _mult(_world, scene.evaluate(node.parent, 'worldMatrix[0]'))
+    return _world
+
+
+def _compute_matrix(scene, node, key):
+    return _local_matrix(scene, node)
+
+
+def _compute_inverse_matrix(scene, node, key):
+    return _inverse(_local_matrix(scene, node))
+
+
+def _compute_world_matrix(scene, node, key):
+    return _world_matrix(scene, node)
+
+
+def _compute_world_inverse_matrix(scene, node, key):
+    return _inverse(_world_matrix(scene, node))
+
+
+def _compute_parent_matrix(scene, node, key):
+    return _parent_matrix(scene, node)
+
+
+def _compute_parent_inverse_matrix(scene, node, key):
+    return _inverse(_parent_matrix(scene, node))
+
+
+def _compute_matrix_sum(scene, node, key):
+    result = list(_IDENTITY)
+    for index in sorted(node.multi.get('matrixIn', ())):
+        result = _mult(result, scene.evaluate(node, 'matrixIn[{}]'.format(index)))
+    return result
+
+
+def _compute_decompose(scene, node, key):
+    _translate, _rotate, _scale = decompose_matrix(scene.evaluate(node, 'inputMatrix'),
+                                                   scene.evaluate(node, 'inputRotateOrder'))
+    _outputs = {'outputTranslate': _translate, 'outputRotate': _rotate, 'outputScale': _scale}
+    return tuple(_outputs[key])
+
+
+def _compute_reverse(scene, node, key):
+    return tuple(1.0 - value for value in scene.evaluate(node, 'input'))
+
+
+_CONDITION_OPERATIONS = [lambda a, b: a == b, lambda a, b: a != b, lambda a, b: a > b,
+                         lambda a, b: a >= b, lambda a, b: a < b, lambda a, b: a <= b]
+
+
+def _compute_condition(scene, node, key):
+    _operation = _CONDITION_OPERATIONS[scene.evaluate(node, 'operation')]
+    if _operation(scene.evaluate(node, 'firstTerm'), scene.evaluate(node, 'secondTerm')):
+        return scene.evaluate(node, 'colorIfTrue')
+    return scene.evaluate(node, 'colorIfFalse')
+
+
+def _target_world(scene, node, index):
+    _prefix = 'target[{}].'.format(index)
+    _local = compose_matrix(scene.evaluate(node, _prefix + 'targetTranslate'),
+                            scene.evaluate(node, _prefix + 'targetRotate'),
+                            scene.evaluate(node, _prefix + 'targetScale'),
+                            scene.evaluate(node, _prefix + 'targetRotateOrder'),
+                            scene.evaluate(node, _prefix + 'targetJointOrient'))
+    _local = _mult(_local, scene.evaluate(node, _prefix + 'targetOffsetParentMatrix'))
+    return _mult(_local, scene.evaluate(node, _prefix + 'targetParentMatrix'))
+
+
+def _compute_constraint(scene, node, key):
+    """
+    - Resuelve el constraint (todos sus targets con peso) y devuelve el valor local del canal pedido.
+    """
+    _kind = node.type
+    _targets = []
+    for index in sorted(node.multi.get('target', ())):
+        _weight = scene.evaluate(node, 'target[{}].targetWeight'.format(index))
+        if _weight:
+            _targets.append((_weight, _target_world(scene, node, index),
+                             scene.evaluate(node, 'target[{}].targetOffsetMatrix'.format(index))))
+
+    _total = sum(weight for weight, _, _ in _targets)
+    if not _targets or not _total:
+        _rest = {'constraintTranslate': 'restTranslate', 'constraintRotate': 'restRotate',
+                 'constraintScale': 'restScale'}
+        return scene.evaluate(node, _rest[key])
+
+    _parentInverse = scene.evaluate(node, 'constraintParentInverseMatrix')
+    _rotateOrder = scene.evaluate(node, 'constraintRotateOrder')
+    _jointOrient = scene.evaluate(node, 'constraintJointOrient')
+
+    if _kind == 'scaleConstraint':
+        _scale = [0.0, 0.0, 0.0]
+        for weight, world, offset in _targets:
+            for axis in range(3):
+                _scale[axis] += _row_length(world, axis) * offset[axis * 5] * weight / _total
+        _parentScale = [1.0 / (_row_length(_parentInverse, axis) or 1.0) for axis in range(3)]
+        return tuple(value / parentValue for value, parentValue in zip(_scale, _parentScale))
+
+    if _kind == 'pointConstraint':
+        _position = [0.0, 0.0, 0.0]
+        for weight, world, offset in _targets:
+            for axis in range(3):
+                _position[axis] += (world[12 + axis] + offset[12 + axis]) * weight / _total
+        return tuple(_transform_point(_position, _parentInverse))
+
+    if _kind == 'orientConstraint':
+        _blend = [0.0] * 16
+        for weight, world, offset in _targets:
+            _rot = _mult(offset, _rotation_part(world))
+            _blend = [a + b * weight / _total for a, b in zip(_blend, _rot)]
+        _local = _mult(_orthonormalize(_blend), _rotation_part(_parentInverse))
+        _, _rotate, _ = decompose_matrix(_local, _rotateOrder, _jointOrient)
+        return tuple(_rotate)
+
+    # parentConstraint
+    _blend = [0.0] * 16
+    for weight, world, offset in _targets:
+        _world = _mult(offset, world)
+        _blend = [a + b * weight / _total for a, b in zip(_blend, _world)]
+    _blend = _orthonormalize(_blend)
+    _blend[15] = 1.0
+    _translate, _rotate, _ = decompose_matrix(_mult(_blend, _parentInverse), _rotateOrder, _jointOrient)
+    return tuple(_translate if key == 'constraintTranslate' else _rotate)
+
+
+# ------------------------------------------------------------------------------
+# Tipos de nodo
+# ------------------------------------------------------------------------------
+
+_ENUM_ROTATE_ORDER = ROTATE_ORDERS
+
+_register_type('node', None, _attr('message', 'msg', 'message') +
+               _attr('caching', 'cch', 'bool', False) +
+               _attr('frozen', 'fzn', 'bool', False) +
+               _attr('isHistoricallyInteresting', 'ihi', 'byte', 2, hidden=True) +
+               _attr('nodeState', 'nds', 'enum', 0,
+                     enum=['Normal', 'PassThrough', 'Blocking', 'Internally Disabled', 'Internally Disabled',
+                           'Internally Disabled', 'Waiting-Normal', 'Waiting-PassThrough', 'Waiting-Blocking']),
+               dag=False)
+
+_register_type('dagNode', 'node', _attr('visibility', 'v', 'bool', True, keyable=True) +
+               _attr('template', 'tmp', 'bool', False) +
+               _attr('worldMatrix', 'wm', 'matrix', multi=True, compute=_compute_world_matrix) +
+               _attr('worldInverseMatrix', 'wim', 'matrix', multi=True, compute=_compute_world_inverse_matrix) +
+               _attr('parentMatrix', 'pm', 'matrix', multi=True, compute=_compute_parent_matrix) +
+               _attr('parentInverseMatrix', 'pim', 'matrix', multi=True, compute=_compute_parent_inverse_matrix) +
+               _attr('offsetParentMatrix', 'opm', 'matrix', _IDENTITY) +
+               _attr('inheritsTransform', 'it', 'bool', True),
+               dag=True)
+
+_register_type('transform', 'dagNode', _compound('translate', 't', 'doubleLinear', keyable=True) +
+               _compound('rotate', 'r', 'doubleAngle', keyable=True) +
+               _compound('scale', 's', 'double', (1.0, 1.0, 1.0), keyable=True) +
+               _attr('rotateOrder', 'ro', 'enum', 0, enum=_ENUM_ROTATE_ORDER) +
+               _attr('matrix', 'm', 'matrix', compute=_compute_matrix) +
+               _attr('inverseMatrix', 'im', 'matrix', compute=_compute_inverse_matrix))
+
+_register_type('joint', 'transform', _compound('jointOrient', 'jo', 'doubleAngle') +
+               _attr('segmentScaleCompensate', 'ssc', 'bool', True) +
+               _attr('radius', 'radi', 'double', 1.0, min=0.0))
+
+_register_type('locator', 'dagNode', _compound('localPosition', 'lp', 'doubleLinear') +
+               _compound('localScale', 'los', 'doubleLinear', (1.0, 1.0, 1.0)))
+
+_register_type('constraint', 'transform', _attr('target', 'tg', 'compound', multi=True) +
+               _attr('targetParentMatrix', 'tpm', 'matrix', _IDENTITY) +
+               _attr('targetOffsetParentMatrix', 'topm', 'matrix', _IDENTITY) +
+               _compound('targetTranslate', 'tt', 'doubleLinear') +
+               _compound('targetRotate', 'tr', 'doubleAngle') +
+               _compound('targetScale', 'ts', 'double', (1.0, 1.0, 1.0)) +
+               _attr('targetRotateOrder', 'tro', 'enum', 0, enum=_ENUM_ROTATE_ORDER) +
+               _compound('targetJointOrient', 'tjo', 'doubleAngle') +
+               _attr('targetWeight', 'tw', 'double', 1.0, min=0.0) +
+               _attr('targetOffsetMatrix', 'tom', 'matrix', _IDENTITY, hidden=True) +
+               _attr('constraintParentInverseMatrix', 'cpim', 'matrix', _IDENTITY) +
+               _attr('constraintRotateOrder', 'cro', 'enum', 0, enum=_ENUM_ROTATE_ORDER) +
+               _compound('constraintJointOrient', 'cjo', 'doubleAngle') +
+               _compound('restTranslate', 'rst', 'doubleLinear', hidden=True) +
+               _compound('restRotate', 'rsrr', 'doubleAngle', hidden=True) +
+               _compound('restScale', 'rssc', 'double', (1.0, 1.0, 1.0), hidden=True) +
+               _compound('constraintTranslate', 'ct', 'doubleLinear', compute=_compute_constraint) +
+               _compound('constraintRotate', 'cr', 'doubleAngle', compute=_compute_constraint) +
+               _compound('constraintScale', 'cs', 'double', (1.0, 1.0, 1.0), compute=_compute_constraint))
+
+for _constraintType in ['parentConstraint', 'pointConstraint', 'orientConstraint', 'scaleConstraint']:
+    _register_type(_constraintType, 'constraint', [])
+
+_register_type('multMatrix', 'node', _attr('matrixIn', 'i', 'matrix', _IDENTITY, multi=True) +
+               _attr('matrixSum', 'o', 'matrix', compute=_compute_matrix_sum))
+
+_register_type('decomposeMatrix', 'node', _attr('inputMatrix', 'imat', 'matrix', _IDENTITY) +
+               _attr('inputRotateOrder', 'ro', 'enum', 0, enum=_ENUM_ROTATE_ORDER) +
+               _compound('outputTranslate', 'ot', 'doubleLinear', compute=_compute_decompose) +
+               _compound('outputRotate', 'or', 'doubleAngle', compute=_compute_decompose) +
+               _compound('outputScale', 'os', 'double', (1.0, 1.0, 1.0), compute=_compute_decompose))
+
+_register_type('reverse', 'node', _compound('input', 'i', 'float') +
+               _compound('output', 'o', 'float', compute=_compute_reverse))
+
+_register_type('condition', 'node', _attr('operation', 'op', 'enum', 0,
+                                          enum=['Equal', 'Not Equal', 'Greater Than', 'Greater or Equal',
+                                                'Less Than', 'Less or Equal']) +
+               _attr('firstTerm', 'ft', 'float', 0.0) +
+               _attr('secondTerm', 'st', 'float', 0.0) +
+               _compound('colorIfTrue', 'ct', 'float', (0.0, 0.0, 0.0), 'RGB') +
+               _compound('colorIfFalse', 'cf', 'float', (1.0, 1.0, 1.0), 'RGB') +
+               _compound('outColor', 'oc', 'float', (0.0, 0.0, 0.0), 'RGB', compute=_compute_condition))
+
+_register_type('controller', 'node', _attr('controllerObject', 'act', 'message') +
+               _attr('parent', 'pa', 'message') +
+               _attr('children', 'ch', 'message', multi=True))
+
+# Tipos de atributo de addAttr: (attributeType, valor default)
+_ATTRIBUTE_TYPES = {'double': 0.0, 'float': 0.0, 'doubleLinear': 0.0, 'doubleAngle': 0.0, 'bool': False,
+                    'long': 0, 'short': 0, 'byte': 0, 'enum': 0, 'message': None, 'matrix': _IDENTITY,
+                    'double3': None, 'float3': None, 'compound': None}
+_DATA_TYPES = {'string': None, 'matrix': _IDENTITY, 'double3': None}
+
+_FLOAT_TYPES = ['double', 'float', 'doubleLinear', 'doubleAngle']
+_INT_TYPES = ['long', 'short', 'byte', 'enum']
+
+
+def _cast(attrDef, value):
+    """
+    - Convierte el valor al tipo del atributo, y lo ajusta a su min/max.
+    """
+    if attrDef.type in _FLOAT_TYPES:
+        value = float(value)
+    elif attrDef.type in _INT_TYPES:
+        value = int(value)
+    elif attrDef.type == 'bool':
+        value = bool(value)
+    elif attrDef.type == 'matrix':
+        value = tuple(float(item) for item in value)
+        if len(value) != 16:
+            raise RuntimeError("A matrix needs 16 values.")
+        return value
+    else:
+        return value
+
+    if attrDef.min is not None and value < attrDef.min:
+        value = type(value)(attrDef.min)
+    if attrDef.max is not None and value > attrDef.max:
+        value = type(value)(attrDef.max)
+    return value
+
+
+# ------------------------------------------------------------------------------
+# Escena
+# ------------------------------------------------------------------------------
+
+class _Node(object):
+    """
+    - Nodo de la escena. Las conexiones se guardan por nodo: incoming {key: (srcNode, srcKey)}
+        y outgoing {key: [(dstNode, dstKey), ...]}.
+    """
+    __slots__ = ['name', 'type', 'nodeType', 'uuid', 'parent', 'children', 'values', 'flags',
+                 'dynamic', 'incoming', 'outgoing', 'multi', 'alive', '__weakref__']
+
+    def __init__(self, name, nodeType):
+        self.name = name
+        self.type = nodeType
+        self.nodeType = _NODE_TYPES[nodeType]
+        self.uuid = str(uuid.uuid4()).upper()
+        self.parent = None
+        self.children = []
+        # {<str key>: valor}. Solo los valores que no son el default
+        self.values = {}
+        # {<str key>: {'locked': .., 'keyable': .., 'channelBox': ..}} cambios respecto a la definicion
+        self.flags = {}
+        # Atributos dinamicos {<str name/short>: _AttrDef}
+        self.dynamic = collections.OrderedDict()
+        self.incoming = {}
+        self.outgoing = {}
+        # Indices usados de los atributos multi {<str name>: set}
+        self.multi = {}
+        self.alive = True
+
+    @property
+    def dag(self):
+        return self.nodeType.dag
+
+    def attr_def(self, name):
+        attrDef = self.dynamic.get(name)
+        if attrDef is None:
+            attrDef = self.nodeType.defs.get(name)
+        return attrDef
+
+    def attr_defs(self):
+        result = list(self.nodeType.order)
+        for name, attrDef in self.dynamic.items():
+            if name == attrDef.name:
+                result.append(attrDef)
+        return result
+
+    def flag(self, key, flag, attrDef):
+        _flags = self.flags.get(key)
+        if _flags and flag in _flags:
+            return _flags[flag]
+        if flag == 'locked':
+            return False
+        return getattr(attrDef, flag)
+
+
+_INDEX_RE = re.compile(r'^([^\[\]]+)(?:\[(\d+)\])?$')
+_WILDCARD_RE = re.compile(r'[*?\[]')
+
+
+def _last_name(key):
+    _name = key[key.rfind('.') + 1:]
+    _bracket = _name.find('[')
+    return _name if _bracket < 0 else _name[:_bracket]
+
+
+def _sibling_key(key, name):
+    return key[:key.rfind('.') + 1] + name
+
+
+def _flatten(args):
+    result = []
+    for arg in args:
+        if isinstance(arg, (list, tuple, set)):
+            result.extend(_flatten(arg))
+        elif arg is not None:
+            result.append(arg)
+    return result
+
+
+class Scene(object):
+    """
+    - Escena en memoria sobre la que trabajan los comandos del modulo maya.cmds de install().
+    - Ademas de los comandos, tiene una pequena API propia para los benchmarks y las pruebas:
+        stats(), reset_stats(), add_reference(), nodes() y warnings.
+    """
+    def __init__(self):
+        self._nodes = []
+        self._byShort = {}
+        self._byUuid = {}
+        self.selection = []
+        self.references = collections.OrderedDict()
+        self.plugins = set()
+        self.warnings = []
+        self.calls = collections.Counter()
+        self.suspended = False
+        self.evaluationMode = 'parallel'
+
+        # Animacion: tiempo actual y keys guardadas {(node, key): {frame: value}} (no se evaluan)
+        self.time = 1.0
+        self.keys = {}
+        # Valores evaluados {(node, key): valor}, y los plugs que se calcularon a partir de cada plug
+        # {(node, key): set((node, key))}. Un cambio solo invalida los plugs que dependen de el (dirty propagation)
+        self._cache = {}
+        self._dependents = {}
+        self._evaluating = []
+
+        # Undo
+        self.undoEnabled = True
+        self._undoStack = []
+        self._undoNames = []
+        self._undoDepth = 0
+        self._chunkDepth = 0
+        self._chunkName = ''
+        self._current = None
+        self._replaying = False
+
+    # --------------------------------------------------------------------------
+    # API propia
+    # --------------------------------------------------------------------------
+    def stats(self):
+        """
+        - Devuelve el numero de llamadas por comando de maya.cmds desde el ultimo reset_stats().
+        """
+        return dict(self.calls)
+
+    def reset_stats(self):
+        self.calls.clear()
+
+    def nodes(self, nodeType=None):
+        """
+        - Devuelve los nombres de todos los nodos (o los del tipo especificado), en orden de creacion.
+        """
+        return [self.display_name(node) for node in self._nodes
+                if nodeType is None or nodeType in node.nodeType.inherited]
+
+    def add_reference(self, namespace, filePath=None, loaded=True):
+        """
+        - Registra una referencia simulada para file(query=True, reference=True) y referenceQuery.
+        - Devuelve el path de la referencia.
+        """
+        filePath = filePath or "/standIn/references/{}.ma".format(namespace.replace(':', '_'))
+        _referenceNode = "{}RN".format(namespace.replace(':', '_'))
+        self.references[filePath] = {'namespace': namespace, 'loaded': loaded, 'node': _referenceNode}
+        return filePath
+
+    # --------------------------------------------------------------------------
+    # Nombres
+    # --------------------------------------------------------------------------
+    def long_name(self, node):
+        if not node.dag:
+            return node.name
+        _parts = []
+        while node is not None:
+            _parts.append(node.name)
+            node = node.parent
+        return '|' + '|'.join(reversed(_parts))
+
+    def display_name(self, node):
+        """
+        - Nombre que devuelven los comandos: el nombre corto si es unico, o el path parcial minimo.
+        """
+        if len(self._byShort.get(node.name, ())) < 2 or not node.dag:
+            return node.name
+        _parts = [node.name]
+        _parent = node.parent
+        while _parent is not None:
+            _parts.insert(0, _parent.name)
+            _candidate = '|'.join(_parts)
+            if len(self._match_path(_parts)) == 1:
+                return _candidate
+            _parent = _parent.parent
+        return '|' + '|'.join(_parts)
+
+    def _match_path(self, parts, absolute=False):
+        result = []
+        for node in self._byShort.get(parts[-1], ()):
+            _ancestor = node.parent
+            _matched = True
+            for part in reversed(parts[:-1]):
+                if _ancestor is None or _ancestor.name != part:
+                    _matched = False
+                    break
+                _ancestor = _ancestor.parent
+            if _matched and (not absolute or _ancestor is None):
+                result.append(node)
+        return result
+
+    def find(self, name):
+        """
+        - Devuelve la lista de nodos que coinciden con el nombre (corto, path o UUID).
+        """
+        if '|' in name:
+            _absolute = name.startswith('|')
+            return self._match_path(name.lstrip('|').split('|'), _absolute)
+        result = self._byShort.get(name)
+        if result:
+            return list(result)
+        _node = self._byUuid.get(name)
+        return [_node] if _node else []
+
+    def node(self, name):
+        """
+        - Devuelve el nodo con ese nombre. Da ValueError si no existe o hay mas de uno.
+        """
+        _nodes = self.find(name)
+        if not _nodes:
+            raise ValueError("No object matches name: {}".format(name))
+        if len(_nodes) > 1:
+            raise ValueError("More than one object matches name: {}".format(name))
+        return _nodes[0]
+
+    def plug(self, plug):
+        """
+        - Devuelve (node, key) de un plug "node.attr[index].child", con los nombres largos de los atributos.
+        """
+        if '.' not in plug:
+            raise ValueError("No object matches name: {}".format(plug))
+        _nodeName, _attrPath = plug.split('.', 1)
+        node = self.node(_nodeName)
+        return node, self.attr_key(node, _attrPath, plug)
+
+    def attr_key(self, node, attrPath, plug=None):
+        _parts = []
+        for component in attrPath.split('.'):
+            _match = _INDEX_RE.match(component)
+            attrDef = node.attr_def(_match.group(1)) if _match else None
+            if attrDef is None:
+                raise ValueError("No object matches name: {}".format(plug or attrPath))
+            _index = _match.group(2)
+            if _index is None and attrDef.multi and attrDef.type != 'compound':
+                _index = '0'
+            _parts.append(attrDef.name if _index is None else "{}[{}]".format(attrDef.name, _index))
+        return '.'.join(_parts)
+
+    def plug_name(self, node, key):
+        return "{}.{}".format(self.display_name(node), key)
+
+    def _unique_name(self, name, parent, dag, node=None):
+        """
+        - Si el nombre ya existe (entre hermanos del DAG, o en cualquier nodo DG) le agrega/incrementa un numero.
+        """
+        def _taken(candidate):
+            for other in self._byShort.get(candidate, ()):
+                if other is node:
+                    continue
+                if not dag or not other.dag or other.parent is parent:
+                    return True
+            return False
+
+        if not _taken(name):
+            return name
+        _match = re.match(r'^(.*?)(\d*)$', name)
+        _base = _match.group(1)
+        _number = int(_match.group(2)) + 1 if _match.group(2) else 1
+        while _taken("{}{}".format(_base, _number)):
+            _number += 1
+        return "{}{}".format(_base, _number)
+
+    # --------------------------------------------------------------------------
+    # Undo
+    # --------------------------------------------------------------------------
+    def _record(self, undo):
+        if self._current is not None and not self._replaying:
+            self._current.append(undo)
+
+    def begin_command(self):
+        self._undoDepth += 1
+        if self._undoDepth == 1 and not self._chunkDepth:
+            self._current = [] if self.undoEnabled else None
+
+    def end_command(self):
+        self._undoDepth -= 1
+        if self._undoDepth == 0 and not self._chunkDepth:
+            if self._current:
+                self._undoStack.append(self._current)
+                self._undoNames.append('')
+            self._current = None
+
+    def open_chunk(self, name=''):
+        self._chunkDepth += 1
+        if self._chunkDepth == 1:
+            self._current = [] if self.undoEnabled else None
+            self._chunkName = name
+
+    def close_chunk(self):
+        if not self._chunkDepth:
+            return
+        self._chunkDepth -= 1
+        if not self._chunkDepth:
+            if self._current:
+                self._undoStack.append(self._current)
+                self._undoNames.append(self._chunkName)
+            self._current = None
+
+    def set_undo_state(self, state, flush=True):
+        self.undoEnabled = bool(state)
+        if not state and flush:
+            self._undoStack = []
+            self._undoNames = []
+        if self._current is None and state and (self._chunkDepth or self._undoDepth):
+            self._current = []
+        elif not state:
+            self._current = None
+
+    def undo(self):
+        if not self._undoStack:
+            self.warning("There are no more commands to undo.")
+            return False
+        _chunk = self._undoStack.pop()
+        self._undoNames.pop()
+        self._replaying = True
+        try:
+            for function in reversed(_chunk):
+                function()
+        finally:
+            self._replaying = False
+        return True
+
+    # --------------------------------------------------------------------------
+    # Nodos
+    # --------------------------------------------------------------------------
+    def create(self, nodeType, name=None, parent=None):
+        if nodeType not in _NODE_TYPES or nodeType in ['node', 'dagNode', 'constraint']:
+            raise RuntimeError("Unknown object type: {}".format(nodeType))
+        _type = _NODE_TYPES[nodeType]
+        if parent is not None and not _type.dag:
+            raise RuntimeError("Only DAG nodes can have a parent: {}".format(nodeType))
+        name = self._unique_name(name or "{}1".format(nodeType), parent, _type.dag)
+        node = _Node(name, nodeType)
+        self._insert(node, parent)
+        self._record(lambda: self._remove(node))
+        return node
+
+    def _insert(self, node, parent, index=None):
+        # Un nodo nuevo no cambia ningun valor; al restaurar un nodo borrado (undo) si se vacia la cache
+        if index is not None:
+            self._clear_cache()
+        node.alive = True
+        if index is None:
+            self._nodes.append(node)
+        else:
+            self._nodes.insert(index, node)
+        self._byShort.setdefault(node.name, []).append(node)
+        self._byUuid[node.uuid] = node
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+        _emit('added', node)
+
+    def _remove(self, node):
+        # delete() ya desconecto el nodo (invalidando sus destinos) y borro sus hijos: no hace falta vaciar la cache
+        node.alive = False
+        self._nodes.remove(node)
+        _same = self._byShort[node.name]
+        _same.remove(node)
+        if not _same:
+            del self._byShort[node.name]
+        del self._byUuid[node.uuid]
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        if node in self.selection:
+            self.selection.remove(node)
+        _emit('removed', node)
+
+    def delete(self, node):
+        """
+        - Borra el nodo, sus hijos y sus conexiones. Los plugs que dependian de el se quedan con su ultimo valor.
+        """
+        for child in list(node.children):
+            if child.alive:
+                self.delete(child)
+
+        # Primero las salidas, para que los destinos se queden con el valor que el nodo les daba
+        for key in list(node.outgoing):
+            for _dstNode, _dstKey in list(node.outgoing.get(key, ())):
+                self.disconnect(node, key, _dstNode, _dstKey)
+        for key in list(node.incoming):
+            _srcNode, _srcKey = node.incoming[key]
+            self.disconnect(_srcNode, _srcKey, node, key, keepValue=False)
+
+        _index = self._nodes.index(node)
+        _parent = node.parent
+        _selected = node in self.selection
+        self._remove(node)
+
+        def _undo():
+            self._insert(node, _parent, _index)
+            if _selected:
+                self.selection.append(node)
+        self._record(_undo)
+
+    def rename(self, node, name):
+        _old = node.name
+        name = self._unique_name(name, node.parent, node.dag, node)
+        _same = self._byShort[_old]
+        _same.remove(node)
+        if not _same:
+            del self._byShort[_old]
+        node.name = name
+        self._byShort.setdefault(name, []).append(node)
+        self._record(lambda: self.rename(node, _old))
+        _emit('renamed', node)
+        return name
+
+    def reparent(self, node, parent, preserveWorld=True):
+        if parent is not None:
+            _ancestor = parent
+            while _ancestor is not None:
+                if _ancestor is node:
+                    raise RuntimeError("Cannot parent {} under one of its descendants.".format(node.name))
+                _ancestor = _ancestor.parent
+
+        _world = self.evaluate(node, 'worldMatrix[0]') if preserveWorld and 'translate' in node.nodeType.defs else None
+        self._clear_cache()
+        _oldParent = node.parent
+        if _oldParent is not None:
+            _oldParent.children.remove(node)
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+        _emit('reparented', node)
+
+        # Un hermano con el mismo nombre obliga a renombrar
+        if len(self._byShort.get(node.name, ())) > 1:
+            _siblings = [other for other in self._byShort[node.name] if other is not node and other.parent is parent]
+            if _siblings:
+                self.rename(node, node.name)
+
+        self._record(lambda: self.reparent(node, _oldParent, preserveWorld=False))
+        if _world is not None:
+            self.set_world_matrix(node, _world)
+
+    # --------------------------------------------------------------------------
+    # Atributos
+    # --------------------------------------------------------------------------
+    def evaluate(self, node, key):
+        """
+        - Devuelve el valor del plug, siguiendo sus conexiones y calculando los atributos de salida.
+        - Registra el plug como dependencia del plug que se esta evaluando, para _invalidate.
+        """
+        _cacheKey = (node, key)
+        if self._evaluating:
+            _dependents = self._dependents.get(_cacheKey)
+            if _dependents is None:
+                self._dependents[_cacheKey] = _dependents = set()
+            _dependents.add(self._evaluating[-1])
+        if _cacheKey in self._cache:
+            return self._cache[_cacheKey]
+        self._evaluating.append(_cacheKey)
+        try:
+            value = self._evaluate(node, key)
+        finally:
+            self._evaluating.pop()
+        self._cache[_cacheKey] = value
+        return value
+
+    def _invalidate(self, node, key):
+        """
+        - Quita de la cache el plug (y sus hijos si es compuesto) y todos los plugs calculados a partir de el.
+        """
+        _pending = [(node, key)]
+        attrDef = node.attr_def(_last_name(key))
+        if attrDef is not None:
+            _pending.extend((node, _sibling_key(key, child.name)) for child in attrDef.children)
+        while _pending:
+            _cacheKey = _pending.pop()
+            self._cache.pop(_cacheKey, None)
+            _pending.extend(self._dependents.pop(_cacheKey, ()))
+
+    def _clear_cache(self):
+        self._cache.clear()
+        self._dependents.clear()
+
+    def _evaluate(self, node, key):
+        _source = node.incoming.get(key)
+        if _source is not None:
+            return self.evaluate(_source[0], _source[1])
+
+        attrDef = node.attr_def(_last_name(key))
+        _parent = attrDef.parent
+        if _parent is not None:
+            _parentKey = _sibling_key(key, _parent.name)
+            if _parent.compute is not None or _parentKey in node.incoming:
+                return self.evaluate(node, _parentKey)[attrDef.index]
+
+        if attrDef.compute is not None:
+            return attrDef.compute(self, node, _last_name(key))
+        if attrDef.children:
+            return tuple(self.evaluate(node, _sibling_key(key, child.name)) for child in attrDef.children)
+
+        _value = node.values.get(key)
+        if _value is None:
+            _value = attrDef.default
+        if attrDef.type == 'matrix' and _value is not None:
+            return tuple(_value)
+        return _value
+
+    def driven(self, node, key):
+        """
+        - Devuelve True si el plug (o su compuesto padre) tiene una conexion de entrada.
+        """
+        if key in node.incoming:
+            return True
+        attrDef = node.attr_def(_last_name(key))
+        return attrDef.parent is not None and _sibling_key(key, attrDef.parent.name) in node.incoming
+
+    def _track_index(self, node, key):
+        _first = key.split('.', 1)[0]
+        _bracket = _first.find('[')
+        if _bracket >= 0:
+            _indices = node.multi.setdefault(_first[:_bracket], set())
+            _index = int(_first[_bracket + 1:-1])
+            if _index not in _indices:
+                # Los compute que recorren el multi (constraints, multMatrix) no dependen aun del indice nuevo
+                _indices.add(_index)
+                for attrDef in node.nodeType.order:
+                    if attrDef.compute is not None and not attrDef.multi and attrDef.parent is None:
+                        self._invalidate(node, attrDef.name)
+
+    def set_value(self, node, key, value):
+        """
+        - Guarda el valor de un atributo (los compuestos se reparten en sus hijos).
+        """
+        attrDef = node.attr_def(_last_name(key))
+        if attrDef.children:
+            for child, childValue in zip(attrDef.children, value):
+                self.set_value(node, _sibling_key(key, child.name), childValue)
+            return
+
+        self._invalidate(node, key)
+        value = _cast(attrDef, value)
+        _missing = object()
+        _old = node.values.get(key, _missing)
+        node.values[key] = value
+        self._track_index(node, key)
+        _emit_attribute('set', node, key)
+
+        def _undo():
+            self._invalidate(node, key)
+            if _old is _missing:
+                node.values.pop(key, None)
+            else:
+                node.values[key] = _old
+            _emit_attribute('set', node, key)
+        self._record(_undo)
+
+    def set_flag(self, node, key, flag, value):
+        _flags = node.flags.setdefault(key, {})
+        _missing = object()
+        _old = _flags.get(flag, _missing)
+        _flags[flag] = bool(value)
+        _emit_attribute('flags', node, key)
+
+        def _undo():
+            if _old is _missing:
+                _flags.pop(flag, None)
+            else:
+                _flags[flag] = _old
+            _emit_attribute('flags', node, key)
+        self._record(_undo)
+
+    def locked(self, node, key):
+        attrDef = node.attr_def(_last_name(key))
+        if node.flag(key, 'locked', attrDef):
+            return True
+        return attrDef.parent is not None and node.flag(_sibling_key(key, attrDef.parent.name), 'locked',
+                                                        attrDef.parent)
+
+    def add_attr(self, node, attrDef):
+        for name in {attrDef.name, attrDef.short}:
+            if node.attr_def(name) is not None:
+                raise RuntimeError("Found attribute with the same name {!r} on {}.".format(name, node.name))
+        node.dynamic[attrDef.name] = attrDef
+        node.dynamic.setdefault(attrDef.short, attrDef)
+        _emit_attribute('added', node, attrDef.name)
+        self._record(lambda: self.delete_attr(node, attrDef, record=False))
+
+    def delete_attr(self, node, attrDef, record=True):
+        for child in attrDef.children:
+            self.delete_attr(node, child, record)
+        for key in [key for key in list(node.incoming) if _last_name(key) == attrDef.name]:
+            _srcNode, _srcKey = node.incoming[key]
+            self.disconnect(_srcNode, _srcKey, node, key, keepValue=False)
+        for key in [key for key in list(node.outgoing) if _last_name(key) == attrDef.name]:
+            for _dstNode, _dstKey in list(node.outgoing[key]):
+                self.disconnect(node, key, _dstNode, _dstKey)
+        self._clear_cache()
+        node.dynamic.pop(attrDef.name, None)
+        if node.dynamic.get(attrDef.short) is attrDef:
+            node.dynamic.pop(attrDef.short)
+        _value = node.values.pop(attrDef.name, None)
+        _emit_attribute('removed', node, attrDef.name)
+        if record:
+            def _undo():
+                self._clear_cache()
+                node.dynamic[attrDef.name] = attrDef
+                node.dynamic.setdefault(attrDef.short, attrDef)
+                if _value is not None:
+                    node.values[attrDef.name] = _value
+                _emit_attribute('added', node, attrDef.name)
+            self._record(_undo)
+
+    def connect(self, srcNode, srcKey, dstNode, dstKey, force=False):
+        _dstDef = dstNode.attr_def(_last_name(dstKey))
+        _dstName = self.plug_name(dstNode, dstKey)
+        if _dstDef.output:
+            raise RuntimeError("The destination attribute {!r} cannot be connected to.".format(_dstName))
+        if self.locked(dstNode, dstKey):
+            raise RuntimeError("The destination attribute {!r} is locked.".format(_dstName))
+
+        _current = dstNode.incoming.get(dstKey)
+        if _current is not None:
+            if _current == (srcNode, srcKey):
+                self.warning("{!r} is already connected to {!r}.".format(self.plug_name(srcNode, srcKey), _dstName))
+                return
+            if not force:
+                raise RuntimeError("The attribute {!r} is already connected to {!r}.".format(
+                    _dstName, self.plug_name(*_current)))
+            self.disconnect(_current[0], _current[1], dstNode, dstKey, keepValue=False)
+
+        self._invalidate(dstNode, dstKey)
+        dstNode.incoming[dstKey] = (srcNode, srcKey)
+        srcNode.outgoing.setdefault(srcKey, []).append((dstNode, dstKey))
+        self._track_index(dstNode, dstKey)
+        self._track_index(srcNode, srcKey)
+        _emit_attribute('connected', dstNode, dstKey)
+        self._record(lambda: self.disconnect(srcNode, srcKey, dstNode, dstKey, keepValue=False))
+
+    def disconnect(self, srcNode, srcKey, dstNode, dstKey, keepValue=True):
+        if dstNode.incoming.get(dstKey) != (srcNode, srcKey):
+            raise RuntimeError("There is no connection from {!r} to {!r} to disconnect.".format(
+                self.plug_name(srcNode, srcKey), self.plug_name(dstNode, dstKey)))
+
+        # Como en Maya, el destino se queda con el ultimo valor que recibio
+        _value = self.evaluate(dstNode, dstKey) if keepValue and srcNode.alive else None
+
+        self._invalidate(dstNode, dstKey)
+        del dstNode.incoming[dstKey]
+        _outgoing = srcNode.outgoing[srcKey]
+        _outgoing.remove((dstNode, dstKey))
+        if not _outgoing:
+            del srcNode.outgoing[srcKey]
+        _emit_attribute('disconnected', dstNode, dstKey)
+
+        self._record(lambda: self.connect(srcNode, srcKey, dstNode, dstKey))
+        if _value is not None:
+            self.set_value(dstNode, dstKey, _value)
+
+    # --------------------------------------------------------------------------
+    # Transforms
+    # --------------------------------------------------------------------------
+    def parent_space(self, node):
+        """
+        - Matriz del espacio del padre, incluyendo el offsetParentMatrix: world = local * parent_space.
+        """
+        return _mult(self.evaluate(node, 'offsetParentMatrix'), _parent_matrix(self, node))
+
+    def joint_orient(self, node):
+        if 'jointOrient' in node.nodeType.defs:
+            return self.evaluate(node, 'jointOrient')
+        return None
+
+    def set_channels(self, node, translate=None, rotate=None, scale=None):
+        """
+        - Escribe translate/rotate/scale, saltando los canales bloqueados o conectados (como xform).
+        """
+        for attr, values in [('translate', translate), ('rotate', rotate), ('scale', scale)]:
+            if values is None:
+                continue
+            for axis, value in zip('XYZ', values):
+                _key = attr + axis
+                if not self.locked(node, _key) and not self.driven(node, _key):
+                    self.set_value(node, _key, value)
+
+    def set_world_matrix(self, node, matrix):
+        _local = _mult(matrix, _inverse(self.parent_space(node)))
+        self.set_local_matrix(node, _local)
+
+    def set_local_matrix(self, node, matrix):
+        _translate, _rotate, _scale = decompose_matrix(matrix, self.evaluate(node, 'rotateOrder'),
+                                                       self.joint_orient(node))
+        self.set_channels(node, _translate, _rotate, _scale)
+
+    def set_world_translation(self, node, position):
+        self.set_channels(node, translate=_transform_point(position, _inverse(self.parent_space(node))))
+
+    def set_world_rotation(self, node, rotation):
+        _rotateOrder = self.evaluate(node, 'rotateOrder')
+        _world = euler_to_matrix(rotation, _rotateOrder)
+        _local = _mult(_world, _rotation_part(_inverse(self.parent_space(node))))
+        _, _rotate, _ = decompose_matrix(_local, _rotateOrder, self.joint_orient(node))
+        self.set_channels(node, rotate=_rotate)
+
+    # --------------------------------------------------------------------------
+    # Mensajes
+    # --------------------------------------------------------------------------
+    def warning(self, message):
+        self.warnings.append(message)
+        sys.stderr.write("# Warning: {} #\n".format(message))
+
+
+# ------------------------------------------------------------------------------
+# Comandos (maya.cmds)
+# ------------------------------------------------------------------------------
+
+_SCENE = None
+_COMMANDS = collections.OrderedDict()
+# Callbacks de nodo y de atributo {id: function}. Se mantienen al cambiar de escena
+_CALLBACKS = collections.OrderedDict()
+_ATTRIBUTE_CALLBACKS = collections.OrderedDict()
+_CALLBACK_IDS = [0]
+
+
+def add_node_callback(function):
+    """
+    - Registra "function(event, uuid, name, parentUuid, isDag)", que se llama cuando un nodo se crea ('added'),
+        se borra ('removed'), se renombra ('renamed') o cambia de padre ('reparented'), tambien al hacer undo.
+    - Al cambiar de escena (new_scene/install) se llama con ('cleared', None, None, None, None).
+    - Devuelve el id para remove_node_callback().
+    """
+    _CALLBACK_IDS[0] += 1
+    _CALLBACKS[_CALLBACK_IDS[0]] = function
+    return _CALLBACK_IDS[0]
+
+
+def remove_node_callback(callbackId):
+    _CALLBACKS.pop(callbackId, None)
+
+
+def add_attribute_callback(function):
+    """
+    - Registra "function(event, uuid, key)", que se llama cuando se cambia el valor de un atributo ('set'),
+        se agrega o borra un atributo dinamico ('added', 'removed'), cambian sus flags de lock/keyable/channelBox
+        ('flags') o se conecta o desconecta su entrada ('connected', 'disconnected'), tambien al hacer undo.
+        Como addAttributeChangedCallback de OpenMaya, pero para todos los nodos: "function" filtra
+        los que le interesan por uuid.
+    - Los valores que cambian por evaluacion (plugs conectados) no llaman a "function".
+    - Devuelve el id para remove_attribute_callback().
+    """
+    _CALLBACK_IDS[0] += 1
+    _ATTRIBUTE_CALLBACKS[_CALLBACK_IDS[0]] = function
+    return _CALLBACK_IDS[0]
+
+
+def remove_attribute_callback(callbackId):
+    _ATTRIBUTE_CALLBACKS.pop(callbackId, None)
+
+
+def _emit(event, node=None):
+    if not _CALLBACKS:
+        return
+    if node is None:
+        _args = (None, None, None, None)
+    else:
+        _args = (node.uuid, node.name, node.parent.uuid if node.parent is not None else None, node.dag)
+    for function in list(_CALLBACKS.values()):
+        function(event, *_args)
+
+
+def _emit_attribute(event, node, key):
+    if not _ATTRIBUTE_CALLBACKS:
+        return
+    for function in list(_ATTRIBUTE_CALLBACKS.values()):
+        function(event, node.uuid, key)
+
+
+def current_scene():
+    """
+    - Devuelve la escena activa (la crea si no existe).
+    """
+    global _SCENE
+    if _SCENE is None:
+        _SCENE = Scene()
+    return _SCENE
+
+
+def new_scene():
+    """
+    - Reemplaza la escena activa por una vacia y la devuelve (igual que cmds.file(new=True, force=True)).
+    """
+    global _SCENE
+    _SCENE = Scene()
+    _emit('cleared')
+    return _SCENE
+
+
+def _command(*flags):
+    """
+    - Registra una funcion como comando de maya.cmds. "flags" son los flags soportados: "nombreLargo corto".
+    - Los flags se traducen a su nombre largo; un flag no soportado da TypeError.
+    """
+    _aliases = {}
+    for flag in flags:
+        _names = flag.split()
+        for name in _names:
+            _aliases[name] = _names[0]
+
+    def _decorator(function):
+        _name = function.__name__.rstrip('_')
+
+        @functools.wraps(function)
+        def _wrapper(*args, **kwargs):
+            _flags = {}
+            for flag, value in kwargs.items():
+                if flag not in _aliases:
+                    raise TypeError("Invalid flag '{}' (not supported by the stand-in {}).".format(flag, _name))
+                _flags[_aliases[flag]] = value
+            scene = current_scene()
+            scene.calls[_name] += 1
+            scene.begin_command()
+            try:
+                return function(scene, *args, **_flags)
+            finally:
+                scene.end_command()
+
+        _wrapper.__name__ = _name
+        _COMMANDS[_name] = _wrapper
+        return _wrapper
+    return _decorator
+
+
+def _selection_or(scene, args):
+    _names = _flatten(args)
+    if _names:
+        return _names
+    return [scene.display_name(node) for node in scene.selection]
+
+
+def _wildcard_regex(pattern):
+    _regex = ''
+    for char in pattern:
+        if char == '*':
+            _regex += '[^|]*'
+        elif char == '?':
+            _regex += '[^|]'
+        else:
+            _regex += re.escape(char)
+    return re.compile('^' + _regex + '$')
+
+
+@_command("selection sl", "long l", "type typ", "showType st", "uuid", "dagObjects dag", "transforms tr",
+          "objectsOnly o", "flatten fl", "noIntermediate ni", "shapes s", "exactType et", "references rf")
+def ls(scene, *args, **flags):
+    _names = _flatten(args)
+    _nodes = []
+    _plugs = []
+
+    if flags.get('references'):
+        return [info['node'] for info in scene.references.values()]
+
+    if _names:
+        for name in _names:
+            if '.' in name:
+                try:
+                    _node, _key = scene.plug(name)
+                except ValueError:
+                    continue
+                if flags.get('objectsOnly'):
+                    _nodes.append(_node)
+                else:
+                    _plugs.append(name)
+            elif _WILDCARD_RE.search(name):
+                _regex = _wildcard_regex(name)
+                _nodes.extend(node for node in scene._nodes
+                              if _regex.match(node.name) or ('|' in name and _regex.match(scene.long_name(node))))
+            else:
+                _nodes.extend(scene.find(name))
+        if flags.get('selection'):
+            _nodes = [node for node in _nodes if node in scene.selection]
+    elif flags.get('selection'):
+        _nodes = list(scene.selection)
+    else:
+        _nodes = list(scene._nodes)
+
+    _types = flags.get('type') or flags.get('exactType')
+    if _types:
+        _types = [_types] if isinstance(_types, str) else list(_types)
+        if flags.get('exactType'):
+            _nodes = [node for node in _nodes if node.type in _types]
+        else:
+            _nodes = [node for node in _nodes if any(item in node.nodeType.inherited for item in _types)]
+    if flags.get('dagObjects'):
+        _nodes = [node for node in _nodes if node.dag]
+    if flags.get('transforms'):
+        _nodes = [node for node in _nodes if 'transform' in node.nodeType.inherited]
+    if flags.get('shapes'):
+        _nodes = [node for node in _nodes if node.type == 'locator']
+
+    # Sin repetidos, manteniendo el orden
+    _seen = set()
+    _unique = []
+    for node in _nodes:
+        if id(node) not in _seen:
+            _seen.add(id(node))
+            _unique.append(node)
+
+    if flags.get('uuid'):
+        return [node.uuid for node in _unique]
+
+    if flags.get('long'):
+        result = [scene.long_name(node) for node in _unique]
+    else:
+        result = [scene.display_name(node) for node in _unique]
+    result += _plugs
+
+    if flags.get('showType'):
+        _typed = []
+        for name, node in zip(result, _unique):
+            _typed.extend([name, node.type])
+        return _typed
+    return result
+
+
+@_command()
+def objExists(scene, name):
+    if '.' in name:
+        try:
+            scene.plug(name)
+        except ValueError:
+            return False
+        return True
+    return bool(scene.find(name))
+
+
+@_command("type typ", "lock l", "keyable k", "channelBox cb", "settable se", "asString", "silent",
+          "multiIndices mi", "size s")
+def getAttr(scene, plug, **flags):
+    node, key = scene.plug(plug)
+    attrDef = node.attr_def(_last_name(key))
+
+    if flags.get('type'):
+        return attrDef.type
+    if flags.get('lock'):
+        return scene.locked(node, key)
+    if flags.get('keyable'):
+        return node.flag(key, 'keyable', attrDef)
+    if flags.get('channelBox'):
+        return node.flag(key, 'channelBox', attrDef)
+    if flags.get('settable'):
+        return not attrDef.output and not scene.locked(node, key) and not scene.driven(node, key)
+    if flags.get('multiIndices'):
+        return sorted(node.multi.get(attrDef.name, ())) or None
+    if flags.get('size'):
+        return len(node.multi.get(attrDef.name, ()))
+
+    value = scene.evaluate(node, key)
+    if flags.get('asString') and attrDef.type == 'enum':
+        return attrDef.enum[value]
+    if attrDef.children:
+        return [tuple(value)]
+    if attrDef.type == 'matrix':
+        return [float(item) for item in value]
+    return value
+
+
+@_command("type typ", "lock l", "keyable k", "channelBox cb", "clamp c", "alteredValue av")
+def setAttr(scene, plug, *values, **flags):
+    node, key = scene.plug(plug)
+    attrDef = node.attr_def(_last_name(key))
+
+    for flag in ['lock', 'keyable', 'channelBox']:
+        if flag in flags:
+            scene.set_flag(node, key, 'locked' if flag == 'lock' else flag, flags[flag])
+
+    if not values:
+        return
+    if attrDef.output or scene.locked(node, key) or scene.driven(node, key):
+        raise RuntimeError("The attribute {!r} is locked or connected and cannot be modified.".format(plug))
+
+    if attrDef.children or attrDef.type == 'matrix':
+        value = _flatten(values)
+        if attrDef.children and len(value) != len(attrDef.children):
+            raise RuntimeError("{!r} needs {} values.".format(plug, len(attrDef.children)))
+    elif len(values) == 1:
+        value = values[0]
+    else:
+        raise RuntimeError("Too many values for {!r}.".format(plug))
+    scene.set_value(node, key, value)
+
+
+@_command("query q", "worldSpace ws", "objectSpace os", "translation t", "rotation ro", "scale s", "matrix m",
+          "absolute a", "relative r")
+def xform(scene, *args, **flags):
+    _nodes = [scene.node(name) for name in _selection_or(scene, args)]
+    _world = flags.get('worldSpace', False) and not flags.get('objectSpace', False)
+
+    if flags.get('query'):
+        node = _nodes[0]
+        if flags.get('matrix'):
+            return list(scene.evaluate(node, 'worldMatrix[0]' if _world else 'matrix'))
+        if not _world:
+            _attr = 'translate' if flags.get('translation') else 'rotate' if flags.get('rotation') else 'scale'
+            return list(scene.evaluate(node, _attr))
+        _translate, _rotate, _scale = decompose_matrix(scene.evaluate(node, 'worldMatrix[0]'),
+                                                       scene.evaluate(node, 'rotateOrder'))
+        if flags.get('translation'):
+            return list(_translate)
+        if flags.get('rotation'):
+            return list(_rotate)
+        return list(_scale)
+
+    if flags.get('relative'):
+        raise TypeError("The stand-in xform doesn't support relative transformations.")
+
+    for node in _nodes:
+        if flags.get('matrix') is not None:
+            if _world:
+                scene.set_world_matrix(node, flags['matrix'])
+            else:
+                scene.set_local_matrix(node, flags['matrix'])
+        if flags.get('scale') is not None:
+            scene.set_channels(node, scale=flags['scale'])
+        if flags.get('rotation') is not None:
+            if _world:
+                scene.set_world_rotation(node, flags['rotation'])
+            else:
+                scene.set_channels(node, rotate=flags['rotation'])
+        if flags.get('translation') is not None:
+            if _world:
+                scene.set_world_translation(node, flags['translation'])
+            else:
+                scene.set_channels(node, translate=flags['translation'])
+
+
+def _list_attr_defs(scene, node, flags):
+    result = []
+    for attrDef in node.attr_defs():
+        if attrDef.hidden or attrDef.type == 'compound':
+            continue
+        _key = attrDef.name
+        if flags.get('keyable') and not node.flag(_key, 'keyable', attrDef):
+            continue
+        if flags.get('channelBox') and (node.flag(_key, 'keyable', attrDef) or
+                                        not node.flag(_key, 'channelBox', attrDef)):
+            continue
+        if flags.get('userDefined') and not attrDef.dynamic:
+            continue
+        if flags.get('locked') and not scene.locked(node, _key):
+            continue
+        if flags.get('unlocked') and scene.locked(node, _key):
+            continue
+        if flags.get('multi') is not None and bool(attrDef.multi) != bool(flags['multi']):
+            continue
+        result.append(attrDef)
+    return result
+
+
+@_command("keyable k", "userDefined ud", "channelBox cb", "locked l", "unlocked u", "multi m", "shortNames sn")
+def listAttr(scene, *args, **flags):
+    result = []
+    for name in _selection_or(scene, args):
+        if '.' in name:
+            node, key = scene.plug(name)
+            attrDef = node.attr_def(_last_name(key))
+            _defs = [attrDef] + list(attrDef.children)
+        else:
+            node = scene.node(name)
+            _defs = _list_attr_defs(scene, node, flags)
+        result.extend(attrDef.short if flags.get('shortNames') else attrDef.name for attrDef in _defs)
+    return result or None
+
+
+@_command()
+def listAnimatable(scene, *args):
+    result = []
+    for name in _selection_or(scene, args):
+        node = scene.node(name)
+        _prefix = scene.long_name(node)
+        for attrDef in _list_attr_defs(scene, node, {'keyable': True, 'unlocked': True}):
+            if attrDef.children or attrDef.output or scene.driven(node, attrDef.name):
+                continue
+            result.append("{}.{}".format(_prefix, attrDef.name))
+    return result or None
+
+
+@_command("node n", "exists ex", "attributeType at", "maxExists mxe", "minExists mne", "maximum max",
+          "minimum min", "listEnum le", "listDefault ld", "keyable k", "hidden h", "listChildren lc",
+          "listParent lp", "numberOfChildren nc", "multi m", "longName ln", "shortName sn", "niceName nn",
+          "type typ", "writable w", "readable r")
+def attributeQuery(scene, attr, **flags):
+    _nodeName = flags.get('node')
+    if _nodeName:
+        attrDef = scene.node(_nodeName).attr_def(attr)
+    elif flags.get('type'):
+        attrDef = _NODE_TYPES[flags['type']].defs.get(attr)
+    else:
+        raise RuntimeError("attributeQuery needs the node or type flag.")
+
+    if flags.get('exists'):
+        return attrDef is not None
+    if attrDef is None:
+        raise RuntimeError("No attribute named {!r}.".format(attr))
+
+    if flags.get('attributeType'):
+        return attrDef.type if attrDef.type not in ['double3', 'float3'] else 'compound'
+    if flags.get('maxExists'):
+        return attrDef.max is not None
+    if flags.get('minExists'):
+        return attrDef.min is not None
+    if flags.get('maximum'):
+        return [attrDef.max] if attrDef.max is not None else None
+    if flags.get('minimum'):
+        return [attrDef.min] if attrDef.min is not None else None
+    if flags.get('listEnum'):
+        return [':'.join(attrDef.enum)] if attrDef.enum else None
+    if flags.get('listDefault'):
+        if attrDef.children:
+            return [child.default for child in attrDef.children]
+        return list(attrDef.default) if attrDef.type == 'matrix' else [attrDef.default]
+    if flags.get('keyable'):
+        return attrDef.keyable
+    if flags.get('hidden'):
+        return attrDef.hidden
+    if flags.get('listChildren'):
+        return [child.name for child in attrDef.children] or None
+    if flags.get('listParent'):
+        return [attrDef.parent.name] if attrDef.parent else None
+    if flags.get('numberOfChildren'):
+        return len(attrDef.children)
+    if flags.get('multi'):
+        return attrDef.multi
+    if flags.get('longName'):
+        return attrDef.name
+    if flags.get('shortName'):
+        return attrDef.short
+    if flags.get('niceName'):
+        return attrDef.niceName or attrDef.name
+    if flags.get('writable'):
+        return not attrDef.output
+    if flags.get('readable'):
+        return True
+    raise TypeError("attributeQuery: no query flag specified.")
+
+
+@_command("longName ln", "shortName sn", "niceName nn", "attributeType at", "dataType dt", "keyable k",
+          "defaultValue dv", "minValue min", "maxValue max", "hasMinValue hnv", "hasMaxValue hxv",
+          "enumName en", "hidden h", "parent p", "numberOfChildren nc", "multi m", "query q", "edit e",
+          "exists ex", "usedAsColor uac")
+def addAttr(scene, *args, **flags):
+    _names = _selection_or(scene, args)
+
+    if flags.get('query') or flags.get('edit'):
+        node, key = scene.plug(_names[0])
+        attrDef = node.attr_def(_last_name(key))
+        if flags.get('edit'):
+            if 'minValue' in flags:
+                attrDef.min = flags['minValue']
+            if 'maxValue' in flags:
+                attrDef.max = flags['maxValue']
+            if flags.get('hasMinValue') is False:
+                attrDef.min = None
+            if flags.get('hasMaxValue') is False:
+                attrDef.max = None
+            if 'defaultValue' in flags:
+                attrDef.default = _cast(attrDef, flags['defaultValue'])
+            if 'enumName' in flags:
+                attrDef.enum = flags['enumName'].split(':')
+            if 'keyable' in flags:
+                attrDef.keyable = bool(flags['keyable'])
+            return
+        if flags.get('exists'):
+            return True
+        # Los enum tienen min/max implicitos: 0 y el ultimo indice
+        _enumMax = len(attrDef.enum) - 1 if attrDef.enum else None
+        if flags.get('maxValue'):
+            return attrDef.max if attrDef.max is not None else _enumMax
+        if flags.get('minValue'):
+            return attrDef.min if attrDef.min is not None else (0 if attrDef.enum else None)
+        if flags.get('hasMaxValue'):
+            return attrDef.max is not None or bool(attrDef.enum)
+        if flags.get('hasMinValue'):
+            return attrDef.min is not None or bool(attrDef.enum)
+        if flags.get('enumName'):
+            return ':'.join(attrDef.enum or [])
+        if flags.get('defaultValue'):
+            return attrDef.default
+        if flags.get('attributeType'):
+            return attrDef.type
+        if flags.get('keyable'):
+            return attrDef.keyable
+        raise TypeError("addAttr: no query flag specified.")
+
+    _name = flags.get('longName') or flags.get('shortName')
+    if not _name:
+        raise RuntimeError("addAttr needs a longName.")
+    _type = flags.get('attributeType') or flags.get('dataType') or 'double'
+    if _type not in _ATTRIBUTE_TYPES and _type not in _DATA_TYPES:
+        raise RuntimeError("The stand-in doesn't support the attribute type {!r}.".format(_type))
+
+    for name in _names:
+        node = scene.node(name)
+        _default = flags.get('defaultValue', _ATTRIBUTE_TYPES.get(_type, _DATA_TYPES.get(_type)))
+        attrDef = _AttrDef(_name, flags.get('shortName'), _type, None,
+                           keyable=bool(flags.get('keyable', False)), hidden=bool(flags.get('hidden', False)),
+                           min=flags.get('minValue'), max=flags.get('maxValue'), dynamic=True,
+                           enum=flags['enumName'].split(':') if flags.get('enumName') else None,
+                           multi=bool(flags.get('multi', False)), niceName=flags.get('niceName'))
+        attrDef.default = _cast(attrDef, _default) if _default is not None else None
+
+        if flags.get('parent'):
+            _parentDef = node.attr_def(flags['parent'])
+            if _parentDef is None:
+                raise RuntimeError("The parent attribute {!r} doesn't exist.".format(flags['parent']))
+            attrDef.parent = _parentDef
+            attrDef.index = len(_parentDef.children)
+            attrDef.keyable = attrDef.keyable or _parentDef.keyable
+            _parentDef.children.append(attrDef)
+            if _parentDef.keyable:
+                _parentDef.keyable = False
+                attrDef.keyable = True
+        scene.add_attr(node, attrDef)
+
+
+@_command()
+def deleteAttr(scene, plug):
+    node, key = scene.plug(plug)
+    attrDef = node.attr_def(_last_name(key))
+    if not attrDef.dynamic:
+        raise RuntimeError("Only dynamic attributes can be deleted: {!r}".format(plug))
+    scene.delete_attr(node, attrDef)
+
+
+def _connections_of(scene, node, key, source, destination):
+    """
+    - Devuelve [(thisKey, otherNode, otherKey)] de un nodo (key None) o de un plug y sus hijos.
+    """
+    if key is None:
+        _keys = None
+    else:
+        attrDef = node.attr_def(_last_name(key))
+        _keys = set([key] + [_sibling_key(key, child.name) for child in attrDef.children])
+
+    result = []
+    if source:
+        for _key, (otherNode, otherKey) in node.incoming.items():
+            if _keys is None or _key in _keys:
+                result.append((_key, otherNode, otherKey))
+    if destination:
+        for _key, targets in node.outgoing.items():
+            if _keys is None or _key in _keys:
+                result.extend((_key, otherNode, otherKey) for otherNode, otherKey in targets)
+    return result
+
+
+@_command("source s", "destination d", "connections c", "plugs p", "type t", "skipConversionNodes scn",
+          "shapes sh", "exactType et")
+def listConnections(scene, *args, **flags):
+    _source = flags.get('source', True)
+    _destination = flags.get('destination', True)
+
+    result = []
+    for name in _selection_or(scene, args):
+        if '.' in name:
+            node, key = scene.plug(name)
+        else:
+            node, key = scene.node(name), None
+        for thisKey, otherNode, otherKey in _connections_of(scene, node, key, _source, _destination):
+            if flags.get('type') and flags['type'] not in otherNode.nodeType.inherited:
+                continue
+            if flags.get('connections'):
+                result.append(scene.plug_name(node, thisKey))
+            result.append(scene.plug_name(otherNode, otherKey) if flags.get('plugs')
+                          else scene.display_name(otherNode))
+    return result or None
+
+
+@_command("force f", "nextAvailable na", "lock l")
+def connectAttr(scene, source, destination, **flags):
+    _srcNode, _srcKey = scene.plug(source)
+    _dstNode, _dstKey = scene.plug(destination)
+    scene.connect(_srcNode, _srcKey, _dstNode, _dstKey, force=flags.get('force', False))
+
+
+@_command("nextAvailable na")
+def disconnectAttr(scene, source, destination, **flags):
+    _srcNode, _srcKey = scene.plug(source)
+    _dstNode, _dstKey = scene.plug(destination)
+    scene.disconnect(_srcNode, _srcKey, _dstNode, _dstKey)
+
+
+@_command("name n", "parent p", "skipSelect ss", "shared s")
+def createNode(scene, nodeType, **flags):
+    _parent = scene.node(flags['parent']) if flags.get('parent') else None
+    node = scene.create(nodeType, flags.get('name'), _parent)
+    if not flags.get('skipSelect'):
+        _select(scene, [node])
+    return scene.display_name(node)
+
+
+@_command("constraints cn", "hierarchy hi")
+def delete(scene, *args, **flags):
+    _nodes = []
+    for name in _selection_or(scene, args):
+        node = scene.node(name)
+        if node not in _nodes:
+            _nodes.append(node)
+    if not _nodes:
+        raise RuntimeError("Not enough objects or values.")
+    for node in _nodes:
+        if node.alive:
+            scene.delete(node)
+
+
+@_command()
+def rename(scene, *args):
+    if len(args) == 1:
+        node, newName = scene.selection[0], args[0]
+    else:
+        node, newName = scene.node(args[0]), args[1]
+    scene.rename(node, newName)
+    return scene.display_name(node)
+
+
+@_command()
+def nodeType(scene, name):
+    return scene.node(name.split('.', 1)[0]).type
+
+
+def _select(scene, nodes, add=False):
+    _old = list(scene.selection)
+    if add:
+        scene.selection.extend(node for node in nodes if node not in scene.selection)
+    else:
+        scene.selection[:] = nodes
+
+    def _undo():
+        scene.selection[:] = _old
+    scene._record(_undo)
+
+
+@_command("add af", "replace r", "clear cl", "deselect d", "toggle tgl", "noExpand ne", "hierarchy hi")
+def select(scene, *args, **flags):
+    if flags.get('clear'):
+        _select(scene, [])
+        return
+    _nodes = []
+    for name in _flatten(args):
+        _found = scene.find(name)
+        if not _found:
+            raise ValueError("No object matches name: {}".format(name))
+        _nodes.extend(_found)
+    if flags.get('deselect'):
+        _select(scene, [node for node in scene.selection if node not in _nodes])
+    elif flags.get('toggle'):
+        _select(scene, [node for node in scene.selection if node not in _nodes] +
+                [node for node in _nodes if node not in scene.selection])
+    else:
+        _select(scene, _nodes, add=flags.get('add', False))
+
+
+@_command("name n", "position p", "absolute a")
+def spaceLocator(scene, **flags):
+    node = scene.create('transform', flags.get('name') or 'locator1')
+    _shapeName = re.sub(r'(\d*)$', r'Shape\1', node.name, count=1)
+    scene.create('locator', _shapeName, node)
+    if flags.get('position'):
+        scene.set_value(node, 'translate', flags['position'])
+    _select(scene, [node])
+    return [scene.display_name(node)]
+
+
+@_command("name n", "empty em", "world w", "parent p", "relative r", "absolute a")
+def group(scene, *args, **flags):
+    _nodes = [] if flags.get('empty') else [scene.node(name) for name in _selection_or(scene, args)]
+    if not flags.get('empty') and not _nodes:
+        raise RuntimeError("Not enough objects or values.")
+
+    _parent = None
+    if flags.get('parent'):
+        _parent = scene.node(flags['parent'])
+    elif _nodes and not flags.get('world'):
+        _parents = set(id(node.parent) for node in _nodes)
+        if len(_parents) == 1:
+            _parent = _nodes[0].parent
+
+    node = scene.create('transform', flags.get('name') or 'group1', _parent)
+    for child in _nodes:
+        scene.reparent(child, node, preserveWorld=not flags.get('relative', False))
+    _select(scene, [node])
+    return scene.display_name(node)
+
+
+@_command("world w", "relative r", "absolute a", "add add", "shape s")
+def parent(scene, *args, **flags):
+    _names = _flatten(args)
+    if flags.get('world'):
+        _children, _parent = _selection_or(scene, _names), None
+    elif len(_names) == 1:
+        _children, _parent = _selection_or(scene, []), scene.node(_names[0])
+    elif _names:
+        _children, _parent = _names[:-1], scene.node(_names[-1])
+    else:
+        raise RuntimeError("Not enough objects or values.")
+
+    result = []
+    for name in _children:
+        node = scene.node(name)
+        if node.parent is _parent:
+            scene.warning("Object {} is already a child of {}.".format(
+                name, scene.display_name(_parent) if _parent else 'the world'))
+            continue
+        scene.reparent(node, _parent, preserveWorld=not flags.get('relative', False))
+        result.append(scene.display_name(node))
+    return result
+
+
+@_command("parent p", "children c", "allDescendents ad", "shapes s", "type typ", "fullPath f",
+          "allParents ap", "path pa", "noIntermediate ni")
+def listRelatives(scene, *args, **flags):
+    result = []
+    for name in _selection_or(scene, args):
+        node = scene.node(name)
+        if flags.get('parent') or flags.get('allParents'):
+            _nodes = [node.parent] if node.parent else []
+        elif flags.get('allDescendents'):
+            _nodes = []
+            _pending = list(reversed(node.children))
+            while _pending:
+                _child = _pending.pop()
+                _nodes.append(_child)
+                _pending.extend(reversed(_child.children))
+            # Como en Maya: los descendientes mas profundos primero
+            _nodes.reverse()
+        else:
+            _nodes = list(node.children)
+
+        if flags.get('shapes'):
+            _nodes = [child for child in _nodes if child.type == 'locator']
+        if flags.get('type'):
+            _types = [flags['type']] if isinstance(flags['type'], str) else flags['type']
+            _nodes = [child for child in _nodes if any(item in child.nodeType.inherited for item in _types)]
+        result.extend(scene.long_name(child) if flags.get('fullPath') else scene.display_name(child)
+                      for child in _nodes)
+    return result or None
+
+
+def _constraint(kind, scene, *args, **flags):
+    """
+    - Crea un constraint de tipo "kind" de los targets al ultimo nodo (con offset y pesos por target).
+    """
+    _names = _selection_or(scene, args)
+    if len(_names) < 2:
+        raise RuntimeError("{} needs at least a target and a constrained object.".format(kind))
+    _targets = [scene.node(name) for name in _names[:-1]]
+    destination = scene.node(_names[-1])
+    _weight = flags.get('weight', 1.0)
+    _weight = 1.0 if _weight is True else float(_weight)
+
+    _name = flags.get('name') or "{}_{}1".format(destination.name, kind)
+    node = scene.create(kind, _name, destination)
+
+    _isJoint = 'jointOrient' in destination.nodeType.defs
+    _destinationWorld = scene.evaluate(destination, 'worldMatrix[0]')
+    for index, target in enumerate(_targets):
+        _prefix = 'target[{}].'.format(index)
+        scene.connect(target, 'parentMatrix[0]', node, _prefix + 'targetParentMatrix')
+        scene.connect(target, 'offsetParentMatrix', node, _prefix + 'targetOffsetParentMatrix')
+        for attr in ['Translate', 'Rotate', 'Scale', 'RotateOrder']:
+            scene.connect(target, attr[0].lower() + attr[1:], node, _prefix + 'target' + attr)
+        if 'jointOrient' in target.nodeType.defs:
+            scene.connect(target, 'jointOrient', node, _prefix + 'targetJointOrient')
+
+        # Alias del peso: <target>W<index>
+        _weightDef = _AttrDef("{}W{}".format(target.name.split(':')[-1], index), None, 'double', _weight,
+                              keyable=True, min=0.0, dynamic=True)
+        scene.add_attr(node, _weightDef)
+        scene.connect(node, _weightDef.name, node, _prefix + 'targetWeight')
+
+        # Offset
+        _targetWorld = _target_world(scene, node, index)
+        _offset = list(_IDENTITY)
+        if flags.get('maintainOffset'):
+            if kind == 'parentConstraint':
+                _offset = _mult(_destinationWorld, _inverse(_targetWorld))
+            elif kind == 'orientConstraint':
+                _offset = _mult(_rotation_part(_destinationWorld), _inverse(_rotation_part(_targetWorld)))
+            elif kind == 'pointConstraint':
+                _offset[12:15] = [a - b for a, b in zip(_destinationWorld[12:15], _targetWorld[12:15])]
+            else:
+                for axis in range(3):
+                    _offset[axis * 5] = _row_length(_destinationWorld, axis) / (_row_length(_targetWorld, axis) or 1.0)
+        elif flags.get('offset') and kind == 'orientConstraint':
+            _offset = euler_to_matrix(flags['offset'])
+        elif flags.get('offset') and kind == 'pointConstraint':
+            _offset[12:15] = [float(value) for value in flags['offset']]
+        scene.set_value(node, _prefix + 'targetOffsetMatrix', _offset)
+
+    scene.connect(destination, 'parentInverseMatrix[0]', node, 'constraintParentInverseMatrix')
+    scene.connect(destination, 'rotateOrder', node, 'constraintRotateOrder')
+    if _isJoint:
+        scene.connect(destination, 'jointOrient', node, 'constraintJointOrient')
+    scene.set_value(node, 'restTranslate', scene.evaluate(destination, 'translate'))
+    scene.set_value(node, 'restRotate', scene.evaluate(destination, 'rotate'))
+    scene.set_value(node, 'restScale', scene.evaluate(destination, 'scale'))
+
+    _outputs = {'parentConstraint': [('constraintTranslate', 'translate'), ('constraintRotate', 'rotate')],
+                'pointConstraint': [('constraintTranslate', 'translate')],
+                'orientConstraint': [('constraintRotate', 'rotate')],
+                'scaleConstraint': [('constraintScale', 'scale')]}[kind]
+    _skip = flags.get('skip') or []
+    _skip = [_skip] if isinstance(_skip, str) else _skip
+    for output, attr in _outputs:
+        _axisSkip = _skip
+        if kind == 'parentConstraint':
+            _axisSkip = flags.get('skipTranslate' if attr == 'translate' else 'skipRotate') or []
+            _axisSkip = [_axisSkip] if isinstance(_axisSkip, str) else _axisSkip
+        for axis in 'XYZ':
+            if axis.lower() in _axisSkip:
+                continue
+            if scene.locked(destination, attr + axis):
+                scene.warning("Could not constrain the locked attribute {}.{}{}".format(
+                    scene.display_name(destination), attr, axis))
+                continue
+            scene.connect(node, output + axis, destination, attr + axis)
+
+    return [scene.display_name(node)]
+
+
+_CONSTRAINT_FLAGS = ("maintainOffset mo", "weight w", "offset o", "name n", "skip sk", "skipTranslate st",
+                     "skipRotate sr")
+
+
+@_command(*_CONSTRAINT_FLAGS)
+def parentConstraint(scene, *args, **flags):
+    return _constraint('parentConstraint', scene, *args, **flags)
+
+
+@_command(*_CONSTRAINT_FLAGS)
+def pointConstraint(scene, *args, **flags):
+    return _constraint('pointConstraint', scene, *args, **flags)
+
+
+@_command(*_CONSTRAINT_FLAGS)
+def orientConstraint(scene, *args, **flags):
+    return _constraint('orientConstraint', scene, *args, **flags)
+
+
+@_command(*_CONSTRAINT_FLAGS)
+def scaleConstraint(scene, *args, **flags):
+    return _constraint('scaleConstraint', scene, *args, **flags)
+
+
+@_command("query q", "state st", "stateWithoutFlush swf", "openChunk ock", "closeChunk cck", "chunkName cn",
+          "undoName un", "redoName rn", "infinity in", "length l", "printQueue pq")
+def undoInfo(scene, **flags):
+    if flags.get('query'):
+        if flags.get('state') or flags.get('stateWithoutFlush'):
+            return scene.undoEnabled
+        if flags.get('length'):
+            return len(scene._undoStack)
+        if flags.get('undoName'):
+            return scene._undoNames[-1] if scene._undoNames else ''
+        return scene.undoEnabled
+    if 'state' in flags:
+        scene.set_undo_state(flags['state'], flush=True)
+    if 'stateWithoutFlush' in flags:
+        scene.set_undo_state(flags['stateWithoutFlush'], flush=False)
+    if flags.get('openChunk'):
+        scene.open_chunk(flags.get('chunkName', ''))
+    if flags.get('closeChunk'):
+        scene.close_chunk()
+
+
+@_command()
+def undo(scene):
+    scene.undo()
+
+
+@_command("suspend su", "force f", "currentView cv")
+def refresh(scene, **flags):
+    if 'suspend' in flags:
+        scene.suspended = bool(flags['suspend'])
+
+
+@_command("query q", "mode m")
+def evaluationManager(scene, **flags):
+    if flags.get('query'):
+        return [scene.evaluationMode]
+    if 'mode' in flags:
+        scene.evaluationMode = flags['mode']
+
+
+@_command("query q", "edit e", "update u")
+def currentTime(scene, *args, **flags):
+    if flags.get('query'):
+        return scene.time
+    scene.time = float(args[0])
+    return scene.time
+
+
+@_command("attribute at", "time t", "value v")
+def setKeyframe(scene, *args, **flags):
+    """
+    - Guarda una key del valor actual de los atributos animables (o de "attribute") en el tiempo actual.
+        Las keys no se evaluan: sirven para comprobar que y cuando se keyeo.
+    """
+    _time = float(flags.get('time', scene.time))
+    _attrs = flags.get('attribute')
+    _attrs = [_attrs] if isinstance(_attrs, str) else _attrs
+    count = 0
+    for name in _selection_or(scene, args):
+        node = scene.node(name)
+        if _attrs:
+            _keys = [node.attr_def(attr).name for attr in _attrs]
+        else:
+            _keys = [attrDef.name for attrDef in _list_attr_defs(scene, node, {'keyable': True, 'unlocked': True})
+                     if not attrDef.children and not attrDef.output and not scene.driven(node, attrDef.name)]
+        for key in _keys:
+            _curve = scene.keys.setdefault((node, key), {})
+            _missing = object()
+            _old = _curve.get(_time, _missing)
+            _curve[_time] = scene.evaluate(node, key)
+            count += 1
+
+            def _undo(_curve=_curve, _old=_old, _missing=_missing):
+                if _old is _missing:
+                    _curve.pop(_time, None)
+                else:
+                    _curve[_time] = _old
+            scene._record(_undo)
+    return count
+
+
+@_command("version v", "batch b", "apiVersion api", "operatingSystem os")
+def about(scene, **flags):
+    if flags.get('batch'):
+        return True
+    if flags.get('apiVersion'):
+        return 20230000
+    if flags.get('operatingSystem'):
+        return 'linux64'
+    return '2023'
+
+
+@_command("query q", "loaded l")
+def pluginInfo(scene, name, **flags):
+    return name in scene.plugins
+
+
+@_command("quiet qt")
+def loadPlugin(scene, name, **flags):
+    scene.plugins.add(name)
+    return [name]
+
+
+@_command()
+def warning(scene, message):
+    scene.warning(message)
+
+
+@_command("query q", "reference r", "new n", "force f", "open o", "save s", "sceneName sn", "rename rn",
+          "type typ")
+def file(scene, *args, **flags):
+    if flags.get('query'):
+        if flags.get('reference'):
+            return list(scene.references)
+        if flags.get('sceneName'):
+            return ''
+        raise TypeError("file: query flag not supported by the stand-in.")
+    if flags.get('new'):
+        new_scene()
+        return ''
+    if flags.get('save'):
+        return ''
+    raise RuntimeError("The stand-in can't open or import Maya files.")
+
+
+@_command("isLoaded il", "namespace ns", "referenceNode rfn", "filename f", "nodes n", "shortName shn")
+def referenceQuery(scene, reference, **flags):
+    _info = scene.references.get(reference)
+    if _info is None:
+        for path, info in scene.references.items():
+            if info['node'] == reference:
+                reference, _info = path, info
+                break
+    if _info is None:
+        raise RuntimeError("{!r} is not a reference.".format(reference))
+    if flags.get('isLoaded'):
+        return _info['loaded']
+    if flags.get('namespace'):
+        return ':' + _info['namespace']
+    if flags.get('referenceNode'):
+        return _info['node']
+    if flags.get('filename'):
+        return reference
+    if flags.get('nodes'):
+        _prefix = _info['namespace'] + ':'
+        return [scene.display_name(node) for node in scene._nodes if node.name.startswith(_prefix)]
+    raise TypeError("referenceQuery: no query flag specified.")
+
+
+# ------------------------------------------------------------------------------
+# Instalacion
+# ------------------------------------------------------------------------------
+
+_PREVIOUS_MODULES = {}
+
+
+def is_installed():
+    """
+    - Devuelve True si maya.cmds es el del stand-in.
+    """
+    return getattr(sys.modules.get('maya.cmds'), '__standIn__', False)
+
+
+def install(scene=None, force=False):
+    """
+    - Registra los modulos 'maya', 'maya.cmds' y 'maya.standalone' del stand-in en sys.modules,
+        y actualiza la variable 'cmds' de los modulos de riggingCodes que ya estuvieran importados.
+    - Dentro de Maya (maya.cmds real ya importado) da RuntimeError, salvo con force=True.
+    - Devuelve la escena activa.
+    """
+    global _SCENE
+    _existing = sys.modules.get('maya.cmds')
+    if _existing is not None and not getattr(_existing, '__standIn__', False):
+        if not force:
+            raise RuntimeError("The real maya.cmds is already loaded. Use force=True to replace it.")
+
+    if not is_installed():
+        for name in ['maya', 'maya.cmds', 'maya.standalone']:
+            _PREVIOUS_MODULES[name] = sys.modules.get(name)
+
+    _SCENE = scene or Scene()
+    _emit('cleared')
+
+    _maya = types.ModuleType('maya')
+    _maya.__path__ = []
+    _cmds = types.ModuleType('maya.cmds')
+    _cmds.__standIn__ = True
+    for name, function in _COMMANDS.items():
+        setattr(_cmds, name, function)
+    _standalone = types.ModuleType('maya.standalone')
+    _standalone.initialize = lambda name='python': None
+    _standalone.uninitialize = lambda: None
+    _maya.cmds = _cmds
+    _maya.standalone = _standalone
+
+    sys.modules['maya'] = _maya
+    sys.modules['maya.cmds'] = _cmds
+    sys.modules['maya.standalone'] = _standalone
+
+    for moduleName, module in list(sys.modules.items()):
+        if moduleName.startswith('riggingCodes.') and isinstance(getattr(module, 'cmds', None), types.ModuleType):
+            module.cmds = _cmds
+
+    return _SCENE
+
+
+def uninstall():
+    """
+    - Quita los modulos del stand-in y restaura los que hubiera antes de install().
+    """
+    if not is_installed():
+        return
+    for name in ['maya', 'maya.cmds', 'maya.standalone']:
+        _previous = _PREVIOUS_MODULES.pop(name, None)
+        if _previous is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = _previous
@@ -0,0 +1,463 @@
+"""
+Detalles:
+    - Libreria de poses con contenido deduplicado, en vez de carpetas con miles de JSON casi iguales de export_dict.
+    - Cada pose se guarda por nodos: los atributos de cada nodo ({attr: {'value': ..., 'type': ...}}) son un chunk
+        cuyo nombre es el hash (sha1) de su contenido. Los chunks iguales (el mismo nodo sin cambios entre poses,
+        o la misma sub-pose en varios personajes) se guardan una unica vez.
+    - Estructura de la carpeta de la libreria:
+            chunks/<ab>/<hash>.json     <- atributos de un nodo
+            poses/<id>.json             <- manifest de la pose: nombres, namespace, tags, fecha y {nodo: hash}
+            index.sqlite                <- indice de las poses (nodo -> poses, nombres, tags, fechas)
+        El id de una pose es el hash de sus {nodo: hash}: guardar dos veces la misma pose no la duplica
+        (se actualizan el nombre y la fecha, y se agregan el nombre nuevo a 'names' y los tags).
+        Los nombres anteriores se conservan: find(name=...) encuentra la pose con cualquiera de ellos.
+    - Las consultas ("todas las poses con L_handIK_ctl", "la ultima pose del namespace rig01") se responden
+        con el indice, sin leer los archivos de las poses. Los nodos se buscan con o sin namespace.
+    - El indice se puede reconstruir desde los manifests (rebuild_index), y se reconstruye solo si no existe.
+    - Ejemplos de uso:
+        from riggingCodes import poseLibrary
+
+        library = poseLibrary.PoseLibrary('C:/Example/Poses')
+        poseId = library.save(name='run_contact', tags=['run', 'blocking'])      # Seleccion actual
+        library.import_folder('C:/Example/Old/Poses')                            # Archivos de export_dict
+        library.find(node='L_handIK_ctl')
+        library.latest(namespace='rig01')
+        library.apply(poseId, namespace='rig02')
+        library.stats()
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Keep every name a pose was saved with ('names'), apply uses the node given by sceneIndex.resolve
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import time
+
+import maya.cmds as cmds
+
+from riggingCodes import mayaBackend, sceneIndex, toolReport
+
+INDEX_NAME = "index.sqlite"
+
+# Version del esquema del indice: si cambia, el indice se reconstruye desde los manifests
+INDEX_VERSION = 2
+
+
+def _hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _dumps(data):
+    # Texto canonico: el mismo contenido siempre da el mismo hash
+    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+
+
+def _write(path, text):
+    """
+    - Escribe el archivo de una vez (archivo temporal y rename), para no dejar archivos a medias.
+    """
+    _folder = os.path.dirname(path)
+    if not os.path.isdir(_folder):
+        os.makedirs(_folder)
+    _temp = "{}.{}.tmp".format(path, os.getpid())
+    with open(_temp, "w") as file_to_write:
+        file_to_write.write(text)
+    os.replace(_temp, path)
+
+
+def split_namespace(node):
+    """
+    - 'rig01:L_handIK_ctl' -> ('rig01', 'L_handIK_ctl'). Los nodos sin namespace devuelven ('', node).
+    """
+    _name = node.split('|')[-1]
+    if ':' not in _name:
+        return '', _name
+    _namespace, _bare = _name.rsplit(':', 1)
+    return _namespace.lstrip(':'), _bare
+
+
+def _manifest_names(manifest):
+    """
+    - Nombres con los que se guardo la pose, del mas viejo al mas nuevo.
+        Los manifests sin 'names' devuelven su 'name'.
+    """
+    _names = list(manifest.get('names') or [])
+    if not _names and manifest.get('name'):
+        _names.append(manifest['name'])
+    return _names
+
+
+class PoseLibrary(object):
+    """
+    - Libreria de poses en la carpeta "root" (ver el docstring del modulo). Se crea si no existe.
+    """
+    def __init__(self, root):
+        import sqlite3
+
+        self.root = root
+        if not os.path.isdir(os.path.join(root, "poses")):
+            os.makedirs(os.path.join(root, "poses"))
+        self.indexPath = os.path.join(root, INDEX_NAME)
+
+        _exists = os.path.isfile(self.indexPath)
+        self._connection = sqlite3.connect(self.indexPath)
+        if not _exists or self._index_version() != INDEX_VERSION:
+            self.rebuild_index()
+
+    def __repr__(self):
+        return "<PoseLibrary {!r}>".format(self.root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    # --------------------------------------------------------------------------
+    # Archivos
+    # --------------------------------------------------------------------------
+    def _chunk_path(self, chunk):
+        return os.path.join(self.root, "chunks", chunk[:2], chunk + ".json")
+
+    def _manifest_path(self, poseId):
+        return os.path.join(self.root, "poses", poseId + ".json")
+
+    def _read_manifest(self, poseId):
+        _path = self._manifest_path(poseId)
+        if not os.path.isfile(_path):
+            raise KeyError("The pose {!r} is not in the library {!r}.".format(poseId, self.root))
+        with open(_path, "r") as file_to_read:
+            return json.load(file_to_read)
+
+    # --------------------------------------------------------------------------
+    # Indice
+    # --------------------------------------------------------------------------
+    def _index_version(self):
+        import sqlite3
+
+        try:
+            _row = self._connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return json.loads(_row[0]) if _row else None
+
+    def rebuild_index(self):
+        """
+        - Vuelve a crear el indice desde los manifests de la carpeta poses.
+        - Devolvera el numero de poses indexadas.
+        """
+        _connection = self._connection
+        with _connection:
+            for table in ['meta', 'poses', 'nodes', 'names', 'tags']:
+                _connection.execute("DROP TABLE IF EXISTS {}".format(table))
+            _connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            _connection.execute("CREATE TABLE poses (id TEXT PRIMARY KEY, name TEXT, namespace TEXT, "
+                                "time REAL, nodeCount INTEGER)")
+            _connection.execute("CREATE TABLE nodes (pose TEXT, node TEXT, namespace TEXT, bare TEXT, chunk TEXT)")
+            _connection.execute("CREATE TABLE names (pose TEXT, name TEXT, PRIMARY KEY (pose, name))")
+            _connection.execute("CREATE TABLE tags (pose TEXT, tag TEXT, PRIMARY KEY (pose, tag))")
+            _connection.execute("CREATE INDEX nodes_node ON nodes (node)")
+            _connection.execute("CREATE INDEX nodes_bare ON nodes (bare)")
+            _connection.execute("CREATE INDEX nodes_pose ON nodes (pose)")
+            _connection.execute("CREATE INDEX poses_namespace ON poses (namespace, time)")
+            _connection.execute("CREATE INDEX names_name ON names (name)")
+            _connection.execute("CREATE INDEX tags_tag ON tags (tag)")
+            _connection.execute("INSERT INTO meta VALUES ('version', ?)", (json.dumps(INDEX_VERSION),))
+
+            _count = 0
+            _folder = os.path.join(self.root, "poses")
+            for fileName in sorted(os.listdir(_folder)):
+                if not fileName.endswith(".json"):
+                    continue
+                _poseId = fileName[:-len(".json")]
+                try:
+                    self._index_pose(_poseId, self._read_manifest(_poseId))
+                except (ValueError, KeyError):
+                    cmds.warning("Invalid pose manifest skipped: {!r}".format(os.path.join(_folder, fileName)))
+                    continue
+                _count += 1
+        return _count
+
+    def _index_pose(self, poseId, manifest):
+        _connection = self._connection
+        _connection.execute("DELETE FROM poses WHERE id = ?", (poseId,))
+        _connection.execute("DELETE FROM nodes WHERE pose = ?", (poseId,))
+        _connection.execute("DELETE FROM names WHERE pose = ?", (poseId,))
+        _connection.execute("DELETE FROM tags WHERE pose = ?", (poseId,))
+        _nodes = manifest['nodes']
+        _connection.execute("INSERT INTO poses VALUES (?, ?, ?, ?, ?)",
+                            (poseId, manifest.get('name', ''), manifest.get('namespace', ''),
+                             manifest.get('time', 0.0), len(_nodes)))
+        _connection.executemany("INSERT INTO nodes VALUES (?, ?, ?, ?, ?)",
+                                [(poseId, node) + split_namespace(node) + (chunk,) for node, chunk in _nodes.items()])
+        _connection.executemany("INSERT OR IGNORE INTO names VALUES (?, ?)",
+                                [(poseId, name) for name in _manifest_names(manifest)])
+        _connection.executemany("INSERT INTO tags VALUES (?, ?)",
+                                [(poseId, tag) for tag in manifest.get('tags', [])])
+
+    # --------------------------------------------------------------------------
+    # Guardar y leer
+    # --------------------------------------------------------------------------
+    def save(self, pose=None, name="", tags=None, namespace=None, timestamp=None):
+        """
+        - Guarda una pose en la libreria.
+        - Argumentos opcionales:
+            -pose       <dict/PoseTable> Pose con el formato de get_nodesInfo_asDict.
+                                Valor default: None, la seleccion actual (Reset_Controls.get_nodesInfo_asTable).
+            -name       <str> Nombre de la pose. Valor default: "".
+                                Si la pose ya estaba guardada (los mismos valores), pasa a ser su nombre y los
+                                nombres anteriores se conservan en 'names'.
+            -tags       <list> Tags de la pose. Valor default: None.
+            -namespace  <str> Namespace de la pose. Valor default: None, el namespace comun de todos sus nodos
+                                ("" si no tienen o si son de varios namespaces).
+            -timestamp  <float> Fecha de la pose (time.time()). Valor default: None, ahora.
+        - Devolvera el id de la pose, o None si no hay nada que guardar.
+        """
+        if pose is None:
+            from riggingCodes import Reset_Controls
+            pose = Reset_Controls.get_nodesInfo_asTable()
+        if not pose:
+            cmds.warning("No values found for the pose to save. Process skipped")
+            return None
+
+        # Chunks: solo se escriben los que no existen
+        _nodes = {}
+        _written = 0
+        for node in pose:
+            _text = _dumps(dict(pose[node].items()))
+            _chunk = _hash(_text)
+            _nodes[node] = _chunk
+            _path = self._chunk_path(_chunk)
+            if not os.path.isfile(_path):
+                _write(_path, _text)
+                _written += 1
+
+        poseId = _hash(_dumps(_nodes))
+        if namespace is None:
+            _namespaces = set(split_namespace(node)[0] for node in _nodes)
+            namespace = _namespaces.pop() if len(_namespaces) == 1 else ""
+
+        # La misma pose guardada otra vez: se actualiza el nombre y la fecha, y se juntan los nombres y los tags
+        _tags = sorted(set(tags or []))
+        _names = []
+        if os.path.isfile(self._manifest_path(poseId)):
+            _previous = self._read_manifest(poseId)
+            _tags = sorted(set(_previous.get('tags', [])) | set(_tags))
+            _names = _manifest_names(_previous)
+            name = name or _previous.get('name', "")
+        if name and name not in _names:
+            _names.append(name)
+
+        _manifest = {'name': name,
+                     'names': _names,
+                     'namespace': namespace,
+                     'tags': _tags,
+                     'time': time.time() if timestamp is None else timestamp,
+                     'nodes': _nodes}
+        _write(self._manifest_path(poseId), json.dumps(_manifest, indent=4, sort_keys=True))
+        with self._connection:
+            self._index_pose(poseId, _manifest)
+
+        print("# Saved pose {!r} ({}): {} nodes, {} new chunks".format(name, poseId[:12], len(_nodes), _written))
+        return poseId
+
+    def load(self, poseId):
+        """
+        - Devolvera la pose con el formato de get_nodesInfo_asDict.
+        """
+        pose = {}
+        for node, chunk in self._read_manifest(poseId)['nodes'].items():
+            with open(self._chunk_path(chunk), "r") as file_to_read:
+                pose[node] = json.load(file_to_read)
+        return pose
+
+    def info(self, poseId):
+        """
+        - Devolvera los datos de una pose del indice (ver find), o None si no existe.
+        """
+        _rows = self._select("SELECT id, name, namespace, time, nodeCount FROM poses WHERE id = ?", [poseId])
+        return _rows[0] if _rows else None
+
+    def apply(self, poseId, namespace=None):
+        """
+        - Setea los valores de una pose en la escena, todos de una vez y en un unico paso de undo.
+        - Argumentos opcionales:
+            -namespace  <str> Aplica la pose en otro namespace (sin ':'), cambiando el namespace de sus nodos.
+                                Valor default: None, los nodos de la pose tal cual.
+        - Devolvera el reporte de la operacion (ver toolReport).
+        """
+        report = toolReport.Report("apply {}".format(poseId[:12]))
+        _backend = mayaBackend.current()
+        _values = []
+        with report.timer('read'):
+            pose = self.load(poseId)
+        with report.timer('resolve'):
+            for node, attrs in pose.items():
+                if namespace is not None:
+                    _bare = split_namespace(node)[1]
+                    node = "{}:{}".format(namespace, _bare) if namespace else _bare
+                try:
+                    _resolved = sceneIndex.resolve(node)
+                except ValueError:
+                    report.fail('ambiguous', node)
+                    continue
+                if _resolved is None:
+                    report.fail('missing', node)
+                    continue
+                node = _resolved
+                for attr, entry in attrs.items():
+                    if not _backend.attribute_exists(node, attr):
+                        report.add('noAttribute', "{}.{}".format(node, attr))
+                        continue
+                    _values.append((node, attr, entry['value']))
+
+        if _values:
+            with report.timer('set'):
+                cmds.undoInfo(openChunk=True, chunkName="apply_pose")
+                try:
+                    _failed = _backend.set_plugs(_values)
+                finally:
+                    cmds.undoInfo(closeChunk=True)
+            for node, attr, e in _failed:
+                report.fail('failed', "{}.{}: {}".format(node, attr, str(e).strip()))
+            report.count('set', len(_values) - len(_failed))
+        return report.emit()
+
+    def import_folder(self, folder, pattern="*.json", tags=None):
+        """
+        - Guarda en la libreria los archivos de export_dict de una carpeta (con su delta, si tienen),
+            con el nombre del archivo y su fecha de modificacion.
+        - Devolvera la lista de ids de las poses (los archivos repetidos devuelven el mismo id).
+        """
+        from riggingCodes import poseTracker
+
+        poseIds = []
+        for fileName in sorted(os.listdir(folder)):
+            _path = os.path.join(folder, fileName)
+            if not fnmatch.fnmatch(fileName, pattern) or ".delta." in fileName or not os.path.isfile(_path):
+                continue
+            try:
+                pose = poseTracker.read_pose(_path)
+            except ValueError:
+                cmds.warning("Invalid pose file skipped: {!r}".format(_path))
+                continue
+            if not isinstance(pose, dict) or not pose:
+                continue
+            poseIds.append(self.save(pose, name=os.path.splitext(fileName)[0], tags=tags,
+                                     timestamp=os.path.getmtime(_path)))
+        return poseIds
+
+    def tag(self, poseId, *tags):
+        """
+        - Agrega tags a una pose.
+        """
+        _manifest = self._read_manifest(poseId)
+        _manifest['tags'] = sorted(set(_manifest.get('tags', [])) | set(tags))
+        _write(self._manifest_path(poseId), json.dumps(_manifest, indent=4, sort_keys=True))
+        with self._connection:
+            self._connection.executemany("INSERT OR IGNORE INTO tags VALUES (?, ?)", [(poseId, tag) for tag in tags])
+
+    def remove(self, poseId):
+        """
+        - Borra una pose de la libreria. Sus chunks se borran con collect_garbage si ninguna otra pose los usa.
+        """
+        _path = self._manifest_path(poseId)
+        if os.path.isfile(_path):
+            os.remove(_path)
+        with self._connection:
+            for table, column in [('poses', 'id'), ('nodes', 'pose'), ('names', 'pose'), ('tags', 'pose')]:
+                self._connection.execute("DELETE FROM {} WHERE {} = ?".format(table, column), (poseId,))
+
+    def collect_garbage(self):
+        """
+        - Borra los chunks que no usa ninguna pose. Devolvera el numero de chunks borrados.
+        """
+        _used = set(row[0] for row in self._connection.execute("SELECT DISTINCT chunk FROM nodes"))
+        _removed = 0
+        _folder = os.path.join(self.root, "chunks")
+        if not os.path.isdir(_folder):
+            return 0
+        for prefix in os.listdir(_folder):
+            for fileName in os.listdir(os.path.join(_folder, prefix)):
+                if fileName.endswith(".json") and fileName[:-len(".json")] not in _used:
+                    os.remove(os.path.join(_folder, prefix, fileName))
+                    _removed += 1
+        return _removed
+
+    # --------------------------------------------------------------------------
+    # Consultas (solo con el indice)
+    # --------------------------------------------------------------------------
+    def _select(self, sql, args):
+        _rows = self._connection.execute(sql, args).fetchall()
+        poses = []
+        for poseId, name, namespace, timestamp, nodeCount in _rows:
+            _names = [row[0] for row in self._connection.execute(
+                "SELECT name FROM names WHERE pose = ? ORDER BY rowid", (poseId,))]
+            _tags = [row[0] for row in self._connection.execute(
+                "SELECT tag FROM tags WHERE pose = ? ORDER BY tag", (poseId,))]
+            poses.append({'id': poseId, 'name': name, 'names': _names, 'namespace': namespace, 'time': timestamp,
+                          'nodeCount': nodeCount, 'tags': _tags})
+        return poses
+
+    def find(self, node=None, namespace=None, tag=None, name=None, limit=None):
+        """
+        - Busca poses en el indice, de la mas nueva a la mas vieja.
+        - Argumentos opcionales (se combinan):
+            -node       <str> Poses que contienen el nodo ('L_handIK_ctl' o 'rig01:L_handIK_ctl').
+            -namespace  <str> Poses de un namespace.
+            -tag        <str> Poses con ese tag.
+            -name       <str> Poses con ese nombre, o que se guardaron antes con ese nombre
+                                (acepta comodines: 'run_*').
+            -limit      <int> Numero maximo de poses.
+        - Devolvera una lista de diccionarios {'id', 'name', 'names', 'namespace', 'time', 'nodeCount', 'tags'}.
+        """
+        _where = []
+        _args = []
+        if node is not None:
+            _column = 'node' if ':' in node or '|' in node else 'bare'
+            _where.append("id IN (SELECT pose FROM nodes WHERE {} = ?)".format(_column))
+            _args.append(node.lstrip(':') if _column == 'node' else node)
+        if namespace is not None:
+            _where.append("namespace = ?")
+            _args.append(namespace.strip(':'))
+        if tag is not None:
+            _where.append("id IN (SELECT pose FROM tags WHERE tag = ?)")
+            _args.append(tag)
+        if name is not None:
+            _where.append("(name GLOB ? OR id IN (SELECT pose FROM names WHERE name GLOB ?))")
+            _args.extend([name, name])
+
+        _sql = "SELECT id, name, namespace, time, nodeCount FROM poses"
+        if _where:
+            _sql += " WHERE " + " AND ".join(_where)
+        _sql += " ORDER BY time DESC"
+        if limit:
+            _sql += " LIMIT {:d}".format(limit)
+        return self._select(_sql, _args)
+
+    def latest(self, **kwargs):
+        """
+        - Devolvera la pose mas nueva que cumple los filtros de find, o None.
+        """
+        _poses = self.find(limit=1, **kwargs)
+        return _poses[0] if _poses else None
+
+    def stats(self):
+        """
+        - Devolvera {'poses', 'nodes', 'chunks'}: numero de poses, de nodos guardados (con repetidos)
+            y de chunks (sin repetidos). nodes / chunks es el factor de deduplicacion.
+        """
+        _connection = self._connection
+        return {'poses': _connection.execute("SELECT COUNT(*) FROM poses").fetchone()[0],
+                'nodes': _connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0],
+                'chunks': _connection.execute("SELECT COUNT(DISTINCT chunk) FROM nodes").fetchone()[0]}
@@ -0,0 +1,395 @@
+"""
+Detalles:
+    - Publicacion de poses en memoria compartida, para que otros procesos locales (visores, retargeters)
+        lean los valores del channelBox de los controles sin exportar ni releer un JSON con export_dict.
+    - Un PosePublisher escribe la pose de un set fijo de plugs en un ring buffer de "slots" poses,
+        en un bloque de multiprocessing.shared_memory. Un PoseReader (en cualquier proceso) lee la ultima pose
+        publicada sin copiarla (memoryview sobre la memoria compartida) o copiandola en un array('d').
+    - Formato del bloque (todo alineado a 8 bytes):
+        header      struct '<8sIIIIQ': magic, version, slots, plugCount, tableBytes, sequence (ultima pose publicada).
+        plug table  "node.attr" de cada plug en utf-8, separados por '\\n', con padding hasta tableBytes.
+        slots       "slots" veces: struct '<Qdd' (sequence, time, frame) + plugCount float64 (orden nativo).
+        La pose numero N (desde 1) se escribe en el slot (N - 1) % slots.
+    - Mientras se escribe un slot su sequence es 0: el lector comprueba la sequence del slot antes y despues
+        de leer, y vuelve a leer si cambio (la pose se estaba reescribiendo).
+    - Este modulo no importa maya: el PoseReader se usa fuera de Maya, y un PosePublisher creado con plugs
+        y publicado con valores explicitos (publish(values)) funciona en Python puro (sin Maya ni el stand-in).
+        from_controls() y publish() sin valores leen la escena con riggingCodes.mayaBackend.
+    - Ejemplos de uso:
+        # En Maya
+        from riggingCodes import posePublisher
+
+        publisher = posePublisher.start('L_handIK_ctl', 'L_armPoleVector_ctl', name='rig01_pose')
+        publisher.publish()                             # En cada cambio (por ejemplo con un scriptJob)
+        posePublisher.stop()                            # Libera la memoria compartida
+
+        # En otro proceso
+        from riggingCodes import posePublisher
+
+        with posePublisher.PoseReader('rig01_pose') as reader:
+            sequence, frame, values = reader.read()
+            values[reader.index('L_handIK_ctl', 'translateX')]
+            reader.wait(sequence, timeout=1.0)          # Espera la siguiente pose
+
+        # Sin Maya
+        with posePublisher.PosePublisher(['L_handIK_ctl.translateX', 'L_handIK_ctl.translateY']) as publisher:
+            publisher.publish([1.0, 2.0], frame=1)
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import struct
+import time
+from array import array
+from multiprocessing import shared_memory
+
+MAGIC = b'RCPOSE\x00\x00'
+VERSION = 1
+DEFAULT_SLOTS = 4
+
+_HEADER = struct.Struct('<8sIIIIQ')
+_SLOT_HEADER = struct.Struct('<Qdd')
+# Offset de la sequence dentro del header
+_SEQUENCE_OFFSET = _HEADER.size - 8
+
+
+def _align(size):
+    return (size + 7) // 8 * 8
+
+
+def _plug_name(plug):
+    return plug if isinstance(plug, str) else "{}.{}".format(*plug)
+
+
+# Bloques creados por los publishers de este proceso
+_OWNED = set()
+
+
+def _attach(name):
+    """
+    - Abre un bloque de memoria compartida existente sin registrarlo en el resource_tracker
+        (si no, el tracker del lector lo borraria al terminar el proceso lector).
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    memory = shared_memory.SharedMemory(name=name)
+    if name in _OWNED:
+        # El bloque es de un publisher de este proceso: su registro es el del publisher
+        return memory
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(memory._name, 'shared_memory')
+    except (ImportError, AttributeError, KeyError):
+        pass
+    return memory
+
+
+class _Layout(object):
+    """
+    - Offsets del bloque para un numero de plugs y slots.
+    """
+    def __init__(self, slots, plugCount, tableBytes):
+        self.slots = slots
+        self.plugCount = plugCount
+        self.tableBytes = tableBytes
+        self.stride = _SLOT_HEADER.size + 8 * plugCount
+        self.size = _HEADER.size + tableBytes + slots * self.stride
+
+    def slot(self, index):
+        return _HEADER.size + self.tableBytes + index * self.stride
+
+    def payload(self, index):
+        return self.slot(index) + _SLOT_HEADER.size
+
+
+class PosePublisher(object):
+    """
+    - Escritor de poses en memoria compartida:
+        plugs       <list> "node.attr" de cada valor, en el orden del bloque.
+        name        <str> Nombre del bloque de memoria compartida (el que se pasa a PoseReader).
+        sequence    <int> Numero de poses publicadas.
+    - Los valores se escriben sobre memoryviews del bloque, sin crear objetos por pose.
+    """
+    def __init__(self, plugs, name=None, slots=DEFAULT_SLOTS):
+        self.plugs = [_plug_name(plug) for plug in plugs]
+        if not self.plugs:
+            raise ValueError("A pose publisher needs at least one plug.")
+        if slots < 2:
+            raise ValueError("A pose publisher needs at least 2 slots.")
+
+        _table = "\n".join(self.plugs).encode('utf-8')
+        self._layout = _Layout(slots, len(self.plugs), _align(len(_table)))
+        self._memory = shared_memory.SharedMemory(name=name, create=True, size=self._layout.size)
+        self.name = self._memory.name
+        _OWNED.add(self.name)
+        self.sequence = 0
+        self._nodes = None
+
+        _HEADER.pack_into(self._memory.buf, 0, MAGIC, VERSION, slots, len(self.plugs), self._layout.tableBytes, 0)
+        self._memory.buf[_HEADER.size:_HEADER.size + len(_table)] = _table
+        self._payloads = [self._memory.buf[self._layout.payload(index):
+                                           self._layout.payload(index) + 8 * len(self.plugs)].cast('d')
+                          for index in range(slots)]
+
+    def __repr__(self):
+        return "<PosePublisher {!r} {} plugs, {} published>".format(self.name, len(self.plugs), self.sequence)
+
+    def __del__(self):
+        # Los memoryviews del bloque impiden cerrarlo: se liberan antes que el SharedMemory
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @classmethod
+    def from_controls(cls, *args, **kwargs):
+        """
+        - Crea un PosePublisher con los plugs numericos del channelBox de los controles "args"
+            (o de la seleccion, o de los controles de "rig", como Reset_Controls.get_nodesInfo_asTable).
+        - Keyword Args:
+            name    <str> Nombre del bloque. Default: None (nombre automatico).
+            slots   <int> Numero de poses del ring buffer. Default: DEFAULT_SLOTS.
+            rig     <str> Root del rig cuyos controles se publican (ver controlDiscovery). Default: None.
+        """
+        from riggingCodes import Reset_Controls
+
+        _table = Reset_Controls.get_nodesInfo_asTable(*args, rig=kwargs.get('rig'))
+        _plugs = [(node, attr) for node, attr, value, _type in _table.plugs()
+                  if isinstance(value, (bool, int, float))]
+        return cls(_plugs, name=kwargs.get('name'), slots=kwargs.get('slots', DEFAULT_SLOTS))
+
+    def _read_scene(self):
+        from riggingCodes import mayaBackend
+
+        if self._nodes is None:
+            self._nodes = [plug.rsplit('.', 1) for plug in self.plugs]
+        _backend = mayaBackend.current()
+        return [_backend.get_plug(node, attr) for node, attr in self._nodes]
+
+    def publish(self, values=None, frame=None):
+        """
+        - Escribe una pose en el siguiente slot y la marca como la ultima. Devuelve su numero de sequence.
+        - Keyword Args:
+            values  <list/array> Un valor por plug, en el orden de plugs.
+                        Default: None (se leen de la escena con mayaBackend).
+            frame   <float> Frame de la pose. Default: None (el frame actual en Maya, 0.0 sin valores de la escena).
+        """
+        if values is None:
+            values = self._read_scene()
+            if frame is None:
+                import maya.cmds as cmds
+                frame = cmds.currentTime(query=True)
+        if len(values) != len(self.plugs):
+            raise ValueError("Expected {} values, got {}.".format(len(self.plugs), len(values)))
+
+        sequence = self.sequence + 1
+        _index = (sequence - 1) % self._layout.slots
+        _buffer = self._memory.buf
+        _slot = self._layout.slot(_index)
+        # Sequence 0 mientras se escribe: los lectores descartan el slot
+        _SLOT_HEADER.pack_into(_buffer, _slot, 0, 0.0, 0.0)
+        _payload = self._payloads[_index]
+        if isinstance(values, array) and values.typecode == 'd':
+            _payload[:] = values
+        else:
+            _payload[:] = array('d', values)
+        _SLOT_HEADER.pack_into(_buffer, _slot, sequence, time.time(), float(frame or 0.0))
+        struct.pack_into('<Q', _buffer, _SEQUENCE_OFFSET, sequence)
+        self.sequence = sequence
+        return sequence
+
+    def close(self, unlink=True):
+        """
+        - Cierra el bloque y, si "unlink" es True, lo borra (los lectores abiertos siguen leyendo la ultima pose).
+        """
+        if self._memory is None:
+            return
+        for payload in self._payloads:
+            payload.release()
+        self._payloads = []
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+        _OWNED.discard(self.name)
+        self._memory = None
+
+
+class PoseReader(object):
+    """
+    - Lector de las poses de un PosePublisher, desde cualquier proceso local:
+        plugs       <list> "node.attr" de cada valor, en el orden de las poses.
+        slots       <int> Numero de poses del ring buffer.
+    """
+    def __init__(self, name):
+        self.name = name
+        self._memory = _attach(name)
+        _magic, _version, slots, plugCount, tableBytes, _sequence = _HEADER.unpack_from(self._memory.buf, 0)
+        if _magic != MAGIC:
+            self._memory.close()
+            raise ValueError("{!r} is not a pose publisher block.".format(name))
+        if _version != VERSION:
+            self._memory.close()
+            raise ValueError("Unsupported pose publisher version {} in {!r}.".format(_version, name))
+
+        self.slots = slots
+        self._layout = _Layout(slots, plugCount, tableBytes)
+        _table = bytes(self._memory.buf[_HEADER.size:_HEADER.size + tableBytes]).rstrip(b'\x00')
+        self.plugs = _table.decode('utf-8').split("\n")
+        self._index = None
+        self._views = {}
+
+    def __repr__(self):
+        return "<PoseReader {!r} {} plugs>".format(self.name, len(self.plugs))
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def index(self, node, attr=None):
+        """
+        - Devuelve la posicion de un plug en los valores: index('L_hand_ctl', 'tx') o index('L_hand_ctl.tx').
+        """
+        if self._index is None:
+            self._index = dict((plug, index) for index, plug in enumerate(self.plugs))
+        return self._index[node if attr is None else "{}.{}".format(node, attr)]
+
+    def sequence(self):
+        """
+        - Devuelve el numero de la ultima pose publicada (0 si todavia no hay ninguna).
+        """
+        return struct.unpack_from('<Q', self._memory.buf, _SEQUENCE_OFFSET)[0]
+
+    def _slot_sequence(self, index):
+        return struct.unpack_from('<Q', self._memory.buf, self._layout.slot(index))[0]
+
+    def read(self, copy=True, retries=100):
+        """
+        - Lee la ultima pose publicada. Devuelve (sequence, frame, values), o (0, None, None) si no hay ninguna.
+        - Si "copy" es False, values es un memoryview sobre la memoria compartida (sin copia): el publisher
+            puede reescribirlo despues de "slots" poses nuevas, y valid(sequence) dice si sigue siendo esa pose.
+            Es el mismo memoryview en cada lectura del mismo slot, y se libera con close().
+        """
+        _buffer = self._memory.buf
+        for _ in range(retries):
+            sequence = self.sequence()
+            if not sequence:
+                return 0, None, None
+            _index = (sequence - 1) % self.slots
+            _slot = self._layout.slot(_index)
+            _before, _time, frame = _SLOT_HEADER.unpack_from(_buffer, _slot)
+            if _before != sequence:
+                continue
+            _view = self._view(_index)
+            values = array('d', _view) if copy else _view
+            if self._slot_sequence(_index) == sequence:
+                return sequence, frame, values
+        raise RuntimeError("The pose publisher {!r} is overwriting the poses faster than they can be read."
+                           .format(self.name))
+
+    def _view(self, index):
+        # Un memoryview por slot, creado una vez
+        _view = self._views.get(index)
+        if _view is None:
+            _start = self._layout.payload(index)
+            _view = self._views[index] = self._memory.buf[_start:_start + 8 * self._layout.plugCount].cast('d')
+        return _view
+
+    def valid(self, sequence):
+        """
+        - True si la pose "sequence" sigue en su slot (un memoryview de read(copy=False) todavia es esa pose).
+        """
+        return bool(sequence) and self._slot_sequence((sequence - 1) % self.slots) == sequence
+
+    def wait(self, sequence=0, timeout=None, interval=0.001):
+        """
+        - Espera hasta que haya una pose mas nueva que "sequence". Devuelve la ultima sequence,
+            o None si se acabo el "timeout" (segundos).
+        """
+        _end = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            _current = self.sequence()
+            if _current > sequence:
+                return _current
+            if _end is not None and time.perf_counter() >= _end:
+                return None
+            time.sleep(interval)
+
+    def as_dict(self):
+        """
+        - Devuelve la ultima pose como {node: {attr: value}}, o {} si no hay ninguna.
+        """
+        _sequence, _frame, values = self.read()
+        pose = {}
+        if values is None:
+            return pose
+        for plug, value in zip(self.plugs, values):
+            node, attr = plug.rsplit('.', 1)
+            pose.setdefault(node, {})[attr] = value
+        return pose
+
+    def close(self):
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        if self._memory is not None:
+            self._memory.close()
+            self._memory = None
+
+
+# ------------------------------------------------------------------------------
+# Publishers compartidos
+# ------------------------------------------------------------------------------
+_PUBLISHERS = {}
+
+
+def start(*args, **kwargs):
+    """
+    - Crea un PosePublisher con los controles "args" (ver PosePublisher.from_controls), publica la pose actual
+        y lo guarda para que siga vivo hasta stop(). Reemplaza el publisher anterior con el mismo nombre.
+    """
+    _name = kwargs.get('name')
+    if _name is not None:
+        stop(_name)
+    publisher = PosePublisher.from_controls(*args, **kwargs)
+    publisher.publish()
+    _PUBLISHERS[publisher.name] = publisher
+    return publisher
+
+
+def publisher(name):
+    """
+    - Devuelve el PosePublisher "name" creado con start(), o None.
+    """
+    return _PUBLISHERS.get(name)
+
+
+def stop(name=None):
+    """
+    - Cierra y borra el publisher "name" (o todos, sin "name").
+    """
+    _names = list(_PUBLISHERS) if name is None else [name]
+    for _each in _names:
+        _publisher = _PUBLISHERS.pop(_each, None)
+        if _publisher is not None:
+            _publisher.close()
@@ -0,0 +1,285 @@
+"""
+Detalles:
+    - Pila de snapshots de pose en memoria, para volver a una pose anterior al instante
+        sin exportar ni leer archivos (export_dict/load_dict).
+    - Cada snapshot guarda los valores del channelBox de los nodos en dos arrays de tamano fijo
+        (indices de plug y valores), y los nombres de los plugs se guardan una unica vez
+        en una tabla compartida por todos los snapshots (PlugTable).
+    - La pila tiene un presupuesto de memoria (budget, por defecto 64 MB): al pasarlo se descartan
+        los snapshots mas viejos (ring buffer).
+    - restore() compara el snapshot con los valores actuales y solo setea los plugs que cambiaron,
+        todos de una vez con el backend actual (ver mayaBackend) y en un unico paso de undo.
+    - Las listas de atributos de cada nodo se guardan despues del primer capture. capture(refresh=True)
+        las vuelve a leer (por ejemplo despues de agregar atributos).
+    - Ejemplos de uso:
+        from riggingCodes import poseSnapshots
+
+        poseSnapshots.capture(name='blocking')          # Seleccion actual
+        poseSnapshots.capture('L_handIK_ctl', 'L_armPoleVector_ctl')
+        poseSnapshots.restore()                         # Ultimo snapshot
+        poseSnapshots.restore(name='blocking')
+        poseSnapshots.restore(ago=300)                  # La pose de hace 5 minutos
+        poseSnapshots.stack().snapshots                 # Del mas viejo al mas nuevo
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import collections
+import time
+from array import array
+
+import maya.cmds as cmds
+
+from riggingCodes import mayaBackend, toolReport
+
+# Presupuesto de memoria por defecto de la pila, en bytes
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+# Tipos de getAttr que se guardan como entero o bool al restaurar
+_INT_TYPES = ['long', 'short', 'byte', 'char', 'enum']
+_BOOL_TYPES = ['bool']
+
+
+class PlugTable(object):
+    """
+    - Tabla de plugs compartida por todos los snapshots:
+        plugs:   [(node, attr)]     El indice de cada plug es su posicion.
+        types:   [<str tipo>]       Tipo de getAttr de cada plug (solo se lee la primera vez).
+        indices: {(node, attr): <int>}
+        attrs:   {node: [attr]}     Atributos del channelBox de cada nodo (ver capture).
+        nbytes:  <int>              Memoria aproximada de la tabla.
+    """
+    def __init__(self):
+        self.plugs = []
+        self.types = []
+        self.indices = {}
+        self.attrs = {}
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self.plugs)
+
+    def index(self, node, attr, backend):
+        _index = self.indices.get((node, attr))
+        if _index is None:
+            _index = len(self.plugs)
+            self.plugs.append((node, attr))
+            self.types.append(backend.get_plug_type(node, attr))
+            self.indices[(node, attr)] = _index
+            # Memoria aproximada: nombres, tupla, tipo y entrada del diccionario
+            self.nbytes += len(node) + len(attr) + 200
+        return _index
+
+
+class Snapshot(object):
+    """
+    - Pose capturada:
+        indices  <array('I')> Indices de los plugs en la PlugTable.
+        values   <array('d')> Valor de cada plug (los bool y enteros tambien se guardan como double).
+        extras   <dict> {<int indice>: valor} Los valores que no son numericos (strings, matrices, compuestos).
+    """
+    __slots__ = ['name', 'time', 'indices', 'values', 'extras']
+
+    def __init__(self, name, indices, values, extras):
+        self.name = name
+        self.time = time.time()
+        self.indices = indices
+        self.values = values
+        self.extras = extras
+
+    def __repr__(self):
+        return "<Snapshot {!r} {} plugs, {:.0f} sec ago>".format(self.name, len(self), time.time() - self.time)
+
+    def __len__(self):
+        return len(self.indices) + len(self.extras)
+
+    @property
+    def nbytes(self):
+        return (len(self.indices) * self.indices.itemsize + len(self.values) * self.values.itemsize +
+                len(self.extras) * 200 + 200)
+
+    def items(self, table):
+        """
+        - Devuelve los valores del snapshot como [(node, attr, value)], con el tipo de cada plug.
+        """
+        _plugs = table.plugs
+        _types = table.types
+        result = []
+        for _index, _value in zip(self.indices, self.values):
+            _type = _types[_index]
+            if _type in _BOOL_TYPES:
+                _value = bool(_value)
+            elif _type in _INT_TYPES:
+                _value = int(_value)
+            result.append(_plugs[_index] + (_value,))
+        for _index, _value in self.extras.items():
+            result.append(_plugs[_index] + (_value,))
+        return result
+
+
+class SnapshotStack(object):
+    """
+    - Pila de snapshots con presupuesto de memoria (ring buffer: al pasarse se descartan los mas viejos).
+    """
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.table = PlugTable()
+        self.snapshots = collections.deque()
+        self.evicted = 0
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    @property
+    def nbytes(self):
+        """
+        - Memoria aproximada de la pila: snapshots y tabla de plugs.
+        """
+        return self._nbytes + self.table.nbytes
+
+    def clear(self):
+        self.snapshots.clear()
+        self.table = PlugTable()
+        self._nbytes = 0
+
+    def capture(self, *nodes, **kwargs):
+        """
+        - Guarda los valores del channelBox de "nodes" (o de la seleccion) como un nuevo snapshot.
+        - Argumentos opcionales:
+            -name       <str> Nombre del snapshot. Valor default: "snapshot<N>".
+            -refresh    <bool> Vuelve a leer los atributos del channelBox de los nodos. Valor default: False.
+        - Devolvera el Snapshot, o None si no hay nada que guardar.
+        """
+        name = kwargs.get('name') or "snapshot{}".format(len(self.snapshots) + self.evicted + 1)
+        refresh = kwargs.get('refresh', False)
+        if not nodes:
+            nodes = cmds.ls(sl=True) or []
+
+        _backend = mayaBackend.current()
+        _table = self.table
+        _indices = array('I')
+        _values = array('d')
+        _extras = {}
+        for node in nodes:
+            _attrs = None if refresh else _table.attrs.get(node)
+            try:
+                if _attrs is None:
+                    _attrs = _table.attrs[node] = _backend.list_attributes(node) or []
+                for attr in _attrs:
+                    _value = _backend.get_plug(node, attr)
+                    _index = _table.index(node, attr, _backend)
+                    if isinstance(_value, (bool, int, float)):
+                        _indices.append(_index)
+                        _values.append(_value)
+                    else:
+                        _extras[_index] = _value
+            except (RuntimeError, ValueError):
+                # Nodo que ya no existe (o atributo borrado): se vuelven a leer sus atributos la proxima vez
+                _table.attrs.pop(node, None)
+                continue
+
+        if not len(_indices) and not _extras:
+            cmds.warning("No values found to capture. Snapshot skipped.")
+            return None
+
+        snapshot = Snapshot(name, _indices, _values, _extras)
+        self.snapshots.append(snapshot)
+        self._nbytes += snapshot.nbytes
+        while self._nbytes + _table.nbytes > self.budget and len(self.snapshots) > 1:
+            self._nbytes -= self.snapshots.popleft().nbytes
+            self.evicted += 1
+        return snapshot
+
+    def find(self, name=None, ago=None, index=-1):
+        """
+        - Busca un snapshot: por nombre (el mas nuevo con ese nombre), por antiguedad
+            (el mas nuevo de hace al menos "ago" segundos) o por indice (-1 es el ultimo).
+        - Devuelve None si no existe.
+        """
+        if name is not None:
+            for snapshot in reversed(self.snapshots):
+                if snapshot.name == name:
+                    return snapshot
+            return None
+        if ago is not None:
+            _limit = time.time() - ago
+            for snapshot in reversed(self.snapshots):
+                if snapshot.time <= _limit:
+                    return snapshot
+            return None
+        try:
+            return self.snapshots[index]
+        except IndexError:
+            return None
+
+    def restore(self, snapshot=None, **kwargs):
+        """
+        - Vuelve a la pose de un snapshot (el ultimo, o el que encuentre find con los mismos argumentos).
+        - Solo se setean los plugs cuyo valor actual es distinto, todos de una vez y en un unico paso de undo.
+        - Devolvera el reporte de la operacion (ver toolReport), o None si no existe el snapshot.
+        """
+        if snapshot is None:
+            snapshot = self.find(**kwargs)
+        if snapshot is None:
+            cmds.warning("No snapshot found to restore: {!r}".format(kwargs))
+            return None
+
+        report = toolReport.Report("restore {}".format(snapshot.name))
+        _backend = mayaBackend.current()
+
+        # Diff: solo los plugs que cambiaron desde el snapshot
+        _values = []
+        with report.timer('diff'):
+            for node, attr, value in snapshot.items(self.table):
+                try:
+                    _current = _backend.get_plug(node, attr)
+                except (RuntimeError, ValueError):
+                    report.fail('missing', "{}.{}".format(node, attr))
+                    continue
+                if _current != value:
+                    _values.append((node, attr, value))
+        report.count('unchanged', len(snapshot) - len(_values) - report.counters.get('missing', 0))
+
+        if _values:
+            with report.timer('set'):
+                cmds.undoInfo(openChunk=True, chunkName="restore_{}".format(snapshot.name))
+                try:
+                    _failed = _backend.set_plugs(_values)
+                finally:
+                    cmds.undoInfo(closeChunk=True)
+            for node, attr, e in _failed:
+                report.fail('failed', "{}.{}: {}".format(node, attr, str(e).strip()))
+            report.count('set', len(_values) - len(_failed))
+        return report.emit()
+
+
+_SHARED = [None]
+
+
+def stack():
+    """
+    - Devuelve la pila de snapshots compartida por las herramientas y los botones del shelf.
+    """
+    if _SHARED[0] is None:
+        _SHARED[0] = SnapshotStack()
+    return _SHARED[0]
+
+
+def capture(*nodes, **kwargs):
+    """
+    - Guarda un snapshot en la pila compartida (ver SnapshotStack.capture).
+    """
+    return stack().capture(*nodes, **kwargs)
+
+
+def restore(snapshot=None, **kwargs):
+    """
+    - Vuelve a un snapshot de la pila compartida (ver SnapshotStack.restore y find).
+    """
+    return stack().restore(snapshot, **kwargs)
@@ -0,0 +1,282 @@
+"""
+Detalles:
+    - Modelo compacto de una pose, en vez del diccionario anidado de get_nodesInfo_asDict
+        ({'node': {'attr': {'value': ..., 'type': ...}}}, tres diccionarios y un string de tipo por plug).
+    - Un PoseTable guarda:
+        - Los nombres de los nodos y de los atributos una unica vez (interned).
+        - Un array con el indice del atributo de cada plug y otro con el codigo de su tipo (TYPES).
+        - Un buffer contiguo de valores (array('d')). Los valores no numericos (strings, matrices) van aparte.
+        - Los plugs de cada nodo son contiguos: offsets[i]:offsets[i + 1].
+    - Es compatible con el diccionario para el codigo existente: table['node']['attr'] devuelve
+        {'value': ..., 'type': ...}, y keys/items/get/in/len funcionan igual (Mapping).
+        to_dict() devuelve el diccionario anidado y to_json() el mismo texto que json.dumps(indent=4).
+    - subset(nodes) devuelve otro PoseTable con solo esos nodos sin copiar los buffers,
+        y node_values(node) un memoryview de los valores de un nodo.
+    - Ejemplos de uso:
+        from riggingCodes import Reset_Controls
+
+        table = Reset_Controls.get_nodesInfo_asTable('L_handIK_ctl', 'L_armPoleVector_ctl')
+        table['L_handIK_ctl']['translateX']['value']
+        arm = table.subset(['L_handIK_ctl'])
+        table.nbytes
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import json
+import sys
+from array import array
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# Tabla de tipos compartida por todos los PoseTable: el codigo de un tipo es su posicion
+TYPES = ['double', 'doubleLinear', 'doubleAngle', 'float', 'bool', 'long', 'short', 'byte', 'char', 'enum',
+         'time', 'string', 'matrix']
+_TYPE_CODES = dict((name, code) for code, name in enumerate(TYPES))
+
+# Tipos que se devuelven como entero o bool (en el buffer todo es double)
+_INT_TYPES = set(['long', 'short', 'byte', 'char', 'enum'])
+_BOOL_TYPES = set(['bool'])
+
+
+def _type_code(name):
+    code = _TYPE_CODES.get(name)
+    if code is None:
+        # Tipos que no estan en la tabla (typed, compuestos...): se agregan al vuelo
+        code = _TYPE_CODES[name] = len(TYPES)
+        TYPES.append(name)
+    return code
+
+
+class _Buffers(object):
+    """
+    - Datos de un PoseTable, compartidos con sus subsets.
+    """
+    __slots__ = ['nodes', 'attrNames', 'attrCodes', 'offsets', 'attrIndex', 'typeCodes', 'values', 'extras']
+
+    def __init__(self):
+        self.nodes = []
+        self.attrNames = []
+        self.attrCodes = {}
+        self.offsets = array('I', [0])
+        self.attrIndex = array('I')
+        self.typeCodes = array('B')
+        self.values = array('d')
+        self.extras = {}
+
+
+class _NodeView(Mapping):
+    """
+    - Vista de diccionario de los plugs de un nodo: {'attr': {'value': ..., 'type': ...}}.
+        Los diccionarios de cada plug se crean al acceder, no se guardan.
+    """
+    __slots__ = ['_buffers', '_start', '_end']
+
+    def __init__(self, buffers, start, end):
+        self._buffers = buffers
+        self._start = start
+        self._end = end
+
+    def _find(self, attr):
+        _buffers = self._buffers
+        _code = _buffers.attrCodes.get(attr)
+        if _code is not None:
+            _attrIndex = _buffers.attrIndex
+            for plug in range(self._start, self._end):
+                if _attrIndex[plug] == _code:
+                    return plug
+        return None
+
+    def __getitem__(self, attr):
+        plug = self._find(attr)
+        if plug is None:
+            raise KeyError(attr)
+        return {'value': _value(self._buffers, plug), 'type': TYPES[self._buffers.typeCodes[plug]]}
+
+    def __contains__(self, attr):
+        return self._find(attr) is not None
+
+    def __iter__(self):
+        _buffers = self._buffers
+        for plug in range(self._start, self._end):
+            yield _buffers.attrNames[_buffers.attrIndex[plug]]
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _value(buffers, plug):
+    if plug in buffers.extras:
+        return buffers.extras[plug]
+    _type = TYPES[buffers.typeCodes[plug]]
+    _value = buffers.values[plug]
+    if _type in _BOOL_TYPES:
+        return bool(_value)
+    if _type in _INT_TYPES:
+        return int(_value)
+    return _value
+
+
+class PoseTable(Mapping):
+    """
+    - Pose compacta compatible con el diccionario de get_nodesInfo_asDict (ver el docstring del modulo).
+    - Se construye con add_node, from_dict o Reset_Controls.get_nodesInfo_asTable.
+    """
+    def __init__(self, buffers=None, rows=None):
+        self._buffers = buffers or _Buffers()
+        # Nodos del table (indices en buffers.nodes). None son todos: un subset solo guarda sus indices
+        self._rows = rows
+        self._index = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        - Crea un PoseTable desde el diccionario de get_nodesInfo_asDict (o de un archivo de export_dict).
+        """
+        table = cls()
+        for node, attrs in data.items():
+            table.add_node(node, [(attr, entry['value'], entry['type']) for attr, entry in attrs.items()])
+        return table
+
+    def add_node(self, node, plugs):
+        """
+        - Agrega un nodo con sus plugs [(attr, value, type)] al final del table.
+        """
+        if self._rows is not None:
+            raise TypeError("Can't add nodes to a subset of a PoseTable.")
+        _buffers = self._buffers
+        _attrCodes = _buffers.attrCodes
+        for attr, value, typeName in plugs:
+            _code = _attrCodes.get(attr)
+            if _code is None:
+                _code = _attrCodes[attr] = len(_buffers.attrNames)
+                _buffers.attrNames.append(sys.intern(attr))
+            _buffers.attrIndex.append(_code)
+            _buffers.typeCodes.append(_type_code(typeName))
+            if isinstance(value, (bool, int, float)):
+                _buffers.values.append(value)
+            else:
+                _buffers.extras[len(_buffers.values)] = value
+                _buffers.values.append(0.0)
+        _buffers.nodes.append(sys.intern(node))
+        _buffers.offsets.append(len(_buffers.values))
+        self._index = None
+
+    # --------------------------------------------------------------------------
+    # Mapping
+    # --------------------------------------------------------------------------
+    def _rows_index(self):
+        if self._index is None:
+            _nodes = self._buffers.nodes
+            _rows = range(len(_nodes)) if self._rows is None else self._rows
+            self._index = dict((_nodes[row], row) for row in _rows)
+        return self._index
+
+    def __getitem__(self, node):
+        row = self._rows_index()[node]
+        _offsets = self._buffers.offsets
+        return _NodeView(self._buffers, _offsets[row], _offsets[row + 1])
+
+    def __contains__(self, node):
+        return node in self._rows_index()
+
+    def __iter__(self):
+        _nodes = self._buffers.nodes
+        if self._rows is None:
+            return iter(list(_nodes))
+        return iter([_nodes[row] for row in self._rows])
+
+    def __len__(self):
+        return len(self._buffers.nodes) if self._rows is None else len(self._rows)
+
+    def __repr__(self):
+        return "<PoseTable {} nodes, {} plugs>".format(len(self), self.plug_count())
+
+    # --------------------------------------------------------------------------
+    # Acceso compacto
+    # --------------------------------------------------------------------------
+    def subset(self, nodes):
+        """
+        - Devuelve un PoseTable con solo los nodos "nodes" (los que existan en el table), en ese orden.
+            Comparte los buffers: no se copia ningun valor.
+        """
+        _index = self._rows_index()
+        return PoseTable(self._buffers, [_index[node] for node in nodes if node in _index])
+
+    def node_values(self, node):
+        """
+        - Devuelve un memoryview (sin copia) de los valores de los plugs de un nodo, en el orden de sus atributos.
+            Los valores no numericos aparecen como 0.0 (ver plugs).
+        """
+        row = self._rows_index()[node]
+        _offsets = self._buffers.offsets
+        return memoryview(self._buffers.values)[_offsets[row]:_offsets[row + 1]]
+
+    def plugs(self):
+        """
+        - Recorre los plugs del table como tuplas (node, attr, value, type), sin crear diccionarios.
+        """
+        _buffers = self._buffers
+        _offsets = _buffers.offsets
+        _rows = range(len(_buffers.nodes)) if self._rows is None else self._rows
+        for row in _rows:
+            node = _buffers.nodes[row]
+            for plug in range(_offsets[row], _offsets[row + 1]):
+                yield (node, _buffers.attrNames[_buffers.attrIndex[plug]], _value(_buffers, plug),
+                       TYPES[_buffers.typeCodes[plug]])
+
+    def plug_count(self):
+        _offsets = self._buffers.offsets
+        if self._rows is None:
+            return len(self._buffers.values)
+        return sum(_offsets[row + 1] - _offsets[row] for row in self._rows)
+
+    @property
+    def nbytes(self):
+        """
+        - Memoria aproximada del table (buffers compartidos incluidos), en bytes.
+        """
+        _buffers = self._buffers
+        _arrays = [_buffers.offsets, _buffers.attrIndex, _buffers.typeCodes, _buffers.values]
+        return (sum(sys.getsizeof(each) for each in _arrays) +
+                sys.getsizeof(_buffers.nodes) + sum(sys.getsizeof(each) for each in _buffers.nodes) +
+                sys.getsizeof(_buffers.attrNames) + sys.getsizeof(_buffers.attrCodes) +
+                sum(sys.getsizeof(each) for each in _buffers.attrNames) +
+                sys.getsizeof(_buffers.extras) + sum(sys.getsizeof(each) for each in _buffers.extras.values()))
+
+    # --------------------------------------------------------------------------
+    # Conversion
+    # --------------------------------------------------------------------------
+    def to_dict(self):
+        """
+        - Devuelve el diccionario anidado de get_nodesInfo_asDict.
+        """
+        data = {}
+        for node, attr, value, typeName in self.plugs():
+            data.setdefault(node, {})[attr] = {'value': value, 'type': typeName}
+        return data
+
+    def to_json(self, indent=4):
+        """
+        - Devuelve el mismo texto que json.dumps(table.to_dict(), indent=indent),
+            creando los diccionarios de un nodo cada vez.
+        """
+        if not len(self):
+            return "{}"
+        _pad = " " * indent
+        _lines = []
+        for node in self:
+            _text = json.dumps(dict(self[node].items()), indent=indent).replace("\n", "\n" + _pad)
+            _lines.append("{}{}: {}".format(_pad, json.dumps(node), _text))
+        return "{\n" + ",\n".join(_lines) + "\n}"
@@ -0,0 +1,452 @@
+"""
+Detalles:
+    - Export incremental de poses (Reset_Controls.export_dict con track=True).
+    - Despues de un export completo, un PoseTracker registra callbacks de atributo cambiado en los nodos
+        exportados y guarda los plugs que cambian (dirty set). Los siguientes exports del mismo archivo
+        solo releen esos plugs y escriben un delta contra el ultimo export completo, en un archivo aparte:
+            ctrlsData.json          <- pose completa (base)
+            ctrlsData.delta.json    <- plugs que cambiaron desde la base (se reescribe en cada export)
+    - Los plugs con una conexion de entrada (animacion, constraints) cambian sin llamar a los callbacks,
+        asi que se releen en todos los exports. Los atributos agregados, borrados o que cambian de
+        keyable/channelBox hacen releer la lista de atributos de su nodo.
+    - load_dict lee la base y le aplica el delta (read_pose). El delta guarda el hash de su base,
+        y se ignora si la base cambio despues.
+    - compact() junta el delta con la base en un nuevo archivo completo y borra el delta.
+    - Callbacks de OpenMaya 2.0 (MNodeMessage), o los del stand-in fuera de Maya. Al abrir o crear
+        una escena el tracker se marca como desactualizado y el siguiente export relee todos los nodos.
+    - Ejemplos de uso:
+        from riggingCodes import Reset_Controls, poseTracker
+
+        Reset_Controls.export_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path', track=True)
+        # ... cambios en la escena ...
+        Reset_Controls.export_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path')   # Delta
+        Reset_Controls.compact_export(fileName='ctrlsData', filePath='C:/Example/Directory/Path')
+
+        poseTracker.stop()                  # Quita todos los trackers
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Check the optional dependencies with riggingCodes._lazy
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import hashlib
+import json
+import os
+
+import maya.cmds as cmds
+
+from riggingCodes import _lazy, mayaBackend, poseTable
+
+# Formato del archivo delta
+DELTA_FORMAT = 'riggingCodes.poseDelta'
+
+
+def delta_path(fullPath):
+    """
+    - Devuelve el path del delta de una pose: 'C:/poses/ctrlsData.json' -> 'C:/poses/ctrlsData.delta.json'.
+    """
+    _root, _extension = os.path.splitext(fullPath)
+    return "{}.delta{}".format(_root, _extension)
+
+
+def _hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _write(path, data):
+    """
+    - Escribe "data" en JSON (con el mismo formato que export_dict) y devuelve el hash del texto.
+    """
+    text = json.dumps(data, indent=4)
+    with open(path, "w") as file_to_write:
+        file_to_write.write(text)
+    return _hash(text)
+
+
+class PoseTracker(object):
+    """
+    - Seguimiento de los cambios de los nodos de una pose exportada:
+        base:       <PoseTable> La pose del ultimo export completo (solo se lee, ver poseTable).
+        current:    La pose con los ultimos valores leidos.
+        dirty:      set((node, attr)) Plugs que cambiaron desde el ultimo export.
+        dirtyNodes: set(node) Nodos cuya lista de atributos hay que volver a leer.
+        volatile:   {node: set(attr)} Plugs con conexion de entrada, que se releen en cada export.
+    - Los nodos se identifican con su nombre en la pose; si se renombran se siguen leyendo con el nombre nuevo.
+    """
+    def __init__(self, fullPath, base, baseHash):
+        self.fullPath = fullPath
+        self.deltaPath = delta_path(fullPath)
+        self.base = base if isinstance(base, poseTable.PoseTable) else poseTable.PoseTable.from_dict(base)
+        self.baseHash = baseHash
+        self.current = dict((node, dict(attrs)) for node, attrs in base.items())
+        self.dirty = set()
+        self.dirtyNodes = set()
+        self.volatile = {}
+        self.stale = False
+        self.reads = 0
+        self._names = dict((node, node) for node in base)
+        self._delta = {}
+        self._callbacks = None
+
+    def __repr__(self):
+        return "<PoseTracker {!r} {} nodes, {} dirty>".format(self.fullPath, len(self.base), len(self.dirty))
+
+    @property
+    def changed(self):
+        """
+        - Numero de plugs que cambiaron desde el ultimo export completo (los que se escriben en el delta).
+        """
+        return len(self._delta)
+
+    # --------------------------------------------------------------------------
+    # Callbacks
+    # --------------------------------------------------------------------------
+    def attach(self):
+        """
+        - Registra los callbacks de los nodos y busca sus plugs conectados.
+            Devuelve False si no hay callbacks disponibles.
+        """
+        self.detach()
+        _names = dict((node, name) for node, name in self._names.items() if name and cmds.objExists(name))
+        for node in self._names:
+            if node not in _names:
+                self._names[node] = None
+
+        self._callbacks = _callback_backend(self, _names)
+        if self._callbacks is None:
+            return False
+
+        self.volatile = {}
+        for node, name in _names.items():
+            _plugs = cmds.listConnections(name, source=True, destination=False, connections=True, plugs=True) or []
+            for _plug in _plugs[0::2]:
+                self._set_volatile(node, _plug.split('.', 1)[-1], True)
+        return True
+
+    def detach(self):
+        if self._callbacks is not None:
+            self._callbacks.remove()
+            self._callbacks = None
+
+    def _set_volatile(self, node, attr, driven):
+        # Una conexion a un compuesto (translate) afecta a sus hijos (translateX...)
+        _attrs = [each for each in self.current.get(node, {}) if each == attr or each.startswith(attr)]
+        if driven:
+            self.volatile.setdefault(node, set()).update(_attrs)
+        elif node in self.volatile:
+            self.volatile[node].difference_update(_attrs)
+
+    def _on_attribute(self, event, node, attr):
+        if event == 'set':
+            self.dirty.add((node, attr))
+        elif event in ['connected', 'disconnected']:
+            self._set_volatile(node, attr, event == 'connected')
+            self.dirty.add((node, attr))
+        else:
+            # 'added', 'removed', 'flags': cambia la lista de atributos del channelBox
+            self.dirtyNodes.add(node)
+
+    def _on_node(self, event, node, name):
+        if event == 'renamed':
+            self._names[node] = name
+        elif event == 'removed':
+            # El nodo se queda en la pose con sus ultimos valores
+            self._names[node] = None
+        elif event == 'added':
+            # Undo del borrado: se vuelve a leer completo
+            self._names[node] = name
+            self.dirtyNodes.add(node)
+        else:
+            # 'cleared': nueva escena, los callbacks ya no sirven. Se buscan otra vez los nodos por su nombre en la pose
+            self._names = dict((each, each) for each in self._names)
+            self.stale = True
+
+    # --------------------------------------------------------------------------
+    # Export
+    # --------------------------------------------------------------------------
+    def update(self):
+        """
+        - Relee los plugs que cambiaron (y los conectados), y actualiza current y el delta.
+        - Devuelve el numero de plugs leidos.
+        """
+        _backend = mayaBackend.current()
+        if self.stale:
+            self.stale = False
+            self.attach()
+            self.dirtyNodes.update(self._names)
+
+        _reads = 0
+        for node in self.dirtyNodes:
+            _name = self._names.get(node)
+            if not _name:
+                continue
+            try:
+                _entries = [(attr, {'value': _backend.get_plug(_name, attr),
+                                    'type': _backend.get_plug_type(_name, attr)})
+                            for attr in _backend.list_attributes(_name) or []]
+            except (RuntimeError, ValueError):
+                # Nodo borrado sin callback (en Maya el nodo borrado sigue existiendo en el undo queue)
+                continue
+            _values = self.current.setdefault(node, {})
+            _attrs = set(attr for attr, _ in _entries)
+            for attr in [each for each in _values if each not in _attrs]:
+                del _values[attr]
+                self._delta.pop((node, attr), None)
+            for attr, entry in _entries:
+                self._store(node, attr, entry)
+            _reads += len(_entries)
+
+        _plugs = set(self.dirty)
+        for node, attrs in self.volatile.items():
+            _plugs.update((node, attr) for attr in attrs)
+        for node, attr in _plugs:
+            _name = self._names.get(node)
+            _entry = self.current.get(node, {}).get(attr)
+            # Los atributos que no estan en el channelBox no son parte de la pose
+            if not _name or _entry is None or node in self.dirtyNodes:
+                continue
+            try:
+                self._store(node, attr, {'value': _backend.get_plug(_name, attr), 'type': _entry['type']})
+            except (RuntimeError, ValueError):
+                continue
+            _reads += 1
+
+        self.dirty = set()
+        self.dirtyNodes = set()
+        self.reads = _reads
+        return _reads
+
+    def _store(self, node, attr, entry):
+        self.current.setdefault(node, {})[attr] = entry
+        if self.base.get(node, {}).get(attr) == entry:
+            self._delta.pop((node, attr), None)
+        else:
+            self._delta[(node, attr)] = entry
+
+    def delta(self):
+        """
+        - Devuelve los plugs que cambiaron desde el ultimo export completo, con el formato de la pose.
+        """
+        values = {}
+        for (node, attr), entry in self._delta.items():
+            values.setdefault(node, {})[attr] = entry
+        return values
+
+    def export(self):
+        """
+        - Relee los plugs que cambiaron y escribe el delta. Si no hay cambios desde la base, borra el delta.
+        - Devuelve la pose actual.
+        """
+        self.update()
+        if self._delta:
+            _write(self.deltaPath, {'format': DELTA_FORMAT,
+                                    'base': self.baseHash,
+                                    'values': self.delta()})
+        elif os.path.isfile(self.deltaPath):
+            os.remove(self.deltaPath)
+        return self.current
+
+    def compact(self):
+        """
+        - Escribe la pose actual como nuevo export completo (la nueva base) y borra el delta.
+        - Devuelve la pose actual.
+        """
+        self.update()
+        self.baseHash = _write(self.fullPath, self.current)
+        self.base = poseTable.PoseTable.from_dict(self.current)
+        self._delta = {}
+        if os.path.isfile(self.deltaPath):
+            os.remove(self.deltaPath)
+        return self.current
+
+
+# ------------------------------------------------------------------------------
+# Callbacks
+# ------------------------------------------------------------------------------
+class _StandInCallbacks(object):
+    """
+    - Callbacks del stand-in de maya.cmds (riggingCodes.mayaStandIn), filtrados por los uuids de los nodos.
+    """
+    def __init__(self, tracker, names):
+        from riggingCodes import mayaStandIn
+        self._module = mayaStandIn
+        _nodes = {}
+        for node, name in names.items():
+            for _uuid in cmds.ls(name, uuid=True) or []:
+                _nodes[_uuid] = node
+
+        def _attribute(event, uuid, attr):
+            node = _nodes.get(uuid)
+            if node is not None:
+                tracker._on_attribute(event, node, attr)
+
+        def _node(event, uuid, name, parentUuid, isDag):
+            if event == 'cleared':
+                tracker._on_node(event, None, None)
+            elif event in ['added', 'renamed', 'removed'] and uuid in _nodes:
+                tracker._on_node(event, _nodes[uuid], name)
+
+        self._ids = [mayaStandIn.add_attribute_callback(_attribute), mayaStandIn.add_node_callback(_node)]
+
+    def remove(self):
+        self._module.remove_attribute_callback(self._ids[0])
+        self._module.remove_node_callback(self._ids[1])
+
+
+class _OpenMayaCallbacks(object):
+    """
+    - Callbacks de OpenMaya 2.0 por nodo: MNodeMessage (atributo cambiado, rename y borrado),
+        y MSceneMessage (escena nueva/abierta).
+    - Un error dentro de un callback no debe romper Maya: el tracker se marca para releer todo.
+    """
+    def __init__(self, tracker, names):
+        import maya.api.OpenMaya as om
+        self._om = om
+        _messages = om.MNodeMessage
+
+        def _attribute_changed(message, plug, otherPlug, node):
+            try:
+                if message & _messages.kAttributeSet:
+                    _event = 'set'
+                elif message & (_messages.kConnectionMade | _messages.kConnectionBroken):
+                    if not message & _messages.kIncomingDirection:
+                        return
+                    _event = 'connected' if message & _messages.kConnectionMade else 'disconnected'
+                elif message & (_messages.kAttributeAdded | _messages.kAttributeRemoved |
+                                _messages.kAttributeKeyable | _messages.kAttributeUnkeyable):
+                    _event = 'flags'
+                else:
+                    return
+                tracker._on_attribute(_event, node, plug.partialName(useLongNames=True))
+                # Un compuesto (translate) cambia tambien sus hijos (translateX...)
+                if plug.isCompound:
+                    for index in range(plug.numChildren()):
+                        tracker._on_attribute(_event, node, plug.child(index).partialName(useLongNames=True))
+            except Exception:
+                tracker._on_node('cleared', None, None)
+
+        def _renamed(mobject, previousName, node):
+            tracker._on_node('renamed', node, om.MFnDependencyNode(mobject).name())
+
+        def _destroyed(node):
+            tracker._on_node('removed', node, None)
+
+        def _cleared(*args):
+            tracker._on_node('cleared', None, None)
+
+        self._ids = []
+        for node, name in names.items():
+            _selection = om.MSelectionList()
+            _selection.add(name)
+            _mobject = _selection.getDependNode(0)
+            self._ids.extend([_messages.addAttributeChangedCallback(_mobject, _attribute_changed, node),
+                              _messages.addNameChangedCallback(_mobject, _renamed, node),
+                              _messages.addNodeDestroyedCallback(_mobject, _destroyed, node)])
+        self._ids.extend([om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, _cleared),
+                          om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _cleared)])
+
+    def remove(self):
+        self._om.MMessage.removeCallbacks(self._ids)
+        self._ids = []
+
+
+def _callback_backend(tracker, names):
+    """
+    - Devuelve los callbacks disponibles: los del stand-in si esta instalado, si no los de OpenMaya.
+        None si no hay ninguno.
+    """
+    if getattr(cmds, '__standIn__', False):
+        return _StandInCallbacks(tracker, names)
+    if not _lazy.is_available('maya.api.OpenMaya'):
+        return None
+    return _OpenMayaCallbacks(tracker, names)
+
+
+# ------------------------------------------------------------------------------
+# Trackers por archivo
+# ------------------------------------------------------------------------------
+_TRACKERS = {}
+
+
+def _key(fullPath):
+    return os.path.normcase(os.path.abspath(fullPath))
+
+
+def track(fullPath, base, text):
+    """
+    - Empieza el seguimiento de la pose "base", recien exportada en "fullPath" con el texto "text".
+        Reemplaza el tracker anterior de ese archivo y borra su delta.
+    - Devuelve el PoseTracker, o None si no hay callbacks disponibles.
+    """
+    stop(fullPath)
+    tracker = PoseTracker(fullPath, base, _hash(text))
+    if not tracker.attach():
+        cmds.warning("No attribute callbacks available: the pose {!r} is not tracked.".format(fullPath))
+        return None
+    if os.path.isfile(tracker.deltaPath):
+        os.remove(tracker.deltaPath)
+    _TRACKERS[_key(fullPath)] = tracker
+    return tracker
+
+
+def tracker(fullPath):
+    """
+    - Devuelve el PoseTracker de un archivo, o None.
+    """
+    return _TRACKERS.get(_key(fullPath))
+
+
+def stop(fullPath=None):
+    """
+    - Quita el tracker de un archivo (o todos, sin "fullPath"). Los archivos no se modifican.
+    """
+    _keys = list(_TRACKERS) if fullPath is None else [_key(fullPath)]
+    for _each in _keys:
+        _tracker = _TRACKERS.pop(_each, None)
+        if _tracker is not None:
+            _tracker.detach()
+
+
+def read_pose(fullPath):
+    """
+    - Lee una pose y le aplica su delta, si existe y se hizo sobre esa misma base.
+    - Devuelve la pose (lo que haya en el archivo, aunque no sea un diccionario).
+    """
+    with open(fullPath, "r") as file_to_read:
+        _text = file_to_read.read()
+    data = json.loads(_text)
+
+    _deltaPath = delta_path(fullPath)
+    if not isinstance(data, dict) or not os.path.isfile(_deltaPath):
+        return data
+
+    with open(_deltaPath, "r") as file_to_read:
+        _delta = json.load(file_to_read)
+    if _delta.get('base') != _hash(_text):
+        cmds.warning("The delta {!r} was made for another version of the pose and was ignored.".format(_deltaPath))
+        return data
+
+    for node, attrs in _delta.get('values', {}).items():
+        data.setdefault(node, {}).update(attrs)
+    return data
+
+
+def compact(fullPath):
+    """
+    - Junta el delta de una pose con su base en un unico archivo completo, y borra el delta.
+        Con un tracker activo usa sus valores actuales; sin tracker, los de los archivos.
+    - Devuelve la pose compactada.
+    """
+    _tracker = tracker(fullPath)
+    if _tracker is not None:
+        return _tracker.compact()
+
+    data = read_pose(fullPath)
+    _write(fullPath, data)
+    if os.path.isfile(delta_path(fullPath)):
+        os.remove(delta_path(fullPath))
+    return data
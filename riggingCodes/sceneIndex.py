@@ -0,0 +1,393 @@
+"""
+Detalles:
+    - Indice compartido de los nodos de la escena: nombre corto, namespace y path completo -> UUID.
+    - Se construye una vez y se mantiene al dia con callbacks de nodo creado, borrado, renombrado
+        y reparentado (OpenMaya, o los del stand-in fuera de Maya). Al abrir o crear una escena
+        se vuelve a construir la siguiente vez que se usa.
+    - Con el indice activo, las herramientas resuelven los nombres sin llamadas a maya.cmds
+        (exists/resolve), y detectan los nombres repetidos en vez de fallar mas adelante.
+    - Es opcional: sin enable(), exists() y resolve() usan maya.cmds como siempre.
+    - Ejemplos de uso:
+        from riggingCodes import sceneIndex
+        index = sceneIndex.enable()
+
+        index.uuids('L_handIK_ctl')           # ['6C1A...']
+        index.long_name(uuid)                 # '|rig_grp|controls_grp|...|L_handIK_ctl'
+        index.namespace_nodes('char001')      # Nodos del namespace
+        sceneIndex.resolve('L_wrist_jnt')     # Nombre unico, None si no existe, ValueError si hay varios
+
+        sceneIndex.disable()
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Check the optional dependencies with riggingCodes._lazy
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import maya.cmds as cmds
+
+from riggingCodes import _lazy
+
+
+class SceneIndex(object):
+    """
+    - Indice de los nodos de la escena por UUID:
+        records:   {uuid: [name, parentUuid, isDag]}   (name es el nombre corto, con namespace)
+        byName:    {name: set(uuid)}
+        namespaces: {namespace: set(uuid)}
+        children:  {uuid: set(uuid)}
+    - Los paths completos se calculan subiendo por los padres y se guardan en cache;
+        un rename o reparent solo invalida los paths de esa jerarquia.
+    """
+    def __init__(self):
+        self.records = {}
+        self.byName = {}
+        self.namespaces = {}
+        self.children = {}
+        self._paths = {}
+        self.stale = True
+        self.builds = 0
+        self.updates = 0
+        self._callbacks = None
+
+    # --------------------------------------------------------------------------
+    # Construccion y callbacks
+    # --------------------------------------------------------------------------
+    def build(self):
+        """
+        - Construye el indice con dos consultas 'ls' (paths completos y UUIDs, en el mismo orden).
+        """
+        self._clear()
+        _paths = cmds.ls(long=True) or []
+        _uuids = cmds.ls(uuid=True) or []
+        if len(_paths) != len(_uuids):
+            raise RuntimeError("The scene changed while building the index.")
+
+        _byPath = dict(zip(_paths, _uuids))
+        for path, uuid in zip(_paths, _uuids):
+            isDag = path.startswith('|')
+            _parentPath = path.rsplit('|', 1)[0] if isDag else ''
+            self._add(uuid, path.rsplit('|', 1)[-1], _byPath.get(_parentPath), isDag)
+
+        self.stale = False
+        self.builds += 1
+
+    def ensure(self):
+        """
+        - Construye el indice si no esta construido o si se cambio de escena.
+        """
+        if self.stale:
+            self.build()
+        return self
+
+    def attach(self):
+        """
+        - Registra los callbacks que mantienen el indice al dia. Devuelve False si no hay callbacks disponibles.
+        """
+        if self._callbacks is None:
+            self._callbacks = _callback_backend(self._on_event)
+        return self._callbacks is not None
+
+    def detach(self):
+        if self._callbacks is not None:
+            self._callbacks.remove()
+            self._callbacks = None
+        self.stale = True
+
+    def _on_event(self, event, uuid, name, parentUuid, isDag):
+        """
+        - Actualiza el indice con un evento de nodo: 'added', 'removed', 'renamed', 'reparented' o 'cleared'.
+        """
+        if event == 'cleared':
+            self._clear()
+            self.stale = True
+            return
+        if self.stale:
+            return
+
+        self.updates += 1
+        if event == 'removed':
+            self._discard(uuid)
+        elif uuid not in self.records:
+            self._add(uuid, name, parentUuid, isDag)
+        else:
+            self._invalidate_paths(uuid)
+            self._discard_name(uuid)
+            self._set_parent(uuid, parentUuid)
+            self.records[uuid][0] = name
+            self._add_name(uuid)
+
+    # --------------------------------------------------------------------------
+    # Estructura interna
+    # --------------------------------------------------------------------------
+    def _clear(self):
+        self.records.clear()
+        self.byName.clear()
+        self.namespaces.clear()
+        self.children.clear()
+        self._paths.clear()
+
+    def _add(self, uuid, name, parentUuid, isDag):
+        self.records[uuid] = [name, None, isDag]
+        self._add_name(uuid)
+        self._set_parent(uuid, parentUuid)
+
+    def _add_name(self, uuid):
+        name = self.records[uuid][0]
+        self.byName.setdefault(name, set()).add(uuid)
+        self.namespaces.setdefault(_namespace(name), set()).add(uuid)
+
+    def _discard_name(self, uuid):
+        name = self.records[uuid][0]
+        for _map, key in [(self.byName, name), (self.namespaces, _namespace(name))]:
+            _uuids = _map.get(key)
+            if _uuids is not None:
+                _uuids.discard(uuid)
+                if not _uuids:
+                    del _map[key]
+
+    def _set_parent(self, uuid, parentUuid):
+        record = self.records[uuid]
+        if record[1] is not None:
+            self.children.get(record[1], set()).discard(uuid)
+        record[1] = parentUuid
+        if parentUuid is not None:
+            self.children.setdefault(parentUuid, set()).add(uuid)
+
+    def _discard(self, uuid):
+        if uuid not in self.records:
+            return
+        self._invalidate_paths(uuid)
+        self._discard_name(uuid)
+        self._set_parent(uuid, None)
+        del self.records[uuid]
+        self.children.pop(uuid, None)
+
+    def _invalidate_paths(self, uuid):
+        _pending = [uuid]
+        while _pending:
+            _uuid = _pending.pop()
+            if self._paths.pop(_uuid, None) is not None:
+                _pending.extend(self.children.get(_uuid, ()))
+
+    # --------------------------------------------------------------------------
+    # Consultas
+    # --------------------------------------------------------------------------
+    def long_name(self, uuid):
+        """
+        - Path completo del nodo (|grupo|nodo), o su nombre si no es un nodo DAG.
+        """
+        path = self._paths.get(uuid)
+        if path is None:
+            name, parentUuid, isDag = self.records[uuid]
+            if not isDag:
+                path = name
+            elif parentUuid is None or parentUuid not in self.records:
+                path = '|' + name
+            else:
+                path = self.long_name(parentUuid) + '|' + name
+            self._paths[uuid] = path
+        return path
+
+    def short_name(self, uuid):
+        return self.records[uuid][0]
+
+    def uuids(self, name):
+        """
+        - Devuelve la lista de UUIDs que coinciden con el nombre: corto, con namespace, path parcial o completo,
+            o el propio UUID.
+        """
+        self.ensure()
+        if '|' not in name:
+            _uuids = self.byName.get(name)
+            if _uuids:
+                return list(_uuids)
+            return [name] if name in self.records else []
+
+        _leaf = name.rsplit('|', 1)[-1]
+        _absolute = name.startswith('|')
+        result = []
+        for uuid in self.byName.get(_leaf, ()):
+            path = self.long_name(uuid)
+            if path == name or (not _absolute and path.endswith('|' + name)):
+                result.append(uuid)
+        return result
+
+    def count(self, name):
+        return len(self.uuids(name))
+
+    def exists(self, name):
+        return bool(self.uuids(name))
+
+    def unique_name(self, uuid):
+        """
+        - Nombre mas corto que identifica al nodo sin ambiguedad (como los que devuelve 'ls').
+        """
+        name = self.records[uuid][0]
+        if len(self.byName.get(name, ())) < 2:
+            return name
+        path = self.long_name(uuid)
+        _parts = path.lstrip('|').split('|')
+        for index in range(len(_parts) - 2, -1, -1):
+            _candidate = '|'.join(_parts[index:])
+            if self.count(_candidate) == 1:
+                return _candidate
+        return path
+
+    def namespace_nodes(self, namespace):
+        """
+        - Devuelve los nombres unicos de los nodos de ese namespace (sin ':'; "" para los nodos sin namespace).
+        """
+        self.ensure()
+        return [self.unique_name(uuid) for uuid in self.namespaces.get(namespace.strip(':'), ())]
+
+
+def _namespace(name):
+    return name.rsplit(':', 1)[0] if ':' in name else ''
+
+
+# ------------------------------------------------------------------------------
+# Callbacks
+# ------------------------------------------------------------------------------
+class _StandInCallbacks(object):
+    """
+    - Callbacks del stand-in de maya.cmds (riggingCodes.mayaStandIn).
+    """
+    def __init__(self, function):
+        from riggingCodes import mayaStandIn
+        self._module = mayaStandIn
+        self._id = mayaStandIn.add_node_callback(function)
+
+    def remove(self):
+        self._module.remove_node_callback(self._id)
+
+
+class _OpenMayaCallbacks(object):
+    """
+    - Callbacks de OpenMaya 2.0: MDGMessage (nodo creado/borrado), MNodeMessage (rename),
+        MDagMessage (reparent) y MSceneMessage (escena nueva/abierta).
+    - Un error dentro de un callback no debe romper Maya: el indice se marca para reconstruirse.
+    """
+    def __init__(self, function):
+        import maya.api.OpenMaya as om
+        self._om = om
+        self._function = function
+
+        def _node_event(event):
+            def _callback(mobject, *args):
+                self._call(event, mobject)
+            return _callback
+
+        def _parent_added(child, parent, *args):
+            self._call('reparented', child.node())
+
+        def _cleared(*args):
+            function('cleared', None, None, None, None)
+
+        self._ids = [om.MDGMessage.addNodeAddedCallback(_node_event('added'), 'dependNode'),
+                     om.MDGMessage.addNodeRemovedCallback(_node_event('removed'), 'dependNode'),
+                     om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, _node_event('renamed')),
+                     om.MDagMessage.addParentAddedCallback(_parent_added),
+                     om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, _cleared),
+                     om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _cleared)]
+
+    def _call(self, event, mobject):
+        om = self._om
+        try:
+            _node = om.MFnDependencyNode(mobject)
+            parentUuid = None
+            isDag = mobject.hasFn(om.MFn.kDagNode)
+            if isDag:
+                _dag = om.MFnDagNode(mobject)
+                if _dag.parentCount():
+                    _parent = _dag.parent(0)
+                    if not _parent.hasFn(om.MFn.kWorld):
+                        parentUuid = om.MFnDependencyNode(_parent).uuid().asString()
+            self._function(event, _node.uuid().asString(), _node.name(), parentUuid, isDag)
+        except Exception:
+            self._function('cleared', None, None, None, None)
+
+    def remove(self):
+        self._om.MMessage.removeCallbacks(self._ids)
+        self._ids = []
+
+
+def _callback_backend(function):
+    """
+    - Devuelve los callbacks disponibles: los del stand-in si esta instalado, si no los de OpenMaya.
+        None si no hay ninguno (el indice no se podria mantener al dia).
+    """
+    if getattr(cmds, '__standIn__', False):
+        return _StandInCallbacks(function)
+    if not _lazy.is_available('maya.api.OpenMaya'):
+        return None
+    return _OpenMayaCallbacks(function)
+
+
+# ------------------------------------------------------------------------------
+# Indice compartido
+# ------------------------------------------------------------------------------
+_SHARED = [None]
+
+
+def enable():
+    """
+    - Crea el indice compartido y registra sus callbacks (se construye la primera vez que se usa).
+    - Devuelve el indice, o None si no hay callbacks disponibles.
+    """
+    if _SHARED[0] is None:
+        index = SceneIndex()
+        if not index.attach():
+            cmds.warning("No node callbacks available: the scene index is disabled.")
+            return None
+        _SHARED[0] = index
+    return _SHARED[0]
+
+
+def disable():
+    """
+    - Quita los callbacks y el indice compartido.
+    """
+    if _SHARED[0] is not None:
+        _SHARED[0].detach()
+        _SHARED[0] = None
+
+
+def active():
+    """
+    - Devuelve el indice compartido (construido) si esta activo, o None.
+    """
+    if _SHARED[0] is None:
+        return None
+    return _SHARED[0].ensure()
+
+
+def exists(name):
+    """
+    - Igual que cmds.objExists para nodos, resuelto con el indice si esta activo.
+    """
+    index = active()
+    if index is None:
+        return cmds.objExists(name)
+    return index.exists(name)
+
+
+def resolve(name):
+    """
+    - Devuelve un nombre del nodo que se puede usar con maya.cmds, o None si no existe.
+    - Con el indice activo, si hay varios nodos con ese nombre da ValueError (en vez de fallar despues
+        en el primer comando). Sin el indice solo se comprueba que exista.
+    """
+    index = active()
+    if index is None:
+        return name if cmds.objExists(name) else None
+
+    _uuids = index.uuids(name)
+    if not _uuids:
+        return None
+    if len(_uuids) > 1:
+        raise ValueError("More than one object matches name: {}".format(name))
+    return name
@@ -0,0 +1,109 @@
+"""
+Detalles:
+    - Puntos de entrada para los botones del shelf de Maya.
+    - Cada funcion importa la herramienta que necesita en el momento de ejecutarse,
+        por lo que cargar este modulo no importa ni ejecuta nada.
+    - Ejemplos de uso (comando de un boton del shelf, en Python):
+        from riggingCodes import shelf
+        shelf.auto_snap(part="arm", side="L")
+
+        from riggingCodes import shelf
+        shelf.switch_space(space=1)
+
+        from riggingCodes import shelf
+        shelf.connect_template('C:/Example/Directory/Path', 'templates.rigConnections')
+
+        from riggingCodes import shelf
+        shelf.restore_pose(ago=300)
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Added capture_pose and restore_pose (in-memory pose snapshots)
+        -Added reset_pose (reset to the attribute defaults)
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+
+def export_pose(filePath, fileName):
+    """
+    - Exporta los valores del channelBox de la seleccion (ver Reset_Controls.export_dict).
+    """
+    from riggingCodes import Reset_Controls
+    return Reset_Controls.export_dict(filePath=filePath, fileName=fileName)
+
+
+def load_pose(filePath, fileName, prefix=""):
+    """
+    - Carga los valores guardados con export_pose (ver Reset_Controls.load_dict).
+    """
+    from riggingCodes import Reset_Controls
+    return Reset_Controls.load_dict(filePath=filePath, fileName=fileName, prefix=prefix)
+
+
+def capture_pose(name=None):
+    """
+    - Guarda la pose de la seleccion en la pila de snapshots en memoria (ver poseSnapshots.capture).
+    """
+    from riggingCodes import poseSnapshots
+    return poseSnapshots.capture(name=name)
+
+
+def restore_pose(name=None, ago=None):
+    """
+    - Vuelve a la ultima pose guardada con capture_pose, a la de ese nombre,
+        o a la de hace "ago" segundos (ver poseSnapshots.restore).
+    """
+    from riggingCodes import poseSnapshots
+    return poseSnapshots.restore(name=name, ago=ago)
+
+
+def reset_pose(hierarchy=False, namespace=None):
+    """
+    - Resetea los controles de la seleccion (con sus hijos si hierarchy es True), o de todo un namespace,
+        a sus valores default (ver Reset_Controls.reset_to_default).
+    """
+    from riggingCodes import Reset_Controls
+    return Reset_Controls.reset_to_default(hierarchy=hierarchy, namespace=namespace)
+
+
+def auto_snap(part="arm", side="L"):
+    """
+    - Cambia de FK a IK, o de IK a FK, sin mover los joints (ver snapIKFK.auto_snap).
+    """
+    from riggingCodes import snapIKFK
+    return snapIKFK.auto_snap(part=part, side=side)
+
+
+def switch_space(space=0, attr="Spaces"):
+    """
+    - Cambia el space de los controles seleccionados sin moverlos (ver Grupos_y_Spaces.change_switchSpace).
+    """
+    from riggingCodes import Grupos_y_Spaces
+    return Grupos_y_Spaces.change_switchSpace(attr=attr, space=space)
+
+
+def connect_template(filePath, fileName, **kwargs):
+    """
+    - Conecta el rig en base al template especificado (ver RigConnector.connect).
+    """
+    from riggingCodes.Conectar_Y_Desconectar import RigConnector
+    return RigConnector(filePath, fileName).connect(**kwargs)
+
+
+def disconnect_template(filePath, fileName, **kwargs):
+    """
+    - Desconecta el rig en base al template especificado (ver RigConnector.disconnect).
+    """
+    from riggingCodes.Conectar_Y_Desconectar import RigConnector
+    return RigConnector(filePath, fileName).disconnect(**kwargs)
+
+
+def export_template(filePath, fileName, **kwargs):
+    """
+    - Crea un template en base a la seleccion (ver RigConnector.export_template).
+    """
+    from riggingCodes.Conectar_Y_Desconectar import RigConnector
+    return RigConnector(filePath, fileName).export_template(**kwargs)
@@ -0,0 +1,208 @@
+"""
+Detalles:
+    - Comprobacion de la precision de snapIKFK: mide cuanto se mueven los joints del esqueleto (bind joints)
+        al hacer el snap de FK a IK o de IK a FK, en uno o varios frames.
+    - En cada frame guarda las matrices de mundo de los bind joints antes y despues del snap,
+        y calcula para cada joint el error de posicion (distancia) y de orientacion (angulo en grados).
+    - El calculo del error se hace de una vez para todas las matrices del rango (vectorizado con numpy
+        si esta disponible, si no con listas de Python). Las matrices se guardan en un array('d') plano.
+    - Todos los cambios se hacen en un undo chunk que se deshace al terminar (keep=False),
+        asi que la escena queda como estaba. El frame actual tambien se restaura.
+    - Devuelve un toolReport.Report:
+        - 'drift' (error): frames en los que algun joint supera la tolerancia, del peor al mejor,
+            con el peor joint de cada frame.
+        - 'worst': el peor frame del rango, aunque este dentro de la tolerancia.
+        - groups: error maximo y medio de cada joint en todo el rango.
+    - "pose" permite poner una pose distinta en cada frame (por ejemplo sobre rigs sinteticos sin animacion).
+    - Sirve como test de regresion y benchmark de snapIKFK: ver benchmarks/bench_tools.py --check-snaps.
+    - Ejemplos de uso:
+        from riggingCodes import snapCheck
+
+        report = snapCheck.check_snap(part="arm", side="L", start=1, end=120)
+        report.failed
+        report.details['drift']         # [(frame, joint, position error, angle error), ...]
+        report.groups['L_wrist_jnt']    # {'maxPosition': ..., 'maxAngle': ..., 'meanPosition': ..., 'meanAngle': ...}
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+        -Check the optional dependencies with riggingCodes._lazy
+        -check_snap returns None for a frame range that ends before it starts
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import math
+from array import array
+
+import maya.cmds as cmds
+
+from riggingCodes import _lazy, mayaBackend, snapIKFK, toolReport
+
+# Joints del esqueleto que mueve el snap de cada parte
+BIND_JOINTS = {'arm': ["shoulder", "elbow", "wrist"],
+               'leg': ["hip", "knee", "ankle", "toe"]}
+
+# Tolerancias por defecto: unidades de escena y grados
+POSITION_TOLERANCE = 1e-3
+ANGLE_TOLERANCE = 1e-2
+
+_SNAPS = {('arm', 1): snapIKFK.snap_arm_fk_to_ik, ('arm', 0): snapIKFK.snap_arm_ik_to_fk,
+          ('leg', 1): snapIKFK.snap_leg_fk_to_ik, ('leg', 0): snapIKFK.snap_leg_ik_to_fk}
+
+
+def bind_joints(part="arm", side="L"):
+    """
+    - Devuelve los bind joints de la parte: ["L_shoulder_jnt", "L_elbow_jnt", "L_wrist_jnt"].
+    """
+    return ["{}_{}_jnt".format(side, name) for name in BIND_JOINTS[part]]
+
+
+# NumPy es opcional: solo se importa la primera vez que se calcula el error
+_NUMPY = _lazy.lazy_import('numpy')
+
+
+def _numpy():
+    return _NUMPY if _lazy.is_available('numpy') else None
+
+
+def drift(before, after):
+    """
+    - Calcula el error entre dos secuencias de matrices de mundo (16 valores por matriz, en el orden de xform).
+    - Devuelve dos listas con un valor por matriz:
+        position    Distancia entre las traslaciones.
+        angle       Angulo en grados de la rotacion entre las dos orientaciones (sin tener en cuenta la escala).
+    - El angulo se calcula con la norma de la diferencia de las rotaciones (|Ra - Rb| = 2*sqrt(2)*sin(angulo/2)),
+        que es precisa tambien para angulos muy chicos (con acos de la traza se pierde precision cerca de 0).
+    """
+    if len(before) != len(after) or len(before) % 16:
+        raise ValueError("The matrices before and after the snap don't match.")
+
+    numpy = _numpy()
+    if numpy is not None:
+        _before = numpy.asarray(before, dtype=float).reshape(-1, 4, 4)
+        _after = numpy.asarray(after, dtype=float).reshape(-1, 4, 4)
+        position = numpy.linalg.norm(_after[:, 3, :3] - _before[:, 3, :3], axis=1)
+        _rotBefore = _before[:, :3, :3] / numpy.linalg.norm(_before[:, :3, :3], axis=2, keepdims=True)
+        _rotAfter = _after[:, :3, :3] / numpy.linalg.norm(_after[:, :3, :3], axis=2, keepdims=True)
+        _norm = numpy.linalg.norm((_rotAfter - _rotBefore).reshape(-1, 9), axis=1)
+        angle = numpy.degrees(2.0 * numpy.arcsin(numpy.clip(_norm / (2.0 * math.sqrt(2.0)), 0.0, 1.0)))
+        return position.tolist(), angle.tolist()
+
+    position = []
+    angle = []
+    for offset in range(0, len(before), 16):
+        _a = before[offset:offset + 16]
+        _b = after[offset:offset + 16]
+        position.append(math.sqrt(sum((_b[12 + axis] - _a[12 + axis]) ** 2 for axis in range(3))))
+        _sum = 0.0
+        for row in range(0, 12, 4):
+            _lengthA = math.sqrt(sum(value * value for value in _a[row:row + 3])) or 1.0
+            _lengthB = math.sqrt(sum(value * value for value in _b[row:row + 3])) or 1.0
+            _sum += sum((_b[row + axis] / _lengthB - _a[row + axis] / _lengthA) ** 2 for axis in range(3))
+        angle.append(math.degrees(2.0 * math.asin(min(1.0, math.sqrt(_sum) / (2.0 * math.sqrt(2.0))))))
+    return position, angle
+
+
+def check_snap(part="arm", side="L", start=None, end=None, source=None, pose=None, keep=False,
+               positionTolerance=POSITION_TOLERANCE, angleTolerance=ANGLE_TOLERANCE):
+    """
+    - Hace el snap en cada frame del rango y mide cuanto se mueven los bind joints. Devuelve un toolReport.Report
+        (None si la parte, el lado, el rango o el switch no son validos).
+    - La direccion se decide con el estado del switch (como auto_snap y snap_frame_range), o con "source",
+        y en cada frame se vuelve al estado origen antes del snap.
+    - Keyword Args:
+        part               <str> "arm" o "leg". Default: "arm".
+        side               <str> "L" o "R". Default: "L".
+        start/end          <int> Primer y ultimo frame. Default: None (solo el frame actual).
+        source             <int> 1 para medir el snap de FK a IK, 0 para el de IK a FK.
+                            Default: None (el estado actual del switch).
+        pose               <function> Se llama con el frame despues de cambiarlo y antes del snap,
+                            para poner la pose de ese frame. Default: None.
+        keep               <bool> Si es True, no se deshacen los snaps (queda el resultado del ultimo frame).
+                            Default: False.
+        positionTolerance  <float> Error de posicion permitido. Default: POSITION_TOLERANCE.
+        angleTolerance     <float> Error de orientacion permitido, en grados. Default: ANGLE_TOLERANCE.
+    """
+    if part not in ["arm", "leg"] or side not in ["L", "R"]:
+        print("Please set a valid part ('arm' or 'leg') and side ('L' or 'R').")
+        return
+
+    if start is not None and end is not None and int(end) < int(start):
+        print("Please set a valid frame range: the end frame ({}) is before the start frame ({}).".format(end, start))
+        return
+
+    _switch = "{}_{}IKFK_ctl".format(side, part)
+    if not cmds.objExists("{}.IKFK".format(_switch)):
+        print("Please specify a valid IK/FK {} switch controller and attribute.".format(part))
+        return
+
+    backend = mayaBackend.current()
+    _source = int(round(backend.get_plug(_switch, "IKFK"))) if source is None else int(source)
+    _snap = _SNAPS[(part, _source)]
+    _joints = bind_joints(part, side)
+    _time = cmds.currentTime(query=True)
+    _frames = [_time] if start is None else list(range(int(start), int((start if end is None else end)) + 1))
+
+    report = toolReport.Report("check_snap {}_{} {}".format(side, part, "fk_to_ik" if _source else "ik_to_fk"))
+    report.count('frames', len(_frames))
+    report.count('joints', len(_joints))
+
+    before = array('d')
+    after = array('d')
+    cmds.undoInfo(openChunk=True, chunkName="check_snap")
+    try:
+        with report.timer('snap'):
+            for frame in _frames:
+                cmds.currentTime(frame)
+                if pose is not None:
+                    pose(frame)
+                backend.set_plug(_switch, "IKFK", _source)
+                for joint in _joints:
+                    before.extend(backend.get_world_matrix(joint))
+                _snap(side=side)
+                for joint in _joints:
+                    after.extend(backend.get_world_matrix(joint))
+    finally:
+        cmds.undoInfo(closeChunk=True)
+        if not keep:
+            cmds.undo()
+        cmds.currentTime(_time)
+
+    with report.timer('metrics'):
+        position, angle = drift(before, after)
+    _add_metrics(report, _frames, _joints, position, angle, positionTolerance, angleTolerance)
+    return report.emit()
+
+
+def _add_metrics(report, frames, joints, position, angle, positionTolerance, angleTolerance):
+    """
+    - Agrega al reporte los errores de cada joint (groups) y los peores frames ('drift' y 'worst').
+    """
+    _count = len(joints)
+    for index, joint in enumerate(joints):
+        _position = position[index::_count]
+        _angle = angle[index::_count]
+        report.groups[joint] = {'maxPosition': round(max(_position), 6),
+                                'maxAngle': round(max(_angle), 6),
+                                'meanPosition': round(sum(_position) / len(_position), 6),
+                                'meanAngle': round(sum(_angle) / len(_angle), 6)}
+
+    # Peor joint de cada frame, con el error relativo a la tolerancia
+    _worst = []
+    for frameIndex, frame in enumerate(frames):
+        _offset = frameIndex * _count
+        _scores = [max(position[_offset + index] / positionTolerance, angle[_offset + index] / angleTolerance)
+                   for index in range(_count)]
+        _index = max(range(_count), key=_scores.__getitem__)
+        _worst.append((_scores[_index], frame, joints[_index],
+                       round(position[_offset + _index], 6), round(angle[_offset + _index], 6)))
+    _worst.sort(key=lambda each: each[0], reverse=True)
+
+    if _worst:
+        report.add('worst', _worst[0][1:])
+    for score, frame, joint, positionError, angleError in _worst:
+        if score <= 1.0:
+            break
+        report.fail('drift', (frame, joint, positionError, angleError))
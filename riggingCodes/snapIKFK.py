@@ -10,6 +10,8 @@ Detalles:
         - (...)_handIKRot_ctl (funciona de IK a FK, pero no se puede volver al mismo estado luego)
 
     -Ejemplos de uso
+        from riggingCodes.snapIKFK import *
+
         # CREAR LOCATOR FK EN BRAZOS O PIERNAS
             create_arm_fk_pv_locator(side = "x")    # se cambia x por el lado en el que desea implementar el sistema
             create_leg_fk_pv_locator(side = "x")    # L o R
@@ -29,6 +31,13 @@ Detalles:
         # AUTO SNAP
             auto_snap(part="x", side="y")     # se cambia x por que parte se desea afectar  ( arm o leg )
                                               # se cambia y por el lado que se desea que sea afectado (L o R)
+
+        # SNAP EN UN RANGO DE FRAMES (con keys)
+            snap_frame_range(part="arm", side="L", start=1, end=120, deferred=True)
+
+        # COMPROBAR LA PRECISION DEL SNAP (error de los joints del esqueleto en cada frame, ver snapCheck)
+            from riggingCodes import snapCheck
+            snapCheck.check_snap(part="arm", side="L", start=1, end=120)
 Autor:
     - Sofia Ares Fernandez
 Fecha de actualizacion:
@@ -38,6 +47,12 @@ Fecha de actualizacion:
     14/03/2024 by Sofia:
         -Add leg side to sistem.
         -Testing and changing spelling mistakes
+    19/10/2026:
+        -Moved into the riggingCodes package
+        -Plug values are read and written through the selected backend (riggingCodes.mayaBackend)
+        -snap_frame_range: snap and key a frame range, optionally deferred in chunks (riggingCodes.jobScheduler)
+        -Snap accuracy and drift check over a frame range in riggingCodes.snapCheck
+        -The snap functions get the backend once instead of on every plug read and write
 Entorno:
     -Python 2023.2.4
     -Autodesk Maya 2023
@@ -46,6 +61,8 @@ Entorno:
 
 import maya.cmds as cmds
 
+from riggingCodes import jobScheduler, mayaBackend
+
 def _create_hidden_locator(target=None, name=None, parent=None, lock=None):
     """
     - Creara un locator con el nombre especificado "name" dentro de un grupo,
@@ -179,8 +196,9 @@ def _get_stretch_percentage(start=None, end=None):
     if not end:
         raise ValueError("Please specify an end joint.")
 
-    start_pos = cmds.getAttr("{}.translateX".format(start))
-    end_pos = cmds.getAttr("{}.translateX".format(end))
+    _backend = mayaBackend.current()
+    start_pos = _backend.get_plug(start, "translateX")
+    end_pos = _backend.get_plug(end, "translateX")
 
     return end_pos/start_pos
 
@@ -222,6 +240,9 @@ def snap_arm_fk_to_ik(side="L"):
     #-----------------------
     # Get Values
     #-----------------------
+    # Backend used for every plug read and write of the snap
+    _backend = mayaBackend.current()
+
     # Get current position and orientation of wrist FK
     wrs_trn = cmds.xform(wrs_lst[0], q=True,ws=True,translation=True)
     wrs_rot = cmds.xform(wrs_lst[0], q=True, ws=True,rotation=True)
@@ -231,14 +252,14 @@ def snap_arm_fk_to_ik(side="L"):
     pv_rot = cmds.xform(pole_vector_lst[0], q=True, ws=True, rotation=True)
 
     # Get stretch values
-    shld_str = cmds.getAttr("{}.{}".format(shld_fk_stretch_ctl, stretch_attr))
-    elb_str = cmds.getAttr("{}.{}".format(elbow_fk_stretch_ctl, stretch_attr))
+    shld_str = _backend.get_plug(shld_fk_stretch_ctl, stretch_attr)
+    elb_str = _backend.get_plug(elbow_fk_stretch_ctl, stretch_attr)
 
     #-----------------------
     # Set Values
     #-----------------------
     # Switch Status
-    cmds.setAttr("{}.{}".format(arm_fkik_ctl, arm_fkik_attr), 0)
+    _backend.set_plug(arm_fkik_ctl, arm_fkik_attr, 0)
 
     # Set trn and rot
     cmds.xform(wrs_lst[1], ws=True, translation=wrs_trn)
@@ -246,14 +267,14 @@ def snap_arm_fk_to_ik(side="L"):
 
     # (!) Reset hand to IK Rot just in case
     for axs in 'xyz':
-        cmds.setAttr("{}.r{}".format(hand_ik_rot, axs), 0)
+        _backend.set_plug(hand_ik_rot, "r" + axs, 0)
 
     # Apply FK pole vector pos to IK pole vecto
     cmds.xform(pole_vector_lst[1], ws=True, translation=pv_trn)
     cmds.xform(pole_vector_lst[1], ws=True, rotation=pv_rot)
 
     # (!) Reset stretch attribute for IK just in case
-    cmds.setAttr("{}.{}".format(stretch_ik_ctl, stretch_attr), 0)
+    _backend.set_plug(stretch_ik_ctl, stretch_attr, 0)
 
     # Set manual stretch values for IK
     if shld_str < 1:
@@ -264,8 +285,8 @@ def snap_arm_fk_to_ik(side="L"):
         cmds.warning("The elbow stretch is less than 1, but IK doesn't support values less than 1")
         elb_str = 1
 
-    cmds.setAttr("{}.{}".format(stretch_ik_ctl, stretch_ik_up_attr), shld_str)
-    cmds.setAttr("{}.{}".format(stretch_ik_ctl, stretch_ik_lwr_attr), elb_str)
+    _backend.set_plug(stretch_ik_ctl, stretch_ik_up_attr, shld_str)
+    _backend.set_plug(stretch_ik_ctl, stretch_ik_lwr_attr, elb_str)
 
 def snap_arm_ik_to_fk(side="L"):
     """
@@ -304,6 +325,9 @@ def snap_arm_ik_to_fk(side="L"):
     #-----------------------
     # Get Values
     #-----------------------
+    # Backend used for every plug read and write of the snap
+    _backend = mayaBackend.current()
+
     # Get current IK's pole vector locator values
     pv_trn = cmds.xform(pole_vector_lst[0], q=True, ws=True, translation=True)
     pv_rot = cmds.xform(pole_vector_lst[0], q=True, ws=True, rotation=True)
@@ -316,7 +340,7 @@ def snap_arm_ik_to_fk(side="L"):
     # Set Values
     #-----------------------
     # Switch Status
-    cmds.setAttr("{}.{}".format(arm_fkik_ctl, arm_fkik_attr), 1)
+    _backend.set_plug(arm_fkik_ctl, arm_fkik_attr, 1)
 
     # Apply orientation with constraint
     for axs in ["X", "Z"]:
@@ -329,7 +353,7 @@ def snap_arm_ik_to_fk(side="L"):
     cmds.delete(orCons_shl, orCons_elb, orCons_wrs)
 
     for axs in ["X", "Z"]:
-        cmds.setAttr("{}.rotate{}".format(elb_lst[1], axs), 0)
+        _backend.set_plug(elb_lst[1], "rotate" + axs, 0)
         cmds.setAttr("{}.rotate{}".format(elb_lst[1], axs), lock=True)
 
     # Apply IK pole vector pos to FK pole vecto
@@ -337,8 +361,8 @@ def snap_arm_ik_to_fk(side="L"):
     cmds.xform(pole_vector_lst[1], ws=True, rotation=pv_rot)
 
     # Set stretch percentage
-    cmds.setAttr("{}.{}".format(shld_stretch_ctl, stretch_attr), shld_str_per)
-    cmds.setAttr("{}.{}".format(elbow_stretch_ctl, stretch_attr), elb_str_per)
+    _backend.set_plug(shld_stretch_ctl, stretch_attr, shld_str_per)
+    _backend.set_plug(elbow_stretch_ctl, stretch_attr, elb_str_per)
 
 def create_leg_fk_pv_locator(side = "L"):
     """
@@ -435,6 +459,9 @@ def snap_leg_fk_to_ik(side="L"):
     #-----------------------
     # Get Values
     #-----------------------
+    # Backend used for every plug read and write of the snap
+    _backend = mayaBackend.current()
+
     # Get current position and orientation of ankle FK
     ank_trn = cmds.xform(ank_lst[0], q=True,ws=True,translation=True)
     ank_rot = cmds.xform(ank_lst[0], q=True, ws=True,rotation=True)
@@ -444,8 +471,8 @@ def snap_leg_fk_to_ik(side="L"):
     pv_rot = cmds.xform(pole_vector_lst[0], q=True, ws=True, rotation=True)
 
     # Get stretch values
-    hip_str = cmds.getAttr("{}.{}".format(hip_fk_stretch_ctl, stretch_attr))
-    knee_str = cmds.getAttr("{}.{}".format(knee_fk_stretch_ctl, stretch_attr))
+    hip_str = _backend.get_plug(hip_fk_stretch_ctl, stretch_attr)
+    knee_str = _backend.get_plug(knee_fk_stretch_ctl, stretch_attr)
 
     # Get rotation values for toes
     toes_rot = cmds.xform(toes_lst[0], q=True, ws=True, rotation=True)
@@ -454,7 +481,7 @@ def snap_leg_fk_to_ik(side="L"):
     # Set Values
     #-----------------------
     # Switch Status
-    cmds.setAttr("{}.{}".format(leg_fkik_ctl, leg_fkik_attr), 0)
+    _backend.set_plug(leg_fkik_ctl, leg_fkik_attr, 0)
 
     # Set trn and rot
     cmds.xform(ank_lst[1], ws=True, translation=ank_trn)
@@ -465,7 +492,7 @@ def snap_leg_fk_to_ik(side="L"):
     cmds.xform(pole_vector_lst[1], ws=True, rotation=pv_rot)
 
     # (!) Reset stretch attribute for IK just in case
-    cmds.setAttr("{}.{}".format(stretch_ik_ctl, stretch_attr), 0)
+    _backend.set_plug(stretch_ik_ctl, stretch_attr, 0)
 
     # Set manual stretch values for IK
     if hip_str < 1:
@@ -476,8 +503,8 @@ def snap_leg_fk_to_ik(side="L"):
         cmds.warning("The knee stretch is less than 1, but IK doesn't support values less than 1")
         knee_str = 1
 
-    cmds.setAttr("{}.{}".format(stretch_ik_ctl, stretch_ik_up_attr), hip_str)
-    cmds.setAttr("{}.{}".format(stretch_ik_ctl, stretch_ik_lwr_attr), knee_str)
+    _backend.set_plug(stretch_ik_ctl, stretch_ik_up_attr, hip_str)
+    _backend.set_plug(stretch_ik_ctl, stretch_ik_lwr_attr, knee_str)
 
     # Set toes rotation
     cmds.xform(toes_lst[1], ws=True, rotation=toes_rot)
@@ -522,6 +549,9 @@ def snap_leg_ik_to_fk(side="L"):
     #-----------------------
     # Get Values
     #-----------------------
+    # Backend used for every plug read and write of the snap
+    _backend = mayaBackend.current()
+
     # Get current IK's pole vector locator values
     pv_trn = cmds.xform(pole_vector_lst[0], q=True, ws=True, translation=True)
     pv_rot = cmds.xform(pole_vector_lst[0], q=True, ws=True, rotation=True)
@@ -537,7 +567,7 @@ def snap_leg_ik_to_fk(side="L"):
     # Set Values
     #-----------------------
     # Switch Status
-    cmds.setAttr("{}.{}".format(leg_fkik_ctl, leg_fkik_attr), 1)
+    _backend.set_plug(leg_fkik_ctl, leg_fkik_attr, 1)
 
     # Apply orientation with constraint
     for axs in ["X", "Y"]:
@@ -550,7 +580,7 @@ def snap_leg_ik_to_fk(side="L"):
     cmds.delete(orCons_hip, orCons_knee, orCons_ankle)
 
     for axs in ["X", "Y"]:
-        cmds.setAttr("{}.rotate{}".format(knee_lst[1], axs), 0)
+        _backend.set_plug(knee_lst[1], "rotate" + axs, 0)
         cmds.setAttr("{}.rotate{}".format(knee_lst[1], axs), lock=True)
 
     # Apply IK pole vector pos to FK pole vecto
@@ -558,8 +588,8 @@ def snap_leg_ik_to_fk(side="L"):
     cmds.xform(pole_vector_lst[1], ws=True, rotation=pv_rot)
 
     # Set stretch percentage
-    cmds.setAttr("{}.{}".format(hip_stretch_ctl, stretch_attr), hip_str_per)
-    cmds.setAttr("{}.{}".format(knee_stretch_ctl, stretch_attr), knee_str_per)
+    _backend.set_plug(hip_stretch_ctl, stretch_attr, hip_str_per)
+    _backend.set_plug(knee_stretch_ctl, stretch_attr, knee_str_per)
 
     # Set toes rotation
     cmds.xform(toes_lst[1], ws=True, rotation=toes_rot)
@@ -606,16 +636,71 @@ def auto_snap(part="arm", side="L"):
         return
 
 
+# Controles que cambia cada snap (los que se keyean en snap_frame_range): {(part, estado origen): [sufijos]}
+_SNAP_TARGETS = {('arm', 1): ["_handIK_ctl", "_handIKRot_ctl", "_armPoleVector_ctl", "_armIKFK_ctl"],
+                 ('arm', 0): ["_shoulderFK_ctl", "_elbowFK_ctl", "_wristFK_ctl", "_armPoleVector_ctl_loc",
+                              "_armIKFK_ctl"],
+                 ('leg', 1): ["_footIK_ctl", "_toeIK_ctl", "_legPoleVector_ctl", "_legIKFK_ctl"],
+                 ('leg', 0): ["_hipFK_ctl", "_kneeFK_ctl", "_ankleFK_ctl", "_toeFK_ctl", "_legPoleVector_ctl_loc",
+                              "_legIKFK_ctl"]}
+
+
+def snap_frame_range(part="arm", side="L", start=1, end=1, deferred=False):
+    """
+    - Hace el snap de FK a IK (o de IK a FK) en cada frame del rango, y pone keys en los controles del sistema destino.
+    - La direccion se decide con el estado del switch al llamar a la funcion (como auto_snap),
+        y se mantiene en todo el rango: en cada frame se vuelve al estado origen antes del snap.
+    - Si "deferred" es True, los frames se procesan por partes cuando Maya esta idle, con progreso
+        y cancelacion (ver jobScheduler); cancelar deshace los frames ya keyeados. Devuelve el Job.
+    Keyword Args:
+            part      <str> "arm" o "leg". Default: "arm".
+            side      <str> "L" o "R". Default: "L".
+            start/end <int> Primer y ultimo frame del rango. Default: 1.
+            deferred  <bool> Default: False.
+    """
+    if part not in ["arm", "leg"] or side not in ["L", "R"]:
+        print("Please set a valid part ('arm' or 'leg') and side ('L' or 'R').")
+        return
+
+    _switch = "{}_{}IKFK_ctl".format(side, part)
+    if not cmds.objExists("{}.IKFK".format(_switch)):
+        print("Please specify a valid IK/FK {} switch controller and attribute.".format(part))
+        return
+
+    _source = int(round(mayaBackend.current().get_plug(_switch, "IKFK")))
+    _snap = {('arm', 1): snap_arm_fk_to_ik, ('arm', 0): snap_arm_ik_to_fk,
+             ('leg', 1): snap_leg_fk_to_ik, ('leg', 0): snap_leg_ik_to_fk}[(part, _source)]
+    _targets = [side + suffix for suffix in _SNAP_TARGETS[(part, _source)]]
+    _time = cmds.currentTime(query=True)
+
+    def _process(frames):
+        _backend = mayaBackend.current()
+        for frame in frames:
+            cmds.currentTime(frame)
+            _backend.set_plug(_switch, "IKFK", _source)
+            _snap(side=side)
+            cmds.setKeyframe(_targets)
+
+    def _finish(job):
+        cmds.currentTime(_time)
+
+    job = jobScheduler.Job("snap_{}_{}".format(side, part), range(int(start), int(end) + 1), _process,
+                           finish=_finish)
+    if deferred:
+        return jobScheduler.shared().submit(job)
+    job.run()
+
+
 # Codigos para utilizar para testeo en el modelo de maya
 
-#import snapFKIK
-
-#snapFKIK.create_arm_fk_pv_locator()
-# snapFKIK.create_arm_bones_locator()
-# snapFKIK.snap_arm_fk_to_ik()
-# snapFKIK.snap_arm_ik_to_fk()
-# snapFKIK.create_leg_fk_pv_locator()
-# snapFKIK.create_leg_bones_locator()
-# snapFKIK.snap_leg_fk_to_ik()
-# snapFKIK.snap_leg_ik_to_fk()
-# snapFKIK.auto_snap()
+# from riggingCodes import snapIKFK
+
+# snapIKFK.create_arm_fk_pv_locator()
+# snapIKFK.create_arm_bones_locator()
+# snapIKFK.snap_arm_fk_to_ik()
+# snapIKFK.snap_arm_ik_to_fk()
+# snapIKFK.create_leg_fk_pv_locator()
+# snapIKFK.create_leg_bones_locator()
+# snapIKFK.snap_leg_fk_to_ik()
+# snapIKFK.snap_leg_ik_to_fk()
+# snapIKFK.auto_snap()
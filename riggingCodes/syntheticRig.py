@@ -0,0 +1,299 @@
+"""
+Detalles:
+    - Generador de rigs biped sinteticos, de tamano configurable, para benchmarks y pruebas de regresion.
+    - Solo usa maya.cmds, por lo que funciona tanto en Maya como con el stand-in (riggingCodes.mayaStandIn).
+    - El rig sigue los nombres que esperan las herramientas del paquete:
+        - snapIKFK: <side>_shoulder/elbow/wrist_jnt, <side>_shoulderFK_ctl, <side>_handIK_ctl, <side>_armIKFK_ctl.IKFK,
+            Stretch/UpperStretchManual/LowerStretchManual, y los locators que crean las funciones create_*_locator.
+        - Grupos_y_Spaces: atributo enum "Spaces" en <side>_handIK_ctl y <side>_footIK_ctl, con un
+            parentConstraint en su grupo "_space" cuyos pesos dependen del enum (nodos condition).
+        - Los joints del esqueleto siguen a los joints IK o a los controles FK segun el atributo IKFK
+            (1 = FK, 0 = IK), con un parentConstraint de dos targets y un nodo reverse.
+    - Los controles extra (para llegar al numero de controles pedido) son cadenas de 3 controles
+        bajo las munecas, los dedos de los pies y la cabeza.
+    - La cadena IK no tiene solver: los joints IK se quedan en su posicion de reposo.
+    - Ejemplos de uso:
+        from riggingCodes import mayaStandIn, syntheticRig
+        mayaStandIn.install()
+        rig = syntheticRig.build_biped(controls=1000)
+        rigs = syntheticRig.build_crowd(characters=20, controls=100)
+        small = syntheticRig.build_biped(controls=10, limbs=())
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023 / riggingCodes.mayaStandIn
+"""
+
+import maya.cmds as cmds
+
+
+# Controles de la columna: (nombre, padre, posicion)
+_SPINE = [('C_root', None, (0.0, 0.0, 0.0)),
+          ('C_cog', 'C_root', (0.0, 100.0, 0.0)),
+          ('C_hips', 'C_cog', (0.0, 95.0, 0.0)),
+          ('C_spine01', 'C_cog', (0.0, 110.0, 0.0)),
+          ('C_spine02', 'C_spine01', (0.0, 122.0, 0.0)),
+          ('C_chest', 'C_spine02', (0.0, 135.0, 0.0)),
+          ('C_neck', 'C_chest', (0.0, 150.0, 0.0)),
+          ('C_head', 'C_neck', (0.0, 160.0, 0.0))]
+
+# Posiciones del lado izquierdo (el derecho es el espejo en X)
+_ARM = {'shoulder': (18.0, 140.0, 0.0), 'elbow': (46.0, 140.0, -2.0), 'wrist': (72.0, 140.0, 0.0),
+        'poleVector': (46.0, 140.0, -40.0), 'switch': (80.0, 150.0, 0.0)}
+_LEG = {'hip': (10.0, 95.0, 0.0), 'knee': (10.0, 52.0, 3.0), 'ankle': (10.0, 9.0, 0.0), 'toe': (10.0, 0.0, 12.0),
+        'poleVector': (10.0, 52.0, 40.0), 'switch': (25.0, 20.0, 0.0)}
+
+SIDES = ['L', 'R']
+LIMBS = ['arm', 'leg']
+
+# Nodos bajo los que se agregan las cadenas de controles extra
+_EXTRA_PARENTS = [('L', 'finger', 'L_wristFK'), ('R', 'finger', 'R_wristFK'),
+                  ('L', 'toe', 'L_toeFK'), ('R', 'toe', 'R_toeFK'), ('C', 'face', 'C_head')]
+
+
+class _Builder(object):
+    """
+    - Guarda el namespace y las listas de nodos creados mientras se construye un rig.
+    """
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.controls = []
+        self.joints = []
+        self.switches = []
+        self.spaceControls = []
+
+    def name(self, name):
+        return "{}:{}".format(self.namespace, name) if self.namespace else name
+
+    def transform(self, name, parent, position=None, rotation=None, nodeType='transform'):
+        node = cmds.createNode(nodeType, name=self.name(name), parent=parent, skipSelect=True)
+        if rotation is not None:
+            cmds.xform(node, worldSpace=True, rotation=rotation)
+        if position is not None:
+            cmds.xform(node, worldSpace=True, translation=position)
+        return node
+
+    def control(self, name, parent, position, rotation=None):
+        """
+        - Crea un control con su grupo de offset (<name>_ctl_grp), en la posicion especificada.
+        """
+        _group = self.transform(name + "_ctl_grp", parent, position, rotation)
+        ctl = self.transform(name + "_ctl", _group)
+        self.controls.append(ctl)
+        return ctl
+
+    def joint(self, name, parent, position, jointOrient=None):
+        jnt = cmds.createNode('joint', name=self.name(name), parent=parent, skipSelect=True)
+        if jointOrient:
+            cmds.setAttr(jnt + ".jointOrient", *jointOrient)
+        cmds.xform(jnt, worldSpace=True, translation=position)
+        return jnt
+
+    def snap_locator(self, target, parent):
+        """
+        - Igual que snapIKFK._create_hidden_locator: <target>_loc dentro de <target>_loc_root, oculto bajo "parent".
+        """
+        locator = cmds.spaceLocator(name=target + "_loc")[0]
+        root = cmds.group(locator, name=locator + "_root")
+        cmds.parent(root, parent)
+        cmds.xform(root, worldSpace=True, translation=cmds.xform(target, query=True, worldSpace=True,
+                                                                 translation=True))
+        cmds.xform(root, worldSpace=True, rotation=cmds.xform(target, query=True, worldSpace=True, rotation=True))
+        cmds.setAttr(root + ".visibility", 0)
+        return locator, root
+
+
+def _mirror(position, side):
+    return (position[0] * (1.0 if side == 'L' else -1.0), position[1], position[2])
+
+
+def _add_attr(node, name, **kwargs):
+    cmds.addAttr(node, longName=name, keyable=True, **kwargs)
+
+
+def _weight_attrs(constraint):
+    return cmds.listAttr(constraint, userDefined=True) or []
+
+
+def _blend_constraint(builder, bindJoint, ikNode, fkNode, switch, reverse):
+    """
+    - El joint del esqueleto sigue al IK con peso reverse(IKFK) y al FK con peso IKFK.
+    """
+    constraint = cmds.parentConstraint(ikNode, fkNode, bindJoint, maintainOffset=True)[0]
+    _ikWeight, _fkWeight = _weight_attrs(constraint)
+    cmds.connectAttr(reverse + ".outputX", "{}.{}".format(constraint, _ikWeight))
+    cmds.connectAttr(switch + ".IKFK", "{}.{}".format(constraint, _fkWeight))
+
+
+def _space_switch(builder, ctl, space, targets, names):
+    """
+    - Agrega el enum "Spaces" al control y hace que su grupo "_space" siga al target elegido.
+    """
+    cmds.addAttr(ctl, longName="Spaces", attributeType='enum', enumName=':'.join(names), keyable=True)
+    constraint = cmds.parentConstraint(targets + [space], maintainOffset=True)[0]
+    for index, weight in enumerate(_weight_attrs(constraint)):
+        condition = cmds.createNode('condition', name="{}_space{}_cnd".format(ctl, index), skipSelect=True)
+        cmds.connectAttr(ctl + ".Spaces", condition + ".firstTerm")
+        cmds.setAttr(condition + ".secondTerm", index)
+        cmds.setAttr(condition + ".colorIfTrueR", 1)
+        cmds.setAttr(condition + ".colorIfFalseR", 0)
+        cmds.connectAttr(condition + ".outColorR", "{}.{}".format(constraint, weight))
+    builder.spaceControls.append(ctl)
+
+
+def _ik_control(builder, name, parent, position, rotation, targets, names):
+    space = builder.transform(name + "_ctl_space", parent, position, rotation)
+    ctl = builder.transform(name + "_ctl", space)
+    builder.controls.append(ctl)
+    _add_attr(ctl, "Stretch", attributeType='double', minValue=0, maxValue=1, defaultValue=0)
+    _add_attr(ctl, "UpperStretchManual", attributeType='double', minValue=1, defaultValue=1)
+    _add_attr(ctl, "LowerStretchManual", attributeType='double', minValue=1, defaultValue=1)
+    _space_switch(builder, ctl, space, targets, names)
+    return ctl
+
+
+def _build_limb(builder, limb, side, groups, spine, snapLocators):
+    """
+    - Construye un brazo o una pierna: joints del esqueleto, joints IK, controles FK/IK, switch y locators del snap.
+    """
+    _positions = _ARM if limb == 'arm' else _LEG
+    _chain = ['shoulder', 'elbow', 'wrist'] if limb == 'arm' else ['hip', 'knee', 'ankle', 'toe']
+    # Orientacion de la cadena: el eje X apunta a lo largo del hueso
+    if limb == 'arm':
+        _orient = (0.0, 0.0, 0.0) if side == 'L' else (0.0, 180.0, 0.0)
+    else:
+        _orient = (0.0, 0.0, -90.0)
+    _prefix = side + "_"
+
+    # Switch IKFK (1 = FK, 0 = IK)
+    switch = builder.control(_prefix + limb + "IKFK", groups['controls'], _mirror(_positions['switch'], side))
+    _add_attr(switch, "IKFK", attributeType='double', minValue=0, maxValue=1, defaultValue=1)
+    builder.switches.append(switch)
+    reverse = cmds.createNode('reverse', name=builder.name(_prefix + limb + "IKFK_rev"), skipSelect=True)
+    cmds.connectAttr(switch + ".IKFK", reverse + ".inputX")
+
+    # Joints del esqueleto y joints IK
+    _bind = []
+    _ik = []
+    for index, part in enumerate(_chain):
+        _position = _mirror(_positions[part], side)
+        _bindParent = _bind[-1] if _bind else groups['skeleton']
+        _bind.append(builder.joint(_prefix + part + "_jnt", _bindParent, _position,
+                                   _orient if not index else None))
+        if part != 'toe':
+            _ikParent = _ik[-1] if _ik else groups['ik']
+            _ik.append(builder.joint(_prefix + part + "IK_jnt", _ikParent, _position,
+                                     _orient if not index else None))
+    builder.joints.extend(_bind)
+
+    # Controles FK
+    _fk = []
+    _fkParent = spine['C_chest'] if limb == 'arm' else spine['C_hips']
+    for index, part in enumerate(_chain):
+        _position = _mirror(_positions[part], side)
+        ctl = builder.control(_prefix + part + "FK", _fk[-1] if _fk else _fkParent, _position,
+                              _orient if not index else None)
+        _fk.append(ctl)
+    for ctl in _fk[:2]:
+        _add_attr(ctl, "Stretch", attributeType='double', minValue=0.1, defaultValue=1)
+    # Rodilla y codo solo rotan en un eje
+    for axis in (['X', 'Z'] if limb == 'arm' else ['X', 'Y']):
+        cmds.setAttr("{}.rotate{}".format(_fk[1], axis), lock=True)
+
+    # Controles IK
+    _endRotation = cmds.xform(_bind[2], query=True, worldSpace=True, rotation=True)
+    if limb == 'arm':
+        ik = _ik_control(builder, _prefix + "handIK", groups['controls'], _mirror(_positions['wrist'], side),
+                         _endRotation, [spine['C_root'], spine['C_chest'], spine['C_head']], ['world', 'chest', 'head'])
+        builder.control(_prefix + "handIKRot", ik, _mirror(_positions['wrist'], side), _endRotation)
+    else:
+        ik = _ik_control(builder, _prefix + "footIK", groups['controls'], _mirror(_positions['ankle'], side),
+                         _endRotation, [spine['C_root'], spine['C_cog']], ['world', 'cog'])
+        toeIK = builder.control(_prefix + "toeIK", ik, _mirror(_positions['toe'], side), _endRotation)
+    poleVector = builder.control(_prefix + limb + "PoleVector", groups['controls'],
+                                 _mirror(_positions['poleVector'], side))
+
+    # El esqueleto sigue al IK o al FK segun el switch
+    _ikTargets = _ik + ([toeIK] if limb == 'leg' else [])
+    for bindJoint, ikNode, fkNode in zip(_bind, _ikTargets, _fk):
+        _blend_constraint(builder, bindJoint, ikNode, fkNode, switch, reverse)
+
+    # Locators que crean snapIKFK.create_*_locator (rig en posicion default)
+    if snapLocators:
+        builder.snap_locator(poleVector, _fk[1])
+        for parentJoint, childJoint in zip(_bind[:-1], _bind[1:]):
+            builder.snap_locator(childJoint, parentJoint)
+
+
+def build_biped(namespace='', controls=None, limbs=LIMBS, sides=SIDES, snapLocators=True):
+    """
+    - Construye un biped sintetico y devuelve un diccionario con sus nodos:
+        {'namespace': <str>, 'root': <str rig_grp>, 'controls': <list>, 'joints': <list joints del esqueleto>,
+         'switches': <list controles con IKFK>, 'spaceControls': <list controles con Spaces>}
+    - Keyword Args:
+        namespace    <str> Namespace de todos los nodos (sin ':'). Default: "".
+        controls     <int> Numero total de controles. Si es mayor que el del biped base, se agregan
+                        cadenas de controles extra. Default: None (solo el biped base).
+        limbs        <list> Extremidades a construir: 'arm' y/o 'leg'. Default: ['arm', 'leg'].
+        sides        <list> Lados a construir. Default: ['L', 'R'].
+        snapLocators <bool> Si es True, crea los locators que necesita snapIKFK. Default: True.
+    """
+    builder = _Builder(namespace)
+
+    root = builder.transform("rig_grp", None)
+    groups = {'controls': builder.transform("controls_grp", root),
+              'skeleton': builder.transform("skeleton_grp", root),
+              'ik': builder.transform("ik_grp", root)}
+    cmds.setAttr(groups['ik'] + ".visibility", 0)
+
+    # Columna
+    spine = {}
+    for name, parent, position in _SPINE:
+        spine[name] = builder.control(name, spine[parent] if parent else groups['controls'], position)
+
+    # Extremidades
+    for limb in limbs:
+        for side in sides:
+            _build_limb(builder, limb, side, groups, spine, snapLocators)
+
+    # Controles extra, en cadenas de 3
+    _parents = [(side, part, parent) for side, part, parent in _EXTRA_PARENTS
+                if builder.name(parent + "_ctl") in builder.controls]
+    _chainIndex = 0
+    while controls and len(builder.controls) < controls:
+        side, part, parent = _parents[_chainIndex % len(_parents)]
+        _number = _chainIndex // len(_parents) + 1
+        _parentCtl = builder.name(parent + "_ctl")
+        _position = cmds.xform(_parentCtl, query=True, worldSpace=True, translation=True)
+        for segment in "ABC":
+            if len(builder.controls) >= controls:
+                break
+            _position = [_position[0], _position[1] - 2.0, _position[2] + 1.0]
+            _parentCtl = builder.control("{}_{}{:03d}{}".format(side, part, _number, segment), _parentCtl, _position)
+            if segment == "A":
+                _add_attr(_parentCtl, "Curl", attributeType='double', defaultValue=0)
+        _chainIndex += 1
+
+    cmds.select(clear=True)
+    return {'namespace': namespace, 'root': root, 'controls': builder.controls, 'joints': builder.joints,
+            'switches': builder.switches, 'spaceControls': builder.spaceControls}
+
+
+def build_crowd(characters=10, controls=None, limbs=LIMBS, referenced=True, prefix="char"):
+    """
+    - Construye varios bipeds, cada uno en su namespace (<prefix>001, <prefix>002, ...).
+    - Con referenced=True y el stand-in instalado, registra cada namespace como una referencia
+        (para RigConnector.connect_namespaces).
+    - Devuelve la lista de diccionarios de build_biped.
+    """
+    result = []
+    for index in range(characters):
+        namespace = "{}{:03d}".format(prefix, index + 1)
+        result.append(build_biped(namespace=namespace, controls=controls, limbs=limbs))
+        if referenced:
+            from riggingCodes import mayaStandIn
+            if mayaStandIn.is_installed():
+                mayaStandIn.current_scene().add_reference(namespace)
+    return result
@@ -0,0 +1,267 @@
+"""
+Detalles:
+    - Reporte estructurado de una operacion de las herramientas (load_dict, connect/disconnect de RigConnector,
+        change_switchSpace), en vez de un print o un warning por cada elemento.
+    - Un Report junta contadores, tiempos y listas de detalles con un maximo de elementos (maxDetails),
+        y se emite una unica vez al terminar la operacion con el modulo logging (logger 'riggingCodes'):
+        - Sin errores: una linea de resumen (nivel INFO).
+        - Con errores o avisos: el resumen con los errores y avisos (nivel WARNING).
+        - Con verbosidad 'details': tambien las listas de detalles de los contadores que no son errores.
+    - Verbosidad (set_verbosity): 'quiet' (solo errores y avisos), 'summary' (por defecto) o 'details'.
+    - Si nadie configuro logging (por ejemplo en mayapy), los mensajes se imprimen en el output como antes.
+    - to_json() / as_dict() devuelven el mismo reporte en JSON, para comprobaciones del pipeline.
+    - Ejemplos de uso:
+        from riggingCodes import toolReport, Reset_Controls
+
+        toolReport.set_verbosity('details')
+        report = Reset_Controls.load_dict(fileName='ctrlsData', filePath='C:/Example/Directory/Path')
+        report.counters['failed']
+        report.to_json('C:/Example/Directory/Path/load_dict.json')
+
+        # Dentro de una herramienta
+        report = toolReport.Report('myTool')
+        with report.timer('set'):
+            report.add('set', ('L_hand_ctl', 'tx'))
+        report.fail('missing', 'L_foot_ctl')
+        report.emit()
+Fecha de actualizacion:
+    19/10/2026:
+        -Create script
+Entorno:
+    -Python 2023.2.4
+    -Autodesk Maya 2023
+    -Windows
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+# Maximo de elementos que se guardan en cada lista de detalles (el resto solo se cuenta)
+MAX_DETAILS = 20
+
+# Verbosidad: nivel del logger 'riggingCodes'
+VERBOSITY = {'quiet': logging.WARNING,
+             'summary': logging.INFO,
+             'details': logging.DEBUG}
+
+_LOGGER = logging.getLogger('riggingCodes')
+_LOGGER.setLevel(VERBOSITY['summary'])
+
+_LAST = [None]
+
+
+class _PrintHandler(logging.Handler):
+    """
+    - Handler por defecto cuando logging no esta configurado: imprime el mensaje con print,
+        para que aparezca en el Script Editor (y se pueda redirigir sys.stdout, como en los benchmarks).
+    """
+    def emit(self, record):
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+_DEFAULT_HANDLER = _PrintHandler()
+
+
+def set_verbosity(verbosity):
+    """
+    - Cambia la verbosidad de los reportes de todas las herramientas: 'quiet', 'summary' o 'details'.
+    """
+    if verbosity not in VERBOSITY:
+        raise ValueError("Invalid verbosity {!r}. Use one of: {!r}".format(verbosity, sorted(VERBOSITY)))
+    _LOGGER.setLevel(VERBOSITY[verbosity])
+
+
+def last():
+    """
+    - Devuelve el ultimo Report emitido (o None).
+    """
+    return _LAST[0]
+
+
+def _format_item(item):
+    if isinstance(item, (tuple, list)):
+        return " ".join(str(each) for each in item)
+    return str(item)
+
+
+class Report(object):
+    """
+    - Reporte de una operacion:
+        counters    <dict> {<str nombre>: <int>}, en el orden en que aparecen.
+        details     <dict> {<str nombre>: [elementos]}, con un maximo de maxDetails elementos por nombre.
+        failures    <list> Nombres de los contadores que son errores (ver fail).
+        warnings    <list> Avisos sueltos de la operacion (ver warn).
+        timings     <dict> {<str nombre>: <float segundos>} (ver timer).
+        groups      <dict> {<str grupo>: {<str nombre>: <int>}} Contadores por grupo (por ejemplo por namespace).
+    - Los elementos de los detalles se guardan tal cual (tuplas, nombres) y solo se formatean al emitir,
+        para no construir strings para miles de elementos que no se van a mostrar.
+    """
+    def __init__(self, operation, maxDetails=None):
+        self.operation = operation
+        self.maxDetails = MAX_DETAILS if maxDetails is None else maxDetails
+        self.counters = {}
+        self.details = {}
+        self.failures = []
+        self.warnings = []
+        self.timings = {}
+        self.groups = {}
+        self.elapsed = None
+        self._start = time.perf_counter()
+
+    def __repr__(self):
+        return "<Report {!r} {}>".format(self.operation, self.counters)
+
+    @property
+    def failed(self):
+        """
+        - True si algun contador de errores es mayor que 0.
+        """
+        return any(self.counters.get(name) for name in self.failures)
+
+    def count(self, name, amount=1):
+        """
+        - Suma "amount" al contador "name" sin guardar detalles.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add(self, name, item):
+        """
+        - Suma 1 al contador "name" y guarda "item" en sus detalles (si no se llego al maximo).
+        """
+        self.counters[name] = self.counters.get(name, 0) + 1
+        _details = self.details.setdefault(name, [])
+        if len(_details) < self.maxDetails:
+            _details.append(item)
+
+    def extend(self, name, items):
+        """
+        - Como add, para una lista de elementos de una vez.
+        """
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        self.counters[name] = self.counters.get(name, 0) + len(items)
+        _details = self.details.setdefault(name, [])
+        _details.extend(items[:max(0, self.maxDetails - len(_details))])
+
+    def fail(self, name, item=None):
+        """
+        - Como add (o count si no hay "item"), marcando el contador "name" como error:
+            se emite como WARNING con sus detalles en cualquier verbosidad.
+        """
+        if name not in self.failures:
+            self.failures.append(name)
+        if item is None:
+            self.count(name)
+        else:
+            self.add(name, item)
+
+    def warn(self, message):
+        """
+        - Agrega un aviso suelto a la operacion (se emite como WARNING).
+        """
+        self.warnings.append(message)
+
+    @contextmanager
+    def timer(self, name):
+        """
+        - Mide el tiempo del bloque y lo suma a timings[name].
+        """
+        _start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - _start
+
+    def stop(self):
+        """
+        - Fija el tiempo total de la operacion (se llama solo en emit si no se llamo antes).
+        """
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - self._start
+        return self.elapsed
+
+    # --------------------------------------------------------------------------
+    # Salida
+    # --------------------------------------------------------------------------
+    def summary(self):
+        """
+        - Devuelve la linea de resumen: "# operation: 10 set, 2 failed (0.012 sec)".
+        """
+        _counters = ", ".join("{} {}".format(value, name) for name, value in self.counters.items())
+        return "# {}: {} ({:.3f} sec)".format(self.operation, _counters or "nothing to do", self.stop())
+
+    def _detail_lines(self, names):
+        lines = []
+        for name in names:
+            _details = self.details.get(name)
+            if not _details:
+                continue
+            _more = self.counters.get(name, 0) - len(_details)
+            lines.append("#   {}: {}{}".format(name, ", ".join(_format_item(each) for each in _details),
+                                                " (+{} more)".format(_more) if _more > 0 else ""))
+        return lines
+
+    def format(self, details=False):
+        """
+        - Devuelve el mensaje completo del reporte: resumen, grupos, avisos, errores
+            y, si "details" es True, el resto de detalles y los tiempos.
+        """
+        lines = [self.summary()]
+        if len(self.groups) > 1:
+            for group in sorted(self.groups):
+                lines.append("#   {!r}: {}".format(group, ", ".join(
+                    "{} {}".format(value, name) for name, value in self.groups[group].items())))
+        lines.extend("#   {}".format(message) for message in self.warnings)
+        lines.extend(self._detail_lines(self.failures))
+        if details:
+            lines.extend(self._detail_lines(name for name in self.details if name not in self.failures))
+            if self.timings:
+                lines.append("#   timings: {}".format(", ".join(
+                    "{} {:.3f} sec".format(name, value) for name, value in self.timings.items())))
+        return "\n".join(lines)
+
+    def emit(self, logger=None):
+        """
+        - Emite el reporte como un unico mensaje de logging: WARNING si hay errores o avisos, si no INFO.
+        - Devuelve el Report.
+        """
+        logger = logger or _LOGGER
+        if not logger.hasHandlers():
+            _LOGGER.addHandler(_DEFAULT_HANDLER)
+
+        self.stop()
+        _LAST[0] = self
+        _level = logging.WARNING if self.failed or self.warnings else logging.INFO
+        if logger.isEnabledFor(_level):
+            logger.log(_level, self.format(details=logger.isEnabledFor(logging.DEBUG)))
+        return self
+
+    def as_dict(self):
+        """
+        - Devuelve el reporte como diccionario serializable en JSON.
+        """
+        return {'operation': self.operation,
+                'time': self.stop(),
+                'failed': self.failed,
+                'counters': dict(self.counters),
+                'failures': list(self.failures),
+                'warnings': list(self.warnings),
+                'timings': dict(self.timings),
+                'groups': dict(self.groups),
+                'details': dict((name, [list(each) if isinstance(each, tuple) else each for each in items])
+                                for name, items in self.details.items())}
+
+    def to_json(self, path=None, indent=4):
+        """
+        - Devuelve el reporte en JSON, y lo escribe en "path" si se especifica.
+        """
+        data = json.dumps(self.as_dict(), indent=indent, default=str)
+        if path:
+            with open(path, "w") as file_to_write:
+                file_to_write.write(data)
+        return data